@@ -51,6 +51,14 @@ if [ "${APP_ROLE:-web}" = "web" ]; then
   fi
 fi
 
+# Multi-process metrics: each gunicorn worker writes its own file under
+# METRICS_MULTIPROC_DIR. Files from a previous container would be summed into
+# this one's totals, so start from an empty directory.
+if [ -n "${METRICS_MULTIPROC_DIR:-}" ]; then
+  rm -rf "${METRICS_MULTIPROC_DIR:?}"
+  mkdir -p "${METRICS_MULTIPROC_DIR}"
+fi
+
 # Gunicorn configuration
 # WEB_CONCURRENCY: Number of worker processes (default: 4)
 # GUNICORN_TIMEOUT_SECONDS: Worker timeout in seconds (default: 3600 for long validations)
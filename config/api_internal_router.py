@@ -15,9 +15,12 @@ from validibot.core.api.scheduled_tasks import EnforceAuditRetentionView
 from validibot.core.api.scheduled_tasks import ProcessPurgeRetriesView
 from validibot.core.api.scheduled_tasks import PurgeExpiredOutputsView
 from validibot.core.api.scheduled_tasks import PurgeExpiredSubmissionsView
+from validibot.core.api.scheduled_tasks import ReconcileNotificationCountsView
+from validibot.core.api.scheduled_tasks import RefreshDashboardRollupsView
 from validibot.core.api.scheduled_tasks import SendPeriodicEmailsView
 from validibot.core.api.scheduled_tasks import VerifyValidatorDeploymentsView
 from validibot.tracking.api.log_event import LogTrackingEventView
+from validibot.validations.api.callbacks import ValidationCallbackBatchView
 from validibot.validations.api.callbacks import ValidationCallbackView
 from validibot.validations.api.execute import ExecuteValidationRunView
 from validibot.validations.api.storage_capabilities import (
@@ -47,6 +50,11 @@ urlpatterns = [
         ValidationCallbackView.as_view(),
         name="validation-callbacks",
     ),
+    path(
+        "validation-callbacks/batch/",
+        ValidationCallbackBatchView.as_view(),
+        name="validation-callbacks-batch",
+    ),
     path(
         "validation-storage-capabilities/refresh/",
         ValidationStorageCapabilityRefreshView.as_view(),
@@ -103,4 +111,14 @@ urlpatterns = [
         EnforceAuditRetentionView.as_view(),
         name="scheduled-enforce-audit-retention",
     ),
+    path(
+        "scheduled/refresh-dashboard-rollups/",
+        RefreshDashboardRollupsView.as_view(),
+        name="scheduled-refresh-dashboard-rollups",
+    ),
+    path(
+        "scheduled/reconcile-notification-counts/",
+        ReconcileNotificationCountsView.as_view(),
+        name="scheduled-reconcile-notification-counts",
+    ),
 ]
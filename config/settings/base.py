@@ -320,6 +320,8 @@ MIDDLEWARE = [
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
+    # Adds RateLimit-* headers for the quota QuotaThrottle charged.
+    "validibot.core.ratelimit.RateLimitHeadersMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     # Must come AFTER AuthenticationMiddleware so ``request.user`` is
@@ -486,6 +488,38 @@ LOGGING = {
     },
 }
 
+# METRICS
+# ------------------------------------------------------------------------------
+# Live performance metrics (validibot.core.metrics), served by the worker at
+# /metrics in the Prometheus text format. In-process storage is used unless
+# METRICS_MULTIPROC_DIR is set; multi-process servers (gunicorn workers, Celery
+# prefork children) must point it at a directory shared by those processes so
+# a scrape sees all of them. start.sh empties the directory on boot.
+METRICS_ENABLED = env.bool("METRICS_ENABLED", default=True)
+METRICS_MULTIPROC_DIR = env("METRICS_MULTIPROC_DIR", default="")
+# Opt-in per-run execution profiles (validibot.core.spans). Each execution pass
+# records a span tree of step and phase timings and stores it on the run
+# summary; `manage.py report_run_profiles` aggregates the slowest phases.
+VALIDATION_RUN_PROFILING_ENABLED = env.bool(
+    "VALIDATION_RUN_PROFILING_ENABLED",
+    default=False,
+)
+# Per-step CPU profiles for slow validator steps (validibot.core.sampling_profiler).
+# Validator steps of runs in the listed orgs (slugs) or workflows
+# ("org-slug/workflow-slug") run under a stack sampler; steps that take at least
+# STEP_CPU_PROFILE_MIN_SECONDS store collapsed stacks as a run artifact.
+STEP_CPU_PROFILE_ORGS = env.list("STEP_CPU_PROFILE_ORGS", default=[])
+STEP_CPU_PROFILE_WORKFLOWS = env.list("STEP_CPU_PROFILE_WORKFLOWS", default=[])
+STEP_CPU_PROFILE_MIN_SECONDS = env.float("STEP_CPU_PROFILE_MIN_SECONDS", default=5.0)
+STEP_CPU_PROFILE_INTERVAL_MS = env.int("STEP_CPU_PROFILE_INTERVAL_MS", default=5)
+# Validator benchmarks (validibot.validations.benchmarks). The fraction by which
+# a case's fastest sample may exceed the baseline before
+# `manage.py compare_validator_benchmarks` fails; 0.25 tolerates 25%.
+VALIDATOR_BENCHMARK_REGRESSION_THRESHOLD = env.float(
+    "VALIDATOR_BENCHMARK_REGRESSION_THRESHOLD",
+    default=0.25,
+)
+
 REDIS_URL = env("REDIS_URL", default="redis://localhost:6379/0")
 REDIS_SSL = REDIS_URL.startswith("rediss://")
 
@@ -639,6 +673,9 @@ REST_FRAMEWORK = {
         # GuestAwareThrottle extends ScopedRateThrottle to apply different rates
         # for workflow guests (users with grants but no org membership)
         "validibot.core.throttles.GuestAwareThrottle",
+        # Sliding-window budgets per API credential and per org, per endpoint
+        # class (throttle_scope). See validibot/core/ratelimit.py.
+        "validibot.core.throttles.QuotaThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
         # Authenticated users: generous limits for normal API usage
@@ -656,6 +693,20 @@ REST_FRAMEWORK = {
         "burst": env("DRF_THROTTLE_RATE_BURST", default="30/minute"),
         # Anonymous rate (only used if DRF_ALLOW_ANONYMOUS=True)
         "anon": env("DRF_THROTTLE_RATE_ANON", default="100/hour"),
+        # QuotaThrottle budgets. "credential" is per API key (or per user for
+        # sessions and legacy tokens); "org" is shared by everyone calling
+        # into one org, so a single tenant's bot can't starve the others.
+        # A "<budget>_<throttle_scope>" entry overrides the plain budget.
+        "credential": env("DRF_THROTTLE_RATE_CREDENTIAL", default="1000/hour"),
+        "credential_workflow_launch": env(
+            "DRF_THROTTLE_RATE_CREDENTIAL_LAUNCH",
+            default="60/minute",
+        ),
+        "org": env("DRF_THROTTLE_RATE_ORG", default="5000/hour"),
+        "org_workflow_launch": env(
+            "DRF_THROTTLE_RATE_ORG_LAUNCH",
+            default="300/minute",
+        ),
     },
     # Trusted-proxy depth for client-IP resolution in throttles. DRF's
     # BaseThrottle.get_ident() reads this to pick the real client IP out of
@@ -683,6 +734,28 @@ if DRF_ALLOW_ANONYMOUS:
         "rest_framework.throttling.AnonRateThrottle",
     )
 
+# Cache alias whose backend decides the rate-limit engine: a RedisCache gets
+# the atomic Lua sliding window shared by every instance; anything else gets
+# the per-process fallback. See validibot/core/ratelimit.py.
+RATE_LIMIT_CACHE = env("RATE_LIMIT_CACHE", default="default")
+
+# Where Idempotency-Key claims and replayable responses live. The database
+# store keeps durable IdempotencyKey rows (pruned by cleanup_idempotency_keys);
+# CacheIdempotencyStore keeps them in IDEMPOTENCY_CACHE with SET NX claims and
+# TTL expiry, taking the key bookkeeping off Postgres. Production switches to
+# the cache store when Redis is configured. See validibot/core/idempotency.py.
+IDEMPOTENCY_STORE = env.str(
+    "IDEMPOTENCY_STORE",
+    default="validibot.core.idempotency.DatabaseIdempotencyStore",
+)
+IDEMPOTENCY_CACHE = env("IDEMPOTENCY_CACHE", default="default")
+# How long a cache-store claim may stay in flight before the key frees up
+# again, so a worker that dies mid-request doesn't block retries for a day.
+IDEMPOTENCY_PROCESSING_TIMEOUT_SECONDS = env.int(
+    "IDEMPOTENCY_PROCESSING_TIMEOUT_SECONDS",
+    default=600,
+)
+
 # django-cors-headers - https://github.com/adamchainz/django-cors-headers#setup
 CORS_URLS_REGEX = r"^/api/.*$"
 # Explicitly disallow cross-origin requests; only same-origin calls are allowed.
@@ -765,10 +838,50 @@ VALIDATION_RESULT_MAX_BYTES = env.int(
     "VALIDATION_RESULT_MAX_BYTES",
     default=25 * 1024 * 1024,  # 25 MB
 )
+# Output envelopes at or above this size are not parsed into one Pydantic
+# model. They are spooled to local disk, their header and identity are verified
+# first, and ``messages`` / ``outputs.findings`` are streamed into findings in
+# batches of VALIDATION_RESULT_STREAM_BATCH_SIZE, so worker memory is bounded by
+# the batch size rather than the number of findings.
+VALIDATION_RESULT_STREAM_THRESHOLD_BYTES = env.int(
+    "VALIDATION_RESULT_STREAM_THRESHOLD_BYTES",
+    default=4 * 1024 * 1024,  # 4 MB
+)
+VALIDATION_RESULT_STREAM_BATCH_SIZE = env.int(
+    "VALIDATION_RESULT_STREAM_BATCH_SIZE",
+    default=1000,
+)
+# The batch callback endpoint accepts at most this many callbacks per request
+# and finalises each run in turn while downloading the output envelopes up to
+# VALIDATION_CALLBACK_BATCH_DOWNLOAD_CONCURRENCY ahead on as many threads.
+# Downloads are storage-bound, so a small window hides most of the per-object
+# latency when a large parameter sweep completes at once, and it also bounds
+# how many envelopes a batch holds in memory.
+VALIDATION_CALLBACK_BATCH_MAX_SIZE = env.int(
+    "VALIDATION_CALLBACK_BATCH_MAX_SIZE",
+    default=500,
+)
+VALIDATION_CALLBACK_BATCH_DOWNLOAD_CONCURRENCY = env.int(
+    "VALIDATION_CALLBACK_BATCH_DOWNLOAD_CONCURRENCY",
+    default=8,
+)
 
 # Submission settings
 SUBMISSION_INLINE_MAX_BYTES = 10_000_000  # 10MB
 SUBMISSION_FILE_MAX_BYTES = 1_000_000_000  # 1GB
+# Most files one bulk launch request (``POST .../workflows/<id>/runs/bulk/``)
+# may carry, whether as repeated ``files`` parts or zip archive members. The
+# whole batch is validated and admitted in one request, so this bounds how long
+# that request holds a web worker.
+BULK_LAUNCH_MAX_FILES = env.int("BULK_LAUNCH_MAX_FILES", default=500)
+# The retention purge commands claim expired submissions and runs in chunks and
+# delete each chunk's stored files on up to this many threads before redacting
+# the rows in bulk. Deletes are storage-bound, so a small pool hides most of the
+# per-object latency when a backlog of expiries is drained.
+RETENTION_PURGE_STORAGE_CONCURRENCY = env.int(
+    "RETENTION_PURGE_STORAGE_CONCURRENCY",
+    default=8,
+)
 
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10 MB
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10 MB
@@ -871,6 +984,48 @@ WORKFLOW_RUN_POLL_INTERVAL_SECONDS = env(
     "WORKFLOW_RUN_POLL_INTERVAL_SECONDS",
     default=3,
 )
+# Findings rendered inline per step on run pages and in the run API payload.
+# Runs past this cap show the most severe findings first and point at the
+# keyset-paginated findings API or the streaming export for the rest
+# (validibot.validations.services.findings_keyset).
+RUN_FINDINGS_INLINE_LIMIT = env.int("RUN_FINDINGS_INLINE_LIMIT", default=500)
+
+# Dashboard rollups (validibot.dashboard.rollups)
+# Each refresh re-reads source rows modified this long before the previous
+# refresh, so rows from transactions that committed late still land in their
+# hour. Widgets also count this trailing window from raw rows.
+DASHBOARD_ROLLUP_LAG_SECONDS = env.int("DASHBOARD_ROLLUP_LAG_SECONDS", default=600)
+
+# Buffered writes (validibot.core.write_buffer)
+# "buffered" batches TrackingEvent rows per process and inserts them at the
+# end of each request or task; "sync" inserts each row where it is logged.
+# A hard crash (SIGKILL, OOM) can lose one process's unflushed batch.
+TRACKING_EVENT_DURABILITY = env.str("TRACKING_EVENT_DURABILITY", default="buffered")
+# AuditAction values an operator accepts losing on a hard crash in exchange
+# for batched inserts. Security and privacy actions are always written
+# synchronously regardless (audit.constants.SYNC_ONLY_AUDIT_ACTIONS).
+AUDIT_BUFFERED_ACTIONS = env.list("AUDIT_BUFFERED_ACTIONS", default=[])
+# A buffer also flushes a thread's rows early once that thread has added this
+# many, or when a new row arrives and its oldest has waited this many seconds.
+WRITE_BUFFER_MAX_ROWS = env.int("WRITE_BUFFER_MAX_ROWS", default=500)
+WRITE_BUFFER_MAX_AGE_SECONDS = env.int("WRITE_BUFFER_MAX_AGE_SECONDS", default=5)
+
+# Run completion long-polling (validibot.validations.services.run_completion)
+# Run detail endpoints hold a ``?wait=`` request open for at most this long.
+# Each waiter occupies a web worker thread and one extra DB connection, so
+# waiting is off (0) by default: under gunicorn's sync workers a few waiters
+# block every other request. Enable it (below proxy timeouts) only for
+# threaded or async web workers; clients fall back to polling when it is off.
+RUN_COMPLETION_MAX_WAIT_SECONDS = env.int(
+    "RUN_COMPLETION_MAX_WAIT_SECONDS",
+    default=0,
+)
+# At most this many requests per process wait at once; keep it below the
+# worker's thread count. Requests over the cap are answered immediately.
+RUN_COMPLETION_MAX_WAITERS = env.int("RUN_COMPLETION_MAX_WAITERS", default=2)
+# Waiters re-read the run this often even without a notification, covering
+# terminal transitions that bypass the validation_run_finalized signal.
+RUN_COMPLETION_RECHECK_SECONDS = env.int("RUN_COMPLETION_RECHECK_SECONDS", default=5)
 
 # Site features
 ACCOUNT_ALLOW_LOGIN = env.bool("DJANGO_ACCOUNT_ALLOW_LOGIN", True)
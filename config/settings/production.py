@@ -81,12 +81,33 @@ ALLOWED_HOSTS = env.list("DJANGO_ALLOWED_HOSTS")
 
 # DATABASES
 # ------------------------------------------------------------------------------
-# Keep connections open for 10 minutes to reduce connection overhead through
-# the Cloud SQL Auth Proxy. CONN_HEALTH_CHECKS runs a lightweight SELECT 1
-# before reusing a connection, catching stale connections from Cloud SQL
-# restarts or proxy reconnections.
-DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=600)
+# Each process keeps a pool of connections (psycopg_pool, through Django's
+# native "pool" option) that request and task threads check out and hand
+# back, so a process holds at most DB_POOL_MAX_SIZE server connections and
+# bursts of short runs reuse open ones instead of reconnecting through the
+# Cloud SQL Auth Proxy. Long validator steps hand theirs back while the
+# container runs (see validibot/core/db_pool.py). CONN_HEALTH_CHECKS runs a
+# lightweight SELECT 1 before a connection is handed out or reused, catching
+# stale connections from Cloud SQL restarts or proxy reconnections.
+#
+# DB_POOL_ENABLED=False falls back to one persistent connection per thread,
+# kept open for CONN_MAX_AGE seconds.
+DB_POOL_ENABLED = env.bool("DB_POOL_ENABLED", default=True)
 DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+if DB_POOL_ENABLED:
+    # Pooling replaces persistent connections; Django requires this to be 0.
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        # Connections kept open even when idle.
+        "min_size": env.int("DB_POOL_MIN_SIZE", default=1),
+        "max_size": env.int("DB_POOL_MAX_SIZE", default=4),
+        # Idle connections above min_size are closed after this long.
+        "max_idle": env.float("DB_POOL_MAX_IDLE_SECONDS", default=300.0),
+        # A checkout waiting longer than this fails the request or task.
+        "timeout": env.float("DB_POOL_TIMEOUT_SECONDS", default=30.0),
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=600)
 
 # CACHES
 # ------------------------------------------------------------------------------
@@ -116,6 +137,12 @@ if REDIS_URL:
             "LOCATION": REDIS_URL,
         },
     }
+    # With a shared Redis, idempotency claims are one SET NX and replays one
+    # GET instead of several IdempotencyKey queries on the launch path.
+    IDEMPOTENCY_STORE = env.str(
+        "IDEMPOTENCY_STORE",
+        default="validibot.core.idempotency.CacheIdempotencyStore",
+    )
 else:
     CACHES = {
         "default": {
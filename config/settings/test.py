@@ -13,6 +13,12 @@ from .base import env
 # Test environment uses synchronous inline execution (no task queue or HTTP).
 DEPLOYMENT_TARGET = "test"
 
+# WRITE BUFFER
+# ------------------------------------------------------------------------------
+# Tests assert on TrackingEvent rows straight after the call that logs them,
+# so write them synchronously. The buffered path has its own tests.
+TRACKING_EVENT_DURABILITY = "sync"
+
 # GENERAL
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#secret-key
@@ -8,12 +8,15 @@ the validator callback endpoint. Marketing/UI routes are intentionally omitted.
 from django.urls import include
 from django.urls import path
 
+from validibot.core.api.metrics import MetricsView
 from validibot.core.health import health_check
 
 # Internal-only API surface
 urlpatterns = [
     # Health check endpoint for container orchestration (Docker, Kubernetes)
     path("health/", health_check, name="health-check"),
+    # Prometheus scrape target (worker auth, like every internal endpoint)
+    path("metrics/", MetricsView.as_view(), name="metrics"),
     path("api/v1/", include("config.api_internal_router")),
     # auth-token endpoint disabled - users should create API keys via web UI
     # from rest_framework.authtoken.views import obtain_auth_token
@@ -28,6 +28,10 @@ snapshot is needed.
 
 See refactor-step item ``[review-#10]`` in
 ``validibot-project/docs/adr/2026-04-18-architecture-refactor-step.md``.
+
+The in-process rate-limit engine in :mod:`validibot.core.ratelimit` is
+reset the same way: its hit log lives outside the Django cache, so
+``cache.clear()`` in a test's setup does not reach it.
 """
 
 from __future__ import annotations
@@ -106,3 +110,13 @@ def _snapshot_license():
         yield
     finally:
         set_license(baseline)
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_limits():
+    """Start every test with an empty in-process rate-limit log."""
+    from validibot.core.ratelimit import reset_local_rate_limits
+
+    reset_local_rate_limits()
+    yield
+    reset_local_rate_limits()
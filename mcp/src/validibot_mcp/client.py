@@ -39,6 +39,8 @@ _METADATA_IDENTITY_URL = (
     "http://metadata.google.internal/computeMetadata/v1/instance/service-accounts/default/identity"
 )
 _SERVICE_TOKEN_CACHE_TTL_SECONDS = 300
+# Response header Django sets when it honoured a run detail ``?wait=``.
+RUN_WAIT_HEADER = "X-Validibot-Run-Wait"
 
 _http: httpx.AsyncClient | None = None
 _metadata_http: httpx.AsyncClient | None = None
@@ -317,6 +319,40 @@ async def get_authenticated_run(
     return r.json()
 
 
+async def wait_for_authenticated_run(
+    run_ref: str,
+    *,
+    wait_seconds: int,
+    user_sub: str | None = None,
+    api_token: str | None = None,
+) -> tuple[dict[str, Any], bool]:
+    """Long-poll member-access run detail for up to ``wait_seconds``.
+
+    Django holds the request until the run is terminal or the wait expires.
+    Returns the run plus whether the server honoured the wait (it sets
+    ``X-Validibot-Run-Wait``); older servers, or servers with waiting turned
+    off, answer at once without the header and must be polled instead.
+    """
+
+    if not user_sub and not api_token:
+        msg = "user_sub or api_token is required for authenticated run detail."
+        raise ValueError(msg)
+
+    http_client = await _get_http_client()
+    r = await http_client.get(
+        f"/api/v1/mcp/runs/{_encode_ref(run_ref)}/",
+        params={"wait": wait_seconds},
+        headers=await _service_headers(
+            user_sub=user_sub,
+            api_token=api_token,
+        ),
+        # The default 30s read timeout would cut a long wait short.
+        timeout=httpx.Timeout(wait_seconds + 30.0, connect=5.0),
+    )
+    _raise_for_status(r)
+    return r.json(), RUN_WAIT_HEADER in r.headers
+
+
 async def _get_service_identity_token() -> str:
     """Return a cached Cloud Run identity token for the Django helper API."""
 
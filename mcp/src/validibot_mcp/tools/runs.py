@@ -38,6 +38,11 @@ if TYPE_CHECKING:
 _TERMINAL_STATES = {"COMPLETED"}
 
 _DEFAULT_TIMEOUT = 300  # 5 minutes
+# Longest single ``?wait=`` request. Django caps the wait server-side too
+# (RUN_COMPLETION_MAX_WAIT_SECONDS); staying at or under its default keeps each
+# request inside common proxy idle timeouts.
+_LONG_POLL_WINDOW = 20  # seconds
+# Polling fallback, used when the server does not honour ``?wait=``.
 _POLL_INITIAL_INTERVAL = 2  # seconds — catches fast validators quickly
 _POLL_MAX_INTERVAL = 30  # seconds — cap for slow validators (EnergyPlus, FMU)
 _POLL_BACKOFF_FACTOR = 2  # double the interval each iteration
@@ -54,8 +59,13 @@ async def _get_run_for_path(
     api_key: str | None,
     user_sub: str | None,
     run_ref: str | None,
-) -> dict[str, Any]:
-    """Dispatch run status lookup through the authenticated MCP helper endpoint."""
+    wait_seconds: int = 0,
+) -> tuple[dict[str, Any], bool]:
+    """Dispatch run status lookup through the authenticated MCP helper endpoint.
+
+    With ``wait_seconds`` the lookup long-polls. Returns the run (or an error
+    payload) and whether the server honoured the wait.
+    """
 
     if run_ref:
         try:
@@ -66,7 +76,7 @@ async def _get_run_for_path(
                     "code": "INVALID_PARAMS",
                     "message": "run_ref is invalid.",
                 },
-            }
+            }, False
 
         if resolved_run.auth_kind == RUN_REF_MEMBER_KIND:
             if api_key is None:
@@ -75,20 +85,28 @@ async def _get_run_for_path(
                         "code": "INVALID_PARAMS",
                         "message": "A bearer token is required for member-access run_ref values.",
                     },
-                }
+                }, False
+            if wait_seconds > 0:
+                run, waited = await client.wait_for_authenticated_run(
+                    run_ref,
+                    wait_seconds=wait_seconds,
+                    user_sub=user_sub,
+                    api_token=None if user_sub else api_key,
+                )
+                return _with_run_ref(run), waited
             run = await client.get_authenticated_run(
                 run_ref,
                 user_sub=user_sub,
                 api_token=None if user_sub else api_key,
             )
-            return _with_run_ref(run)
+            return _with_run_ref(run), False
 
     return {
         "error": {
             "code": "INVALID_PARAMS",
             "message": ("run_ref is required."),
         },
-    }
+    }, False
 
 
 def _with_run_ref(run: dict[str, Any]) -> dict[str, Any]:
@@ -129,11 +147,12 @@ async def get_run_status(
         check_global_enabled()
         api_key = auth.get_api_key_or_none()
         user_sub = auth.get_authenticated_user_sub_or_none()
-        return await _get_run_for_path(
+        run, _ = await _get_run_for_path(
             api_key=api_key,
             user_sub=user_sub,
             run_ref=run_ref,
         )
+        return run
     except MCPToolError as exc:
         return format_error(exc)
 
@@ -142,11 +161,13 @@ async def wait_for_run(
     run_ref: str = "",
     timeout_seconds: int = _DEFAULT_TIMEOUT,
 ) -> dict[str, Any]:
-    """Wait for a validation run to complete, polling periodically.
+    """Wait for a validation run to complete.
 
     Blocks until the run reaches a terminal state (``state == "COMPLETED"``)
     or ``timeout_seconds`` elapses. Useful when the agent wants to act on
-    the results immediately.
+    the results immediately. The server is asked to hold each request until
+    the run finishes (``?wait=``), so a run usually costs one request per
+    wait window; servers that don't support waiting are polled with backoff.
 
     Args:
         run_ref: Opaque run handle from ``validate_file``.
@@ -173,13 +194,22 @@ async def wait_for_run(
         user_sub = auth.get_authenticated_user_sub_or_none()
         start = time.monotonic()
         interval = _POLL_INITIAL_INTERVAL
+        long_poll = True
 
         while True:
-            run = await _get_run_for_path(
+            wait_seconds = 0
+            if long_poll:
+                remaining = timeout_seconds - (time.monotonic() - start)
+                wait_seconds = int(min(_LONG_POLL_WINDOW, max(remaining, 0)))
+            run, waited = await _get_run_for_path(
                 api_key=api_key,
                 user_sub=user_sub,
                 run_ref=run_ref,
+                wait_seconds=wait_seconds,
             )
+            if wait_seconds and not waited:
+                # The server answered without waiting: poll from now on.
+                long_poll = False
 
             # If the helper returned an error, propagate it immediately.
             # Check for a truthy value — the API may include "error": null
@@ -203,6 +233,10 @@ async def wait_for_run(
                     ),
                 }
 
+            if long_poll and wait_seconds:
+                # The server already waited; ask again straight away.
+                continue
+
             # Clamp sleep to the remaining time budget so we never
             # overshoot the caller's requested timeout.
             remaining = timeout_seconds - (time.monotonic() - start)
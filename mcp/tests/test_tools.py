@@ -14,6 +14,9 @@ from __future__ import annotations
 
 import base64
 
+import httpx
+
+from validibot_mcp.client import RUN_WAIT_HEADER
 from validibot_mcp.refs import build_member_run_ref, build_workflow_ref
 from validibot_mcp.tools.runs import get_run_status, wait_for_run
 from validibot_mcp.tools.validate import _MAX_FILE_SIZE_BYTES, validate_file
@@ -371,3 +374,61 @@ class TestRunTools:
         # The client-side timeout helper would have stamped ``is_complete``
         # to ``False``; an early-exit must not.
         assert "is_complete" not in result or result.get("is_complete") is not False
+
+    async def test_wait_for_run_long_polls_one_request_per_wait(
+        self, mock_auth, mock_api, monkeypatch
+    ):
+        """A long-polling server needs one request per wait window, no sleeps.
+
+        WHY: the point of ``?wait=`` is to stop paying an authenticated request
+        and a run read per poll. A run that finishes during the second wait
+        must cost exactly two requests, with no client-side sleeping between.
+        """
+
+        async def fail_sleep(_seconds):
+            raise AssertionError("wait_for_run slept despite server-side waiting")
+
+        monkeypatch.setattr("validibot_mcp.tools.runs.asyncio.sleep", fail_sleep)
+        run_ref = build_member_run_ref(org_slug=ORG, run_id=SAMPLE_RUN_PENDING["id"])
+        waited = {RUN_WAIT_HEADER: "20"}
+        route = mock_api.get(f"/api/v1/mcp/runs/{run_ref}/").mock(
+            side_effect=[
+                httpx.Response(200, json=SAMPLE_RUN_PENDING, headers=waited),
+                httpx.Response(200, json=SAMPLE_RUN_COMPLETED, headers=waited),
+            ],
+        )
+
+        result = await wait_for_run(run_ref=run_ref, timeout_seconds=60)
+
+        assert result["state"] == "COMPLETED"
+        assert route.call_count == 2
+        assert route.calls[0].request.url.params["wait"] == "20"
+
+    async def test_wait_for_run_falls_back_to_polling(self, mock_auth, mock_api, monkeypatch):
+        """A server that ignores ``?wait=`` is polled with backoff instead.
+
+        WHY: older Django deployments (or ones with waiting turned off) answer
+        immediately without ``X-Validibot-Run-Wait``. Re-asking straight away
+        would hammer them, so the tool must drop back to sleeping between polls.
+        """
+
+        sleeps: list[float] = []
+
+        async def record_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr("validibot_mcp.tools.runs.asyncio.sleep", record_sleep)
+        run_ref = build_member_run_ref(org_slug=ORG, run_id=SAMPLE_RUN_PENDING["id"])
+        route = mock_api.get(f"/api/v1/mcp/runs/{run_ref}/").mock(
+            side_effect=[
+                httpx.Response(200, json=SAMPLE_RUN_PENDING),
+                httpx.Response(200, json=SAMPLE_RUN_COMPLETED),
+            ],
+        )
+
+        result = await wait_for_run(run_ref=run_ref, timeout_seconds=60)
+
+        assert result["state"] == "COMPLETED"
+        assert route.call_count == 2
+        assert "wait" not in route.calls[1].request.url.params
+        assert len(sleeps) == 1
@@ -98,6 +98,8 @@ class TestWorkerServiceIAM:
             "/api/v1/scheduled/cleanup-stuck-runs/",
             "/api/v1/scheduled/send-periodic-emails/",
             "/api/v1/scheduled/enforce-audit-retention/",
+            "/api/v1/scheduled/refresh-dashboard-rollups/",
+            "/api/v1/scheduled/reconcile-notification-counts/",
         ]
 
         for endpoint in scheduled_endpoints:
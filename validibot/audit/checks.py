@@ -10,6 +10,9 @@ Checks are scoped to the backend that's actually selected:
   beyond what the constructor already enforces.
 * :class:`validibot.audit.backends.gcs.GCSArchiveBackend` — ensures
   ``AUDIT_ARCHIVE_GCS_BUCKET`` is set.
+
+``AUDIT_BUFFERED_ACTIONS`` is checked too: it may only name known,
+bufferable actions.
 """
 
 from __future__ import annotations
@@ -17,6 +20,7 @@ from __future__ import annotations
 from django.conf import settings
 from django.core.checks import Error
 from django.core.checks import Tags
+from django.core.checks import Warning as CheckWarning
 from django.core.checks import register
 
 GCS_BACKEND_DOTTED = "validibot.audit.backends.gcs.GCSArchiveBackend"
@@ -59,3 +63,38 @@ def check_gcs_archive_backend_config(app_configs, **kwargs) -> list[Error]:
             ),
         )
     return errors
+
+
+@register(Tags.compatibility)
+def check_audit_buffered_actions(app_configs, **kwargs) -> list[CheckWarning]:
+    """Flag ``AUDIT_BUFFERED_ACTIONS`` entries that will never be buffered.
+
+    Security and privacy actions are always written synchronously, and an
+    unknown value is most likely a typo. Either way the operator's setting
+    does not do what they think, so say so at startup.
+    """
+
+    from validibot.audit.constants import SYNC_ONLY_AUDIT_ACTIONS
+    from validibot.audit.constants import AuditAction
+
+    configured = getattr(settings, "AUDIT_BUFFERED_ACTIONS", [])
+    ignored = [
+        value
+        for value in configured
+        if value not in AuditAction.values or value in SYNC_ONLY_AUDIT_ACTIONS
+    ]
+    if not ignored:
+        return []
+    return [
+        CheckWarning(
+            (
+                "AUDIT_BUFFERED_ACTIONS lists actions that are always written "
+                f"synchronously or do not exist: {', '.join(ignored)}."
+            ),
+            hint=(
+                "Only non-security AuditAction values can be buffered. See "
+                "SYNC_ONLY_AUDIT_ACTIONS in validibot/audit/constants.py."
+            ),
+            id="validibot.audit.W001",
+        ),
+    ]
@@ -160,6 +160,41 @@ class AuditAction(TextChoices):
     )
 
 
+# ── Write durability ───────────────────────────────────────────────
+# Actions that are always written synchronously, inside the caller's
+# transaction, whatever ``AUDIT_BUFFERED_ACTIONS`` says. These are the
+# rows incident response and account-takeover forensics depend on, so a
+# worker crash must never be able to lose one. Everything else may be
+# opted into the per-process write buffer by an operator (see
+# ``AuditLogService.record``); nothing is buffered by default.
+SYNC_ONLY_AUDIT_ACTIONS: frozenset[str] = frozenset(
+    {
+        AuditAction.API_KEY_CREATED,
+        AuditAction.API_KEY_REVOKED,
+        AuditAction.MEMBER_ROLE_CHANGED,
+        AuditAction.LOGIN_SUCCEEDED,
+        AuditAction.LOGIN_FAILED,
+        AuditAction.MFA_ENABLED,
+        AuditAction.MFA_DISABLED,
+        AuditAction.MFA_CHALLENGE_FAILED,
+        AuditAction.PASSWORD_CHANGED,
+        AuditAction.PASSWORD_RESET_REQUESTED,
+        AuditAction.SESSION_REVOKED,
+        AuditAction.EMAIL_ADDED,
+        AuditAction.EMAIL_CHANGED,
+        AuditAction.EMAIL_VERIFIED,
+        AuditAction.EMAIL_REMOVED,
+        AuditAction.ADMIN_OBJECT_CHANGED,
+        AuditAction.USER_PROMOTED_TO_BASIC,
+        AuditAction.USER_DEMOTED_TO_GUEST,
+        AuditAction.USER_GROUPS_CHANGED,
+        AuditAction.USER_ERASURE_REQUESTED,
+        AuditAction.USER_ERASURE_COMPLETED,
+        AuditAction.AUDIT_ENTRY_SANITISED,
+    },
+)
+
+
 # ── Field whitelists per model ─────────────────────────────────────
 # Only these fields are allowed into the ``changes`` snapshot. Anything
 # else becomes ``{"<field>": "<redacted>"}`` — we record the *fact* of a
@@ -15,6 +15,13 @@ All code that wants to record an audit event goes through
    audit trail remains observable even if the DB write succeeds but
    the DB is later restored from an earlier backup.
 
+Writes are synchronous unless an operator lists an action in
+``AUDIT_BUFFERED_ACTIONS``; those entries go through the per-process
+write buffer (``validibot.core.write_buffer``) and are inserted in one
+batch at the end of the request or task, with their markers emitted
+after the batch lands. Actions in ``SYNC_ONLY_AUDIT_ACTIONS`` are never
+buffered, whatever the setting says.
+
 The service is write-only in Phase 1. Phase 2 adds Pro-gated reads via
 ``views.py``; Phase 3 adds the erasure-sanitisation path.
 """
@@ -26,13 +33,16 @@ import logging
 from dataclasses import dataclass
 from typing import Any
 
+from django.conf import settings
 from django.db import models
 from django.db import transaction
 
 from validibot.audit.constants import AUDITABLE_FIELDS
+from validibot.audit.constants import SYNC_ONLY_AUDIT_ACTIONS
 from validibot.audit.constants import AuditAction
 from validibot.audit.models import AuditActor
 from validibot.audit.models import AuditLogEntry
+from validibot.core.write_buffer import get_write_buffer
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +98,10 @@ class AuditLogService:
 
         ``changes`` is auto-sanitised against ``AUDITABLE_FIELDS`` for
         the target's model — no caller needs to know the whitelist.
+
+        Buffered actions (see the module docstring) return the entry
+        unsaved; its ``pk`` and ``occurred_at`` are filled in when the
+        buffer flushes, so ``occurred_at`` records the flush time.
         """
 
         resolved_target_type, resolved_target_id, resolved_target_repr = (
@@ -104,25 +118,42 @@ class AuditLogService:
             changes=changes,
         )
 
+        entry_kwargs = {
+            "org": org,
+            "action": action.value,
+            "target_type": resolved_target_type,
+            "target_id": resolved_target_id,
+            "target_repr": resolved_target_repr,
+            "changes": sanitised_changes,
+            "metadata": metadata or None,
+            "request_id": request_id,
+        }
+
+        if cls._is_buffered(action):
+            entry = AuditLogEntry(actor=cls._build_actor(actor), **entry_kwargs)
+            get_write_buffer(
+                "audit_log",
+                write_batch=cls._write_buffered_entries,
+            ).add(entry)
+            return entry
+
         with transaction.atomic():
             actor_row = cls._get_or_create_actor(actor)
-            entry = AuditLogEntry.objects.create(
-                actor=actor_row,
-                org=org,
-                action=action.value,
-                target_type=resolved_target_type,
-                target_id=resolved_target_id,
-                target_repr=resolved_target_repr,
-                changes=sanitised_changes,
-                metadata=metadata or None,
-                request_id=request_id,
-            )
+            entry = AuditLogEntry.objects.create(actor=actor_row, **entry_kwargs)
 
         cls._emit_log_marker(entry)
         return entry
 
     # ── helpers ─────────────────────────────────────────────────────
 
+    @staticmethod
+    def _is_buffered(action: AuditAction) -> bool:
+        """Whether ``action`` may go through the write buffer."""
+
+        if action in SYNC_ONLY_AUDIT_ACTIONS:
+            return False
+        return action.value in settings.AUDIT_BUFFERED_ACTIONS
+
     @classmethod
     def _get_or_create_actor(cls, spec: ActorSpec) -> AuditActor:
         """Create an ``AuditActor`` row for this request.
@@ -134,7 +165,13 @@ class AuditLogService:
         session.
         """
 
-        return AuditActor.objects.create(
+        actor = cls._build_actor(spec)
+        actor.save()
+        return actor
+
+    @staticmethod
+    def _build_actor(spec: ActorSpec) -> AuditActor:
+        return AuditActor(
             user=spec.user,
             email=spec.email
             or (getattr(spec.user, "email", None) if spec.user else None),
@@ -142,6 +179,24 @@ class AuditLogService:
             user_agent=spec.user_agent,
         )
 
+    @classmethod
+    def _write_buffered_entries(cls, entries: list[AuditLogEntry]) -> None:
+        """Insert a flushed batch: actors first, then the entries.
+
+        Runs inside the write buffer's transaction. Markers are emitted
+        on commit so a batch that falls back to row-by-row retries does
+        not print markers for entries that were never written.
+        """
+
+        actors = AuditActor.objects.bulk_create([entry.actor for entry in entries])
+        for entry, actor in zip(entries, actors, strict=True):
+            # Re-assign so ``actor_id`` picks up the pk set by bulk_create.
+            entry.actor = actor
+        AuditLogEntry.objects.bulk_create(entries)
+        transaction.on_commit(
+            lambda: [cls._emit_log_marker(entry) for entry in entries],
+        )
+
     @staticmethod
     def _resolve_target(
         target: models.Model | None,
@@ -20,13 +20,16 @@ from __future__ import annotations
 from unittest.mock import patch
 
 from django.test import TestCase
+from django.test import override_settings
 
+from validibot.audit.checks import check_audit_buffered_actions
 from validibot.audit.constants import AuditAction
 from validibot.audit.models import AuditActor
 from validibot.audit.models import AuditLogEntry
 from validibot.audit.services import REDACTED
 from validibot.audit.services import ActorSpec
 from validibot.audit.services import AuditLogService
+from validibot.core.write_buffer import flush_write_buffers
 from validibot.users.tests.factories import OrganizationFactory
 from validibot.users.tests.factories import UserFactory
 
@@ -224,3 +227,40 @@ class LogMarkerEmissionTests(TestCase):
         self.assertNotIn("ip_address", extra)
         self.assertIn("audit_id", extra)
         self.assertIn("action", extra)
+
+
+class BufferedWriteTests(TestCase):
+    """Operator-opted actions batch through the write buffer; security never."""
+
+    @override_settings(AUDIT_BUFFERED_ACTIONS=["workflow_updated", "login_failed"])
+    def test_opted_in_action_is_written_on_flush_with_its_marker(self) -> None:
+        user = UserFactory()
+
+        with patch("validibot.audit.services.logger") as mock_logger:
+            entry = AuditLogService.record(
+                action=AuditAction.WORKFLOW_UPDATED,
+                actor=ActorSpec(user=user),
+            )
+            self.assertIsNone(entry.pk)
+            self.assertFalse(mock_logger.info.called)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                flush_write_buffers()
+
+        entry = AuditLogEntry.objects.get(action=AuditAction.WORKFLOW_UPDATED)
+        self.assertEqual(entry.actor.email, user.email)
+        self.assertEqual(
+            mock_logger.info.call_args.kwargs["extra"]["audit_id"], entry.pk
+        )
+
+    @override_settings(AUDIT_BUFFERED_ACTIONS=["login_failed"])
+    def test_security_actions_are_always_synchronous(self) -> None:
+        entry = AuditLogService.record(
+            action=AuditAction.LOGIN_FAILED,
+            actor=ActorSpec(email="attacker@example.com"),
+        )
+
+        self.assertIsNotNone(entry.pk)
+        self.assertEqual(
+            check_audit_buffered_actions(None)[0].id, "validibot.audit.W001"
+        )
@@ -43,7 +43,6 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.core.cache import cache
 from django.http import HttpResponse
 from django.http import StreamingHttpResponse
 from django.utils import timezone
@@ -53,6 +52,7 @@ from django.views.generic import ListView
 
 from validibot.audit.forms import AuditLogFilterForm
 from validibot.audit.models import AuditLogEntry
+from validibot.core import ratelimit
 from validibot.core.features import CommercialFeature
 from validibot.core.mixins import BreadcrumbMixin
 from validibot.core.mixins import FeatureRequiredMixin
@@ -72,6 +72,10 @@ logger = logging.getLogger(__name__)
 # single source of truth.
 _EXPORT_RATE_LIMIT = 10
 _EXPORT_RATE_WINDOW_SECONDS = 3600
+_EXPORT_QUOTA = ratelimit.Quota(
+    limit=_EXPORT_RATE_LIMIT,
+    window_seconds=_EXPORT_RATE_WINDOW_SECONDS,
+)
 
 # CSV / formula-injection defence. Spreadsheet apps (Excel, LibreOffice,
 # Google Sheets) interpret any cell whose first character is one of these
@@ -298,46 +302,29 @@ class AuditLogExportView(_AuditLogBaseMixin, View):
     def _check_rate_limit(self, request: HttpRequest) -> HttpResponse | None:
         """Return a 429 response if the org exceeded the export limit.
 
-        Same cache-atomic ``set + incr`` pattern as
-        ``validibot.core.ratelimit`` — reimplemented here because that
-        decorator is IP-keyed, while the policy on this endpoint is
-        per-org (10 requests per hour per organisation).
+        Keyed by org rather than client IP: the policy on this endpoint is
+        per-organisation (10 requests in any hour), on the same sliding
+        window as ``validibot.core.ratelimit.rate_limit``.
 
         ``self.org`` is guaranteed non-None at this point — the
         ``get`` handler returns 404 earlier when no active org is
         resolved, so there's no org-less caller to rate-limit.
         """
 
-        cache_key = f"audit:export:org:{self.org.pk}"
-        current = cache.get(cache_key)
-        if current is None:
-            cache.set(cache_key, 1, _EXPORT_RATE_WINDOW_SECONDS)
+        decision = ratelimit.hit(f"audit:export:org:{self.org.pk}", _EXPORT_QUOTA)
+        if decision.allowed:
             return None
 
-        try:
-            current = cache.incr(cache_key)
-        except ValueError:
-            # Key expired between get and incr — reset.
-            cache.set(cache_key, 1, _EXPORT_RATE_WINDOW_SECONDS)
-            return None
-
-        if current > _EXPORT_RATE_LIMIT:
-            logger.warning(
-                "Audit export rate limit exceeded: org=%s (%d/%d in %ds window)",
-                self.org.pk,
-                current,
-                _EXPORT_RATE_LIMIT,
-                _EXPORT_RATE_WINDOW_SECONDS,
-            )
-            response = HttpResponse(
-                "Too many audit-log exports in the last hour. "
-                "Please wait before retrying.",
-                status=HTTPStatus.TOO_MANY_REQUESTS,
-                content_type="text/plain",
-            )
-            response["Retry-After"] = str(_EXPORT_RATE_WINDOW_SECONDS)
-            return response
-        return None
+        logger.warning(
+            "Audit export rate limit exceeded: org=%s (%d in %ds window)",
+            self.org.pk,
+            _EXPORT_RATE_LIMIT,
+            _EXPORT_RATE_WINDOW_SECONDS,
+        )
+        return ratelimit.too_many_requests(
+            decision,
+            "Too many audit-log exports in the last hour. Please wait before retrying.",
+        )
 
     # ── Serialisation ──────────────────────────────────────────────
 
@@ -0,0 +1,28 @@
+"""
+Prometheus scrape endpoint for the worker service.
+
+Serves every sample recorded through ``validibot.core.metrics`` in the
+Prometheus text exposition format. Like the other internal endpoints it only
+exists on worker instances and uses the platform's worker authentication, so
+a Docker Compose Prometheus job sends the shared key::
+
+    authorization:
+      type: Worker-Key
+      credentials: <WORKER_API_KEY>
+"""
+
+from django.http import HttpResponse
+
+from validibot.core import metrics
+from validibot.core.api.worker import WorkerOnlyAPIView
+
+
+class MetricsView(WorkerOnlyAPIView):
+    """Expose recorded metrics for scraping."""
+
+    def get(self, request):
+        """Render the current samples as Prometheus text."""
+        return HttpResponse(
+            metrics.render_latest(),
+            content_type=metrics.EXPOSITION_CONTENT_TYPE,
+        )
@@ -206,8 +206,8 @@ class PurgeExpiredSubmissionsView(ScheduledTaskBaseView):
 
         # Allow overriding batch parameters via request body
         try:
-            batch_size = int(request.data.get("batch_size", 100))
-            max_batches = int(request.data.get("max_batches", 10))
+            batch_size = int(request.data.get("batch_size", 500))
+            max_batches = int(request.data.get("max_batches", 20))
         except (TypeError, ValueError):
             return Response(
                 {"error": "batch_size and max_batches must be integers"},
@@ -275,8 +275,8 @@ class PurgeExpiredOutputsView(ScheduledTaskBaseView):
 
     def post(self, request):
         try:
-            batch_size = int(request.data.get("batch_size", 100))
-            max_batches = int(request.data.get("max_batches", 10))
+            batch_size = int(request.data.get("batch_size", 500))
+            max_batches = int(request.data.get("max_batches", 20))
         except (TypeError, ValueError):
             return Response(
                 {"error": "batch_size and max_batches must be integers"},
@@ -597,3 +597,83 @@ class EnforceAuditRetentionView(ScheduledTaskBaseView):
                 },
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+
+class RefreshDashboardRollupsView(ScheduledTaskBaseView):
+    """
+    Fold recently changed tracking events and validation runs into the
+    dashboard's hourly rollup tables.
+
+    URL: POST /api/v1/scheduled/refresh-dashboard-rollups/
+    Recommended schedule: Every 5 minutes
+    """
+
+    def post(self, request):
+        logger.info("Starting scheduled dashboard rollup refresh")
+
+        try:
+            out = StringIO()
+            call_command("refresh_dashboard_rollups", stdout=out)
+            output = out.getvalue()
+
+            logger.info("Dashboard rollup refresh completed: %s", output.strip())
+
+            return Response(
+                {
+                    "task": "refresh_dashboard_rollups",
+                    "status": "completed",
+                    "output": output.strip(),
+                },
+                status=status.HTTP_200_OK,
+            )
+        except Exception:
+            logger.exception("Failed to refresh dashboard rollups")
+            return Response(
+                {
+                    "task": "refresh_dashboard_rollups",
+                    "status": "failed",
+                    "error": "internal error",
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class ReconcileNotificationCountsView(ScheduledTaskBaseView):
+    """
+    Reset drifted per-user unread-notification counters to the true counts.
+
+    URL: POST /api/v1/scheduled/reconcile-notification-counts/
+    Recommended schedule: Daily at 3:30 AM
+    """
+
+    def post(self, request):
+        logger.info("Starting scheduled notification counter reconciliation")
+
+        try:
+            out = StringIO()
+            call_command("reconcile_notification_counts", stdout=out)
+            output = out.getvalue()
+
+            logger.info(
+                "Notification counter reconciliation completed: %s",
+                output.strip(),
+            )
+
+            return Response(
+                {
+                    "task": "reconcile_notification_counts",
+                    "status": "completed",
+                    "output": output.strip(),
+                },
+                status=status.HTTP_200_OK,
+            )
+        except Exception:
+            logger.exception("Failed to reconcile notification counters")
+            return Response(
+                {
+                    "task": "reconcile_notification_counts",
+                    "status": "failed",
+                    "error": "internal error",
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
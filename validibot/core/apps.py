@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "validibot.core"
+
+    def ready(self):
+        from validibot.core.db_pool import install_pool_metrics_hooks
+        from validibot.core.write_buffer import install_flush_hooks
+
+        install_flush_hooks()
+        install_pool_metrics_hooks()
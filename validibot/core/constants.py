@@ -74,3 +74,17 @@ class InviteStatus(models.TextChoices):
     DECLINED = "DECLINED", _("Declined")
     CANCELED = "CANCELED", _("Canceled")
     EXPIRED = "EXPIRED", _("Expired")
+
+
+class WriteDurability(models.TextChoices):
+    """
+    How a low-value row (analytics event, opt-in audit entry) is written.
+
+    ``SYNC`` inserts the row in the caller's request or task, inside whatever
+    transaction is open. ``BUFFERED`` hands it to the per-process write buffer
+    (``validibot.core.write_buffer``), which batches rows into one INSERT at
+    the end of the request or task; a hard crash can lose that batch.
+    """
+
+    SYNC = "sync", _("Synchronous")
+    BUFFERED = "buffered", _("Buffered")
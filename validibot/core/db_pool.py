@@ -0,0 +1,165 @@
+"""
+Database connection pooling.
+
+With ``DB_POOL_ENABLED`` (the production default) each process keeps one
+psycopg pool per database alias, through Django's native ``"pool"``
+database option. Request and task threads check a connection out on their
+first query and hand it back when the request or task ends, instead of each
+thread holding a persistent connection for ``CONN_MAX_AGE``. A Celery worker
+or Gunicorn process therefore needs at most ``DB_POOL_MAX_SIZE`` server
+connections however many threads it runs, and a burst of short runs reuses
+open connections rather than paying connection setup for each.
+``CONN_HEALTH_CHECKS`` makes the pool pre-ping a connection before handing
+it out, so one dropped by a database restart is replaced, not returned.
+
+Two things this module adds on top:
+
+- :func:`released_connection` hands the current thread's connection back to
+  the pool while a long step runs that does not touch the database — a
+  validator container, say — so an hour-long simulation does not pin a
+  server connection it is not using.
+- :func:`record_pool_stats` publishes the pool's size, waiters, checkouts,
+  wait time and failures through ``validibot.core.metrics``. It runs at the
+  end of every request and task, and on every release.
+
+Without pooling configured, every function here is a no-op.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from django.core.signals import request_finished
+from django.db import DEFAULT_DB_ALIAS
+from django.db import connections
+
+from validibot.core import metrics
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.db.backends.base.base import BaseDatabaseWrapper
+
+logger = logging.getLogger(__name__)
+
+POOL_CONNECTIONS = metrics.gauge(
+    "validibot_db_pool_connections",
+    "Server connections held by this process's pool, by alias and state "
+    "(open: all of them; idle: those not checked out).",
+    labelnames=("alias", "state"),
+)
+POOL_WAITING = metrics.gauge(
+    "validibot_db_pool_waiting_requests",
+    "Threads waiting for a pooled connection.",
+    labelnames=("alias",),
+)
+POOL_CHECKOUTS = metrics.counter(
+    "validibot_db_pool_checkouts_total",
+    "Connections checked out of the pool.",
+    labelnames=("alias",),
+)
+POOL_WAIT_SECONDS = metrics.counter(
+    "validibot_db_pool_wait_seconds_total",
+    "Time threads spent waiting for a pooled connection.",
+    labelnames=("alias",),
+)
+POOL_ERRORS = metrics.counter(
+    "validibot_db_pool_errors_total",
+    "Pool failures, by kind: timeout (no connection within the pool "
+    "timeout), lost (failed the pre-ping health check), connect (could not "
+    "open a new connection).",
+    labelnames=("alias", "kind"),
+)
+POOL_RELEASES = metrics.counter(
+    "validibot_db_pool_releases_total",
+    "Connections handed back to the pool while a long step ran.",
+    labelnames=("alias",),
+)
+
+# psycopg_pool ``pop_stats()`` counters, by the error kind they report.
+_ERROR_STATS = {
+    "requests_errors": "timeout",
+    "connections_lost": "lost",
+    "connections_errors": "connect",
+}
+
+
+def pool_for(connection: BaseDatabaseWrapper):
+    """Return ``connection``'s psycopg pool, or ``None`` if it is not pooled."""
+    if not connection.settings_dict.get("OPTIONS", {}).get("pool"):
+        return None
+    return getattr(connection, "pool", None)
+
+
+@contextmanager
+def released_connection(
+    connection: BaseDatabaseWrapper | None = None,
+) -> Iterator[None]:
+    """Hand this thread's pooled connection back while the block runs.
+
+    ``connection`` defaults to the thread's ``default`` connection. The next
+    query after the block checks a connection out again (pre-pinged by the
+    pool). Nothing is released inside a transaction, whose work would be
+    lost, or when the connection is not pooled: closing a persistent
+    connection would only force a reconnect.
+    """
+    if connection is None:
+        connection = connections[DEFAULT_DB_ALIAS]
+    if (
+        pool_for(connection) is not None
+        and connection.connection is not None
+        and connection.get_autocommit()
+    ):
+        connection.close()
+        POOL_RELEASES.labels(alias=connection.alias).inc()
+        record_pool_stats(connection)
+    yield
+
+
+def record_pool_stats(connection: BaseDatabaseWrapper | None = None) -> None:
+    """Publish the pool's current state and the counters since the last call."""
+    if connection is None:
+        connection = connections[DEFAULT_DB_ALIAS]
+    pool = pool_for(connection)
+    if pool is None:
+        return
+    alias = connection.alias
+    stats = pool.pop_stats()
+    POOL_CONNECTIONS.labels(alias=alias, state="open").set(stats.get("pool_size", 0))
+    POOL_CONNECTIONS.labels(alias=alias, state="idle").set(
+        stats.get("pool_available", 0),
+    )
+    POOL_WAITING.labels(alias=alias).set(stats.get("requests_waiting", 0))
+    if checkouts := stats.get("requests_num", 0):
+        POOL_CHECKOUTS.labels(alias=alias).inc(checkouts)
+    if wait_ms := stats.get("requests_wait_ms", 0):
+        POOL_WAIT_SECONDS.labels(alias=alias).inc(wait_ms / 1000)
+    for stat, kind in _ERROR_STATS.items():
+        if count := stats.get(stat, 0):
+            POOL_ERRORS.labels(alias=alias, kind=kind).inc(count)
+
+
+def _record_all_pools(**kwargs) -> None:
+    for connection in connections.all(initialized_only=True):
+        try:
+            record_pool_stats(connection)
+        except Exception:
+            # Metrics must never fail the request or task they follow.
+            logger.exception(
+                "Could not record connection pool stats for %s",
+                connection.alias,
+            )
+
+
+def install_pool_metrics_hooks() -> None:
+    """Record pool stats after every request and Celery task."""
+    from celery.signals import task_postrun
+
+    request_finished.connect(_record_all_pools, dispatch_uid="db_pool_metrics")
+    task_postrun.connect(
+        _record_all_pools,
+        dispatch_uid="db_pool_metrics",
+        weak=False,
+    )
@@ -9,19 +9,37 @@ requests instead of processing them again.
 Usage:
     class MyViewSet(IdempotencyMixin, viewsets.ModelViewSet):
         idempotent_actions = ["create", "start_validation"]
+
+Where claims and cached responses live is pluggable through
+``IDEMPOTENCY_STORE`` (a dotted path to an :class:`IdempotencyStore`):
+
+- :class:`DatabaseIdempotencyStore` (default) keeps durable
+  ``IdempotencyKey`` rows, pruned nightly by ``cleanup_idempotency_keys``.
+- :class:`CacheIdempotencyStore` keeps them in the ``IDEMPOTENCY_CACHE``
+  cache. On Redis a claim is one ``SET NX`` and a replay one ``GET``, so an
+  idempotent launch never writes to Postgres for its key, and entries expire
+  on their own TTL instead of waiting for the cleanup task.
 """
 
 import hashlib
 import json
 import logging
+import uuid
+from abc import ABC
+from abc import abstractmethod
 from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
 from functools import wraps
 from http import HTTPStatus
 from typing import Any
 
+from django.conf import settings
+from django.core.cache import caches
 from django.db import IntegrityError
 from django.db import transaction
 from django.utils import timezone
+from django.utils.module_loading import import_string
 from rest_framework.response import Response
 
 from validibot.core.models import IDEMPOTENCY_KEY_TTL_HOURS
@@ -112,8 +130,8 @@ def idempotent(func: Callable) -> Callable:
         endpoint = _get_endpoint_name(self)
         request_hash = compute_request_hash(request)
 
-        # Try to find existing key or create a new one
-        result = _process_idempotency_key(
+        store = get_idempotency_store()
+        claim = store.claim(
             org=org,
             key=idempotency_key,
             endpoint=endpoint,
@@ -121,17 +139,14 @@ def idempotent(func: Callable) -> Callable:
             request=request,
         )
 
-        if result["action"] == "replay":
+        if claim.action == "replay":
             # Return cached response with replay indicator
-            response = Response(
-                result["key_record"].response_body,
-                status=result["key_record"].response_status,
-            )
+            response = Response(claim.response_body, status=claim.response_status)
             response["Idempotent-Replayed"] = "true"
-            response["Original-Request-Id"] = str(result["key_record"].id)
+            response["Original-Request-Id"] = claim.request_id
             return response
 
-        if result["action"] == "conflict":
+        if claim.action == "conflict":
             return Response(
                 {
                     "detail": (
@@ -143,7 +158,7 @@ def idempotent(func: Callable) -> Callable:
                 status=HTTPStatus.CONFLICT,
             )
 
-        if result["action"] == "hash_mismatch":
+        if claim.action == "hash_mismatch":
             return Response(
                 {
                     "detail": (
@@ -156,30 +171,18 @@ def idempotent(func: Callable) -> Callable:
             )
 
         # Process without idempotency (edge case from race condition)
-        if result["action"] == "process_without_idempotency":
+        if claim.action == "process_without_idempotency":
             return func(self, request, *args, **kwargs)
 
         # Process new request
-        key_record = result["key_record"]
         try:
             response = func(self, request, *args, **kwargs)
         except Exception:
-            # On error, try to delete the key record so client can retry.
-            # If we're in a broken transaction, the delete will fail too,
-            # but that's okay - the key record will be unusable anyway.
-            try:
-                key_record.delete()
-            except Exception:
-                logger.debug("Failed to delete key record after error")
+            # On error, release the claim so the client can retry.
+            store.release(claim)
             raise
         else:
-            # Cache the response
-            _complete_idempotency_key(
-                key_record=key_record,
-                response=response,
-                validation_run=_extract_validation_run(response),
-            )
-
+            store.complete(claim, response)
             return response
 
     return wrapper
@@ -316,6 +319,18 @@ def _serialize_response_data(data: Any) -> Any:
     return data
 
 
+def _response_body_for_storage(response: Response) -> Any:
+    """Serialize response data for storage, handling UUIDs and other types."""
+    try:
+        return _serialize_response_data(response.data)
+    except Exception:
+        # Fallback: try rendering to JSON and parsing back
+        try:
+            return json.loads(response.rendered_content)
+        except Exception:
+            return {"_serialization_error": True}
+
+
 def _complete_idempotency_key(
     key_record: IdempotencyKey,
     response: Response,
@@ -325,15 +340,7 @@ def _complete_idempotency_key(
     key_record.status = IdempotencyKeyStatus.COMPLETED
     key_record.response_status = response.status_code
 
-    # Serialize response data for storage, handling UUIDs and other types
-    try:
-        key_record.response_body = _serialize_response_data(response.data)
-    except Exception:
-        # Fallback: try rendering to JSON and parsing back
-        try:
-            key_record.response_body = json.loads(response.rendered_content)
-        except Exception:
-            key_record.response_body = {"_serialization_error": True}
+    key_record.response_body = _response_body_for_storage(response)
 
     if validation_run:
         key_record.validation_run = validation_run
@@ -356,6 +363,180 @@ def _extract_validation_run(response: Response):
     return None
 
 
+@dataclass(frozen=True)
+class IdempotencyClaim:
+    """What an :class:`IdempotencyStore` decided about an incoming key.
+
+    ``action`` is one of ``"process"``, ``"replay"``, ``"conflict"``,
+    ``"hash_mismatch"`` or ``"process_without_idempotency"``. Replays carry
+    the cached response; ``handle`` is whatever the store needs to complete
+    or release a ``"process"`` claim later.
+    """
+
+    action: str
+    request_id: str = ""
+    response_status: int | None = None
+    response_body: Any = None
+    handle: Any = None
+
+
+class IdempotencyStore(ABC):
+    """Claims idempotency keys and remembers the responses they produced."""
+
+    @abstractmethod
+    def claim(
+        self,
+        *,
+        org,
+        key: str,
+        endpoint: str,
+        request_hash: str,
+        request,
+    ) -> IdempotencyClaim:
+        """Decide how to handle a request carrying ``key``."""
+
+    @abstractmethod
+    def complete(self, claim: IdempotencyClaim, response: Response) -> None:
+        """Remember ``response`` for replay against a ``"process"`` claim."""
+
+    @abstractmethod
+    def release(self, claim: IdempotencyClaim) -> None:
+        """Drop a ``"process"`` claim so the key can be retried."""
+
+
+class DatabaseIdempotencyStore(IdempotencyStore):
+    """Durable ``IdempotencyKey`` rows in Postgres (the default store)."""
+
+    def claim(
+        self,
+        *,
+        org,
+        key: str,
+        endpoint: str,
+        request_hash: str,
+        request,
+    ) -> IdempotencyClaim:
+        result = _process_idempotency_key(
+            org=org,
+            key=key,
+            endpoint=endpoint,
+            request_hash=request_hash,
+            request=request,
+        )
+        record = result["key_record"]
+        if record is None:
+            return IdempotencyClaim(action=result["action"])
+        return IdempotencyClaim(
+            action=result["action"],
+            request_id=str(record.id),
+            response_status=record.response_status,
+            response_body=record.response_body,
+            handle=record,
+        )
+
+    def complete(self, claim: IdempotencyClaim, response: Response) -> None:
+        _complete_idempotency_key(
+            key_record=claim.handle,
+            response=response,
+            validation_run=_extract_validation_run(response),
+        )
+
+    def release(self, claim: IdempotencyClaim) -> None:
+        # If we're in a broken transaction, the delete will fail too,
+        # but that's okay - the key record will be unusable anyway.
+        try:
+            claim.handle.delete()
+        except Exception:
+            logger.debug("Failed to delete key record after error")
+
+
+class CacheIdempotencyStore(IdempotencyStore):
+    """Claims and cached responses in a Django cache (Redis in production).
+
+    A claim is ``cache.add`` — ``SET NX`` on Redis — so of two concurrent
+    requests with the same key exactly one processes and the other sees
+    ``"conflict"``. An in-flight claim expires after
+    ``IDEMPOTENCY_PROCESSING_TIMEOUT_SECONDS`` so a crashed worker cannot
+    block its key for the whole TTL; a completed response is kept for
+    ``IDEMPOTENCY_KEY_TTL_HOURS`` and then simply disappears.
+    """
+
+    def __init__(self, alias: str | None = None) -> None:
+        self.cache = caches[alias or settings.IDEMPOTENCY_CACHE]
+
+    def claim(
+        self,
+        *,
+        org,
+        key: str,
+        endpoint: str,
+        request_hash: str,
+        request,
+    ) -> IdempotencyClaim:
+        # Keys are client-chosen and up to 255 characters; hash them so the
+        # cache key stays short and valid on every backend.
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        cache_key = f"idempotency:{org.pk}:{endpoint}:{digest}"
+        request_id = str(uuid.uuid4())
+        entry = {
+            "id": request_id,
+            "status": IdempotencyKeyStatus.PROCESSING.value,
+            "request_hash": request_hash,
+        }
+        if self.cache.add(
+            cache_key,
+            entry,
+            timeout=settings.IDEMPOTENCY_PROCESSING_TIMEOUT_SECONDS,
+        ):
+            return IdempotencyClaim(
+                action="process",
+                request_id=request_id,
+                handle=cache_key,
+            )
+
+        existing = self.cache.get(cache_key)
+        if existing is None:
+            # The other claim expired between our add and get.
+            return IdempotencyClaim(action="process_without_idempotency")
+        if existing["request_hash"] != request_hash:
+            return IdempotencyClaim(action="hash_mismatch", request_id=existing["id"])
+        if existing["status"] == IdempotencyKeyStatus.PROCESSING:
+            return IdempotencyClaim(action="conflict", request_id=existing["id"])
+        return IdempotencyClaim(
+            action="replay",
+            request_id=existing["id"],
+            response_status=existing["response_status"],
+            response_body=existing["response_body"],
+        )
+
+    def complete(self, claim: IdempotencyClaim, response: Response) -> None:
+        entry = self.cache.get(claim.handle)
+        if entry is None or entry["id"] != claim.request_id:
+            # Our claim timed out and another request took the key; its
+            # response is the one to replay.
+            return
+        self.cache.set(
+            claim.handle,
+            {
+                **entry,
+                "status": IdempotencyKeyStatus.COMPLETED.value,
+                "response_status": response.status_code,
+                "response_body": _response_body_for_storage(response),
+            },
+            timeout=int(timedelta(hours=IDEMPOTENCY_KEY_TTL_HOURS).total_seconds()),
+        )
+
+    def release(self, claim: IdempotencyClaim) -> None:
+        entry = self.cache.get(claim.handle)
+        if entry is not None and entry["id"] == claim.request_id:
+            self.cache.delete(claim.handle)
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """Instantiate the store named by ``IDEMPOTENCY_STORE``."""
+    return import_string(settings.IDEMPOTENCY_STORE)()
+
+
 class IdempotencyMixin:
     """
     Mixin for DRF views that provides idempotency key support.
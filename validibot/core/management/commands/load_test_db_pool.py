@@ -0,0 +1,269 @@
+"""Load-test database connection handling under concurrent validation runs.
+
+Simulates ``--runs`` validation runs on ``--concurrency`` threads against the
+configured Postgres, once with a persistent connection per thread (the
+``CONN_MAX_AGE`` setup) and once through a connection pool, and reports for
+each how many server connections were open (sampled from
+``pg_stat_activity``), how many were opened, and the run latency
+percentiles. Each simulated run issues its queries in two halves around a
+``--step-seconds`` pause standing in for a validator container, during
+which the pooled mode hands its connection back as the Docker backend does.
+
+Point it at a local Postgres; it only runs ``SELECT 1`` and reads
+``pg_stat_activity``, so it writes nothing::
+
+    python manage.py load_test_db_pool --runs 400 --concurrency 32
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import DEFAULT_DB_ALIAS
+from django.db import connections
+
+from validibot.core.db_pool import pool_for
+from validibot.core.db_pool import released_connection
+
+if TYPE_CHECKING:
+    from django.db.backends.base.base import BaseDatabaseWrapper
+
+MODES = ("persistent", "pooled")
+
+# pg_stat_activity is sampled this often while the runs are in flight.
+_SAMPLE_INTERVAL_SECONDS = 0.01
+
+
+class Command(BaseCommand):
+    """Compare persistent and pooled connections under concurrent runs."""
+
+    help = (
+        "Simulate concurrent validation runs and report server connection "
+        "counts and latency with persistent and pooled connections."
+    )
+
+    def add_arguments(self, parser):
+        """Register load shape, pool size, mode and output options."""
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=200,
+            help="Simulated validation runs per mode (default: 200).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=32,
+            help="Runs in flight at once, one thread each (default: 32).",
+        )
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=20,
+            help="Queries per run, split around the validator step (default: 20).",
+        )
+        parser.add_argument(
+            "--step-seconds",
+            type=float,
+            default=0.2,
+            help="Time each run spends in its validator step (default: 0.2).",
+        )
+        parser.add_argument(
+            "--pool-max-size",
+            type=int,
+            default=4,
+            help="Pool size for the pooled mode (default: 4).",
+        )
+        parser.add_argument(
+            "--mode",
+            choices=[*MODES, "both"],
+            default="both",
+            help="Connection handling to measure (default: both).",
+        )
+        parser.add_argument(
+            "--output",
+            default="",
+            help="Write the JSON report to this path instead of stdout.",
+        )
+
+    def handle(self, *args, **options):
+        """Run the load for each selected mode and write the report."""
+        for name in ("runs", "concurrency", "pool_max_size"):
+            if options[name] < 1:
+                flag = name.replace("_", "-")
+                raise CommandError(f"--{flag} must be greater than zero")
+        modes = MODES if options["mode"] == "both" else (options["mode"],)
+
+        results = [_run_load(mode, options) for mode in modes]
+
+        rendered = json.dumps({"results": results}, indent=2, sort_keys=True)
+        output = options["output"]
+        if output:
+            Path(output).write_text(rendered + "\n", encoding="utf-8")
+            for result in results:
+                self.stdout.write(
+                    f"{result['mode']}: peak {result['connections']['peak']} "
+                    f"connections, p95 {result['latency_seconds']['p95']}s",
+                )
+            return
+        self.stdout.write(rendered)
+
+
+def _template(mode: str, *, pool_max_size: int = 1) -> BaseDatabaseWrapper:
+    """A connection to the default database, configured for ``mode``.
+
+    Worker threads each use a ``copy()`` of it sharing its pool: separate
+    connections that never touch the process's own ``default`` one, under
+    the same alias so ``django.contrib.postgres`` finds its type OIDs.
+    """
+    template = connections[DEFAULT_DB_ALIAS].copy()
+    # Django keeps pools per alias on the class; this one must not be shared
+    # with, or closed over, the process's own ``default`` pool.
+    template._connection_pools = {}
+    config = template.settings_dict
+    options = config.setdefault("OPTIONS", {})
+    options.pop("pool", None)
+    # Tags the connections so the monitor counts only this mode's.
+    options["application_name"] = f"validibot-load-test-{mode}"
+    config["CONN_HEALTH_CHECKS"] = True
+    if mode == "pooled":
+        config["CONN_MAX_AGE"] = 0
+        options["pool"] = {"min_size": 1, "max_size": pool_max_size}
+    else:
+        config["CONN_MAX_AGE"] = None
+    return template
+
+
+def _run_load(mode: str, options: dict) -> dict:
+    template = _template(mode, pool_max_size=options["pool_max_size"])
+    local = threading.local()
+    lock = threading.Lock()
+    wrappers: list[BaseDatabaseWrapper] = []
+
+    def thread_connection() -> BaseDatabaseWrapper:
+        connection = getattr(local, "connection", None)
+        if connection is None:
+            connection = local.connection = template.copy()
+            connection._connection_pools = template._connection_pools
+            with lock:
+                wrappers.append(connection)
+        return connection
+
+    first_half = options["queries"] // 2
+    second_half = options["queries"] - first_half
+
+    def simulated_run(_index: int) -> float:
+        connection = thread_connection()
+        started = time.perf_counter()
+        _query(connection, first_half)
+        with released_connection(connection):
+            time.sleep(options["step_seconds"])
+        _query(connection, second_half)
+        # What the end of a request or task does: a pooled connection goes
+        # back to the pool, a persistent one stays with the thread.
+        connection.close_if_unusable_or_obsolete()
+        return time.perf_counter() - started
+
+    samples: list[int] = []
+    backends: set[int] = set()
+    stop = threading.Event()
+    sampler = threading.Thread(
+        target=_sample_connections,
+        args=(
+            template.settings_dict["OPTIONS"]["application_name"],
+            samples,
+            backends,
+            stop,
+        ),
+        daemon=True,
+    )
+    sampler.start()
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+            latencies = sorted(executor.map(simulated_run, range(options["runs"])))
+        wall_seconds = time.perf_counter() - started
+    finally:
+        stop.set()
+        sampler.join()
+        _close(template, wrappers)
+
+    return {
+        "mode": mode,
+        "runs": options["runs"],
+        "concurrency": options["concurrency"],
+        "queries_per_run": options["queries"],
+        "step_seconds": options["step_seconds"],
+        "pool_max_size": options["pool_max_size"] if mode == "pooled" else None,
+        "connections": {
+            "peak": max(samples, default=0),
+            "mean": round(statistics.fmean(samples), 1) if samples else 0,
+            # Distinct server backends seen while sampling.
+            "opened": len(backends),
+        },
+        "latency_seconds": {
+            "p50": _percentile(latencies, 0.50),
+            "p95": _percentile(latencies, 0.95),
+            "p99": _percentile(latencies, 0.99),
+            "max": round(latencies[-1], 4),
+        },
+        "runs_per_second": round(options["runs"] / wall_seconds, 1),
+    }
+
+
+def _query(connection, count: int) -> None:
+    with connection.cursor() as cursor:
+        for _ in range(count):
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+
+
+def _sample_connections(
+    application_name: str,
+    samples: list[int],
+    backends: set[int],
+    stop: threading.Event,
+) -> None:
+    monitor = connections[DEFAULT_DB_ALIAS].copy()
+    monitor.settings_dict.setdefault("OPTIONS", {}).pop("pool", None)
+    monitor.settings_dict["CONN_MAX_AGE"] = None
+    try:
+        with monitor.cursor() as cursor:
+            while not stop.is_set():
+                cursor.execute(
+                    "SELECT pid FROM pg_stat_activity WHERE application_name = %s",
+                    [application_name],
+                )
+                pids = [row[0] for row in cursor.fetchall()]
+                samples.append(len(pids))
+                backends.update(pids)
+                stop.wait(_SAMPLE_INTERVAL_SECONDS)
+    finally:
+        monitor.close()
+
+
+def _close(template: BaseDatabaseWrapper, wrappers: list) -> None:
+    """Close every worker thread's connection, then the pool."""
+    for wrapper in wrappers:
+        # The worker threads are gone; closing from here is safe.
+        wrapper.inc_thread_sharing()
+        try:
+            wrapper.close()
+        finally:
+            wrapper.dec_thread_sharing()
+    if pool_for(template) is not None:
+        template.close_pool()
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    index = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return round(ordered[index], 4)
@@ -0,0 +1,684 @@
+"""
+In-process metrics with Prometheus text exposition.
+
+Validibot had no live performance numbers: the only latency view was the
+offline ``report_validator_execution_latency`` command built from
+``ExecutionAttempt`` timestamps. This module is a deliberately small metrics
+subsystem — counters, gauges and fixed-bucket histograms — that hot paths can
+update cheaply and that the worker serves at ``/metrics`` for scraping.
+
+Usage::
+
+    from validibot.core import metrics
+
+    STEP_SECONDS = metrics.histogram(
+        "validibot_step_duration_seconds",
+        "Wall-clock time to execute one validator step.",
+        labelnames=("validation_type", "outcome"),
+    )
+    STEP_SECONDS.labels(validation_type="JSON_SCHEMA", outcome="passed").observe(0.2)
+
+Metrics are declared at module level next to the code they measure.
+Declaring the same name twice returns the existing metric (so module reloads
+are harmless) but declaring it with a different type or label set is an error.
+For per-row hot paths, bind ``labels(...)`` once at module level: the bound
+child precomputes its storage keys, so an update is one dict lookup under a
+lock.
+
+Storage
+-------
+
+By default samples live in process memory, which is right for tests, the
+development server and single-process deployments.
+
+Gunicorn and Celery prefork run several processes, and a scrape only reaches
+one of them. When ``METRICS_MULTIPROC_DIR`` is set, every process writes its
+samples to its own memory-mapped file in that directory and the exposition
+endpoint sums them. Counters and histograms from exited processes are kept,
+so totals stay monotonic across worker recycling; gauges from exited
+processes are dropped. The directory should be empty when the service starts
+(``start.sh`` clears it) and shared by every process that should appear in
+the same scrape.
+
+Histograms use fixed buckets. Prometheus derives quantiles from them
+(``histogram_quantile(0.95, rate(..._bucket[5m]))``), which is what p95
+regression alerts are built on.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from abc import ABC
+from abc import abstractmethod
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import ClassVar
+
+from django.conf import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from a fast CEL batch up to a long simulation.
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    900.0,
+)
+
+EXPOSITION_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_METRIC_NAME_RE = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+# Storage kinds: gauges are kept apart so samples from exited processes can
+# be dropped for them only.
+_MONOTONIC = "counter"
+_GAUGE = "gauge"
+
+
+class MetricsError(ValueError):
+    """A metric was declared or used inconsistently."""
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Sample stores
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class _NullStore:
+    """Store used when ``METRICS_ENABLED`` is off: every update is a no-op."""
+
+    def add(self, kind: str, key: str, amount: float) -> None:
+        return
+
+    def set(self, kind: str, key: str, value: float) -> None:
+        return
+
+    def collect(self) -> dict[str, float]:
+        return {}
+
+    def reset(self) -> None:
+        return
+
+
+class _LocalStore:
+    """Samples held in this process's memory."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: dict[str, float] = {}
+
+    def add(self, kind: str, key: str, amount: float) -> None:
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set(self, kind: str, key: str, value: float) -> None:
+        with self._lock:
+            self._values[key] = value
+
+    def collect(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class _MmapTable:
+    """One process's append-only ``key → float64`` table in a mapped file.
+
+    Layout: an 8-byte header holding the number of used bytes, then records of
+    ``uint32 key length | key bytes | padding to 8 | float64 value``. A new
+    record is fully written before the header is advanced, and values are
+    8-byte aligned, so a concurrent reader never sees a torn record.
+    """
+
+    _INITIAL_SIZE = 64 * 1024
+    _HEADER = struct.Struct("<Q")
+    _KEY_LENGTH = struct.Struct("<I")
+    _VALUE = struct.Struct("<d")
+
+    def __init__(self, path: Path) -> None:
+        descriptor = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._file = os.fdopen(descriptor, "r+b")
+        size = os.fstat(self._file.fileno()).st_size
+        if size == 0:
+            self._file.truncate(self._INITIAL_SIZE)
+            size = self._INITIAL_SIZE
+        self._capacity = size
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self._positions: dict[str, int] = {}
+        used = self._HEADER.unpack_from(self._map, 0)[0]
+        if used == 0:
+            self._HEADER.pack_into(self._map, 0, self._HEADER.size)
+        else:
+            for key, _value, position in _iter_records(self._map, used):
+                self._positions[key] = position
+
+    def add(self, key: str, amount: float) -> None:
+        position = self._position(key)
+        current = self._VALUE.unpack_from(self._map, position)[0]
+        self._VALUE.pack_into(self._map, position, current + amount)
+
+    def set(self, key: str, value: float) -> None:
+        self._VALUE.pack_into(self._map, self._position(key), value)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def _position(self, key: str) -> int:
+        position = self._positions.get(key)
+        if position is None:
+            position = self._append(key)
+            self._positions[key] = position
+        return position
+
+    def _append(self, key: str) -> int:
+        encoded = key.encode("utf-8")
+        padded = _align8(self._KEY_LENGTH.size + len(encoded))
+        record_size = padded + self._VALUE.size
+        used = self._HEADER.unpack_from(self._map, 0)[0]
+        if used + record_size > self._capacity:
+            self._grow(used + record_size)
+        self._KEY_LENGTH.pack_into(self._map, used, len(encoded))
+        key_start = used + self._KEY_LENGTH.size
+        self._map[key_start : key_start + len(encoded)] = encoded
+        value_position = used + padded
+        self._VALUE.pack_into(self._map, value_position, 0.0)
+        self._HEADER.pack_into(self._map, 0, used + record_size)
+        return value_position
+
+    def _grow(self, needed: int) -> None:
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        self._map.close()
+        self._file.truncate(capacity)
+        self._map = mmap.mmap(self._file.fileno(), capacity)
+        self._capacity = capacity
+
+
+def _align8(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _iter_records(buffer, used: int) -> Iterator[tuple[str, float, int]]:
+    """Yield ``(key, value, value_position)`` for each record in a table."""
+    offset = _MmapTable._HEADER.size
+    while offset < used:
+        (length,) = _MmapTable._KEY_LENGTH.unpack_from(buffer, offset)
+        key_start = offset + _MmapTable._KEY_LENGTH.size
+        key = bytes(buffer[key_start : key_start + length]).decode("utf-8")
+        value_position = offset + _align8(_MmapTable._KEY_LENGTH.size + length)
+        (value,) = _MmapTable._VALUE.unpack_from(buffer, value_position)
+        yield key, value, value_position
+        offset = value_position + _MmapTable._VALUE.size
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class _MultiprocessStore:
+    """Per-process mapped files in a shared directory, summed on collect."""
+
+    def __init__(self, directory: str) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._tables: dict[str, _MmapTable] = {}
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def add(self, kind: str, key: str, amount: float) -> None:
+        with self._lock:
+            self._table(kind).add(key, amount)
+
+    def set(self, kind: str, key: str, value: float) -> None:
+        with self._lock:
+            self._table(kind).set(key, value)
+
+    def collect(self) -> dict[str, float]:
+        totals: dict[str, float] = defaultdict(float)
+        for path in sorted(self._directory.glob("*.db")):
+            kind, _, pid_text = path.stem.partition("_")
+            if kind == _GAUGE and pid_text.isdigit() and not _pid_alive(int(pid_text)):
+                continue
+            data = path.read_bytes()
+            if len(data) < _MmapTable._HEADER.size:
+                continue
+            used = min(_MmapTable._HEADER.unpack_from(data, 0)[0], len(data))
+            for key, value, _position in _iter_records(data, used):
+                totals[key] += value
+        return dict(totals)
+
+    def reset(self) -> None:
+        with self._lock:
+            for table in self._tables.values():
+                table.close()
+            self._tables.clear()
+            for path in self._directory.glob("*.db"):
+                path.unlink(missing_ok=True)
+
+    def _table(self, kind: str) -> _MmapTable:
+        table = self._tables.get(kind)
+        if table is None:
+            table = _MmapTable(self._directory / f"{kind}_{self._pid}.db")
+            self._tables[kind] = table
+        return table
+
+    def _after_fork(self) -> None:
+        # The child must not write through the parent's mappings, and a lock
+        # held by another parent thread at fork time would never be released.
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._tables = {}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Metrics
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _sample_key(name: str, metric_type: str, labels: Sequence[tuple[str, str]]):
+    """Encode one sample's identity; the type travels with it across processes."""
+    return json.dumps([name, metric_type, list(labels)], separators=(",", ":"))
+
+
+class _Metric(ABC):
+    metric_type: ClassVar[str]
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+    ) -> None:
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._children_lock = threading.Lock()
+
+    def labels(self, **labels: object):
+        """Return the child for one label combination (cached)."""
+        if set(labels) != set(self.labelnames):
+            msg = (
+                f"{self.name} expects labels {sorted(self.labelnames)}, "
+                f"got {sorted(labels)}"
+            )
+            raise MetricsError(msg)
+        values = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(values)
+        if child is None:
+            with self._children_lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._make_child(
+                        tuple(zip(self.labelnames, values, strict=True)),
+                    )
+                    self._children[values] = child
+        return child
+
+    def _unlabelled(self):
+        if self.labelnames:
+            msg = f"{self.name} has labels; call labels(...) first"
+            raise MetricsError(msg)
+        return self.labels()
+
+    @abstractmethod
+    def _make_child(self, labels: tuple[tuple[str, str], ...]):
+        """Build the child that records samples for one label combination."""
+
+
+class _CounterChild:
+    def __init__(self, registry, name: str, labels) -> None:
+        self._registry = registry
+        self._key = _sample_key(name, "counter", labels)
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            msg = "Counters can only increase"
+            raise MetricsError(msg)
+        self._registry.store.add(_MONOTONIC, self._key, amount)
+
+
+class Counter(_Metric):
+    """A monotonically increasing total; names must end in ``_total``."""
+
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def _make_child(self, labels):
+        return _CounterChild(self._registry, self.name, labels)
+
+
+class _GaugeChild:
+    def __init__(self, registry, name: str, labels) -> None:
+        self._registry = registry
+        self._key = _sample_key(name, "gauge", labels)
+
+    def set(self, value: float) -> None:
+        self._registry.store.set(_GAUGE, self._key, float(value))
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._registry.store.add(_GAUGE, self._key, amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._registry.store.add(_GAUGE, self._key, -amount)
+
+
+class Gauge(_Metric):
+    """A value that can go up and down, summed across live processes."""
+
+    metric_type = "gauge"
+
+    def set(self, value: float) -> None:
+        self._unlabelled().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabelled().dec(amount)
+
+    def _make_child(self, labels):
+        return _GaugeChild(self._registry, self.name, labels)
+
+
+class _HistogramChild:
+    def __init__(self, registry, name: str, labels, buckets) -> None:
+        self._registry = registry
+        self._buckets = buckets
+        self._bucket_keys = [
+            _sample_key(name, "histogram", (*labels, ("le", _format_value(bound))))
+            for bound in buckets
+        ]
+        self._sum_key = _sample_key(name, "histogram", (*labels, ("__sum__", "")))
+        self._count_key = _sample_key(name, "histogram", (*labels, ("__count__", "")))
+
+    def observe(self, value: float) -> None:
+        store = self._registry.store
+        # Buckets are stored non-cumulatively (one write per observation) and
+        # made cumulative at exposition time.
+        for bound, key in zip(self._buckets, self._bucket_keys, strict=True):
+            if value <= bound:
+                store.add(_MONOTONIC, key, 1.0)
+                break
+        store.add(_MONOTONIC, self._sum_key, value)
+        store.add(_MONOTONIC, self._count_key, 1.0)
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall-clock duration of the ``with`` block, in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class Histogram(_Metric):
+    """Fixed-bucket distribution of observed values (usually seconds)."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        registry,
+        name,
+        documentation,
+        labelnames,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        if "le" in labelnames:
+            msg = "'le' is reserved for histogram buckets"
+            raise MetricsError(msg)
+        bounds = tuple(float(bound) for bound in buckets)
+        if not bounds or list(bounds) != sorted(set(bounds)):
+            msg = f"{name} buckets must be non-empty and strictly increasing"
+            raise MetricsError(msg)
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = bounds
+
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+
+    def time(self):
+        return self._unlabelled().time()
+
+    def _make_child(self, labels):
+        return _HistogramChild(self._registry, self.name, labels, self.buckets)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Registry and exposition
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class MetricsRegistry:
+    """Declared metrics plus the store their samples are written to."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._store = None
+
+    @property
+    def store(self):
+        store = self._store
+        if store is None:
+            with self._lock:
+                if self._store is None:
+                    self._store = self._build_store()
+                store = self._store
+        return store
+
+    @staticmethod
+    def _build_store():
+        if not getattr(settings, "METRICS_ENABLED", True):
+            return _NullStore()
+        directory = getattr(settings, "METRICS_MULTIPROC_DIR", "")
+        if directory:
+            return _MultiprocessStore(directory)
+        return _LocalStore()
+
+    def reset(self) -> None:
+        """Discard all samples and re-read settings on the next update."""
+        with self._lock:
+            if self._store is not None:
+                self._store.reset()
+            self._store = None
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        if not name.endswith("_total"):
+            msg = f"Counter names must end in '_total': {name}"
+            raise MetricsError(msg)
+        return self._declare(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._declare(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        metric = self._declare(
+            Histogram,
+            name,
+            documentation,
+            labelnames,
+            buckets=buckets,
+        )
+        if metric.buckets != tuple(float(bound) for bound in buckets):
+            msg = f"{name} is already declared with different buckets"
+            raise MetricsError(msg)
+        return metric
+
+    def _declare(self, cls, name, documentation, labelnames, **kwargs):
+        if not _METRIC_NAME_RE.match(name):
+            msg = f"Invalid metric name: {name!r}"
+            raise MetricsError(msg)
+        for label in labelnames:
+            if not _LABEL_NAME_RE.match(label) or label.startswith("__"):
+                msg = f"Invalid label name for {name}: {label!r}"
+                raise MetricsError(msg)
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if type(existing) is not cls or existing.labelnames != tuple(
+                    labelnames,
+                ):
+                    msg = f"{name} is already declared with a different shape"
+                    raise MetricsError(msg)
+                return existing
+            metric = cls(self, name, documentation, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def render(self) -> str:
+        """Return every recorded sample in the Prometheus text format."""
+        families: dict[str, tuple[str, list[tuple[list, float]]]] = {}
+        for key, value in self.store.collect().items():
+            name, metric_type, labels = json.loads(key)
+            families.setdefault(name, (metric_type, []))[1].append((labels, value))
+
+        lines: list[str] = []
+        for name in sorted(families):
+            metric_type, samples = families[name]
+            metric = self._metrics.get(name)
+            if metric is not None and metric.documentation:
+                lines.append(f"# HELP {name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            if metric_type == "histogram":
+                bounds = metric.buckets if isinstance(metric, Histogram) else ()
+                lines.extend(_render_histogram(name, samples, bounds))
+            else:
+                lines.extend(
+                    f"{name}{_format_labels(labels)} {_format_value(value)}"
+                    for labels, value in sorted(samples)
+                )
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _render_histogram(name: str, samples, bounds: Sequence[float]) -> list[str]:
+    """Render cumulative buckets, emitting every declared bound every time.
+
+    Quantile queries need each bucket series to exist on every scrape, so
+    empty buckets declared on the metric are rendered as zero.
+    """
+    series: dict[tuple, dict] = defaultdict(
+        lambda: {"buckets": {}, "sum": 0.0, "count": 0.0},
+    )
+    for labels, value in samples:
+        base = tuple(
+            (label, label_value)
+            for label, label_value in labels
+            if label not in {"le", "__sum__", "__count__"}
+        )
+        entry = series[base]
+        label_names = {label for label, _value in labels}
+        if "__sum__" in label_names:
+            entry["sum"] += value
+        elif "__count__" in label_names:
+            entry["count"] += value
+        else:
+            bound = float(dict(labels)["le"])
+            entry["buckets"][bound] = entry["buckets"].get(bound, 0.0) + value
+
+    lines = []
+    for base in sorted(series):
+        entry = series[base]
+        for bound in bounds:
+            entry["buckets"].setdefault(bound, 0.0)
+        cumulative = 0.0
+        for bound in sorted(entry["buckets"]):
+            cumulative += entry["buckets"][bound]
+            labels = [*base, ("le", _format_value(bound))]
+            lines.append(
+                f"{name}_bucket{_format_labels(labels)} {_format_value(cumulative)}",
+            )
+        labels = [*base, ("le", "+Inf")]
+        lines.append(
+            f"{name}_bucket{_format_labels(labels)} {_format_value(entry['count'])}",
+        )
+        lines.append(f"{name}_sum{_format_labels(base)} {_format_value(entry['sum'])}")
+        lines.append(
+            f"{name}_count{_format_labels(base)} {_format_value(entry['count'])}",
+        )
+    return lines
+
+
+def _format_labels(labels) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(
+        f'{label}="{_escape_label_value(value)}"' for label, value in labels
+    )
+    return "{" + rendered + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+REGISTRY = MetricsRegistry()
+
+counter = REGISTRY.counter
+gauge = REGISTRY.gauge
+histogram = REGISTRY.histogram
+render_latest = REGISTRY.render
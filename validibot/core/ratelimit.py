@@ -1,10 +1,33 @@
 """
-Cache-based rate limiting for Django views.
+Sliding-window rate limiting.
 
-Provides a simple ``@rate_limit`` decorator that uses Django's cache
-framework to throttle requests by IP address. This avoids adding an
-external dependency (like django-ratelimit) while providing effective
-protection against automated abuse.
+Every quota in Validibot goes through :func:`hit`, which records one request
+against a key and answers whether it fits the quota. The window slides: a
+quota of ``10/m`` admits at most ten requests in *any* 60-second span, so a
+burst straddling a window edge cannot double the effective rate the way the
+old fixed-window counters could.
+
+Three engines implement the same contract, chosen by the backend of the
+cache named by ``RATE_LIMIT_CACHE``:
+
+- **Redis** — for Django's ``RedisCache``. Each key is a sorted set of hit
+  timestamps, pruned, counted and appended by one Lua script, so the
+  check-and-record is atomic across every process and instance sharing the
+  Redis. The script reads the clock from Redis itself, so instances with
+  skewed clocks still agree.
+- **Shared cache** — for every other shared backend (the ``DatabaseCache``
+  production falls back to without Redis, Memcached, ...). The window is
+  split into ``_SHARED_BUCKETS`` fixed sub-windows, each one cache counter
+  created with ``cache.add`` and bumped with ``cache.incr``. A hit counts
+  the buckets inside the window plus the expired share of the oldest one,
+  an approximate sliding window. The budget is shared by every process and
+  instance. ``DatabaseCache``'s ``incr`` is a read then a write, so under
+  heavy contention on one key a few extra requests can slip through.
+- **In-process** — for ``LocMemCache`` and ``DummyCache`` (local runs,
+  tests), which no two processes share anyway. The same sliding log kept in
+  a dict under a lock. Exact within one process; each process enforces its
+  own budget. If a shared cache is configured but fails, hits fall back
+  here rather than failing every request.
 
 Usage::
 
@@ -15,36 +38,47 @@ Usage::
         def post(self, request):
             ...
 
-Rate format: ``"<count>/<period>"`` where period is one of:
+Rate format: ``"<count>/<period>"`` where period starts with one of:
     - ``s`` — seconds
     - ``m`` — minutes
     - ``h`` — hours
+    - ``d`` — days
 
-The decorator extracts the client IP from the request (respecting
-X-Forwarded-For when behind a reverse proxy) and returns a 429
-response when the rate is exceeded.
-
-Limitations:
-    - Uses Django's default cache (LocMemCache unless configured).
-      With LocMemCache, rate limits are per-process — each Cloud Run
-      instance enforces independently. This is acceptable for most
-      abuse scenarios (attackers typically hit the same instance via
-      keep-alive connections). For stricter enforcement, configure
-      a shared cache backend (Redis/Memcached).
-    - No user-level scoping — only IP-based. Use allauth's built-in
-      rate limits for user/key-scoped throttling.
+so DRF-style rates such as ``"60/minute"`` parse too.
+
+Responses carry the ``RateLimit-Limit``, ``RateLimit-Remaining`` and
+``RateLimit-Reset`` headers, plus ``Retry-After`` when the request is
+refused. DRF endpoints get per-credential and per-org quotas through
+:class:`validibot.core.throttles.QuotaThrottle`, which uses the same engine.
 """
 
 from __future__ import annotations
 
 import functools
 import logging
+import math
 import re
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
 from http import HTTPStatus
+from typing import TYPE_CHECKING
 
-from django.core.cache import cache
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
 from django.http import HttpRequest
 from django.http import HttpResponse
+from redis.exceptions import RedisError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.core.cache.backends.base import BaseCache
 
 logger = logging.getLogger(__name__)
 
@@ -53,23 +87,276 @@ _PERIOD_MAP = {
     "s": 1,
     "m": 60,
     "h": 3600,
+    "d": 86400,
 }
 
-_RATE_PATTERN = re.compile(r"^(\d+)/([smh])$")
+_RATE_PATTERN = re.compile(r"^(\d+)/([smhd])[a-z]*$")
+
+# The in-process engine sweeps idle keys once it tracks this many.
+_LOCAL_SWEEP_THRESHOLD = 10_000
+
+# Sub-windows per quota window in the shared-cache engine. More buckets track
+# a true sliding window more closely at the cost of a wider ``get_many``.
+_SHARED_BUCKETS = 10
 
+# Backends private to one process; only these use the in-process engine.
+_PROCESS_LOCAL_CACHES = (LocMemCache, DummyCache)
 
-def _parse_rate(rate_str: str) -> tuple[int, int]:
-    """Parse a rate string like '10/m' into (max_requests, window_seconds)."""
-    match = _RATE_PATTERN.match(rate_str)
-    if not match:
-        msg = (
-            f"Invalid rate format: '{rate_str}'. "
-            "Expected format: '<count>/<period>' where period is s, m, or h."
+# KEYS[1]: sorted set of hit timestamps in milliseconds (Lua stringifies
+# numbers with 14 significant digits, so microseconds would lose precision).
+# ARGV[1]: request limit; ARGV[2]: window in milliseconds; ARGV[3]: a unique
+# suffix so two hits in the same millisecond stay distinct members.
+# Returns {allowed, remaining, milliseconds until the oldest hit expires}.
+_SLIDING_WINDOW_LUA = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+local reset = window
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window - now
+end
+if count >= limit then
+    return {0, 0, reset}
+end
+redis.call('ZADD', KEYS[1], now, now .. ':' .. ARGV[3])
+redis.call('PEXPIRE', KEYS[1], window)
+return {1, limit - count - 1, reset}
+"""
+
+
+@dataclass(frozen=True)
+class Quota:
+    """At most ``limit`` requests in any ``window_seconds`` span."""
+
+    limit: int
+    window_seconds: int
+
+    @classmethod
+    def parse(cls, rate_str: str) -> Quota:
+        """Parse a rate string like ``'10/m'`` or ``'60/minute'``."""
+        match = _RATE_PATTERN.match(rate_str)
+        if not match:
+            msg = (
+                f"Invalid rate format: '{rate_str}'. "
+                "Expected format: '<count>/<period>' where period is s, m, h, or d."
+            )
+            raise ValueError(msg)
+        return cls(
+            limit=int(match.group(1)),
+            window_seconds=_PERIOD_MAP[match.group(2)],
         )
-        raise ValueError(msg)
-    count = int(match.group(1))
-    period = _PERIOD_MAP[match.group(2)]
-    return count, period
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """The outcome of recording one request against a quota.
+
+    ``reset_seconds`` is how long until the oldest counted request leaves
+    the window — i.e. until at least one more request would be admitted.
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_seconds: int
+
+
+class LocalSlidingWindow:
+    """Exact sliding-window log kept in this process's memory."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hits: dict[str, tuple[int, deque[float]]] = {}
+
+    def hit(self, key: str, quota: Quota) -> RateLimitDecision:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._hits) >= _LOCAL_SWEEP_THRESHOLD:
+                self._sweep(now)
+            _window, hits = self._hits.setdefault(
+                key,
+                (quota.window_seconds, deque()),
+            )
+            cutoff = now - quota.window_seconds
+            while hits and hits[0] <= cutoff:
+                hits.popleft()
+            allowed = len(hits) < quota.limit
+            if allowed:
+                hits.append(now)
+            reset = hits[0] + quota.window_seconds - now if hits else 0
+            return RateLimitDecision(
+                allowed=allowed,
+                limit=quota.limit,
+                remaining=quota.limit - len(hits),
+                reset_seconds=math.ceil(reset),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hits.clear()
+
+    def _sweep(self, now: float) -> None:
+        idle = [
+            key
+            for key, (window, hits) in self._hits.items()
+            if not hits or hits[-1] <= now - window
+        ]
+        for key in idle:
+            del self._hits[key]
+
+
+_local_limiter = LocalSlidingWindow()
+
+
+def _redis_hit(cache: RedisCache, key: str, quota: Quota) -> RateLimitDecision:
+    # Going through the cache's own client and key function keeps rate-limit
+    # keys under the environment's KEY_PREFIX like every other cache entry.
+    cache_key = cache.make_and_validate_key(key)
+    client = cache._cache.get_client(cache_key, write=True)
+    script = client.register_script(_SLIDING_WINDOW_LUA)
+    allowed, remaining, reset_millis = script(
+        keys=[cache_key],
+        args=[quota.limit, quota.window_seconds * 1000, uuid.uuid4().hex],
+    )
+    return RateLimitDecision(
+        allowed=bool(allowed),
+        limit=quota.limit,
+        remaining=int(remaining),
+        reset_seconds=math.ceil(int(reset_millis) / 1000),
+    )
+
+
+def _shared_cache_hit(cache: BaseCache, key: str, quota: Quota) -> RateLimitDecision:
+    bucket_seconds = quota.window_seconds / _SHARED_BUCKETS
+    position = time.time() / bucket_seconds
+    current = math.floor(position)
+    # The oldest bucket straddles the window's start; only the part of it
+    # still inside the window counts.
+    oldest_weight = 1 - (position - current)
+    bucket_keys = {
+        index: f"ratelimit:{key}:{quota.window_seconds}:{index}"
+        for index in range(current - _SHARED_BUCKETS, current + 1)
+    }
+    current_key = bucket_keys[current]
+    timeout = math.ceil(quota.window_seconds + 2 * bucket_seconds)
+
+    # Record first, then count: incr hands concurrent hitters distinct
+    # totals, so two of them cannot both take the last slot.
+    if cache.add(current_key, 1, timeout=timeout):
+        recorded = 1
+    else:
+        try:
+            recorded = cache.incr(current_key)
+        except ValueError:
+            # Expired between add and incr.
+            cache.add(current_key, 1, timeout=timeout)
+            recorded = 1
+    stored = cache.get_many(list(bucket_keys.values()))
+    counts = {index: int(stored.get(name, 0)) for index, name in bucket_keys.items()}
+    counts[current] = recorded
+    oldest = current - _SHARED_BUCKETS
+    estimate = sum(counts.values()) - counts[oldest] * (1 - oldest_weight)
+
+    allowed = estimate <= quota.limit
+    if not allowed:
+        # Refused requests are not recorded.
+        cache.decr(current_key)
+        counts[current] -= 1
+    remaining = max(0, quota.limit - math.ceil(estimate)) if allowed else 0
+    # Seconds until enough buckets have left the window to admit one more.
+    target = quota.limit - 1 if not allowed else sum(counts.values()) - 1
+    total = sum(counts[index] for index in range(oldest + 1, current + 1))
+    for step in range(_SHARED_BUCKETS + 1):
+        if total <= target:
+            break
+        total -= counts.get(oldest + 1 + step, 0)
+    reset = (current + 1 + step) * bucket_seconds - position * bucket_seconds
+    return RateLimitDecision(
+        allowed=allowed,
+        limit=quota.limit,
+        remaining=remaining,
+        reset_seconds=math.ceil(reset),
+    )
+
+
+def hit(key: str, quota: Quota) -> RateLimitDecision:
+    """Record one request against ``key`` and decide whether it fits ``quota``.
+
+    A refused request is not recorded, so a client hammering a closed
+    window does not push its own reset further out.
+    """
+    cache = caches[settings.RATE_LIMIT_CACHE]
+    if isinstance(cache, RedisCache):
+        try:
+            return _redis_hit(cache, f"ratelimit:{key}", quota)
+        except RedisError:
+            logger.warning(
+                "Redis rate limiter unavailable; enforcing %s in-process",
+                key,
+                exc_info=True,
+            )
+    elif not isinstance(cache, _PROCESS_LOCAL_CACHES):
+        try:
+            return _shared_cache_hit(cache, key, quota)
+        except Exception:
+            logger.warning(
+                "Shared rate limiter unavailable; enforcing %s in-process",
+                key,
+                exc_info=True,
+            )
+    return _local_limiter.hit(key, quota)
+
+
+def reset_local_rate_limits() -> None:
+    """Forget every in-process hit (test isolation)."""
+    _local_limiter.clear()
+
+
+def apply_rate_limit_headers(
+    response: HttpResponse,
+    decision: RateLimitDecision,
+) -> HttpResponse:
+    """Advertise the quota on ``response`` and, if refused, when to retry."""
+    response["RateLimit-Limit"] = str(decision.limit)
+    response["RateLimit-Remaining"] = str(decision.remaining)
+    response["RateLimit-Reset"] = str(decision.reset_seconds)
+    if not decision.allowed:
+        response["Retry-After"] = str(decision.reset_seconds)
+    return response
+
+
+def too_many_requests(decision: RateLimitDecision, message: str) -> HttpResponse:
+    """Build the plain-text 429 returned by non-DRF views."""
+    response = HttpResponse(
+        message,
+        status=HTTPStatus.TOO_MANY_REQUESTS,
+        content_type="text/plain",
+    )
+    return apply_rate_limit_headers(response, decision)
+
+
+class RateLimitHeadersMiddleware:
+    """Copy the decision a DRF throttle stashed on the request onto the response.
+
+    DRF throttles only see the request, so :class:`QuotaThrottle` leaves its
+    tightest decision in ``request.rate_limit`` and this middleware adds the
+    headers once the view has answered. Throttled responses already carry
+    ``Retry-After`` from DRF; the remaining headers are added here.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+        decision = getattr(request, "rate_limit", None)
+        if decision is not None:
+            apply_rate_limit_headers(response, decision)
+        return response
 
 
 def _get_client_ip(request: HttpRequest) -> str:
@@ -85,20 +372,27 @@ def _get_client_ip(request: HttpRequest) -> str:
     return request.META.get("REMOTE_ADDR", "unknown")
 
 
-def rate_limit(rate_str: str, key_prefix: str = "rl"):
-    """Decorator that rate-limits a view by client IP address.
+def rate_limit(
+    rate_str: str,
+    key_prefix: str = "rl",
+    key_func: Callable[[HttpRequest], str] = _get_client_ip,
+):
+    """Decorator that rate-limits a view with a sliding window.
 
     Args:
         rate_str: Rate in ``"count/period"`` format (e.g., ``"10/m"``).
-        key_prefix: Cache key prefix. Use a unique prefix per endpoint
+        key_prefix: Key prefix. Use a unique prefix per endpoint
             to prevent rate limit counters from colliding across
             different views.
+        key_func: Returns who the quota belongs to. Defaults to the
+            client IP; pass e.g. ``lambda r: str(r.user.pk)`` to key
+            by account instead.
 
     Returns:
         429 Too Many Requests when the rate is exceeded, with a
         Retry-After header indicating when the client can retry.
     """
-    max_requests, window_seconds = _parse_rate(rate_str)
+    quota = Quota.parse(rate_str)
 
     def decorator(view_func):
         @functools.wraps(view_func)
@@ -114,41 +408,23 @@ def rate_limit(rate_str: str, key_prefix: str = "rl"):
             if request is None:
                 return view_func(request_or_self, *args, **kwargs)
 
-            ip = _get_client_ip(request)
-            cache_key = f"{key_prefix}:{view_func.__qualname__}:{ip}"
-
-            # Increment the counter for this IP in this window.
-            # cache.get_or_set + cache.incr is atomic in most backends.
-            current = cache.get(cache_key)
-            if current is None:
-                cache.set(cache_key, 1, window_seconds)
-                current = 1
-            else:
-                try:
-                    current = cache.incr(cache_key)
-                except ValueError:
-                    # Key expired between get and incr — reset
-                    cache.set(cache_key, 1, window_seconds)
-                    current = 1
-
-            if current > max_requests:
+            ident = key_func(request)
+            decision = hit(f"{key_prefix}:{view_func.__qualname__}:{ident}", quota)
+            if not decision.allowed:
                 logger.warning(
-                    "Rate limit exceeded: %s from %s (%d/%d in %ds window)",
+                    "Rate limit exceeded: %s from %s (%d in %ds window)",
                     view_func.__qualname__,
-                    ip,
-                    current,
-                    max_requests,
-                    window_seconds,
+                    ident,
+                    quota.limit,
+                    quota.window_seconds,
                 )
-                response = HttpResponse(
+                return too_many_requests(
+                    decision,
                     "Too many requests. Please try again later.",
-                    status=HTTPStatus.TOO_MANY_REQUESTS,
-                    content_type="text/plain",
                 )
-                response["Retry-After"] = str(window_seconds)
-                return response
 
-            return view_func(request_or_self, *args, **kwargs)
+            response = view_func(request_or_self, *args, **kwargs)
+            return apply_rate_limit_headers(response, decision)
 
         return wrapper
 
@@ -100,6 +100,15 @@ def run_created_hooks(validation_run: ValidationRun, **context) -> None:
         hook_fn(validation_run, **context)
 
 
+def has_run_created_hooks() -> bool:
+    """Return whether any run-created hook is registered.
+
+    Bulk launch uses this to skip the per-run savepoint it needs only when a
+    hook might refuse one run of the batch.
+    """
+    return bool(_run_created_hooks)
+
+
 def reset_run_created_hooks() -> None:
     """Clear all registered run-created hooks (for testing)."""
     _run_created_hooks.clear()
@@ -0,0 +1,191 @@
+"""
+Low-overhead sampling CPU profiler producing collapsed stacks.
+
+Span profiles (``validibot.core.spans``) show which phase of a run was slow;
+they cannot show *which code* inside the phase burned the CPU — the one CEL
+expression or regex pattern that went quadratic on a particular submission.
+``StackSampler`` answers that without reproducing the submission: it samples
+Python stacks at a fixed interval and counts identical stacks, producing the
+"collapsed stack" text that flame-graph tools (``flamegraph.pl``, speedscope,
+Firefox Profiler) read directly::
+
+    validibot.validations.cel_eval:evaluate_cel_expression;...;re:match 412
+
+Sampling mode
+-------------
+
+On the main thread of a Unix process (Gunicorn sync workers, Celery prefork
+children) the sampler uses ``SIGPROF`` with ``ITIMER_PROF``: the kernel fires
+the signal every *interval* of process CPU time, so samples land where CPU is
+actually spent and an idle or blocked process records nothing. Elsewhere
+(threaded servers, Windows, nested use) it falls back to a daemon thread that
+samples on wall-clock time.
+
+Expression evaluation runs on the shared ``vb-expr-eval`` pool, so a sample
+covers the profiled thread *and* any busy pool thread; idle pool threads
+(parked in ``queue``/``threading`` waits) are skipped.
+"""
+
+from __future__ import annotations
+
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Self
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+DEFAULT_INTERVAL_S = 0.005
+DEFAULT_MAX_DEPTH = 128
+# Threads whose stacks are sampled alongside the profiled thread.
+DEFAULT_HELPER_THREAD_PREFIXES = ("vb-expr-eval",)
+# A helper thread whose innermost frame lives here is parked, not working.
+_IDLE_MODULE_FILES = frozenset({"threading.py", "queue.py", "selectors.py"})
+
+# Only one signal-driven sampler may own SIGPROF at a time.
+_SIGNAL_LOCK = threading.Lock()
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__") or Path(code.co_filename).stem
+    return f"{module}:{code.co_name}".replace(";", ":").replace(" ", "_")
+
+
+def _collapse(frame: FrameType | None, max_depth: int) -> tuple[str, ...]:
+    labels: list[str] = []
+    while frame is not None and len(labels) < max_depth:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return tuple(labels)
+
+
+class StackSampler:
+    """Sample one thread (plus busy helper threads) into collapsed stacks.
+
+    Use as a context manager or with ``start()``/``stop()``; ``collapsed()``
+    renders the counts. A sampler is single-use.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval_s: float = DEFAULT_INTERVAL_S,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        helper_thread_prefixes: tuple[str, ...] = DEFAULT_HELPER_THREAD_PREFIXES,
+    ) -> None:
+        self.interval_s = interval_s
+        self.max_depth = max_depth
+        self.helper_thread_prefixes = helper_thread_prefixes
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self.sample_count = 0
+        self.mode = ""
+        self._target_ident: int | None = None
+        self._previous_handler = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_at = 0.0
+        self.elapsed_s = 0.0
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._target_ident = threading.get_ident()
+        self._started_at = time.perf_counter()
+        if self._can_use_signal() and _SIGNAL_LOCK.acquire(blocking=False):
+            self.mode = "signal"
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval_s, self.interval_s)
+            return
+        self.mode = "thread"
+        self._thread = threading.Thread(
+            target=self._run_sampler_thread,
+            name="vb-stack-sampler",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self.mode == "signal":
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+            _SIGNAL_LOCK.release()
+        elif self.mode == "thread" and self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+        self.elapsed_s = time.perf_counter() - self._started_at
+        self.mode = f"{self.mode}-stopped"
+
+    def collapsed(self) -> str:
+        """Render ``frame;frame;... count`` lines, heaviest stacks first."""
+        return "".join(
+            f"{';'.join(stack)} {count}\n"
+            for stack, count in sorted(
+                self.samples.items(),
+                key=lambda item: (-item[1], item[0]),
+            )
+        )
+
+    # ── Sampling ──────────────────────────────────────────────────────
+
+    @staticmethod
+    def _can_use_signal() -> bool:
+        return (
+            hasattr(signal, "setitimer")
+            and hasattr(signal, "SIGPROF")
+            and threading.current_thread() is threading.main_thread()
+        )
+
+    def _on_signal(self, signum, frame) -> None:
+        self._take_sample(frames=None, interrupted=frame)
+
+    def _run_sampler_thread(self) -> None:
+        while not self._stop_event.wait(self.interval_s):
+            self._take_sample(frames=sys._current_frames(), interrupted=None)
+
+    def _take_sample(
+        self,
+        *,
+        frames: dict[int, FrameType] | None,
+        interrupted: FrameType | None,
+    ) -> None:
+        if frames is None:
+            frames = sys._current_frames()
+        target = interrupted or frames.get(self._target_ident)
+        if target is not None:
+            self.samples[_collapse(target, self.max_depth)] += 1
+        if self.helper_thread_prefixes:
+            for ident, frame in frames.items():
+                if ident == self._target_ident:
+                    continue
+                name = _thread_name(ident)
+                if not name.startswith(self.helper_thread_prefixes):
+                    continue
+                if _is_idle(frame):
+                    continue
+                pool = name.rsplit("_", 1)[0]
+                self.samples[(pool, *_collapse(frame, self.max_depth))] += 1
+        self.sample_count += 1
+
+
+def _thread_name(ident: int) -> str:
+    # ``threading.enumerate()`` takes a non-reentrant lock, which a signal
+    # handler must never do: the interrupted main thread may hold it. A plain
+    # dict read of the registry is atomic under the GIL.
+    thread = threading._active.get(ident)
+    return thread.name if thread is not None else ""
+
+
+def _is_idle(frame: FrameType) -> bool:
+    return Path(frame.f_code.co_filename).name in _IDLE_MODULE_FILES
@@ -0,0 +1,166 @@
+"""
+Per-run span recorder for opt-in execution profiles.
+
+Aggregate metrics (``validibot.core.metrics``) say *that* runs got slower;
+they cannot say where one particular run spent its time. When
+``VALIDATION_RUN_PROFILING_ENABLED`` is on, the step orchestrator records a
+span tree for each execution pass and stores it with the run summary, so a
+slow run can be opened and read phase by phase.
+
+Usage::
+
+    from validibot.core import spans
+
+    with spans.span("persistence"):
+        persist(...)
+
+    @spans.traced("summary")
+    def build_summary(...): ...
+
+``span()`` is always safe to call. With no recorder active (profiling off,
+or code running outside a run) it returns a shared no-op context, so the
+instrumented hot paths pay one context-variable read.
+
+The recorder lives in a ``ContextVar``, so nested spans attach to whichever
+span is open in the current thread or task. Work pushed to another thread
+does not inherit the recorder unless the context is copied; such work simply
+goes unrecorded.
+
+Sibling spans with the same name and label are merged, so a phase that runs
+once per row batch or once per assertion stage stays a single node carrying
+its total time and a call count. That keeps a profile to a few hundred
+bytes regardless of input size.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from contextlib import contextmanager
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_ACTIVE: ContextVar[SpanRecorder | None] = ContextVar(
+    "validibot_span_recorder",
+    default=None,
+)
+_NOOP = nullcontext()
+
+# Format marker stored alongside the tree; bump if the node shape changes.
+PROFILE_VERSION = 1
+
+
+class _SpanNode:
+    __slots__ = ("children", "count", "label", "name", "seconds")
+
+    def __init__(self, name: str, label: str = "") -> None:
+        self.name = name
+        self.label = label
+        self.seconds = 0.0
+        self.count = 0
+        self.children: dict[tuple[str, str], _SpanNode] = {}
+
+    def child(self, name: str, label: str) -> _SpanNode:
+        key = (name, label)
+        node = self.children.get(key)
+        if node is None:
+            node = _SpanNode(name, label)
+            self.children[key] = node
+        return node
+
+    def as_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "name": self.name,
+            "ms": round(self.seconds * 1000, 3),
+        }
+        if self.label:
+            data["label"] = self.label
+        if self.count > 1:
+            data["count"] = self.count
+        if self.children:
+            data["children"] = [node.as_dict() for node in self.children.values()]
+        return data
+
+
+class SpanRecorder:
+    """Collects a merged span tree for one unit of work."""
+
+    def __init__(self, name: str = "run") -> None:
+        self._root = _SpanNode(name)
+        self._stack: list[_SpanNode] = [self._root]
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, label: str = "") -> Iterator[None]:
+        node = self._stack[-1].child(name, label)
+        self._stack.append(node)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            node.seconds += time.perf_counter() - started
+            node.count += 1
+            self._stack.pop()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the tree as JSON-ready data; the root covers elapsed time."""
+        self._root.seconds = time.perf_counter() - self._started
+        self._root.count = 1
+        return {"version": PROFILE_VERSION, **self._root.as_dict()}
+
+
+def span(name: str, label: str = ""):
+    """Time a block under the active recorder, or do nothing without one."""
+    recorder = _ACTIVE.get()
+    if recorder is None:
+        return _NOOP
+    return recorder.span(name, label)
+
+
+def traced(name: str):
+    """Decorate a function so each call is recorded as a ``name`` span."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = _ACTIVE.get()
+            if recorder is None:
+                return func(*args, **kwargs)
+            with recorder.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def active_recorder() -> SpanRecorder | None:
+    """Return the recorder for the current context, if any."""
+    return _ACTIVE.get()
+
+
+@contextmanager
+def recording(name: str = "run") -> Iterator[SpanRecorder]:
+    """Activate a fresh recorder for the duration of the block."""
+    recorder = SpanRecorder(name)
+    token = _ACTIVE.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _ACTIVE.reset(token)
+
+
+def iter_spans(
+    tree: dict[str, Any],
+    parents: tuple[str, ...] = (),
+) -> Iterator[tuple[tuple[str, ...], dict[str, Any]]]:
+    """Yield ``(ancestor names, node)`` for every node below ``tree``'s root."""
+    path = (*parents, tree.get("name", ""))
+    for child in tree.get("children", ()):
+        yield path, child
+        yield from iter_spans(child, path)
@@ -105,25 +105,25 @@ from validibot.core.tasks.registry import get_enabled_admin_tasks
 from validibot.core.tasks.registry import register_scheduled_admin_task
 from validibot.core.tasks.scheduled_tasks import cleanup_callback_receipts  # noqa: F401
 from validibot.core.tasks.scheduled_tasks import cleanup_idempotency_keys  # noqa: F401
-from validibot.core.tasks.scheduled_tasks import (  # noqa: F401
-    cleanup_orphaned_containers,
-)
+from validibot.core.tasks.scheduled_tasks import cleanup_orphaned_containers  # noqa: F401
 from validibot.core.tasks.scheduled_tasks import cleanup_stuck_runs  # noqa: F401
 from validibot.core.tasks.scheduled_tasks import clear_sessions  # noqa: F401
 from validibot.core.tasks.scheduled_tasks import process_purge_retries  # noqa: F401
 from validibot.core.tasks.scheduled_tasks import purge_expired_outputs  # noqa: F401
 from validibot.core.tasks.scheduled_tasks import purge_expired_submissions  # noqa: F401
+from validibot.core.tasks.scheduled_tasks import reconcile_notification_counts  # noqa: F401
+from validibot.core.tasks.scheduled_tasks import refresh_dashboard_rollups  # noqa: F401
 from validibot.core.tasks.task_dispatch import enqueue_validation_run
+from validibot.core.tasks.task_dispatch import enqueue_validation_runs
 
 # Validation execution task (dispatched by CeleryDispatcher)
-from validibot.core.tasks.validation_tasks import (  # noqa: F401
-    execute_validation_run_task,
-)
+from validibot.core.tasks.validation_tasks import execute_validation_run_task  # noqa: F401
 
 __all__ = [
     "Backend",
     "ScheduledAdminTaskDefinition",
     "enqueue_validation_run",
+    "enqueue_validation_runs",
     "get_admin_task_by_id",
     "get_admin_tasks_for_backend",
     "get_all_admin_tasks",
@@ -162,3 +162,17 @@ class TaskDispatcher(ABC):
             Instead, return a response with the error field populated.
             This allows callers to handle failures gracefully.
         """
+
+    def dispatch_many(
+        self,
+        requests: list[TaskDispatchRequest],
+    ) -> list[TaskDispatchResponse]:
+        """
+        Dispatch several validation run tasks, one response per request.
+
+        The default sends each request through ``dispatch()`` in order.
+        Dispatchers whose backend can amortize per-message setup (a broker
+        connection, say) override this. Like ``dispatch()``, it reports
+        failures in the responses rather than raising.
+        """
+        return [self.dispatch(request) for request in requests]
@@ -153,3 +153,54 @@ class CeleryDispatcher(TaskDispatcher):
                 is_sync=False,
                 error=str(exc),
             )
+
+    def dispatch_many(
+        self,
+        requests: list[TaskDispatchRequest],
+    ) -> list[TaskDispatchResponse]:
+        """Enqueue a batch of runs over one broker connection."""
+        if not self.is_available() or current_app.conf.task_always_eager:
+            return super().dispatch_many(requests)
+
+        messages = [
+            (
+                f"task-{request.validation_run_id}-{uuid.uuid4().hex[:8]}",
+                {
+                    "validation_run_id": str(request.validation_run_id),
+                    "user_id": request.user_id,
+                    "resume_from_step": request.resume_from_step,
+                },
+            )
+            for request in requests
+        ]
+
+        def send_tasks():
+            with current_app.producer_or_acquire() as producer:
+                for task_id, task_kwargs in messages:
+                    execute_validation_run_task.apply_async(
+                        kwargs=task_kwargs,
+                        task_id=task_id,
+                        producer=producer,
+                    )
+
+        logger.info("Celery dispatcher: enqueueing %d validation runs", len(messages))
+        # As in ``dispatch()``: a batch admitted inside a transaction is only
+        # sent once that transaction commits.
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(send_tasks)
+        else:
+            try:
+                send_tasks()
+            except Exception as exc:
+                logger.exception(
+                    "Celery dispatcher: failed to enqueue %d validation runs",
+                    len(messages),
+                )
+                return [
+                    TaskDispatchResponse(task_id=None, is_sync=False, error=str(exc))
+                    for _ in messages
+                ]
+        return [
+            TaskDispatchResponse(task_id=task_id, is_sync=False)
+            for task_id, _ in messages
+        ]
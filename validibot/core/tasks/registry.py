@@ -239,6 +239,34 @@ SCHEDULED_ADMIN_TASKS: tuple[ScheduledAdminTaskDefinition, ...] = (
         backends=(Backend.CELERY,),  # Only for Docker Compose deployments
     ),
     # -------------------------------------------------------------------------
+    # Dashboard rollups
+    # -------------------------------------------------------------------------
+    ScheduledAdminTaskDefinition(
+        id="refresh-dashboard-rollups",
+        name="Refresh Dashboard Rollups",
+        celery_task="validibot.refresh_dashboard_rollups",
+        api_endpoint="/api/v1/scheduled/refresh-dashboard-rollups/",
+        schedule_cron="*/5 * * * *",  # Every 5 minutes
+        schedule_interval_minutes=5,
+        description=(
+            "Recompute hourly dashboard rollups for tracking events and "
+            "validation runs changed since the last refresh"
+        ),
+    ),
+    # -------------------------------------------------------------------------
+    # Notification counters
+    # -------------------------------------------------------------------------
+    ScheduledAdminTaskDefinition(
+        id="reconcile-notification-counts",
+        name="Reconcile Notification Counts",
+        celery_task="validibot.reconcile_notification_counts",
+        api_endpoint="/api/v1/scheduled/reconcile-notification-counts/",
+        schedule_cron="30 3 * * *",  # Daily at 3:30 AM
+        description=(
+            "Reset drifted per-user unread-notification counters to the true counts"
+        ),
+    ),
+    # -------------------------------------------------------------------------
     # Audit log retention
     # -------------------------------------------------------------------------
     ScheduledAdminTaskDefinition(
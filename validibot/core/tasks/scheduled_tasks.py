@@ -123,6 +123,8 @@ def _run_management_command(
 #   cleanup_callback_receipts     - Weekly on Sunday at 4:00 AM
 #   clear_sessions                - Daily at 2:00 AM
 #   cleanup_orphaned_containers   - Every 10 minutes (Docker Compose only)
+#   refresh_dashboard_rollups     - Every 5 minutes
+#   reconcile_notification_counts - Daily at 3:30 AM
 
 
 @shared_task(
@@ -150,8 +152,8 @@ def purge_expired_submissions(self) -> dict:
 
     result = _run_management_command(
         "purge_expired_submissions",
-        "--batch-size=100",
-        "--max-batches=10",
+        "--batch-size=500",
+        "--max-batches=20",
         capture_stderr=True,
     )
 
@@ -184,8 +186,8 @@ def purge_expired_outputs(self) -> dict:
 
     result = _run_management_command(
         "purge_expired_outputs",
-        "--batch-size=100",
-        "--max-batches=10",
+        "--batch-size=500",
+        "--max-batches=20",
         capture_stderr=True,
     )
 
@@ -437,3 +439,67 @@ def enforce_audit_retention(self) -> dict:
 
     logger.info("Audit retention completed: %s", result.get("output", ""))
     return result
+
+
+@shared_task(
+    bind=True,
+    name="validibot.refresh_dashboard_rollups",
+    autoretry_for=RETRYABLE_EXCEPTIONS,
+    max_retries=3,
+    retry_backoff=30,
+    retry_backoff_max=300,
+    acks_late=True,
+)
+def refresh_dashboard_rollups(self) -> dict:
+    """
+    Fold recently changed tracking events and validation runs into the
+    dashboard's hourly rollup tables.
+
+    Dashboard widgets read settled hours from the rollups and count only the
+    live tail from raw rows, so a stalled schedule makes widgets slower, not
+    wrong.
+
+    Default schedule: Every 5 minutes
+    """
+    logger.info(
+        "Starting scheduled dashboard rollup refresh (task_id=%s)",
+        self.request.id,
+    )
+
+    result = _run_management_command("refresh_dashboard_rollups")
+
+    logger.info("Dashboard rollup refresh completed: %s", result.get("output", ""))
+    return result
+
+
+@shared_task(
+    bind=True,
+    name="validibot.reconcile_notification_counts",
+    autoretry_for=RETRYABLE_EXCEPTIONS,
+    max_retries=3,
+    retry_backoff=60,
+    retry_backoff_max=600,
+    acks_late=True,
+)
+def reconcile_notification_counts(self) -> dict:
+    """
+    Reset drifted per-user unread-notification counters.
+
+    The counters are maintained on every create/read/dismiss; this repairs
+    the paths they cannot see, such as notifications removed by a cascaded
+    user or org delete.
+
+    Default schedule: Daily at 3:30 AM
+    """
+    logger.info(
+        "Starting scheduled notification counter reconciliation (task_id=%s)",
+        self.request.id,
+    )
+
+    result = _run_management_command("reconcile_notification_counts")
+
+    logger.info(
+        "Notification counter reconciliation completed: %s",
+        result.get("output", ""),
+    )
+    return result
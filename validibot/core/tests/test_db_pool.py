@@ -0,0 +1,129 @@
+"""Tests for database connection pooling (``core/db_pool.py``).
+
+A pooled connection must hand itself back during a long step, outside a
+transaction only, and check a pre-pinged one out again on the next query; an
+unpooled one must be left alone. Pool stats reach the metrics registry, and
+the load-test command reports connection counts and latency for both modes.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS
+from django.db import connections
+
+from validibot.core import metrics
+from validibot.core.db_pool import pool_for
+from validibot.core.db_pool import record_pool_stats
+from validibot.core.db_pool import released_connection
+
+POOL_MAX_SIZE = 2
+LOAD_RUNS = 12
+LOAD_CONCURRENCY = 6
+
+
+@pytest.fixture
+def pooled():
+    # A copy of the default connection with a pool of its own, under the same
+    # alias so django.contrib.postgres finds its cached type OIDs.
+    connection = connections[DEFAULT_DB_ALIAS].copy()
+    connection._connection_pools = {}
+    connection.settings_dict["CONN_MAX_AGE"] = 0
+    connection.settings_dict["CONN_HEALTH_CHECKS"] = True
+    connection.settings_dict.setdefault("OPTIONS", {})["pool"] = {
+        "min_size": 1,
+        "max_size": POOL_MAX_SIZE,
+    }
+    metrics.REGISTRY.reset()
+    yield connection
+    connection.close()
+    connection.close_pool()
+    metrics.REGISTRY.reset()
+
+
+def _select_one(connection) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+
+
+@pytest.mark.django_db
+class TestReleasedConnection:
+    def test_returns_the_connection_to_the_pool_and_checks_out_again(self, pooled):
+        _select_one(pooled)
+        available = pooled.pool.get_stats()["pool_available"]
+
+        with released_connection(pooled):
+            assert pooled.connection is None
+            assert pooled.pool.get_stats()["pool_available"] == available + 1
+
+        _select_one(pooled)
+        assert pooled.connection is not None
+
+    def test_keeps_the_connection_inside_a_transaction(self, pooled):
+        _select_one(pooled)
+        held = pooled.connection
+        pooled.set_autocommit(False)
+        try:
+            with released_connection(pooled):
+                assert pooled.connection is held
+        finally:
+            pooled.rollback()
+            pooled.set_autocommit(True)
+
+    def test_leaves_unpooled_connections_open(self):
+        connection = connections[DEFAULT_DB_ALIAS]
+        _select_one(connection)
+        held = connection.connection
+
+        with released_connection():
+            assert connection.connection is held
+        assert pool_for(connection) is None
+
+
+@pytest.mark.django_db
+def test_pool_stats_reach_the_metrics_registry(pooled):
+    _select_one(pooled)
+    with released_connection(pooled):
+        pass
+    record_pool_stats(pooled)
+
+    text = metrics.render_latest()
+
+    # The pool may have opened a second connection while the first connected.
+    opened = re.search(
+        r'validibot_db_pool_connections\{alias="default",state="open"\} (\S+)',
+        text,
+    )
+    assert opened
+    assert 1 <= float(opened.group(1)) <= POOL_MAX_SIZE
+    assert f'validibot_db_pool_releases_total{{alias="{DEFAULT_DB_ALIAS}"}} 1.0' in text
+    assert f'validibot_db_pool_checkouts_total{{alias="{DEFAULT_DB_ALIAS}"}}' in text
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_test_reports_both_modes():
+    stdout = StringIO()
+
+    call_command(
+        "load_test_db_pool",
+        f"--runs={LOAD_RUNS}",
+        f"--concurrency={LOAD_CONCURRENCY}",
+        "--queries=4",
+        "--step-seconds=0.05",
+        f"--pool-max-size={POOL_MAX_SIZE}",
+        stdout=stdout,
+    )
+
+    persistent, pooled_result = json.loads(stdout.getvalue())["results"]
+    assert persistent["mode"] == "persistent"
+    assert pooled_result["mode"] == "pooled"
+    assert 0 < pooled_result["connections"]["peak"] <= POOL_MAX_SIZE
+    assert pooled_result["connections"]["opened"] <= POOL_MAX_SIZE
+    for result in (persistent, pooled_result):
+        assert result["runs"] == LOAD_RUNS
+        assert 0 < result["latency_seconds"]["p50"] <= result["latency_seconds"]["max"]
@@ -11,18 +11,30 @@ These tests verify that the Idempotency-Key header pattern works correctly:
 
 import contextlib
 import json
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from http import HTTPStatus
+from threading import Barrier
 from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
+from django.core.cache.backends import locmem
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework import status
+from rest_framework.response import Response
 from rest_framework.test import APIClient
 
 import validibot.workflows.views.launch as views_mod
 import validibot.workflows.views_launch_helpers as launch_helpers_mod
+from validibot.core.idempotency import CacheIdempotencyStore
+from validibot.core.models import IDEMPOTENCY_KEY_TTL_HOURS
 from validibot.core.models import IdempotencyKey
 from validibot.core.models import IdempotencyKeyStatus
 from validibot.submissions.constants import SubmissionFileType
@@ -45,6 +57,9 @@ except Exception:
     WorkflowFactory = None
     WorkflowStepFactory = None
 
+CACHE_STORE = "validibot.core.idempotency.CacheIdempotencyStore"
+CONCURRENT_DUPLICATES = 8
+
 
 @pytest.fixture
 def api_client() -> APIClient:
@@ -547,3 +562,122 @@ class TestIdempotencyKeyModel:
                 request_hash="hash2",
                 expires_at=timezone.now() + timedelta(hours=24),
             )
+
+
+def _claim(store, org, *, key="key-1", request_hash="hash-1"):
+    return store.claim(
+        org=org,
+        key=key,
+        endpoint="OrgScopedWorkflowViewSet.runs",
+        request_hash=request_hash,
+        request=None,
+    )
+
+
+def _after(seconds: float):
+    """Move the local-memory cache's clock ``seconds`` into the future."""
+    future = time.time() + seconds
+    return patch.object(locmem, "time", SimpleNamespace(time=lambda: future))
+
+
+@pytest.fixture
+def cache_store():
+    cache.clear()
+    with override_settings(IDEMPOTENCY_STORE=CACHE_STORE):
+        yield CacheIdempotencyStore()
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestCacheIdempotencyStore:
+    """The cache store keeps the same contract without touching Postgres."""
+
+    def test_duplicate_request_replays_without_database_rows(
+        self,
+        cache_store,
+        api_client: APIClient,
+        org,
+        user,
+        workflow,
+    ):
+        api_client.force_authenticate(user=user)
+        grant_role(user, org, RoleCode.EXECUTOR)
+        payload = json.dumps({"hello": "world"})
+        headers = {"HTTP_IDEMPOTENCY_KEY": str(uuid.uuid4())}
+
+        first = api_client.post(
+            start_url(workflow),
+            data=payload,
+            content_type="application/json",
+            **headers,
+        )
+        with CaptureQueriesContext(connection) as queries:
+            replay = api_client.post(
+                start_url(workflow),
+                data=payload,
+                content_type="application/json",
+                **headers,
+            )
+
+        assert first.status_code == status.HTTP_201_CREATED
+        assert replay.status_code == status.HTTP_201_CREATED
+        assert replay["Idempotent-Replayed"] == "true"
+        assert replay.data["id"] == first.data["id"]
+        assert not IdempotencyKey.objects.exists()
+        assert not [q for q in queries if "core_idempotencykey" in q["sql"]]
+
+    def test_different_body_same_key_is_a_hash_mismatch(self, cache_store, org):
+        claim = _claim(cache_store, org)
+        cache_store.complete(claim, Response({"id": "run-1"}, status=201))
+
+        assert _claim(cache_store, org, request_hash="hash-2").action == (
+            "hash_mismatch"
+        )
+
+    def test_concurrent_duplicates_process_exactly_once(self, cache_store, org):
+        start = Barrier(CONCURRENT_DUPLICATES)
+
+        def claim(_):
+            start.wait()
+            return _claim(cache_store, org).action
+
+        with ThreadPoolExecutor(max_workers=CONCURRENT_DUPLICATES) as pool:
+            actions = list(pool.map(claim, range(CONCURRENT_DUPLICATES)))
+
+        assert actions.count("process") == 1
+        assert actions.count("conflict") == CONCURRENT_DUPLICATES - 1
+
+    def test_completed_response_expires_after_the_ttl(self, cache_store, org):
+        claim = _claim(cache_store, org)
+        cache_store.complete(claim, Response({"id": "run-1"}, status=201))
+        ttl_seconds = IDEMPOTENCY_KEY_TTL_HOURS * 3600
+
+        with _after(ttl_seconds - 60):
+            replay = _claim(cache_store, org)
+        with _after(ttl_seconds + 1):
+            fresh = _claim(cache_store, org)
+
+        assert replay.action == "replay"
+        assert replay.response_body == {"id": "run-1"}
+        assert replay.request_id == claim.request_id
+        assert fresh.action == "process"
+
+    def test_stalled_claim_frees_the_key_after_the_processing_timeout(
+        self,
+        cache_store,
+        org,
+        settings,
+    ):
+        _claim(cache_store, org)
+
+        with _after(settings.IDEMPOTENCY_PROCESSING_TIMEOUT_SECONDS + 1):
+            retry = _claim(cache_store, org)
+
+        assert _claim(cache_store, org).action == "conflict"
+        assert retry.action == "process"
+
+    def test_released_claim_can_be_retried(self, cache_store, org):
+        claim = _claim(cache_store, org)
+        cache_store.release(claim)
+
+        assert _claim(cache_store, org).action == "process"
@@ -0,0 +1,163 @@
+"""
+Tests for the in-process metrics registry and the worker ``/metrics`` endpoint.
+
+The registry has to produce exposition text Prometheus accepts (cumulative
+histogram buckets, ``_total`` counters, escaped labels) and, under Gunicorn or
+Celery prefork, add up samples written by several processes.
+"""
+
+import os
+import tempfile
+
+import pytest
+from django.test import SimpleTestCase
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from validibot.core import metrics
+
+FORKED_INCREMENT = 3
+
+
+class MetricsRegistryTests(SimpleTestCase):
+    """Declaration rules and text rendering."""
+
+    def setUp(self):
+        self.registry = metrics.MetricsRegistry()
+
+    def test_counter_renders_labelled_samples(self):
+        requests = self.registry.counter(
+            "demo_requests_total",
+            "Requests served.",
+            labelnames=("outcome",),
+        )
+        requests.labels(outcome="ok").inc()
+        requests.labels(outcome="ok").inc(2)
+        requests.labels(outcome='bad "quote"').inc()
+
+        text = self.registry.render()
+
+        assert "# HELP demo_requests_total Requests served." in text
+        assert "# TYPE demo_requests_total counter" in text
+        assert 'demo_requests_total{outcome="ok"} 3.0' in text
+        assert 'demo_requests_total{outcome="bad \\"quote\\""} 1.0' in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        latency = self.registry.histogram(
+            "demo_seconds",
+            "Latency.",
+            buckets=(0.1, 1.0),
+        )
+        latency.observe(0.05)
+        latency.observe(0.5)
+        latency.observe(5.0)
+
+        lines = self.registry.render().splitlines()
+
+        assert 'demo_seconds_bucket{le="0.1"} 1.0' in lines
+        assert 'demo_seconds_bucket{le="1.0"} 2.0' in lines
+        assert 'demo_seconds_bucket{le="+Inf"} 3.0' in lines
+        assert "demo_seconds_count 3.0" in lines
+        assert "demo_seconds_sum 5.55" in lines
+
+    def test_gauge_set_and_adjust(self):
+        depth = self.registry.gauge("demo_queue_depth", "Queued items.")
+        depth.set(4)
+        depth.dec()
+
+        assert "demo_queue_depth 3.0" in self.registry.render()
+
+    def test_redeclaring_returns_existing_metric(self):
+        first = self.registry.counter("demo_total", "Demo.", labelnames=("a",))
+        second = self.registry.counter("demo_total", "Demo.", labelnames=("a",))
+
+        assert first is second
+
+    def test_inconsistent_declarations_are_rejected(self):
+        self.registry.counter("demo_total", "Demo.", labelnames=("a",))
+
+        with pytest.raises(metrics.MetricsError):
+            self.registry.counter("demo_total", "Demo.", labelnames=("b",))
+        with pytest.raises(metrics.MetricsError):
+            self.registry.gauge("demo_total", "Demo.")
+        with pytest.raises(metrics.MetricsError):
+            self.registry.counter("demo_requests", "Missing the _total suffix.")
+        with pytest.raises(metrics.MetricsError):
+            self.registry.gauge("demo_gauge", "Demo.", labelnames=("__reserved",))
+
+    def test_labels_must_match_declaration(self):
+        requests = self.registry.counter(
+            "demo_total",
+            "Demo.",
+            labelnames=("outcome",),
+        )
+
+        with pytest.raises(metrics.MetricsError):
+            requests.labels(other="x")
+        with pytest.raises(metrics.MetricsError):
+            requests.inc()
+
+    @override_settings(METRICS_ENABLED=False)
+    def test_disabled_metrics_record_nothing(self):
+        self.registry.counter("demo_total", "Demo.").inc()
+
+        assert self.registry.render() == ""
+
+
+class MultiprocessStoreTests(SimpleTestCase):
+    """Samples written by separate processes are summed on collection."""
+
+    def test_forked_child_samples_are_aggregated(self):
+        with (
+            tempfile.TemporaryDirectory() as directory,
+            override_settings(METRICS_MULTIPROC_DIR=directory),
+        ):
+            registry = metrics.MetricsRegistry()
+            jobs = registry.counter("demo_jobs_total", "Jobs run.")
+            jobs.inc()
+
+            pid = os.fork()
+            if pid == 0:  # pragma: no cover - runs in the child
+                jobs.inc(FORKED_INCREMENT)
+                os._exit(0)
+            _pid, exit_status = os.waitpid(pid, 0)
+
+            text = registry.render()
+            registry.reset()
+
+        assert os.waitstatus_to_exitcode(exit_status) == 0
+        expected = 1 + FORKED_INCREMENT
+        assert f"demo_jobs_total {float(expected)}" in text
+
+
+@override_settings(
+    APP_IS_WORKER=True,
+    ROOT_URLCONF="config.urls_worker",
+    WORKER_API_KEY="test-metrics-key",
+)
+class MetricsEndpointTests(SimpleTestCase):
+    """The worker exposes the default registry at ``/metrics/``."""
+
+    def setUp(self):
+        self.client = APIClient()
+        metrics.REGISTRY.reset()
+        self.addCleanup(metrics.REGISTRY.reset)
+
+    def test_scrape_returns_exposition_text(self):
+        metrics.counter("validibot_test_scrapes_total", "Test counter.").inc()
+        self.client.credentials(HTTP_AUTHORIZATION="Worker-Key test-metrics-key")
+
+        response = self.client.get("/metrics/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == metrics.EXPOSITION_CONTENT_TYPE
+        assert b"validibot_test_scrapes_total 1.0" in response.content
+
+    def test_scrape_requires_worker_key(self):
+        response = self.client.get("/metrics/")
+
+        assert response.status_code in {
+            status.HTTP_401_UNAUTHORIZED,
+            status.HTTP_403_FORBIDDEN,
+        }
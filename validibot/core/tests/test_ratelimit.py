@@ -0,0 +1,326 @@
+"""Tests for the sliding-window rate limiter (``core/ratelimit.py``).
+
+Covers the properties the fixed-window counters lacked: a burst straddling a
+window edge is still held to the quota, parallel requests are admitted
+exactly up to the limit (no lost updates), and quotas are keyed by
+credential and org rather than client IP. The shared-cache engine runs
+against a ``DatabaseCache``, as production does without Redis; the Redis
+engine is exercised against a live server when ``REDIS_URL`` answers, and
+skipped otherwise.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from threading import Barrier
+from unittest.mock import patch
+
+import pytest
+import redis
+from django.conf import settings
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test import override_settings
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.test import force_authenticate
+from rest_framework.views import APIView
+
+from validibot.core.ratelimit import Quota
+from validibot.core.ratelimit import RateLimitHeadersMiddleware
+from validibot.core.ratelimit import hit
+from validibot.core.ratelimit import rate_limit
+from validibot.core.ratelimit import reset_local_rate_limits
+from validibot.core.throttles import QuotaThrottle
+from validibot.users.tests.factories import OrganizationFactory
+from validibot.users.tests.factories import UserFactory
+
+LIMIT = 5
+WINDOW_SECONDS = 60
+PARALLEL_LIMIT = 50
+WORKERS = 16
+ATTEMPTS = 400
+ORG_LIMIT = 3
+# The shared-cache engine counts in tenth-of-a-window buckets, so its reset
+# can overshoot the exact sliding window by up to one bucket.
+SHARED_RESET_SLACK = WINDOW_SECONDS // 10
+CREDENTIAL_LIMIT = 2
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _hammer(key: str, quota: Quota) -> int:
+    """Fire ``ATTEMPTS`` hits from ``WORKERS`` threads at once; count admits."""
+
+    start = Barrier(WORKERS)
+
+    def worker(attempts: int) -> int:
+        start.wait()
+        return sum(hit(key, quota).allowed for _ in range(attempts))
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        return sum(pool.map(worker, [ATTEMPTS // WORKERS] * WORKERS))
+
+
+class TestQuota:
+    @pytest.mark.parametrize(
+        ("rate", "expected"),
+        [
+            ("10/s", Quota(10, 1)),
+            ("10/m", Quota(10, 60)),
+            ("60/minute", Quota(60, 60)),
+            ("1000/hour", Quota(1000, 3600)),
+            ("5/day", Quota(5, 86400)),
+        ],
+    )
+    def test_parses_short_and_drf_style_rates(self, rate, expected):
+        assert Quota.parse(rate) == expected
+
+    @pytest.mark.parametrize("rate", ["10", "ten/m", "10/w", "10/ m"])
+    def test_rejects_malformed_rates(self, rate):
+        with pytest.raises(ValueError, match="Invalid rate format"):
+            Quota.parse(rate)
+
+
+class TestLocalSlidingWindow:
+    def test_burst_across_a_window_edge_is_held_to_the_quota(self):
+        clock = FakeClock()
+        quota = Quota(LIMIT, WINDOW_SECONDS)
+
+        with patch("validibot.core.ratelimit.time.monotonic", clock):
+            clock.now += WINDOW_SECONDS - 1
+            assert all(hit("edge", quota).allowed for _ in range(LIMIT))
+            # A fixed window would reset here and admit a second full burst.
+            clock.now += 2
+            assert not hit("edge", quota).allowed
+            clock.now += WINDOW_SECONDS
+            assert hit("edge", quota).allowed
+
+    def test_decision_reports_remaining_and_reset(self):
+        clock = FakeClock()
+        quota = Quota(LIMIT, WINDOW_SECONDS)
+
+        with patch("validibot.core.ratelimit.time.monotonic", clock):
+            first = hit("report", quota)
+            clock.now += 10
+            for _ in range(LIMIT - 1):
+                hit("report", quota)
+            refused = hit("report", quota)
+
+        assert first.remaining == LIMIT - 1
+        assert not refused.allowed
+        assert refused.remaining == 0
+        assert refused.reset_seconds == WINDOW_SECONDS - 10
+
+    def test_parallel_requests_are_admitted_exactly_up_to_the_limit(self):
+        quota = Quota(PARALLEL_LIMIT, WINDOW_SECONDS)
+
+        assert _hammer("parallel", quota) == PARALLEL_LIMIT
+
+
+@pytest.mark.django_db
+class TestSharedCacheSlidingWindow:
+    @pytest.fixture(autouse=True)
+    def _database_cache(self):
+        caches = {
+            **settings.CACHES,
+            "ratelimit": {
+                "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+                "LOCATION": "ratelimit_test_cache",
+            },
+        }
+        with override_settings(CACHES=caches, RATE_LIMIT_CACHE="ratelimit"):
+            call_command("createcachetable", "ratelimit_test_cache")
+            yield
+
+    def test_budget_is_kept_in_the_cache_not_the_process(self):
+        quota = Quota(LIMIT, WINDOW_SECONDS)
+
+        assert all(hit("shared", quota).allowed for _ in range(LIMIT))
+        # Another process starts with an empty in-process limiter.
+        reset_local_rate_limits()
+        refused = hit("shared", quota)
+
+        assert not refused.allowed
+        assert refused.remaining == 0
+        assert 0 < refused.reset_seconds <= WINDOW_SECONDS + SHARED_RESET_SLACK
+
+    def test_burst_across_a_window_edge_is_held_to_the_quota(self):
+        clock = FakeClock()
+        # Cache expiry reads the same clock, so start it at the real time.
+        clock.now = time.time()
+        quota = Quota(LIMIT, WINDOW_SECONDS)
+
+        with patch("validibot.core.ratelimit.time.time", clock):
+            clock.now += WINDOW_SECONDS - 1
+            assert all(hit("shared-edge", quota).allowed for _ in range(LIMIT))
+            clock.now += 2
+            assert not hit("shared-edge", quota).allowed
+            clock.now += WINDOW_SECONDS
+            assert hit("shared-edge", quota).allowed
+
+    def test_decision_reports_remaining(self):
+        quota = Quota(LIMIT, WINDOW_SECONDS)
+
+        first = hit("shared-report", quota)
+
+        assert first.allowed
+        assert first.remaining == LIMIT - 1
+
+
+class TestRedisSlidingWindow:
+    @pytest.fixture(autouse=True)
+    def _redis_cache(self):
+        client = redis.Redis.from_url(settings.REDIS_URL)
+        try:
+            client.ping()
+        except redis.RedisError:
+            pytest.skip(f"Redis is not reachable at {settings.REDIS_URL}")
+        caches = {
+            **settings.CACHES,
+            "ratelimit": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": settings.REDIS_URL,
+                "KEY_PREFIX": "validibot-tests",
+            },
+        }
+        with override_settings(CACHES=caches, RATE_LIMIT_CACHE="ratelimit"):
+            yield
+        for key in client.scan_iter("validibot-tests:*ratelimit:*"):
+            client.delete(key)
+
+    def test_parallel_requests_are_admitted_exactly_up_to_the_limit(self):
+        quota = Quota(PARALLEL_LIMIT, WINDOW_SECONDS)
+
+        assert _hammer("redis-parallel", quota) == PARALLEL_LIMIT
+
+    def test_refusal_reports_when_the_oldest_hit_expires(self):
+        quota = Quota(LIMIT, WINDOW_SECONDS)
+        for _ in range(LIMIT):
+            hit("redis-reset", quota)
+
+        refused = hit("redis-reset", quota)
+
+        assert not refused.allowed
+        assert 0 < refused.reset_seconds <= WINDOW_SECONDS
+
+
+class TestRateLimitDecorator:
+    def test_adds_headers_and_refuses_over_the_quota(self):
+        view = rate_limit(f"{LIMIT}/m", key_prefix="test")(
+            lambda request: HttpResponse("ok"),
+        )
+        request = RequestFactory().get("/", REMOTE_ADDR="203.0.113.7")
+
+        responses = [view(request) for _ in range(LIMIT + 1)]
+
+        assert responses[0]["RateLimit-Limit"] == str(LIMIT)
+        assert responses[0]["RateLimit-Remaining"] == str(LIMIT - 1)
+        assert responses[-1].status_code == HTTPStatus.TOO_MANY_REQUESTS
+        assert responses[-1]["Retry-After"] == str(WINDOW_SECONDS)
+
+    def test_key_func_scopes_the_quota(self):
+        view = rate_limit("1/m", key_func=lambda request: request.GET["who"])(
+            lambda request: HttpResponse("ok"),
+        )
+        factory = RequestFactory()
+
+        assert view(factory.get("/", {"who": "a"})).status_code == HTTPStatus.OK
+        assert view(factory.get("/", {"who": "b"})).status_code == HTTPStatus.OK
+        assert (
+            view(factory.get("/", {"who": "a"})).status_code
+            == HTTPStatus.TOO_MANY_REQUESTS
+        )
+
+
+class QuotaView(APIView):
+    throttle_classes = [QuotaThrottle]
+    throttle_scope = "workflow_launch"
+
+    def post(self, request, org_slug):
+        return Response({"ok": True})
+
+
+@pytest.mark.django_db
+class TestQuotaThrottle:
+    @pytest.fixture(autouse=True)
+    def _rates(self):
+        rest_framework = {
+            **settings.REST_FRAMEWORK,
+            "DEFAULT_THROTTLE_RATES": {
+                "credential_workflow_launch": f"{CREDENTIAL_LIMIT}/minute",
+                "org_workflow_launch": f"{ORG_LIMIT}/minute",
+            },
+        }
+        with override_settings(REST_FRAMEWORK=rest_framework):
+            yield
+
+    @pytest.fixture(autouse=True)
+    def _orgs(self):
+        self.acme = OrganizationFactory(slug="acme")
+        self.other = OrganizationFactory(slug="other")
+
+    @staticmethod
+    def _post(user, org_slug: str = "acme"):
+        request = APIRequestFactory().post(f"/orgs/{org_slug}/runs/")
+        force_authenticate(request, user=user)
+        response = QuotaView.as_view()(request, org_slug=org_slug)
+        return request, response
+
+    def test_credential_budget_is_per_caller(self):
+        alice, bob = UserFactory(orgs=[self.acme]), UserFactory(orgs=[self.acme])
+
+        statuses = [self._post(alice)[1].status_code for _ in range(3)]
+
+        assert statuses == [
+            HTTPStatus.OK,
+            HTTPStatus.OK,
+            HTTPStatus.TOO_MANY_REQUESTS,
+        ]
+        assert self._post(bob)[1].status_code == HTTPStatus.OK
+
+    def test_org_budget_is_shared_by_every_caller(self):
+        users = [
+            UserFactory(orgs=[self.acme, self.other]) for _ in range(ORG_LIMIT + 1)
+        ]
+
+        statuses = [self._post(user)[1].status_code for user in users]
+
+        assert statuses[-1] == HTTPStatus.TOO_MANY_REQUESTS
+        assert self._post(users[-1], org_slug="other")[1].status_code == (HTTPStatus.OK)
+
+    def test_outsiders_do_not_spend_the_org_budget(self):
+        outsiders = [UserFactory(orgs=[self.other]) for _ in range(ORG_LIMIT + 1)]
+        member = UserFactory(orgs=[self.acme])
+
+        statuses = [self._post(outsider)[1].status_code for outsider in outsiders]
+        self._post(outsiders[0], org_slug="no-such-org")
+
+        assert statuses == [HTTPStatus.OK] * len(outsiders)
+        assert self._post(member)[1].status_code == HTTPStatus.OK
+        # The member's request was the only charge to acme's budget.
+        probe = hit(
+            "throttle:org:acme:workflow_launch",
+            Quota.parse(f"{ORG_LIMIT}/minute"),
+        )
+        assert probe.remaining == ORG_LIMIT - 2
+
+    def test_middleware_advertises_the_tightest_budget(self):
+        user = UserFactory(orgs=[self.acme])
+        request, _response = self._post(user)
+
+        response = RateLimitHeadersMiddleware(lambda _request: HttpResponse())(
+            request,
+        )
+
+        assert response["RateLimit-Limit"] == str(CREDENTIAL_LIMIT)
+        assert response["RateLimit-Remaining"] == str(CREDENTIAL_LIMIT - 1)
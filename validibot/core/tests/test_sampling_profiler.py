@@ -0,0 +1,59 @@
+"""Tests for the sampling CPU profiler.
+
+The sampler must attribute CPU time to the functions that burned it, render
+flame-graph-compatible collapsed stacks, and leave no timer or sampling
+thread behind once stopped.
+"""
+
+import signal
+import threading
+import time
+
+from validibot.core.sampling_profiler import StackSampler
+
+BUSY_SECONDS = 0.3
+INTERVAL_S = 0.002
+
+
+def _burn_cpu(seconds: float) -> int:
+    deadline = time.process_time() + seconds
+    total = 0
+    while time.process_time() < deadline:
+        total += sum(range(200))
+    return total
+
+
+def test_main_thread_samples_land_in_the_busy_function():
+    with StackSampler(interval_s=INTERVAL_S) as sampler:
+        _burn_cpu(BUSY_SECONDS)
+
+    assert sampler.mode == "signal-stopped"
+    assert sampler.sample_count > 0
+    assert any(stack[-1].endswith(":_burn_cpu") for stack in sampler.samples)
+    assert signal.getitimer(signal.ITIMER_PROF) == (0.0, 0.0)
+
+
+def test_collapsed_output_is_heaviest_first():
+    sampler = StackSampler()
+    sampler.samples[("app:main", "app:light")] = 1
+    sampler.samples[("app:main", "app:heavy")] = 5
+
+    assert sampler.collapsed() == "app:main;app:heavy 5\napp:main;app:light 1\n"
+
+
+def test_off_main_thread_falls_back_to_a_sampling_thread():
+    result = {}
+
+    def profile_in_worker():
+        with StackSampler(interval_s=INTERVAL_S) as sampler:
+            _burn_cpu(BUSY_SECONDS)
+        result["sampler"] = sampler
+
+    worker = threading.Thread(target=profile_in_worker)
+    worker.start()
+    worker.join()
+
+    sampler = result["sampler"]
+    assert sampler.mode == "thread-stopped"
+    assert any(stack[-1].endswith(":_burn_cpu") for stack in sampler.samples)
+    assert not any(t.name == "vb-stack-sampler" for t in threading.enumerate())
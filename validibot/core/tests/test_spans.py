@@ -0,0 +1,90 @@
+"""Tests for the per-run span recorder.
+
+Spans must cost nothing outside a recording, nest under whichever span is
+open, and merge repeated siblings so a profile stays small however many
+times a phase runs.
+"""
+
+import pytest
+
+from validibot.core import spans
+
+REPEATED_CALLS = 3
+FAILURE_MESSAGE = "disk full"
+
+
+def test_span_is_a_noop_without_a_recorder():
+    assert spans.active_recorder() is None
+
+    with spans.span("anything"):
+        pass
+
+    assert spans.active_recorder() is None
+
+
+def test_nested_spans_build_a_tree():
+    with spans.recording() as recorder:
+        with spans.span("step", label="1:TABULAR"):
+            with spans.span("read"):
+                pass
+            with spans.span("native"):
+                pass
+        with spans.span("summary"):
+            pass
+
+    tree = recorder.as_dict()
+
+    assert tree["name"] == "run"
+    assert tree["version"] == spans.PROFILE_VERSION
+    step, summary = tree["children"]
+    assert step["label"] == "1:TABULAR"
+    assert [child["name"] for child in step["children"]] == ["read", "native"]
+    assert summary["name"] == "summary"
+    assert tree["ms"] >= step["ms"] >= step["children"][0]["ms"]
+
+
+def test_repeated_siblings_are_merged_with_a_count():
+    with spans.recording() as recorder:
+        for _ in range(REPEATED_CALLS):
+            with spans.span("assertions"):
+                pass
+
+    (assertions,) = recorder.as_dict()["children"]
+
+    assert assertions["count"] == REPEATED_CALLS
+
+
+def test_traced_records_calls_and_exceptions():
+    @spans.traced("persistence")
+    def persist(*, fail=False):
+        if fail:
+            raise ValueError(FAILURE_MESSAGE)
+        return "saved"
+
+    assert persist() == "saved"
+    with spans.recording() as recorder:
+        assert persist() == "saved"
+        with pytest.raises(ValueError, match=FAILURE_MESSAGE):
+            persist(fail=True)
+
+    (node,) = recorder.as_dict()["children"]
+    assert node["name"] == "persistence"
+    assert node["count"] == REPEATED_CALLS - 1
+
+
+def test_recording_restores_the_outer_context():
+    with spans.recording() as outer:
+        with spans.recording() as inner:
+            assert spans.active_recorder() is inner
+        assert spans.active_recorder() is outer
+    assert spans.active_recorder() is None
+
+
+def test_iter_spans_walks_every_node_with_its_ancestors():
+    with spans.recording() as recorder, spans.span("step"), spans.span("read"):
+        pass
+
+    tree = recorder.as_dict()
+    walked = [(parents, node["name"]) for parents, node in spans.iter_spans(tree)]
+
+    assert walked == [(("run",), "step"), (("run", "step"), "read")]
@@ -0,0 +1,164 @@
+"""Tests for the per-process write buffer (``core/write_buffer.py``).
+
+Covers the flush points (end of request, end of Celery task, size limit),
+their restriction to the current thread's rows, the row-by-row fallback that
+drops only bad rows, and a benchmark that pins what buffering removes from
+the request path: one INSERT per tracking event.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from celery.signals import task_postrun
+from django.core.signals import request_finished
+from django.db import close_old_connections
+from django.db import connection
+from django.test import TestCase
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from validibot.core.constants import WriteDurability
+from validibot.core.write_buffer import WriteBuffer
+from validibot.core.write_buffer import flush_write_buffers
+from validibot.events.constants import AppEventType
+from validibot.projects.tests.factories import ProjectFactory
+from validibot.tracking.constants import TrackingEventType
+from validibot.tracking.models import TrackingEvent
+from validibot.tracking.services import TrackingEventService
+
+MAX_ROWS = 3
+BENCHMARK_EVENTS = 200
+
+
+def _inserts(captured: CaptureQueriesContext) -> int:
+    return sum(query["sql"].startswith("INSERT") for query in captured)
+
+
+@override_settings(TRACKING_EVENT_DURABILITY=WriteDurability.BUFFERED)
+class BufferedTrackingEventTests(TestCase):
+    """Buffered tracking events reach the table at the next flush point."""
+
+    def setUp(self):
+        self.project = ProjectFactory()
+        self.service = TrackingEventService()
+
+    def tearDown(self):
+        flush_write_buffers()
+
+    def _log(self, **overrides):
+        kwargs = {
+            "event_type": TrackingEventType.APP_EVENT,
+            "app_event_type": AppEventType.USER_LOGGED_IN,
+            "project": self.project,
+            "org": self.project.org,
+        }
+        kwargs.update(overrides)
+        return self.service.log_tracking_event(**kwargs)
+
+    def test_event_is_written_when_the_request_finishes(self):
+        event = self._log()
+
+        self.assertIsNone(event.pk)
+        self.assertFalse(TrackingEvent.objects.exists())
+
+        # As the test client does: keep Django from closing the test
+        # connection when the request ends.
+        request_finished.disconnect(close_old_connections)
+        try:
+            request_finished.send(sender=self.__class__)
+        finally:
+            request_finished.connect(close_old_connections)
+
+        self.assertTrue(TrackingEvent.objects.filter(pk=event.pk).exists())
+
+    def test_event_is_written_when_a_celery_task_finishes(self):
+        self._log()
+
+        task_postrun.send(sender=None, task_id="t", task=None)
+
+        self.assertEqual(TrackingEvent.objects.count(), 1)
+
+    @override_settings(WRITE_BUFFER_MAX_ROWS=MAX_ROWS)
+    def test_full_buffer_flushes_once_the_transaction_commits(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(MAX_ROWS):
+                self._log()
+            # Never mid-transaction: the size flush waits for the commit.
+            self.assertFalse(TrackingEvent.objects.exists())
+
+        self.assertEqual(TrackingEvent.objects.count(), MAX_ROWS)
+
+    def test_failed_batch_drops_only_the_bad_rows(self):
+        self._log()
+        self.service._log_tracking_event(
+            event_type=TrackingEventType.APP_EVENT,
+            app_event_type="x" * 500,
+            project=self.project,
+            org=self.project.org,
+        )
+        self._log()
+
+        with self.assertLogs("validibot.core.write_buffer", level="ERROR"):
+            written = flush_write_buffers()
+
+        self.assertEqual(written, 2)
+        self.assertEqual(TrackingEvent.objects.count(), 2)
+
+    def test_explicit_sync_durability_writes_immediately(self):
+        event = self.service._log_tracking_event(
+            event_type=TrackingEventType.APP_EVENT,
+            app_event_type=AppEventType.USER_LOGGED_IN,
+            project=self.project,
+            org=self.project.org,
+            durability=WriteDurability.SYNC,
+        )
+
+        self.assertIsNotNone(event.pk)
+
+    def test_benchmark_buffering_removes_per_event_inserts(self):
+        """Seed a request's worth of events both ways and compare.
+
+        Synchronous logging costs one INSERT per event inside the request;
+        buffered logging costs none there and one batched INSERT at flush.
+        """
+        with self.settings(TRACKING_EVENT_DURABILITY=WriteDurability.SYNC):
+            started = time.perf_counter()
+            with CaptureQueriesContext(connection) as sync_queries:
+                for _ in range(BENCHMARK_EVENTS):
+                    self._log()
+            sync_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        with CaptureQueriesContext(connection) as buffered_queries:
+            for _ in range(BENCHMARK_EVENTS):
+                self._log()
+        buffered_seconds = time.perf_counter() - started
+        with CaptureQueriesContext(connection) as flush_queries:
+            flush_write_buffers()
+
+        self.assertEqual(_inserts(sync_queries), BENCHMARK_EVENTS)
+        self.assertEqual(_inserts(buffered_queries), 0)
+        self.assertEqual(_inserts(flush_queries), 1)
+        self.assertEqual(TrackingEvent.objects.count(), BENCHMARK_EVENTS * 2)
+        self.assertLess(buffered_seconds, sync_seconds)
+
+
+class WriteBufferThreadTests(TestCase):
+    """A request's flush never writes another thread's rows."""
+
+    def test_flush_writes_only_the_current_threads_rows(self):
+        written = []
+        buffer = WriteBuffer("threads", write_batch=written.extend)
+        buffer.add("mine")
+        other = threading.Thread(target=buffer.add, args=("theirs",))
+        other.start()
+        other.join()
+
+        self.assertEqual(buffer.flush(trigger="request"), 1)
+        self.assertEqual(written, ["mine"])
+        self.assertEqual(len(buffer), 1)
+
+        self.assertEqual(buffer.flush(trigger="shutdown", every_thread=True), 1)
+        self.assertEqual(written, ["mine", "theirs"])
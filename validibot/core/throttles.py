@@ -5,14 +5,24 @@ limits to GUEST-classified accounts vs. regular accounts. GUEST is a
 system-wide :class:`~validibot.users.constants.UserKindGroup`, not a
 per-workflow concept; this throttle keys off the account kind, not the
 specific resource being accessed.
+
+It also provides :class:`QuotaThrottle`, which enforces per-credential and
+per-org quotas for each endpoint class on the sliding-window engine in
+:mod:`validibot.core.ratelimit`.
 """
 
 from __future__ import annotations
 
 import logging
 
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
 from rest_framework.throttling import ScopedRateThrottle
 
+from validibot.core.ratelimit import Quota
+from validibot.core.ratelimit import RateLimitDecision
+from validibot.core.ratelimit import hit
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,3 +77,118 @@ class GuestAwareThrottle(ScopedRateThrottle):
                 self.num_requests, self.duration = self.parse_rate(self.rate)
 
         return super().get_cache_key(request, view)
+
+
+class QuotaThrottle(BaseThrottle):
+    """Sliding-window quotas per credential and per org, per endpoint class.
+
+    Two budgets are charged for every authenticated request:
+
+    - ``credential`` — the API key (or, for legacy tokens and browser
+      sessions, the user) making the call, so one leaked or runaway key
+      cannot spend its owner's other keys' budget;
+    - ``org`` — the organization named in the URL, so one tenant's bot
+      cannot starve every other caller behind the same NAT or proxy. Only
+      active members are charged to it, so outsiders cannot spend it.
+
+    The endpoint class is the view's ``throttle_scope`` (``default`` when
+    unset). Rates come from ``DEFAULT_THROTTLE_RATES``: a
+    ``<budget>_<scope>`` entry such as ``org_workflow_launch`` wins over the
+    plain ``<budget>`` entry; a budget with neither is not enforced.
+
+    Settings example::
+
+        REST_FRAMEWORK = {
+            "DEFAULT_THROTTLE_RATES": {
+                "credential": "1000/hour",
+                "credential_workflow_launch": "60/minute",
+                "org": "5000/hour",
+                "org_workflow_launch": "300/minute",
+            }
+        }
+
+    The tightest decision is left on ``request.rate_limit`` for
+    :class:`~validibot.core.ratelimit.RateLimitHeadersMiddleware` to
+    advertise. Anonymous requests are left to ``AnonRateThrottle``.
+    """
+
+    decision: RateLimitDecision | None = None
+
+    def allow_request(self, request, view) -> bool:
+        """Charge each configured budget, refusing at the first one that's spent."""
+
+        if not request.user or not request.user.is_authenticated:
+            return True
+
+        rates = api_settings.DEFAULT_THROTTLE_RATES
+        scope = getattr(view, "throttle_scope", None) or "default"
+        budgets = [("credential", self._credential_ident(request))]
+        org_slug = getattr(view, "kwargs", {}).get("org_slug")
+        if org_slug and self._is_member(request.user, org_slug):
+            budgets.append(("org", org_slug))
+
+        tightest: RateLimitDecision | None = None
+        for budget, ident in budgets:
+            rate = rates.get(f"{budget}_{scope}") or rates.get(budget)
+            if not rate:
+                continue
+            quota = Quota.parse(rate)
+            decision = hit(f"throttle:{budget}:{ident}:{scope}", quota)
+            if not decision.allowed:
+                logger.warning(
+                    "Quota exceeded: %s %s on %s (%d per %ds)",
+                    budget,
+                    ident,
+                    scope,
+                    quota.limit,
+                    quota.window_seconds,
+                )
+                tightest = decision
+                break
+            if tightest is None or decision.remaining < tightest.remaining:
+                tightest = decision
+
+        if tightest is not None:
+            request._request.rate_limit = tightest
+        self.decision = tightest
+        return tightest is None or tightest.allowed
+
+    def wait(self) -> float | None:
+        """Seconds until the refusing budget admits another request."""
+
+        if self.decision is None:
+            return None
+        return self.decision.reset_seconds
+
+    @staticmethod
+    def _is_member(user, org_slug: str) -> bool:
+        """Whether ``user`` may spend ``org_slug``'s budget.
+
+        Throttles run before the view resolves the org, so an outsider (or a
+        slug that names no org) would otherwise drain a tenant's budget and
+        lock its members out. Such requests are charged to their credential
+        only and then refused by the view's own membership check.
+        """
+
+        from validibot.users.models import Membership
+
+        return Membership.objects.filter(
+            user=user,
+            org__slug=org_slug,
+            is_active=True,
+        ).exists()
+
+    @staticmethod
+    def _credential_ident(request) -> str:
+        """Name the credential behind ``request`` without exposing a secret."""
+
+        from rest_framework.authtoken.models import Token
+
+        from validibot.users.models import ValidibotAPIKey
+
+        if isinstance(request.auth, ValidibotAPIKey):
+            return f"key:{request.auth.pk}"
+        if isinstance(request.auth, Token):
+            # A legacy token's primary key *is* the secret; key by owner.
+            return f"token:{request.auth.user_id}"
+        return f"user:{request.user.pk}"
@@ -0,0 +1,210 @@
+"""
+Per-process buffers that batch low-value row writes into one INSERT.
+
+Analytics rows (``TrackingEvent``) used to cost a synchronous single-row
+INSERT inside the launch, callback or API request that produced them. A
+:class:`WriteBuffer` collects such rows in process memory and writes them
+with one ``bulk_create`` when any of these happens first:
+
+* the buffer holds ``WRITE_BUFFER_MAX_ROWS`` rows;
+* the oldest row has waited ``WRITE_BUFFER_MAX_AGE_SECONDS`` (checked when the
+  next row arrives, so a quiet process does not need a timer thread);
+* the current request finishes (``request_finished``, after the response has
+  been sent) or the current Celery task finishes (``task_postrun``);
+* the process shuts down cleanly (``atexit`` and Celery's
+  ``worker_process_shutdown``).
+
+Rows are kept per thread, and every flush point except shutdown writes only
+the current thread's rows. Under a threaded server, one request's
+``request_finished`` therefore never writes rows that another request added
+inside a transaction that has not committed yet.
+
+Durability is a per-caller choice (``core.constants.WriteDurability``). Buffered rows
+are lost if the process is killed outright (SIGKILL, OOM) before one of the
+flush points above; that is at most each thread's current request's or
+task's rows, or ``WRITE_BUFFER_MAX_ROWS`` per thread. Anything that must survive that — every
+security-relevant audit action — stays ``SYNC``.
+
+A flushed batch is not part of the transaction that produced its rows
+(size and age flushes wait for that transaction to commit). If
+the batch INSERT fails (say one row references a parent created in a
+transaction that later rolled back), each row is retried on its own and only
+the failing rows are dropped, with an error log per row.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db import transaction
+
+from validibot.core import metrics
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+BUFFERED_ROWS = metrics.counter(
+    "validibot_write_buffer_rows_total",
+    "Rows leaving a write buffer, by buffer and outcome (written or dropped).",
+    labelnames=("buffer", "outcome"),
+)
+BUFFER_FLUSHES = metrics.counter(
+    "validibot_write_buffer_flushes_total",
+    "Write buffer flushes, by buffer and trigger.",
+    labelnames=("buffer", "trigger"),
+)
+
+
+class WriteBuffer:
+    """
+    Thread-safe, per-process buffer of pending rows, kept per adding thread.
+
+    ``write_batch`` receives a list of buffered items and writes them, usually
+    with ``bulk_create``. It runs outside the buffer's lock, so other threads
+    can keep appending while a batch is written.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        write_batch: Callable[[list[Any]], None],
+    ) -> None:
+        self.name = name
+        self._write_batch = write_batch
+        self._lock = threading.Lock()
+        # Thread ident -> (pending items, when the oldest of them arrived).
+        self._pending: dict[int, tuple[list[Any], float]] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(items) for items, _oldest in self._pending.values())
+
+    def add(self, item: Any) -> None:
+        """Buffer ``item``, flushing this thread's rows if a limit is reached."""
+        now = time.monotonic()
+        with self._lock:
+            items, oldest = self._pending.setdefault(threading.get_ident(), ([], now))
+            items.append(item)
+            full = len(items) >= settings.WRITE_BUFFER_MAX_ROWS
+            stale = now - oldest >= settings.WRITE_BUFFER_MAX_AGE_SECONDS
+        if full or stale:
+            # Deferred to commit so a size or age flush never joins (and
+            # never rolls back with) the caller's open transaction. Outside
+            # a transaction ``on_commit`` runs immediately.
+            trigger = "size" if full else "age"
+            transaction.on_commit(lambda: self.flush(trigger=trigger))
+
+    def flush(self, *, trigger: str = "manual", every_thread: bool = False) -> int:
+        """Write the current thread's pending items; return how many were written.
+
+        ``every_thread`` writes all threads' items instead. Only shutdown uses
+        it, once no request or task can still be mid-transaction.
+        """
+        with self._lock:
+            if every_thread:
+                pending, self._pending = self._pending, {}
+                items = [item for batch, _oldest in pending.values() for item in batch]
+            else:
+                items, _oldest = self._pending.pop(threading.get_ident(), ([], None))
+        if not items:
+            return 0
+        BUFFER_FLUSHES.labels(buffer=self.name, trigger=trigger).inc()
+        try:
+            with transaction.atomic():
+                self._write_batch(items)
+        except Exception:
+            logger.warning(
+                "Write buffer %s: batch of %d failed; retrying rows one by one",
+                self.name,
+                len(items),
+                exc_info=True,
+            )
+            return self._write_one_by_one(items)
+        BUFFERED_ROWS.labels(buffer=self.name, outcome="written").inc(len(items))
+        return len(items)
+
+    def _write_one_by_one(self, items: list[Any]) -> int:
+        written = 0
+        for item in items:
+            try:
+                with transaction.atomic():
+                    self._write_batch([item])
+            except Exception:
+                logger.exception("Write buffer %s: dropped one row", self.name)
+                BUFFERED_ROWS.labels(buffer=self.name, outcome="dropped").inc()
+            else:
+                written += 1
+        BUFFERED_ROWS.labels(buffer=self.name, outcome="written").inc(written)
+        return written
+
+
+_buffers: dict[str, WriteBuffer] = {}
+_buffers_lock = threading.Lock()
+
+
+def get_write_buffer(
+    name: str,
+    *,
+    write_batch: Callable[[list[Any]], None],
+) -> WriteBuffer:
+    """Return the process-wide buffer called ``name``, creating it once."""
+    with _buffers_lock:
+        buffer = _buffers.get(name)
+        if buffer is None:
+            buffer = _buffers[name] = WriteBuffer(name, write_batch=write_batch)
+        return buffer
+
+
+def flush_write_buffers(*, trigger: str = "manual", every_thread: bool = False) -> int:
+    """Flush every buffer in this process; return the rows written.
+
+    Only the current thread's rows are written unless ``every_thread`` is set.
+    """
+    with _buffers_lock:
+        buffers = list(_buffers.values())
+    written = 0
+    for buffer in buffers:
+        try:
+            written += buffer.flush(trigger=trigger, every_thread=every_thread)
+        except Exception:
+            # Flush points run in signal handlers and atexit; never let one
+            # buffer's failure take the others (or the request) down.
+            logger.exception("Write buffer %s: flush failed", buffer.name)
+    return written
+
+
+def _flush_after_request(**kwargs) -> None:
+    flush_write_buffers(trigger="request")
+
+
+def _flush_after_task(**kwargs) -> None:
+    flush_write_buffers(trigger="task")
+
+
+def _flush_on_shutdown(**kwargs) -> None:
+    flush_write_buffers(trigger="shutdown", every_thread=True)
+
+
+def install_flush_hooks() -> None:
+    """Connect the end-of-request, end-of-task and shutdown flush points."""
+    from celery.signals import task_postrun
+    from celery.signals import worker_process_shutdown
+
+    request_finished.connect(_flush_after_request, dispatch_uid="write_buffer")
+    task_postrun.connect(_flush_after_task, dispatch_uid="write_buffer", weak=False)
+    worker_process_shutdown.connect(
+        _flush_on_shutdown,
+        dispatch_uid="write_buffer",
+        weak=False,
+    )
+    atexit.register(_flush_on_shutdown)
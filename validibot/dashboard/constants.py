@@ -0,0 +1,22 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class RollupSource(models.TextChoices):
+    """Raw tables the dashboard rollups are built from."""
+
+    TRACKING_EVENTS = "tracking_events", _("Tracking events")
+    VALIDATION_RUNS = "validation_runs", _("Validation runs")
+
+
+class RollupChannel(models.TextChoices):
+    """
+    Interaction channel of a rolled-up tracking event.
+
+    Events whose ``extra_data.channel`` is missing, null or empty count as
+    web traffic, matching the users widget's raw filter.
+    """
+
+    API = "api", _("API")
+    WEB = "web", _("Web")
+    OTHER = "other", _("Other")
@@ -0,0 +1,36 @@
+"""
+Management command to refresh the dashboard's hourly rollup tables.
+
+Recomputes the UTC hours touched by tracking events and validation runs that
+changed since the previous refresh. Runs every five minutes from the
+scheduler registry; safe to run by hand at any time.
+
+Usage:
+    python manage.py refresh_dashboard_rollups
+    python manage.py refresh_dashboard_rollups --rebuild
+"""
+
+from django.core.management.base import BaseCommand
+
+from validibot.dashboard.rollups import refresh_rollups
+
+
+class Command(BaseCommand):
+    help = "Fold recent tracking events and validation runs into dashboard rollups."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help=(
+                "Recompute every hour from raw rows. Needed after raw rows "
+                "are deleted, which incremental refreshes do not see."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        recomputed = refresh_rollups(rebuild=options["rebuild"])
+        for source, hours in recomputed.items():
+            self.stdout.write(
+                self.style.SUCCESS(f"{source}: recomputed {hours} hour(s)."),
+            )
@@ -0,0 +1,154 @@
+# Generated by Django 6.0.7 on 2026-10-18 22:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("users", "0004_current_schema"),
+        ("workflows", "0010_workflow_access_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RollupWatermark",
+            fields=[
+                (
+                    "source",
+                    models.CharField(
+                        choices=[
+                            ("tracking_events", "Tracking events"),
+                            ("validation_runs", "Validation runs"),
+                        ],
+                        max_length=32,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "rolled_until",
+                    models.DateTimeField(
+                        help_text="Start time of the last completed refresh."
+                    ),
+                ),
+                ("modified", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="TrackingEventHourlyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("bucket_start", models.DateTimeField()),
+                (
+                    "channel",
+                    models.CharField(
+                        choices=[("api", "API"), ("web", "Web"), ("other", "Other")],
+                        max_length=16,
+                    ),
+                ),
+                ("event_count", models.PositiveIntegerField()),
+                (
+                    "org",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="users.organization",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["org", "bucket_start"],
+                        name="dashboard_t_org_id_cb78b0_idx",
+                    ),
+                    models.Index(
+                        fields=["bucket_start"], name="dashboard_t_bucket__9426cb_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ValidationRunHourlyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("bucket_start", models.DateTimeField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "Pending"),
+                            ("RUNNING", "Running"),
+                            ("SUCCEEDED", "Succeeded"),
+                            ("FAILED", "Failed"),
+                            ("CANCELED", "Canceled"),
+                            ("TIMED_OUT", "Timed Out"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                ("run_count", models.PositiveIntegerField()),
+                (
+                    "org",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="users.organization",
+                    ),
+                ),
+                (
+                    "workflow",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="workflows.workflow",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["org", "bucket_start"],
+                        name="dashboard_v_org_id_13120c_idx",
+                    ),
+                    models.Index(
+                        fields=["bucket_start"], name="dashboard_v_bucket__e36b02_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
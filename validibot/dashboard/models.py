@@ -0,0 +1,118 @@
+"""
+Pre-aggregated dashboard rollups.
+
+Dashboard charts used to group raw ``TrackingEvent`` and ``ValidationRun``
+rows by hour or day on every load, which gets slower as history grows. The
+tables here hold the same counts per UTC hour, maintained incrementally by
+``refresh_dashboard_rollups`` (see :mod:`validibot.dashboard.rollups`).
+
+Only hourly rows are stored. Day buckets are summed from the hourly rows in
+the viewer's timezone at read time, so a single table serves every timezone
+instead of baking one day boundary into a daily table.
+"""
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from validibot.dashboard.constants import RollupChannel
+from validibot.dashboard.constants import RollupSource
+from validibot.users.models import Organization
+from validibot.users.models import User
+from validibot.validations.constants import ValidationRunStatus
+from validibot.workflows.models import Workflow
+
+
+class RollupWatermark(models.Model):
+    """
+    How far each rollup source has been folded into its hourly table.
+
+    Every source row modified at or after ``rolled_until`` (less the
+    ``DASHBOARD_ROLLUP_LAG_SECONDS`` overlap) marks its hour as dirty on the
+    next refresh. Readers treat hours starting at or after ``rolled_until``
+    as the live tail and count them from raw rows.
+    """
+
+    source = models.CharField(
+        max_length=32,
+        choices=RollupSource.choices,
+        primary_key=True,
+    )
+    rolled_until = models.DateTimeField(
+        help_text=_("Start time of the last completed refresh."),
+    )
+    modified = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.source} @ {self.rolled_until.isoformat()}"
+
+
+class TrackingEventHourlyRollup(models.Model):
+    """
+    Tracking event count per UTC hour, org, user and channel.
+
+    Keeping ``user`` in the key lets the users widget count distinct users
+    over any span of hours without going back to the raw events.
+    """
+
+    bucket_start = models.DateTimeField()
+    org = models.ForeignKey(
+        Organization,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    channel = models.CharField(
+        max_length=16,
+        choices=RollupChannel.choices,
+    )
+    event_count = models.PositiveIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["org", "bucket_start"]),
+            # Refreshes replace whole hours across every org.
+            models.Index(fields=["bucket_start"]),
+        ]
+
+    def __str__(self):
+        return f"{self.bucket_start.isoformat()} {self.channel}: {self.event_count}"
+
+
+class ValidationRunHourlyRollup(models.Model):
+    """
+    Validation run count per UTC hour (of ``created``), org, workflow and status.
+    """
+
+    bucket_start = models.DateTimeField()
+    org = models.ForeignKey(
+        Organization,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    workflow = models.ForeignKey(
+        Workflow,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=ValidationRunStatus.choices,
+    )
+    run_count = models.PositiveIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["org", "bucket_start"]),
+            models.Index(fields=["bucket_start"]),
+        ]
+
+    def __str__(self):
+        return f"{self.bucket_start.isoformat()} {self.status}: {self.run_count}"
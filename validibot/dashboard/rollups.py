@@ -0,0 +1,444 @@
+"""
+Incremental hourly rollups behind the dashboard widgets.
+
+Refresh side
+------------
+
+:func:`refresh_rollups` (run by the ``refresh_dashboard_rollups`` scheduled
+task) folds raw ``TrackingEvent`` and ``ValidationRun`` rows into the hourly
+tables in :mod:`validibot.dashboard.models`. It does not add deltas; it finds
+the UTC hours touched by rows changed since the source's watermark and
+recomputes those hours from scratch, so a refresh that overlaps the previous
+one (``DASHBOARD_ROLLUP_LAG_SECONDS``) or is retried after a crash converges
+on the same counts.
+
+A run's status usually changes through ``QuerySet.update()``, which leaves
+``modified`` alone, so runs also count as changed when ``started_at`` or
+``ended_at`` moved past the watermark. Hard deletes of raw rows are not seen
+incrementally; ``refresh_dashboard_rollups --rebuild`` recomputes every hour.
+
+Read side
+---------
+
+The ``*_time_series`` and ``count_*`` helpers return what the raw queries in
+:func:`validibot.dashboard.services.generate_time_series` would. Whole hours
+the rollup has settled are read from the hourly tables; the partial hour at
+the start of the window and the live tail after the watermark come from raw
+rows. Day buckets are summed from hourly rows in the active timezone, which
+is exact whenever that timezone's UTC offset is a whole number of hours. For
+the few zones where it isn't, and before the first refresh, the helpers fall
+back to the raw queries.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from itertools import batched
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import models
+from django.db import transaction
+from django.db.models import Case
+from django.db.models import Count
+from django.db.models import Q
+from django.db.models import Sum
+from django.db.models import Value
+from django.db.models import When
+from django.db.models.functions import Greatest
+from django.db.models.functions import TruncHour
+from django.db.models.lookups import GreaterThanOrEqual
+from django.utils import timezone
+
+from validibot.dashboard.constants import RollupChannel
+from validibot.dashboard.constants import RollupSource
+from validibot.dashboard.models import RollupWatermark
+from validibot.dashboard.models import TrackingEventHourlyRollup
+from validibot.dashboard.models import ValidationRunHourlyRollup
+from validibot.dashboard.services import _align_to_bucket
+from validibot.dashboard.services import _empty_series
+from validibot.dashboard.services import _truncate_qs
+from validibot.dashboard.services import generate_time_series
+from validibot.tracking.models import TrackingEvent
+from validibot.validations.models import ValidationRun
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.db.models import QuerySet
+
+    from validibot.dashboard.time_ranges import ResolvedTimeRange
+    from validibot.users.models import Organization
+
+logger = logging.getLogger(__name__)
+
+HOUR = timedelta(hours=1)
+
+# Dirty hours recomputed per transaction. A week of hours keeps each delete +
+# insert short enough not to hold locks that widgets would notice.
+REFRESH_HOURS_PER_BATCH = 168
+
+# Raw ``extra_data.channel`` filters for each rollup channel. The web filter
+# matches the users widget's historical definition of web traffic.
+_RAW_CHANNEL_FILTERS: dict[str, Q] = {
+    RollupChannel.API: Q(extra_data__channel="api"),
+    RollupChannel.WEB: (
+        Q(extra_data__channel="web")
+        | Q(extra_data__channel__isnull=True)
+        | Q(extra_data__channel="")
+    ),
+}
+
+
+def _floor_hour(dt: datetime) -> datetime:
+    return dt.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil_hour(dt: datetime) -> datetime:
+    floored = _floor_hour(dt)
+    return floored if floored == dt else floored + HOUR
+
+
+def _lag() -> timedelta:
+    return timedelta(seconds=settings.DASHBOARD_ROLLUP_LAG_SECONDS)
+
+
+# =============================================================================
+# Refresh
+# =============================================================================
+
+
+def _tracking_event_rollups(raw: QuerySet) -> list[TrackingEventHourlyRollup]:
+    channel = Case(
+        When(_RAW_CHANNEL_FILTERS[RollupChannel.API], then=Value(RollupChannel.API)),
+        When(_RAW_CHANNEL_FILTERS[RollupChannel.WEB], then=Value(RollupChannel.WEB)),
+        default=Value(RollupChannel.OTHER),
+    )
+    rows = (
+        raw.annotate(rollup_channel=channel)
+        .values("bucket", "org_id", "user_id", "rollup_channel")
+        .order_by()
+        .annotate(total=Count("id"))
+    )
+    return [
+        TrackingEventHourlyRollup(
+            bucket_start=row["bucket"],
+            org_id=row["org_id"],
+            user_id=row["user_id"],
+            channel=row["rollup_channel"],
+            event_count=row["total"],
+        )
+        for row in rows
+    ]
+
+
+def _validation_run_rollups(raw: QuerySet) -> list[ValidationRunHourlyRollup]:
+    rows = (
+        raw.values("bucket", "org_id", "workflow_id", "status")
+        .order_by()
+        .annotate(total=Count("id"))
+    )
+    return [
+        ValidationRunHourlyRollup(
+            bucket_start=row["bucket"],
+            org_id=row["org_id"],
+            workflow_id=row["workflow_id"],
+            status=row["status"],
+            run_count=row["total"],
+        )
+        for row in rows
+    ]
+
+
+@dataclass(frozen=True)
+class _RollupSpec:
+    raw_model: type[models.Model]
+    rollup_model: type[models.Model]
+    build_rollups: Callable[[QuerySet], list[models.Model]]
+    changed_since: Callable[[datetime], Q]
+
+
+_SOURCES: dict[str, _RollupSpec] = {
+    RollupSource.TRACKING_EVENTS: _RollupSpec(
+        raw_model=TrackingEvent,
+        rollup_model=TrackingEventHourlyRollup,
+        build_rollups=_tracking_event_rollups,
+        # Indexed (tracking_event_modified_idx).
+        changed_since=lambda since: Q(modified__gte=since),
+    ),
+    RollupSource.VALIDATION_RUNS: _RollupSpec(
+        raw_model=ValidationRun,
+        rollup_model=ValidationRunHourlyRollup,
+        build_rollups=_validation_run_rollups,
+        # The same expression as ValidationRun's run_last_changed_idx, so the
+        # refresh is an index range scan.
+        changed_since=lambda since: Q(
+            GreaterThanOrEqual(Greatest("modified", "started_at", "ended_at"), since),
+        ),
+    ),
+}
+
+
+def _refresh_source(source: str, *, now: datetime, rebuild: bool) -> int:
+    spec = _SOURCES[source]
+    watermark = RollupWatermark.objects.filter(source=source).first()
+
+    changed = spec.raw_model.objects.all()
+    if watermark is not None and not rebuild:
+        changed = changed.filter(spec.changed_since(watermark.rolled_until - _lag()))
+    dirty_hours = list(
+        changed.annotate(bucket=TruncHour("created", tzinfo=UTC))
+        .order_by("bucket")
+        .values_list("bucket", flat=True)
+        .distinct(),
+    )
+
+    # A rebuild also drops hours whose raw rows are all gone, so it runs as
+    # one transaction; readers keep seeing the old rollup until it commits.
+    with transaction.atomic() if rebuild else contextlib.nullcontext():
+        if rebuild:
+            spec.rollup_model.objects.all().delete()
+        for hours in batched(dirty_hours, REFRESH_HOURS_PER_BATCH, strict=False):
+            raw = (
+                spec.raw_model.objects.filter(
+                    created__gte=hours[0],
+                    created__lt=hours[-1] + HOUR,
+                )
+                .annotate(bucket=TruncHour("created", tzinfo=UTC))
+                .filter(bucket__in=hours)
+            )
+            with transaction.atomic():
+                spec.rollup_model.objects.filter(bucket_start__in=hours).delete()
+                spec.rollup_model.objects.bulk_create(spec.build_rollups(raw))
+
+    RollupWatermark.objects.update_or_create(
+        source=source,
+        defaults={"rolled_until": now},
+    )
+    return len(dirty_hours)
+
+
+def refresh_rollups(*, rebuild: bool = False) -> dict[str, int]:
+    """
+    Fold raw rows changed since the last refresh into the hourly rollups.
+
+    Args:
+        rebuild: Drop and recompute every hour instead of only dirty ones.
+
+    Returns:
+        Number of hours recomputed, keyed by :class:`RollupSource` value.
+    """
+    now = timezone.now()
+    recomputed: dict[str, int] = {}
+    for source in RollupSource:
+        recomputed[source.value] = _refresh_source(source, now=now, rebuild=rebuild)
+        logger.info(
+            "Dashboard rollup %s: recomputed %d hour(s)",
+            source.value,
+            recomputed[source.value],
+        )
+    return recomputed
+
+
+# =============================================================================
+# Read
+# =============================================================================
+
+
+def _has_whole_hour_offsets(time_range: ResolvedTimeRange) -> bool:
+    """Whether every UTC hour in the range falls inside one local hour."""
+    tz = timezone.get_current_timezone()
+    return all(
+        moment.astimezone(tz).utcoffset() % HOUR == timedelta(0)
+        for moment in (time_range.start, time_range.end)
+    )
+
+
+def _rollup_window(
+    source: str,
+    time_range: ResolvedTimeRange,
+) -> tuple[datetime, datetime] | None:
+    """Whole settled hours of ``time_range`` to read from the rollup, if any."""
+    rolled_until = (
+        RollupWatermark.objects.filter(source=source)
+        .values_list("rolled_until", flat=True)
+        .first()
+    )
+    if rolled_until is None:
+        return None
+    start = _ceil_hour(time_range.start)
+    end = min(_floor_hour(rolled_until - _lag()), _floor_hour(time_range.end))
+    if end <= start:
+        return None
+    return start, end
+
+
+def _outside_window(
+    qs: QuerySet,
+    time_range: ResolvedTimeRange,
+    window: tuple[datetime, datetime],
+) -> QuerySet:
+    """Raw rows in ``time_range`` but before or after the rolled-up window."""
+    return qs.filter(
+        Q(created__gte=time_range.start, created__lt=window[0])
+        | Q(created__gte=window[1], created__lt=time_range.end),
+    )
+
+
+def _merge_counts(
+    time_range: ResolvedTimeRange,
+    *,
+    bucket: str,
+    raw: QuerySet,
+    rollups: QuerySet,
+    rollup_field: str,
+    window: tuple[datetime, datetime],
+) -> list[tuple[datetime, int]]:
+    series = _empty_series(time_range, bucket=bucket)
+    raw_rows = (
+        _truncate_qs(_outside_window(raw, time_range, window), bucket=bucket)
+        .values("period")
+        .order_by("period")
+        .annotate(total=Count("id"))
+    )
+    rolled_rows = (
+        _truncate_qs(
+            rollups.filter(bucket_start__gte=window[0], bucket_start__lt=window[1]),
+            bucket=bucket,
+            field="bucket_start",
+        )
+        .values("period")
+        .order_by("period")
+        .annotate(total=Sum(rollup_field))
+    )
+    for rows in (raw_rows, rolled_rows):
+        for row in rows:
+            key = _align_to_bucket(row["period"], bucket=bucket)
+            series[key] = series.get(key, 0) + row["total"]
+    return sorted(series.items())
+
+
+def _merge_distinct_users(
+    time_range: ResolvedTimeRange,
+    *,
+    bucket: str,
+    raw: QuerySet,
+    rollups: QuerySet,
+    window: tuple[datetime, datetime],
+) -> list[tuple[datetime, int]]:
+    users_by_period: defaultdict[datetime, set[int]] = defaultdict(set)
+    raw_pairs = (
+        _truncate_qs(_outside_window(raw, time_range, window), bucket=bucket)
+        .values_list("period", "user_id")
+        .order_by()
+        .distinct()
+    )
+    rolled_pairs = (
+        _truncate_qs(
+            rollups.filter(bucket_start__gte=window[0], bucket_start__lt=window[1]),
+            bucket=bucket,
+            field="bucket_start",
+        )
+        .values_list("period", "user_id")
+        .order_by()
+        .distinct()
+    )
+    for pairs in (raw_pairs, rolled_pairs):
+        for period, user_id in pairs:
+            users_by_period[_align_to_bucket(period, bucket=bucket)].add(user_id)
+
+    series = _empty_series(time_range, bucket=bucket)
+    for key, user_ids in users_by_period.items():
+        series[key] = len(user_ids)
+    return sorted(series.items())
+
+
+def tracking_event_time_series(
+    *,
+    org: Organization | None,
+    time_range: ResolvedTimeRange,
+    bucket: str,
+) -> list[tuple[datetime, int]]:
+    """Tracking events per bucket; same result as the raw ``generate_time_series``."""
+    raw = TrackingEvent.objects.all()
+    rollups = TrackingEventHourlyRollup.objects.all()
+    if org:
+        raw = raw.filter(org=org)
+        rollups = rollups.filter(org=org)
+    window = _rollup_window(RollupSource.TRACKING_EVENTS, time_range)
+    if window is None or not _has_whole_hour_offsets(time_range):
+        return generate_time_series(raw, time_range=time_range, bucket=bucket)
+    return _merge_counts(
+        time_range,
+        bucket=bucket,
+        raw=raw,
+        rollups=rollups,
+        rollup_field="event_count",
+        window=window,
+    )
+
+
+def active_user_time_series(
+    *,
+    org: Organization | None,
+    time_range: ResolvedTimeRange,
+    bucket: str,
+    channel: str,
+) -> list[tuple[datetime, int]]:
+    """Distinct users per bucket with tracking events on ``channel`` (api/web)."""
+    raw = TrackingEvent.objects.filter(user__isnull=False).filter(
+        _RAW_CHANNEL_FILTERS[channel],
+    )
+    rollups = TrackingEventHourlyRollup.objects.filter(
+        user__isnull=False,
+        channel=channel,
+    )
+    if org:
+        raw = raw.filter(org=org)
+        rollups = rollups.filter(org=org)
+    window = _rollup_window(RollupSource.TRACKING_EVENTS, time_range)
+    if window is None or not _has_whole_hour_offsets(time_range):
+        return generate_time_series(
+            raw,
+            time_range=time_range,
+            bucket=bucket,
+            value_field="user_id",
+            distinct=True,
+        )
+    return _merge_distinct_users(
+        time_range,
+        bucket=bucket,
+        raw=raw,
+        rollups=rollups,
+        window=window,
+    )
+
+
+def count_validation_runs(
+    *,
+    org: Organization | None,
+    time_range: ResolvedTimeRange,
+) -> int:
+    """Validation runs created within ``time_range``."""
+    raw = ValidationRun.objects.all()
+    rollups = ValidationRunHourlyRollup.objects.all()
+    if org:
+        raw = raw.filter(org=org)
+        rollups = rollups.filter(org=org)
+    window = _rollup_window(RollupSource.VALIDATION_RUNS, time_range)
+    if window is None:
+        return raw.filter(
+            created__gte=time_range.start,
+            created__lt=time_range.end,
+        ).count()
+    rolled = rollups.filter(
+        bucket_start__gte=window[0],
+        bucket_start__lt=window[1],
+    ).aggregate(total=Sum("run_count"))["total"]
+    return _outside_window(raw, time_range, window).count() + (rolled or 0)
@@ -17,8 +17,8 @@ if TYPE_CHECKING:
     from validibot.dashboard.time_ranges import ResolvedTimeRange
 
 
-def _truncate_qs(qs: QuerySet, *, bucket: str):
-    trunc_field = TruncHour("created") if bucket == "hour" else TruncDay("created")
+def _truncate_qs(qs: QuerySet, *, bucket: str, field: str = "created"):
+    trunc_field = TruncHour(field) if bucket == "hour" else TruncDay(field)
     return qs.annotate(period=trunc_field)
 
 
@@ -64,6 +64,20 @@ def generate_time_series(
         .annotate(total=Count(value_field, **count_kwargs))
     )
 
+    period_to_value = _empty_series(time_range, bucket=bucket)
+    for row in aggregated:
+        key = _align_to_bucket(row["period"], bucket=bucket)
+        period_to_value[key] = row["total"]
+
+    return list(period_to_value.items())
+
+
+def _empty_series(
+    time_range: ResolvedTimeRange,
+    *,
+    bucket: str,
+) -> OrderedDict[datetime, int]:
+    """Zero-filled buckets from the aligned start up to the aligned end."""
     period_to_value: OrderedDict[datetime, int] = OrderedDict()
     aligned_start = _align_to_bucket(time_range.start, bucket=bucket)
     aligned_end = _align_to_bucket(time_range.end, bucket=bucket)
@@ -74,13 +88,7 @@ def generate_time_series(
     while current < aligned_end:
         period_to_value[current] = 0
         current += step
-
-    for row in aggregated:
-        period = timezone.localtime(row["period"])
-        key = _align_to_bucket(period, bucket=bucket)
-        period_to_value[key] = row["total"]
-
-    return list(period_to_value.items())
+    return period_to_value
 
 
 def build_chart_payload(
@@ -0,0 +1,272 @@
+"""
+Tests for the dashboard hourly rollups (``dashboard/rollups.py``).
+
+The rollup readers must return exactly what the raw ``generate_time_series``
+queries return, so every test here builds the same series both ways and
+compares them. Events are placed on both sides of hour and day boundaries,
+in the partial first hour of the window, and in the live tail after the
+watermark, and the day series are re-read under several timezones from one
+set of UTC hourly rows.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.models import Q
+from django.db.models import Sum
+from django.test import TestCase
+from django.test import override_settings
+from django.utils import timezone
+
+from validibot.dashboard.constants import RollupChannel
+from validibot.dashboard.constants import RollupSource
+from validibot.dashboard.models import RollupWatermark
+from validibot.dashboard.models import TrackingEventHourlyRollup
+from validibot.dashboard.models import ValidationRunHourlyRollup
+from validibot.dashboard.rollups import active_user_time_series
+from validibot.dashboard.rollups import count_validation_runs
+from validibot.dashboard.rollups import refresh_rollups
+from validibot.dashboard.rollups import tracking_event_time_series
+from validibot.dashboard.services import generate_time_series
+from validibot.dashboard.time_ranges import resolve_time_range
+from validibot.tracking.models import TrackingEvent
+from validibot.tracking.tests.factories import TrackingEventFactory
+from validibot.users.tests.factories import UserFactory
+from validibot.validations.constants import ValidationRunStatus
+from validibot.validations.models import ValidationRun
+from validibot.validations.tests.factories import ValidationRunFactory
+
+# Timezones the day series is re-read in: UTC, a DST zone behind UTC, and a
+# zone far ahead, so local midnight falls on a different UTC hour each time.
+WHOLE_HOUR_ZONES = ("UTC", "America/New_York", "Pacific/Auckland")
+# India's +05:30 offset splits UTC hours across local hours.
+FRACTIONAL_OFFSET_ZONE = "Asia/Kolkata"
+
+# Hours before "now" at which the shared fixture places events. Includes
+# neighbours across day boundaries in every zone above and events old enough
+# to sit only in the 7-day window.
+EVENT_HOURS_AGO = (0, 0, 1, 3, 5, 5, 11, 12, 13, 23, 30, 47, 48, 49, 100, 160)
+
+
+def _api_web_extra(index: int) -> dict:
+    if index % 3 == 0:
+        return {"channel": "api"}
+    if index % 3 == 1:
+        return {"channel": "web"}
+    return {}
+
+
+class RollupParityTests(TestCase):
+    """Rollup-backed series must match the raw queries bucket for bucket."""
+
+    def setUp(self):
+        self.now = timezone.now()
+        self.user = UserFactory()
+        self.org = self.user.orgs.first()
+        self.other_user = UserFactory(orgs=[self.org])
+        for index, hours_ago in enumerate(EVENT_HOURS_AGO):
+            self._event(
+                self.now - timedelta(hours=hours_ago, minutes=index),
+                user=self.user if index % 2 else self.other_user,
+                extra_data=_api_web_extra(index),
+            )
+        # Another org's events must never leak into this org's series.
+        TrackingEventFactory()
+
+    def _event(self, created, *, user, extra_data):
+        event = TrackingEventFactory(
+            org=self.org,
+            project__org=self.org,
+            user=user,
+            extra_data=extra_data,
+        )
+        TrackingEvent.objects.filter(pk=event.pk).update(created=created)
+        return event
+
+    def _raw_events(self, time_range, bucket):
+        return generate_time_series(
+            TrackingEvent.objects.filter(org=self.org),
+            time_range=time_range,
+            bucket=bucket,
+        )
+
+    def _assert_event_parity(self, slug):
+        time_range = resolve_time_range(slug, reference=self.now)
+        bucket = time_range.select_bucket_granularity()
+        self.assertEqual(
+            tracking_event_time_series(
+                org=self.org,
+                time_range=time_range,
+                bucket=bucket,
+            ),
+            self._raw_events(time_range, bucket),
+        )
+
+    def test_hourly_and_daily_series_match_raw_queries(self):
+        refresh_rollups()
+
+        for slug in ("6h", "24h", "7d"):
+            with self.subTest(slug=slug):
+                self._assert_event_parity(slug)
+
+    def test_day_buckets_match_raw_queries_in_every_timezone(self):
+        refresh_rollups()
+
+        for zone in (*WHOLE_HOUR_ZONES, FRACTIONAL_OFFSET_ZONE):
+            with self.subTest(zone=zone), timezone.override(zone):
+                self._assert_event_parity("7d")
+                self._assert_event_parity("24h")
+
+    def test_live_tail_after_refresh_is_counted_from_raw_rows(self):
+        refresh_rollups()
+        # Arrives after the refresh, in the current (live) hour.
+        self._event(self.now, user=self.user, extra_data={})
+
+        self._assert_event_parity("24h")
+        self._assert_event_parity("7d")
+
+    def test_distinct_users_match_raw_queries_per_channel(self):
+        refresh_rollups()
+
+        for channel in (RollupChannel.API, RollupChannel.WEB):
+            raw = TrackingEvent.objects.filter(org=self.org, user__isnull=False)
+            if channel == RollupChannel.API:
+                raw = raw.filter(extra_data__channel="api")
+            else:
+                raw = raw.filter(
+                    Q(extra_data__channel="web")
+                    | Q(extra_data__channel__isnull=True)
+                    | Q(extra_data__channel=""),
+                )
+            for slug in ("24h", "7d"):
+                time_range = resolve_time_range(slug, reference=self.now)
+                bucket = time_range.select_bucket_granularity()
+                with self.subTest(channel=channel, slug=slug):
+                    self.assertEqual(
+                        active_user_time_series(
+                            org=self.org,
+                            time_range=time_range,
+                            bucket=bucket,
+                            channel=channel,
+                        ),
+                        generate_time_series(
+                            raw,
+                            time_range=time_range,
+                            bucket=bucket,
+                            value_field="user_id",
+                            distinct=True,
+                        ),
+                    )
+
+    def test_settled_hours_are_read_from_the_rollup(self):
+        refresh_rollups()
+        # Deleting raw rows behind the refresh's back shows which hours the
+        # reader takes from the rollup: settled hours keep their old counts.
+        TrackingEvent.objects.filter(org=self.org).delete()
+
+        time_range = resolve_time_range("7d", reference=self.now)
+        series = tracking_event_time_series(
+            org=self.org,
+            time_range=time_range,
+            bucket="day",
+        )
+
+        self.assertGreater(sum(value for _, value in series), 0)
+        self.assertEqual(
+            sum(value for _, value in self._raw_events(time_range, "day")),
+            0,
+        )
+
+    def test_without_a_refresh_readers_use_raw_queries(self):
+        self.assertFalse(RollupWatermark.objects.exists())
+
+        self._assert_event_parity("24h")
+
+
+class RollupRefreshTests(TestCase):
+    """The scheduled refresh only recomputes hours touched since its watermark."""
+
+    def setUp(self):
+        self.now = timezone.now()
+        self.run = ValidationRunFactory(status=ValidationRunStatus.PENDING)
+        ValidationRun.objects.filter(pk=self.run.pk).update(
+            created=self.now - timedelta(hours=30),
+        )
+
+    @override_settings(DASHBOARD_ROLLUP_LAG_SECONDS=0)
+    def test_incremental_refresh_recomputes_only_dirty_hours(self):
+        first = refresh_rollups()
+        second = refresh_rollups()
+        TrackingEventFactory()
+        third = refresh_rollups()
+
+        self.assertEqual(first[RollupSource.VALIDATION_RUNS], 1)
+        self.assertEqual(second[RollupSource.TRACKING_EVENTS], 0)
+        self.assertEqual(third[RollupSource.TRACKING_EVENTS], 1)
+        self.assertEqual(
+            TrackingEventHourlyRollup.objects.aggregate(total=Sum("event_count")),
+            {"total": TrackingEvent.objects.count()},
+        )
+
+    @override_settings(DASHBOARD_ROLLUP_LAG_SECONDS=0)
+    def test_status_change_via_update_is_picked_up(self):
+        refresh_rollups()
+        # Status transitions use QuerySet.update(), which leaves ``modified``
+        # alone; ``ended_at`` is what marks the run's hour dirty.
+        ValidationRun.objects.filter(pk=self.run.pk).update(
+            status=ValidationRunStatus.SUCCEEDED,
+            started_at=timezone.now(),
+            ended_at=timezone.now(),
+        )
+
+        refresh_rollups()
+
+        self.assertEqual(
+            list(ValidationRunHourlyRollup.objects.values_list("status", "run_count")),
+            [(ValidationRunStatus.SUCCEEDED, 1)],
+        )
+
+    def test_run_count_matches_raw_count(self):
+        refresh_rollups()
+        fresh = ValidationRunFactory(org=self.run.org, workflow=self.run.workflow)
+
+        for slug in ("1h", "24h", "7d"):
+            time_range = resolve_time_range(slug, reference=timezone.now())
+            with self.subTest(slug=slug):
+                self.assertEqual(
+                    count_validation_runs(org=self.run.org, time_range=time_range),
+                    ValidationRun.objects.filter(
+                        org=fresh.org,
+                        created__gte=time_range.start,
+                        created__lt=time_range.end,
+                    ).count(),
+                )
+
+    def test_rebuild_drops_hours_whose_rows_were_deleted(self):
+        TrackingEventFactory()
+        refresh_rollups()
+        TrackingEvent.objects.all().delete()
+
+        out = StringIO()
+        call_command("refresh_dashboard_rollups", "--rebuild", stdout=out)
+
+        self.assertFalse(TrackingEventHourlyRollup.objects.exists())
+        self.assertIn("tracking_events: recomputed 0 hour(s).", out.getvalue())
+
+
+class RollupScheduleTests(TestCase):
+    """The refresh is registered with the scheduler registry."""
+
+    def test_refresh_dashboard_rollups_in_registry(self):
+        from validibot.core.tasks.registry import get_admin_task_by_id
+
+        task = get_admin_task_by_id("refresh-dashboard-rollups")
+        self.assertIsNotNone(task, "refresh-dashboard-rollups missing from registry")
+        self.assertEqual(task.celery_task, "validibot.refresh_dashboard_rollups")
+        self.assertEqual(
+            task.api_endpoint,
+            "/api/v1/scheduled/refresh-dashboard-rollups/",
+        )
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from typing import Any
 
+from validibot.dashboard.rollups import count_validation_runs
 from validibot.dashboard.widgets.base import DashboardWidget
 from validibot.dashboard.widgets.base import register_widget
 from validibot.validations.constants import Severity
 from validibot.validations.models import ValidationFinding
-from validibot.validations.models import ValidationRun
 
 
 @register_widget
@@ -18,15 +18,11 @@ class TotalValidationsWidget(DashboardWidget):
     width = "col-xl-3 col-md-6"
 
     def get_context_data(self) -> dict[str, Any]:
-        org = self.get_org()
-        qs = ValidationRun.objects.all()
-        if org:
-            qs = qs.filter(org=org)
-        qs = qs.filter(
-            created__gte=self.time_range.start,
-            created__lt=self.time_range.end,
+        total = count_validation_runs(
+            org=self.get_org(),
+            time_range=self.time_range,
         )
-        return {"total_count": qs.count()}
+        return {"total_count": total}
 
 
 @register_widget
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 from typing import Any
 
-from django.db import models
-
+from validibot.dashboard.constants import RollupChannel
+from validibot.dashboard.rollups import active_user_time_series
+from validibot.dashboard.rollups import tracking_event_time_series
 from validibot.dashboard.services import build_chart_payload
 from validibot.dashboard.services import build_stacked_bar_payload
-from validibot.dashboard.services import generate_time_series
 from validibot.dashboard.widgets.base import DashboardWidget
 from validibot.dashboard.widgets.base import register_widget
-from validibot.tracking.models import TrackingEvent
 
 
 @register_widget
@@ -21,13 +20,9 @@ class EventsTimeSeriesWidget(DashboardWidget):
     width = "col-xl-6 col-lg-12"
 
     def get_context_data(self) -> dict[str, Any]:
-        org = self.get_org()
-        qs = TrackingEvent.objects.all()
-        if org:
-            qs = qs.filter(org=org)
         bucket = self.time_range.select_bucket_granularity()
-        series = generate_time_series(
-            qs,
+        series = tracking_event_time_series(
+            org=self.get_org(),
             time_range=self.time_range,
             bucket=bucket,
         )
@@ -54,27 +49,18 @@ class UsersTimeSeriesWidget(DashboardWidget):
 
     def get_context_data(self) -> dict[str, Any]:
         org = self.get_org()
-        qs = TrackingEvent.objects.filter(user__isnull=False)
-        if org:
-            qs = qs.filter(org=org)
         bucket = self.time_range.select_bucket_granularity()
-        api_series = generate_time_series(
-            qs.filter(extra_data__channel="api"),
+        api_series = active_user_time_series(
+            org=org,
             time_range=self.time_range,
             bucket=bucket,
-            value_field="user_id",
-            distinct=True,
+            channel=RollupChannel.API,
         )
-        web_series = generate_time_series(
-            qs.filter(
-                models.Q(extra_data__channel="web")
-                | models.Q(extra_data__channel__isnull=True)
-                | models.Q(extra_data__channel=""),
-            ),
+        web_series = active_user_time_series(
+            org=org,
             time_range=self.time_range,
             bucket=bucket,
-            value_field="user_id",
-            distinct=True,
+            channel=RollupChannel.WEB,
         )
         chart_config = build_stacked_bar_payload(
             {
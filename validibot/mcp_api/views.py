@@ -35,6 +35,9 @@ from validibot.validations.constants import ValidationRunSource
 from validibot.validations.models import ValidationRun
 from validibot.validations.serializers import ValidationRunSerializer
 from validibot.validations.serializers import ValidationRunStartSerializer
+from validibot.validations.services.run_completion import RUN_WAIT_HEADER
+from validibot.validations.services.run_completion import parse_wait_seconds
+from validibot.validations.services.run_completion import wait_and_reload
 from validibot.workflows.models import Workflow
 from validibot.workflows.serializers import WorkflowFullSerializer
 from validibot.workflows.version_utils import get_latest_workflow_ids
@@ -531,14 +534,33 @@ class MCPRunDetailView(APIView):
             read_only_fields = fields
 
     def get(self, request, run_ref: str):
-        """Return validation run detail for the authenticated MCP user."""
+        """Return validation run detail for the authenticated MCP user.
+
+        ``?wait=<seconds>`` holds the request until the run is terminal (see
+        ``services/run_completion.py``), so ``wait_for_run`` needs one
+        request per wait window instead of one per poll.
+        """
 
         validation_run = _resolve_member_run(
             user=request.user,
             run_ref=run_ref,
         )
+        wait = parse_wait_seconds(request.query_params.get("wait"))
+        waited = None
+        if wait:
+            validation_run, waited = wait_and_reload(
+                validation_run,
+                wait=wait,
+                reload=lambda: _resolve_member_run(
+                    user=request.user,
+                    run_ref=run_ref,
+                ),
+            )
         serializer = self.RunSerializer(
             validation_run,
             context={"request": request},
         )
-        return Response(serializer.data, status=HTTPStatus.OK)
+        response = Response(serializer.data, status=HTTPStatus.OK)
+        if waited is not None:
+            response[RUN_WAIT_HEADER] = str(waited)
+        return response
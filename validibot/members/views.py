@@ -1209,6 +1209,7 @@ class GuestRevokeAllView(FeatureRequiredMixin, OrganizationAdminRequiredMixin, V
     def post(self, request, *args, **kwargs):
         from validibot.workflows.models import OrgGuestAccess
         from validibot.workflows.models import WorkflowAccessGrant
+        from validibot.workflows.services.access_index import sync_user_access
 
         user_id = kwargs.get("user_id")
         target_user = get_object_or_404(
@@ -1254,6 +1255,8 @@ class GuestRevokeAllView(FeatureRequiredMixin, OrganizationAdminRequiredMixin, V
                 user=target_user,
                 is_active=True,
             ).update(is_active=False, modified=now)
+            # ``update()`` sends no signals; refresh the access index here.
+            sync_user_access(target_user.pk, self.organization.pk)
         revoked_count = workflow_grants_revoked + org_grants_revoked
 
         # Audit the revocation. The bulk ``update()`` bypasses
@@ -1,20 +1,17 @@
 from __future__ import annotations
 
-from validibot.notifications.models import Notification
-
 
 def notifications_context(request):
     """
-    Provide unread notification count for the current user and org.
+    Provide the unread notification count for the current user.
+
+    Read from the user's maintained counter (see
+    ``validibot.notifications.counters``), so rendering a page runs no
+    notification query.
     """
 
     if not getattr(request, "user", None) or not request.user.is_authenticated:
         return {}
-    unread_count = Notification.objects.filter(
-        user=request.user,
-        read_at__isnull=True,
-        dismissed_at__isnull=True,
-    ).count()
     return {
-        "unread_notification_count": unread_count,
+        "unread_notification_count": request.user.unread_notification_count,
     }
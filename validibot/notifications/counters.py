@@ -0,0 +1,76 @@
+"""
+Per-user unread-notification counters.
+
+``User.unread_notification_count`` mirrors the number of a user's
+notifications that are neither read nor dismissed, so the navbar badge is
+read off ``request.user`` rather than counted on every page render.
+
+The counter moves only where a notification crosses the unread boundary:
+``Notification.save()`` on create, and ``NotificationQuerySet.mark_read`` /
+``dismiss`` (which the single-object ``Notification.mark_read`` /
+``dismiss`` wrap). Those transitions lock the affected rows, so concurrent
+marks of the same notification decrement once. Paths the counter cannot see
+— cascaded deletes when a user or org is removed, ad-hoc ``update()`` calls
+— are repaired by :func:`reconcile_unread_counts`, which runs nightly.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import IntegerField
+from django.db.models import OuterRef
+from django.db.models import Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.functions import Greatest
+
+from validibot.users.models import User
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+def adjust_unread_counts(deltas: Mapping[int, int]) -> None:
+    """Add ``deltas[user_id]`` to each user's counter, never going below zero.
+
+    Users sharing a delta are updated in one statement, so a bulk mark that
+    closes one notification each for many users is a single UPDATE.
+    """
+    by_delta: dict[int, list[int]] = defaultdict(list)
+    for user_id, delta in deltas.items():
+        if delta:
+            by_delta[delta].append(user_id)
+    for delta, user_ids in by_delta.items():
+        User.objects.filter(pk__in=user_ids).update(
+            unread_notification_count=Greatest(
+                F("unread_notification_count") + delta,
+                0,
+            ),
+        )
+
+
+def reconcile_unread_counts() -> int:
+    """Reset every drifted counter to the true unread count.
+
+    One UPDATE over the users whose counter disagrees with their
+    notifications; returns how many were repaired. A notification created
+    while this runs can leave its user one off until the next pass, which
+    converges.
+    """
+    from validibot.notifications.models import Notification
+
+    unread = (
+        Notification.objects.unread()
+        .filter(user=OuterRef("pk"))
+        .order_by()
+        .values("user")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    actual = Coalesce(Subquery(unread, output_field=IntegerField()), 0)
+    return User.objects.exclude(unread_notification_count=actual).update(
+        unread_notification_count=actual
+    )
@@ -0,0 +1,24 @@
+"""
+Management command to repair drifted unread-notification counters.
+
+Resets ``User.unread_notification_count`` to the true number of unread,
+undismissed notifications for every user whose counter disagrees. Runs
+nightly from the scheduler registry; safe to run by hand at any time.
+
+Usage:
+    python manage.py reconcile_notification_counts
+"""
+
+from django.core.management.base import BaseCommand
+
+from validibot.notifications.counters import reconcile_unread_counts
+
+
+class Command(BaseCommand):
+    help = "Reset drifted unread-notification counters to the true counts."
+
+    def handle(self, *args, **options):
+        repaired = reconcile_unread_counts()
+        self.stdout.write(
+            self.style.SUCCESS(f"Repaired {repaired} unread-notification counter(s)."),
+        )
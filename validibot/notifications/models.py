@@ -1,15 +1,60 @@
 from __future__ import annotations
 
+from collections import Counter
 from uuid import uuid4
 
 from django.db import models
+from django.db import transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from validibot.notifications.counters import adjust_unread_counts
 from validibot.users.models import MemberInvite
 from validibot.users.models import Organization
 from validibot.users.models import User
 
 
+class NotificationQuerySet(models.QuerySet):
+    """Notification queries that keep the per-user unread counters in step."""
+
+    def unread(self):
+        """Notifications that count towards the unread badge."""
+        return self.filter(read_at__isnull=True, dismissed_at__isnull=True)
+
+    def mark_read(self, *, when=None) -> int:
+        """Stamp ``read_at`` on every matched notification not yet read."""
+        return self._close("read_at", when or timezone.now())
+
+    def dismiss(self, *, when=None) -> int:
+        """Stamp ``dismissed_at`` on every matched notification not yet dismissed."""
+        return self._close("dismissed_at", when or timezone.now())
+
+    def _close(self, field: str, when) -> int:
+        # Lock the rows (in pk order, so overlapping bulk marks can't
+        # deadlock) before deciding which ones leave the unread set. A
+        # concurrent mark of the same row waits here, then finds it already
+        # stamped, so each notification decrements its user exactly once.
+        with transaction.atomic():
+            rows = list(
+                self.filter(**{f"{field}__isnull": True})
+                .select_for_update(of=("self",))
+                .order_by("pk")
+                .values_list("pk", "user_id", "read_at", "dismissed_at"),
+            )
+            if not rows:
+                return 0
+            type(self)(self.model, using=self.db).filter(
+                pk__in=[pk for pk, *_rest in rows],
+            ).update(**{field: when})
+            closed = Counter(
+                user_id
+                for _pk, user_id, read_at, dismissed_at in rows
+                if read_at is None and dismissed_at is None
+            )
+            adjust_unread_counts({user_id: -n for user_id, n in closed.items()})
+        return len(rows)
+
+
 class Notification(models.Model):
     """
     Generic notification record tied to a user and organization.
@@ -68,12 +113,34 @@ class Notification(models.Model):
     read_at = models.DateTimeField(null=True, blank=True)
     dismissed_at = models.DateTimeField(null=True, blank=True)
 
+    objects = NotificationQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
 
     def __str__(self):
         return f"Notification {self.type} for {self.user}"
 
+    def save(self, *args, **kwargs):
+        """Count a new unread notification against its user's badge."""
+        adding = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding and self.read_at is None and self.dismissed_at is None:
+                adjust_unread_counts({self.user_id: 1})
+
+    def mark_read(self) -> None:
+        """Mark this notification read, updating the unread counter once."""
+        when = timezone.now()
+        type(self).objects.filter(pk=self.pk).mark_read(when=when)
+        self.read_at = self.read_at or when
+
+    def dismiss(self) -> None:
+        """Dismiss this notification, updating the unread counter once."""
+        when = timezone.now()
+        type(self).objects.filter(pk=self.pk).dismiss(when=when)
+        self.dismissed_at = self.dismissed_at or when
+
     @property
     def is_unread(self) -> bool:
         return self.read_at is None
@@ -0,0 +1,169 @@
+"""Tests for the maintained unread-notification counter.
+
+The navbar badge reads ``User.unread_notification_count`` instead of running
+a COUNT per page, so the counter has to agree with the rows through every
+transition: create, mark read, dismiss, their bulk forms, and concurrent
+marks of the same notification. Drift from paths it cannot see is repaired
+by the reconciliation command.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from threading import Barrier
+
+import pytest
+from django.core.management import call_command
+from django.db import close_old_connections
+from django.test import RequestFactory
+
+from validibot.notifications.context_processors import notifications_context
+from validibot.notifications.models import Notification
+from validibot.users.models import User
+from validibot.users.tests.factories import OrganizationFactory
+from validibot.users.tests.factories import UserFactory
+
+THREADS = 8
+NOTIFICATIONS_PER_USER = 3
+
+
+def _notify(user, org, **kwargs) -> Notification:
+    return Notification.objects.create(
+        user=user,
+        org=org,
+        type=Notification.Type.SYSTEM_ALERT,
+        payload={"message": "hello"},
+        **kwargs,
+    )
+
+
+def _counter(user) -> int:
+    return User.objects.values_list("unread_notification_count", flat=True).get(
+        pk=user.pk,
+    )
+
+
+def _actual(user) -> int:
+    return Notification.objects.filter(user=user).unread().count()
+
+
+@pytest.mark.django_db
+class TestUnreadCounter:
+    def test_create_counts_only_unread_notifications(self):
+        user, org = UserFactory(), OrganizationFactory()
+
+        _notify(user, org)
+        _notify(user, org)
+        read = _notify(user, org)
+        read.mark_read()
+
+        assert _counter(user) == _actual(user) == NOTIFICATIONS_PER_USER - 1
+
+    def test_each_notification_leaves_the_unread_set_once(self):
+        user, org = UserFactory(), OrganizationFactory()
+        notification = _notify(user, org)
+
+        notification.mark_read()
+        notification.mark_read()
+        notification.dismiss()
+
+        assert _counter(user) == 0
+        notification.refresh_from_db()
+        assert notification.read_at is not None
+        assert notification.dismissed_at is not None
+
+    def test_dismissing_an_unread_notification_decrements(self):
+        user, org = UserFactory(), OrganizationFactory()
+        notification = _notify(user, org)
+        _notify(user, org)
+
+        notification.dismiss()
+
+        assert _counter(user) == _actual(user) == 1
+
+    def test_bulk_marks_adjust_every_affected_user(self):
+        org = OrganizationFactory()
+        alice, bob = UserFactory(), UserFactory()
+        for user in (alice, bob):
+            for _ in range(NOTIFICATIONS_PER_USER):
+                _notify(user, org)
+        first_alice = Notification.objects.filter(user=alice).first()
+        first_alice.mark_read()
+
+        marked = Notification.objects.filter(org=org).mark_read()
+        dismissed = Notification.objects.filter(user=alice).dismiss()
+
+        assert marked == 2 * NOTIFICATIONS_PER_USER - 1
+        assert dismissed == NOTIFICATIONS_PER_USER
+        assert _counter(alice) == _counter(bob) == 0
+
+    def test_saving_a_loaded_user_keeps_concurrent_increments(self):
+        user, org = UserFactory(), OrganizationFactory()
+        # Loaded before the notification, as a profile form would be.
+        stale = User.objects.get(pk=user.pk)
+        _notify(user, org)
+
+        stale.name = "Renamed"
+        stale.save()
+
+        assert _counter(user) == _actual(user) == 1
+        assert User.objects.get(pk=user.pk).name == "Renamed"
+
+    def test_context_processor_reads_the_counter_without_a_query(
+        self,
+        django_assert_num_queries,
+    ):
+        user, org = UserFactory(), OrganizationFactory()
+        _notify(user, org)
+        request = RequestFactory().get("/")
+        request.user = User.objects.get(pk=user.pk)
+
+        with django_assert_num_queries(0):
+            context = notifications_context(request)
+
+        assert context == {"unread_notification_count": 1}
+
+    def test_reconcile_repairs_drift(self):
+        user, org = UserFactory(), OrganizationFactory()
+        _notify(user, org)
+        _notify(user, org)
+        # An update() the counter cannot see.
+        Notification.objects.filter(user=user).update(read_at="2026-01-01T00:00Z")
+        stdout = StringIO()
+
+        call_command("reconcile_notification_counts", stdout=stdout)
+
+        assert _counter(user) == 0
+        assert "Repaired 1 unread-notification counter(s)." in stdout.getvalue()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_marks_decrement_exactly_once():
+    """Racing single and bulk marks of the same rows agree with the table."""
+
+    org = OrganizationFactory()
+    user = UserFactory()
+    notifications = [_notify(user, org) for _ in range(NOTIFICATIONS_PER_USER)]
+    start = Barrier(THREADS)
+
+    def mark(index: int) -> None:
+        close_old_connections()
+        try:
+            start.wait()
+            if index % 2:
+                Notification.objects.filter(user=user).mark_read()
+            else:
+                notifications[index % NOTIFICATIONS_PER_USER].dismiss()
+        finally:
+            close_old_connections()
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        list(pool.map(mark, range(THREADS)))
+
+    assert _actual(user) == 0
+    assert _counter(user) == 0
+    # Nothing was clamped at zero along the way: a fresh unread notification
+    # brings the counter to exactly one.
+    _notify(user, org)
+    assert _counter(user) == 1
@@ -10,7 +10,6 @@ from django.http import HttpResponseRedirect
 from django.shortcuts import get_object_or_404
 from django.shortcuts import render
 from django.urls import reverse
-from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views import View
 from django.views.generic import ListView
@@ -153,8 +152,7 @@ class AcceptInviteView(LoginRequiredMixin, View):
         except SeatQuotaExceededError as exc:
             messages.error(request, str(exc))
             return HttpResponseRedirect(reverse("notifications:notification-list"))
-        notification.read_at = timezone.now()
-        notification.save(update_fields=["read_at"])
+        notification.mark_read()
         _notify_inviter(invite, action=_("accepted"))
         TrackingEventService().log_tracking_event(
             event_type=TrackingEventType.APP_EVENT,
@@ -200,8 +198,7 @@ class DeclineInviteView(LoginRequiredMixin, View):
             messages.error(request, _("This invite was sent to a different user."))
             return HttpResponseRedirect(reverse("notifications:notification-list"))
         invite.decline()
-        notification.read_at = timezone.now()
-        notification.save(update_fields=["read_at"])
+        notification.mark_read()
         _notify_inviter(invite, action=_("declined"))
         TrackingEventService().log_tracking_event(
             event_type=TrackingEventType.APP_EVENT,
@@ -309,8 +306,7 @@ class AcceptGuestInviteView(GuestInvitesEnabledMixin, LoginRequiredMixin, View):
         result = invite.accept(user=request.user)
         is_org_wide = isinstance(result, OrgGuestAccess)
 
-        notification.read_at = timezone.now()
-        notification.save(update_fields=["read_at"])
+        notification.mark_read()
         _notify_guest_inviter(invite, action=_("accepted"))
 
         # Tracking metadata: ``workflows_granted`` is per-workflow grant
@@ -379,8 +375,7 @@ class DeclineGuestInviteView(LoginRequiredMixin, View):
             return HttpResponseRedirect(reverse("notifications:notification-list"))
 
         invite.decline()
-        notification.read_at = timezone.now()
-        notification.save(update_fields=["read_at"])
+        notification.mark_read()
         _notify_guest_inviter(invite, action=_("declined"))
 
         TrackingEventService().log_tracking_event(
@@ -476,8 +471,7 @@ class AcceptWorkflowInviteView(LoginRequiredMixin, View):
 
         # Accept invite and create workflow access grant
         grant = invite.accept(user=request.user)
-        notification.read_at = timezone.now()
-        notification.save(update_fields=["read_at"])
+        notification.mark_read()
         _notify_workflow_inviter(invite, action=_("accepted"))
 
         TrackingEventService().log_tracking_event(
@@ -536,8 +530,7 @@ class DeclineWorkflowInviteView(LoginRequiredMixin, View):
             return HttpResponseRedirect(reverse("notifications:notification-list"))
 
         invite.decline()
-        notification.read_at = timezone.now()
-        notification.save(update_fields=["read_at"])
+        notification.mark_read()
         _notify_workflow_inviter(invite, action=_("declined"))
 
         TrackingEventService().log_tracking_event(
@@ -577,8 +570,7 @@ class DismissNotificationView(LoginRequiredMixin, View):
         notification = get_object_or_404(
             Notification, pk=kwargs.get("pk"), user=request.user
         )
-        notification.dismissed_at = timezone.now()
-        notification.save(update_fields=["dismissed_at"])
+        notification.dismiss()
         if request.headers.get("HX-Request"):
             show_dismissed = request.POST.get("show_dismissed") == "on"
             if show_dismissed:
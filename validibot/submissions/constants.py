@@ -181,8 +181,9 @@ DATA_FORMAT_FILE_TYPE_MAP: dict[str, list[str]] = {
     SubmissionDataFormat.FMU: [SubmissionFileType.BINARY],
     SubmissionDataFormat.THERM_THMX: [SubmissionFileType.XML],
     SubmissionDataFormat.THERM_THMZ: [SubmissionFileType.BINARY],
-    # CSV is carried as a plain-text file (the Tabular Validator reads it).
-    SubmissionDataFormat.CSV: [SubmissionFileType.TEXT],
+    # CSV is carried as a plain-text file (the Tabular Validator reads it);
+    # the same tabular format also arrives as binary Parquet or Arrow IPC.
+    SubmissionDataFormat.CSV: [SubmissionFileType.TEXT, SubmissionFileType.BINARY],
     SubmissionDataFormat.PORTFOLIO_MANAGER_REPORT: [
         SubmissionFileType.BINARY,
         SubmissionFileType.XML,
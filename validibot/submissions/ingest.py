@@ -4,11 +4,14 @@ import hashlib
 from dataclasses import dataclass
 
 from django.core.exceptions import ValidationError
+from django.core.files import File
 from django.utils.translation import gettext_lazy as _
 
 from validibot.core.filesafety import build_safe_filename
 from validibot.core.filesafety import detect_suspicious_magic
 from validibot.core.filesafety import sha256_hexdigest
+from validibot.submissions.models import Submission
+from validibot.submissions.models import detect_file_type
 
 
 @dataclass
@@ -61,37 +64,131 @@ def prepare_inline_text(
     return safe_name, IngestResult(filename=safe_name, sha256=digest)
 
 
-def prepare_uploaded_file(
+def ingest_uploaded_file(
+    submission: Submission,
     *,
     uploaded_file,
     filename: str,
     content_type: str,
     max_bytes: int,
+    file_type: str | None = None,
 ) -> IngestResult:
     """
-    Stream through uploaded_file to compute SHA-256 and enforce size.
-    Returns IngestResult. Caller should pass the same uploaded_file to storage.
+    Store uploaded_file on ``submission`` reading it once, and return the
+    IngestResult.
+
+    The size cap and the magic-byte sniff run first, from the upload's
+    declared size and a peek at its first bytes, so a rejected file never
+    reaches storage. The storage write then reads the body through a tee that
+    hashes every chunk on its way to the storage backend, and the digest is
+    set as ``checksum_sha256`` so ``Submission.save()`` has nothing to
+    re-read. Caller still saves the submission.
+
+    If the backend reads out of order (seeks somewhere other than the
+    start or where it already is), the tee's digest cannot be trusted and the stored file is hashed
+    instead, so the submission always leaves here with its checksum.
     """
     # safety: use provided filename or file.name
     effective_name = filename or getattr(uploaded_file, "name", "") or "document"
     safe_name = build_safe_filename(effective_name, content_type=content_type)
 
-    # stream to avoid memory spikes
-    total = 0
-    h = hashlib.sha256()
-    first = None
-    for chunk in uploaded_file.chunks():
-        if first is None:
-            first = chunk
-        total += len(chunk)
-        if total > max_bytes:
-            raise ValidationError(_("File too large."))
-        h.update(chunk)
-    if first and content_type in TEXTUAL_CT and detect_suspicious_magic(first):
+    declared_size = getattr(uploaded_file, "size", None)
+    if declared_size is not None and declared_size > max_bytes:
+        raise ValidationError(_("File too large."))
+
+    head = _peek(uploaded_file, _SNIFF_BYTES)
+    if head and content_type in TEXTUAL_CT and detect_suspicious_magic(head):
         raise ValidationError(
             _("Binary/archived file not allowed for this content type."),
         )
-    digest = h.hexdigest()
+    if file_type is None:
+        file_type = detect_file_type(
+            filename=safe_name,
+            text=head.decode("utf-8", errors="ignore"),
+        )
+
+    tee = HashingReader(uploaded_file, name=safe_name)
+    submission.set_content(
+        uploaded_file=tee,
+        filename=safe_name,
+        file_type=file_type,
+    )
+    # Backstop for uploads that do not declare a size: the count is only
+    # known once storage has read everything, so remove what was written.
+    if tee.bytes_read > max_bytes:
+        with contextlib.suppress(Exception):
+            submission.input_file.delete(save=False)
+        raise ValidationError(_("File too large."))
+
+    digest = tee.hexdigest()
+    if digest is None:
+        with submission.input_file.open("rb"):
+            digest = submission._compute_checksum_filelike(submission.input_file)
+    else:
+        submission.size_bytes = tee.bytes_read
+    submission.checksum_sha256 = digest
+    return IngestResult(filename=safe_name, sha256=digest)
+
+
+# detect_suspicious_magic looks at the first 4 bytes; detect_file_type's text
+# sniff only needs the first non-blank character, so a small peek is plenty.
+_SNIFF_BYTES = 1024
+
+
+def _peek(uploaded_file, size: int) -> bytes:
     with contextlib.suppress(AttributeError, OSError):
         uploaded_file.seek(0)
-    return IngestResult(filename=safe_name, sha256=digest)
+    head = uploaded_file.read(size) or b""
+    with contextlib.suppress(AttributeError, OSError):
+        uploaded_file.seek(0)
+    return head.encode("utf-8") if isinstance(head, str) else head
+
+
+class HashingReader(File):
+    """
+    File wrapper that hashes and counts bytes as they are read.
+
+    Storage backends read their input sequentially, either through
+    ``chunks()`` or repeated ``read(n)`` calls, after an optional rewind. The
+    stream counts as complete at EOF or, when the wrapped file declares its
+    ``size``, once that many bytes have been read; backends such as GCS read
+    exactly the declared size and never make a final empty read. A rewind to
+    the start restarts the digest and a seek to the current position is
+    ignored (resumable uploads re-seek before each chunk); any other seek
+    marks the digest unusable, and ``hexdigest()`` then returns None.
+    """
+
+    def __init__(self, file, name=None):
+        super().__init__(file, name=name)
+        self._declared_size = getattr(file, "size", None)
+        self._restart()
+
+    def _restart(self) -> None:
+        self._hasher = hashlib.sha256()
+        self.bytes_read = 0
+        self._at_eof = False
+        self._sequential = True
+
+    def read(self, size=-1):
+        data = self.file.read(size)
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        if raw:
+            self._hasher.update(raw)
+            self.bytes_read += len(raw)
+        if not raw or size is None or size < 0:
+            self._at_eof = True
+        return data
+
+    def seek(self, offset, whence=0):
+        if whence == 0 and offset == 0:
+            self._restart()
+        elif not (whence == 0 and offset == self.bytes_read):
+            self._sequential = False
+        return self.file.seek(offset, whence)
+
+    def hexdigest(self) -> str | None:
+        """Return the digest of the full stream, or None if it is unknown."""
+        complete = self._at_eof or self.bytes_read == self._declared_size
+        if complete and self._sequential:
+            return self._hasher.hexdigest()
+        return None
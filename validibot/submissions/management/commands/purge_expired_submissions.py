@@ -5,12 +5,17 @@ This command processes submissions that have passed their retention period
 (expires_at < now) and purges their content. The submission record is preserved
 for audit trail; only the content (inline text or uploaded file) is removed.
 
+Submissions are claimed in chunks with ``FOR UPDATE SKIP LOCKED``, their stored
+files are deleted concurrently, and the rows are redacted in bulk (see
+``validibot.validations.services.retention_purge``). Overlapping invocations
+therefore split a backlog instead of contending for it.
+
 This command should be scheduled to run periodically (e.g., hourly via
 Cloud Scheduler or cron).
 
 Usage:
     python manage.py purge_expired_submissions
-    python manage.py purge_expired_submissions --batch-size 100
+    python manage.py purge_expired_submissions --batch-size 500
     python manage.py purge_expired_submissions --dry-run
 
 Environment:
@@ -18,20 +23,15 @@ Environment:
     to GCS for deleting execution bundles.
 """
 
-import logging
-
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from django.db.models import Exists
-from django.db.models import OuterRef
 from django.utils import timezone
 
 from validibot.submissions.models import Submission
-from validibot.validations.constants import VALIDATION_RUN_TERMINAL_STATUSES
-from validibot.validations.models import ValidationRun
 from validibot.validations.services.retention import schedule_submission_retention
-
-logger = logging.getLogger(__name__)
+from validibot.validations.services.retention_purge import expired_submissions
+from validibot.validations.services.retention_purge import (
+    purge_expired_submission_chunk,
+)
 
 
 class Command(BaseCommand):
@@ -41,8 +41,8 @@ class Command(BaseCommand):
         parser.add_argument(
             "--batch-size",
             type=int,
-            default=100,
-            help="Number of submissions to process per batch (default: 100)",
+            default=500,
+            help="Number of submissions to claim per batch (default: 500)",
         )
         parser.add_argument(
             "--dry-run",
@@ -52,8 +52,8 @@ class Command(BaseCommand):
         parser.add_argument(
             "--max-batches",
             type=int,
-            default=10,
-            help="Maximum number of batches to process (default: 10, 0=unlimited)",
+            default=20,
+            help="Maximum number of batches to process (default: 20, 0=unlimited)",
         )
 
     def handle(self, *args, **options):
@@ -65,7 +65,9 @@ class Command(BaseCommand):
         self._repair_completion_based_deadlines(now=now)
         now = timezone.now()
         total_purged = 0
-        total_failed = 0
+        # Rows that failed stay expired; skip them for the rest of this run so
+        # a persistent storage error cannot make every batch re-claim them.
+        failed: dict[str, str] = {}
         batch_count = 0
 
         while True:
@@ -74,72 +76,58 @@ class Command(BaseCommand):
                 self.stdout.write(
                     self.style.WARNING(
                         f"Reached max batch limit ({max_batches}). "
-                        f"Purged {total_purged}, failed {total_failed}."
+                        f"Purged {total_purged}, failed {len(failed)}."
                     )
                 )
                 break
 
-            # Find expired submissions that haven't been purged yet
-            active_runs = ValidationRun.objects.filter(
-                submission_id=OuterRef("pk"),
-            ).exclude(status__in=VALIDATION_RUN_TERMINAL_STATUSES)
-            expired_submissions = (
-                Submission.objects.filter(
-                    expires_at__lte=now,
-                    content_purged_at__isnull=True,
+            if dry_run:
+                offset = batch_count * batch_size
+                batch = list(
+                    expired_submissions(now).values_list(
+                        "id",
+                        "retention_policy",
+                        "expires_at",
+                    )[offset : offset + batch_size],
                 )
-                .annotate(has_active_runs=Exists(active_runs))
-                .filter(has_active_runs=False)
-                .order_by("expires_at")[:batch_size]
-            )
-
-            # Convert to list to avoid queryset changes during iteration
-            submissions_to_process = list(expired_submissions)
+                for submission_id, policy, expires_at in batch:
+                    self.stdout.write(
+                        f"  [DRY RUN] Would purge: {submission_id} "
+                        f"(policy={policy}, expires={expires_at})"
+                    )
+                purged, batch_failed = len(batch), {}
+            else:
+                chunk = purge_expired_submission_chunk(
+                    now=now,
+                    limit=batch_size,
+                    skip_ids=failed,
+                )
+                purged, batch_failed = len(chunk.purged), chunk.failed
 
-            if not submissions_to_process:
-                if total_purged == 0 and total_failed == 0:
+            if not purged and not batch_failed:
+                if total_purged == 0 and not failed:
                     self.stdout.write(
                         self.style.SUCCESS("No expired submissions to purge.")
                     )
                 else:
                     self.stdout.write(
                         self.style.SUCCESS(
-                            f"Completed. Purged {total_purged}, failed {total_failed}."
+                            f"Completed. Purged {total_purged}, failed {len(failed)}."
                         )
                     )
                 break
 
             batch_count += 1
+            total_purged += purged
+            failed.update(batch_failed)
             self.stdout.write(
-                f"Processing batch {batch_count}: {len(submissions_to_process)} "
-                f"submission(s)"
+                f"Processed batch {batch_count}: {purged} purged, "
+                f"{len(batch_failed)} failed"
             )
-
-            for submission in submissions_to_process:
-                if dry_run:
-                    self.stdout.write(
-                        f"  [DRY RUN] Would purge: {submission.id} "
-                        f"(policy={submission.retention_policy}, "
-                        f"expires={submission.expires_at})"
-                    )
-                    total_purged += 1
-                    continue
-
-                try:
-                    with transaction.atomic():
-                        submission.purge_content()
-                    total_purged += 1
-                    self.stdout.write(self.style.SUCCESS(f"  Purged: {submission.id}"))
-                except Exception as e:
-                    total_failed += 1
-                    self.stdout.write(
-                        self.style.ERROR(f"  Failed to purge {submission.id}: {e}")
-                    )
-                    logger.exception(
-                        "Failed to purge expired submission",
-                        extra={"submission_id": str(submission.id)},
-                    )
-                    # Continue with other submissions - don't stop on failure
+            for submission_id, error in batch_failed.items():
+                self.stdout.write(
+                    self.style.ERROR(f"  Failed to purge {submission_id}: {error}")
+                )
 
         if dry_run:
             self.stdout.write(
@@ -150,15 +138,15 @@ class Command(BaseCommand):
         else:
             self.stdout.write(
                 self.style.SUCCESS(
-                    f"Purge complete. Purged: {total_purged}, Failed: {total_failed}"
+                    f"Purge complete. Purged: {total_purged}, Failed: {len(failed)}"
                 )
             )
 
         # Return non-zero exit code if there were failures
-        if total_failed > 0:
+        if failed:
             self.stderr.write(
                 self.style.ERROR(
-                    f"{total_failed} submission(s) failed to purge. "
+                    f"{len(failed)} submission(s) failed to purge. "
                     "Check logs and retry."
                 )
             )
@@ -4,6 +4,7 @@ import contextlib
 import hashlib
 import logging
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -30,6 +31,8 @@ from validibot.users.models import User
 from validibot.workflows.models import Workflow
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from django.core.files.uploadedfile import UploadedFile
 
 logger = logging.getLogger(__name__)
@@ -1002,39 +1005,90 @@ def _delete_run_input_files(run) -> None:
     External failures propagate so callers cannot stamp ``content_purged_at``
     while copied input bytes may remain.
     """
-    org_id = str(run.org_id)
-    run_id = str(run.id)
-    run_path = f"runs/{org_id}/{run_id}/"
-    bucket = getattr(settings, "GCS_VALIDATION_BUCKET", "")
-
-    attempts = list(run.step_runs.prefetch_related("execution_attempts").all())
-    attempt_rows = [
-        attempt
-        for step_run in attempts
+    attempts = [
+        (attempt.id, attempt.output_envelope_uri)
+        for step_run in run.step_runs.prefetch_related("execution_attempts").all()
         for attempt in step_run.execution_attempts.all()
     ]
+    artifact_uris = [
+        uri
+        for artifact in run.artifacts.all()
+        for uri in (artifact.storage_uri, artifact.manifest_uri)
+    ]
+    _delete_run_input_prefix(
+        _plan_run_input_deletion(
+            org_id=run.org_id,
+            run_id=run.id,
+            attempts=attempts,
+            artifact_uris=artifact_uris,
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class _RunInputDeletion:
+    """What to delete below one run prefix, and what output to keep there.
+
+    Built from database rows by :func:`_plan_run_input_deletion`; executing it
+    touches storage only, so the retention purge can run many of them on
+    worker threads without a database connection each.
+    """
 
-    def _attempt_relative_prefix(attempt) -> str:
-        return f"attempts/{attempt.id}/"
+    org_id: str
+    run_id: str
+    keep_relative_uris: frozenset[str]
+    keep_relative_prefixes: frozenset[str]
+
+
+def _plan_run_input_deletion(
+    *,
+    org_id,
+    run_id,
+    attempts: Iterable[tuple[object, str]],
+    artifact_uris: Iterable[str],
+) -> _RunInputDeletion:
+    """Compute the keep-set for a run's copied-input deletion.
+
+    ``attempts`` are ``(attempt_id, output_envelope_uri)`` pairs for every
+    execution attempt of the run; ``artifact_uris`` are the storage and
+    manifest URIs of its artifacts.
+    """
+    run_path = f"runs/{org_id}/{run_id}/"
+    bucket = getattr(settings, "GCS_VALIDATION_BUCKET", "")
+    expected_prefix = f"gs://{bucket}/{run_path}" if bucket else ""
 
     keep_relative_uris = {"output.json"}
     keep_relative_prefixes = {"output/", "outputs/"}
-    for attempt in attempt_rows:
-        relative_prefix = _attempt_relative_prefix(attempt)
+    for attempt_id, output_envelope_uri in attempts:
+        relative_prefix = f"attempts/{attempt_id}/"
         keep_relative_uris.add(f"{relative_prefix}output.json")
         keep_relative_prefixes.add(f"{relative_prefix}output/")
         keep_relative_prefixes.add(f"{relative_prefix}outputs/")
 
-        output_uri = (attempt.output_envelope_uri or "").strip()
-        expected_prefix = f"gs://{bucket}/{run_path}" if bucket else ""
+        output_uri = (output_envelope_uri or "").strip()
         if expected_prefix and output_uri.startswith(expected_prefix):
             keep_relative_uris.add(output_uri[len(expected_prefix) :])
 
-    for artifact in run.artifacts.all():
-        for uri in (artifact.storage_uri, artifact.manifest_uri):
-            expected_prefix = f"gs://{bucket}/{run_path}" if bucket else ""
-            if expected_prefix and uri.startswith(expected_prefix):
-                keep_relative_uris.add(uri[len(expected_prefix) :])
+    for uri in artifact_uris:
+        if expected_prefix and uri.startswith(expected_prefix):
+            keep_relative_uris.add(uri[len(expected_prefix) :])
+
+    return _RunInputDeletion(
+        org_id=str(org_id),
+        run_id=str(run_id),
+        keep_relative_uris=frozenset(keep_relative_uris),
+        keep_relative_prefixes=frozenset(keep_relative_prefixes),
+    )
+
+
+def _delete_run_input_prefix(plan: _RunInputDeletion) -> None:
+    """Execute a :class:`_RunInputDeletion` against storage."""
+    org_id = plan.org_id
+    run_id = plan.run_id
+    run_path = f"runs/{org_id}/{run_id}/"
+    bucket = getattr(settings, "GCS_VALIDATION_BUCKET", "")
+    keep_relative_uris = plan.keep_relative_uris
+    keep_relative_prefixes = plan.keep_relative_prefixes
 
     try:
         if bucket:
@@ -1118,6 +1172,8 @@ def detect_file_type(
         return SubmissionFileType.XML
     if name.endswith(".thmz"):
         return SubmissionFileType.BINARY
+    if name.endswith((".parquet", ".arrow", ".feather")):
+        return SubmissionFileType.BINARY
     if text:
         s = text.lstrip()
         if s.startswith(("{", "[")):
@@ -0,0 +1,185 @@
+"""
+Tests for single-pass upload ingest (``validibot.submissions.ingest``).
+
+An upload used to be read three times: once to hash and sniff it, once by
+the storage write, and once more when ``Submission.save()`` re-hashed the
+stored file. These tests pin the single-pass contract:
+
+- the upload's bytes are read once (plus a small peek for the magic sniff);
+- the submission leaves ingest with its checksum, so ``save()`` reads nothing;
+- rejected uploads (too large, binary-as-text) never reach storage;
+- a storage backend that reads out of order still gets a correct checksum.
+"""
+
+import hashlib
+import io
+from unittest.mock import patch
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import InMemoryUploadedFile
+
+from validibot.submissions.constants import SubmissionFileType
+from validibot.submissions.ingest import HashingReader
+from validibot.submissions.ingest import ingest_uploaded_file
+from validibot.submissions.models import Submission
+from validibot.users.tests.factories import OrganizationFactory
+from validibot.workflows.tests.factories import WorkflowFactory
+
+PAYLOAD = b'{"meter": "SN-1", "reading": 12.5}\n' * 4096
+MAX_BYTES = len(PAYLOAD)
+PEEK_ALLOWANCE = 1024
+SEEK_OFFSET = 5
+
+
+class CountingBytesIO(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def _upload(data: bytes, name: str = "meters.json"):
+    source = CountingBytesIO(data)
+    upload = InMemoryUploadedFile(
+        source,
+        field_name="file",
+        name=name,
+        content_type="application/json",
+        size=len(data),
+        charset=None,
+    )
+    return upload, source
+
+
+def _ingest(submission, upload, *, max_bytes=MAX_BYTES, content_type=None):
+    return ingest_uploaded_file(
+        submission,
+        uploaded_file=upload,
+        filename=upload.name,
+        content_type=content_type or "application/json",
+        max_bytes=max_bytes,
+        file_type=SubmissionFileType.JSON,
+    )
+
+
+@pytest.mark.django_db
+class TestIngestUploadedFile:
+    def test_reads_the_upload_once_and_sets_the_checksum(self):
+        submission = Submission(org=OrganizationFactory())
+        upload, source = _upload(PAYLOAD)
+
+        result = _ingest(submission, upload)
+
+        expected = hashlib.sha256(PAYLOAD).hexdigest()
+        assert result.sha256 == expected
+        assert submission.checksum_sha256 == expected
+        assert submission.size_bytes == len(PAYLOAD)
+        assert source.bytes_read <= len(PAYLOAD) + PEEK_ALLOWANCE
+        with submission.input_file.open("rb") as stored:
+            assert stored.read() == PAYLOAD
+
+    def test_save_does_not_rehash_the_stored_file(self):
+        workflow = WorkflowFactory()
+        submission = Submission(
+            org=workflow.org,
+            workflow=workflow,
+            project=workflow.project,
+        )
+        upload, _source = _upload(PAYLOAD)
+        _ingest(submission, upload)
+        submission.name = "meters.json"
+
+        with patch.object(
+            Submission,
+            "_compute_checksum_filelike",
+            side_effect=AssertionError("stored file was re-read"),
+        ):
+            submission.save()
+
+        assert submission.checksum_sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+
+    def test_oversized_upload_is_rejected_before_storage(self):
+        submission = Submission(org=OrganizationFactory())
+        upload, source = _upload(PAYLOAD)
+
+        with pytest.raises(ValidationError):
+            _ingest(submission, upload, max_bytes=len(PAYLOAD) - 1)
+
+        assert not submission.input_file
+        assert source.bytes_read == 0
+
+    def test_binary_posing_as_text_is_rejected_before_storage(self):
+        submission = Submission(org=OrganizationFactory())
+        upload, source = _upload(b"PK\x03\x04" + PAYLOAD)
+
+        with pytest.raises(ValidationError):
+            _ingest(submission, upload, max_bytes=len(PAYLOAD) * 2)
+
+        assert not submission.input_file
+        assert source.bytes_read <= PEEK_ALLOWANCE
+
+    def test_out_of_order_storage_reads_fall_back_to_rehashing(self):
+        submission = Submission(org=OrganizationFactory())
+        upload, _source = _upload(PAYLOAD)
+        original_read = HashingReader.read
+
+        def skip_ahead_then_read(self, size=-1):
+            # A backend that seeks mid-stream invalidates the tee's digest.
+            if self.file.tell() == 0:
+                self.seek(SEEK_OFFSET)
+            return original_read(self, size)
+
+        with patch.object(HashingReader, "read", skip_ahead_then_read):
+            result = _ingest(submission, upload)
+
+        with submission.input_file.open("rb") as stored:
+            stored_bytes = stored.read()
+        assert stored_bytes == PAYLOAD[SEEK_OFFSET:]
+        assert result.sha256 == hashlib.sha256(stored_bytes).hexdigest()
+        assert submission.checksum_sha256 == result.sha256
+
+
+class TestHashingReader:
+    def test_rewind_restarts_the_digest(self):
+        reader = HashingReader(io.BytesIO(PAYLOAD))
+        reader.read(100)
+        reader.seek(0)
+
+        assert b"".join(reader.chunks()) == PAYLOAD
+        assert reader.hexdigest() == hashlib.sha256(PAYLOAD).hexdigest()
+
+    def test_partial_or_out_of_order_reads_have_no_digest(self):
+        partial = HashingReader(io.BytesIO(PAYLOAD))
+        partial.read(100)
+        assert partial.hexdigest() is None
+
+        skipped = HashingReader(io.BytesIO(PAYLOAD))
+        skipped.seek(SEEK_OFFSET)
+        skipped.read()
+        assert skipped.hexdigest() is None
+
+    def test_reading_exactly_the_declared_size_completes_the_digest(self):
+        # GCS multipart uploads make one read(size) and no final empty read.
+        upload, _source = _upload(PAYLOAD)
+        reader = HashingReader(upload)
+
+        assert reader.read(len(PAYLOAD)) == PAYLOAD
+        assert reader.hexdigest() == hashlib.sha256(PAYLOAD).hexdigest()
+
+    def test_reseeking_the_current_position_keeps_the_digest(self):
+        # Resumable uploads seek to the next chunk's offset before reading it.
+        upload, _source = _upload(PAYLOAD)
+        reader = HashingReader(upload)
+        chunk = len(PAYLOAD) // 2
+
+        reader.seek(0)
+        reader.read(chunk)
+        reader.seek(reader.tell())
+        reader.read(len(PAYLOAD) - chunk)
+
+        assert reader.hexdigest() == hashlib.sha256(PAYLOAD).hexdigest()
@@ -55,6 +55,7 @@ from rest_framework import status
 from rest_framework.response import Response
 
 from validibot.core.api.worker import WorkerOnlyAPIView
+from validibot.core.constants import WriteDurability
 
 logger = logging.getLogger(__name__)
 
@@ -137,7 +138,9 @@ class LogTrackingEventView(WorkerOnlyAPIView):
             # failures from Cloud Tasks (it'd see a 200 and not
             # retry). Calling the raising path means a real DB error
             # bubbles to the ``except Exception`` below and becomes a
-            # 500 that Cloud Tasks retries with backoff.
+            # 500 that Cloud Tasks retries with backoff. For the same
+            # reason the write is synchronous: a buffered row would be
+            # acknowledged before it reached the database.
             service._log_tracking_event(
                 event_type=event_type,
                 app_event_type=app_event_type,
@@ -146,6 +149,7 @@ class LogTrackingEventView(WorkerOnlyAPIView):
                 user=user,
                 extra_data=extra_data,
                 channel=channel,
+                durability=WriteDurability.SYNC,
             )
             return Response({"status": "ok"})
         except ValueError as exc:
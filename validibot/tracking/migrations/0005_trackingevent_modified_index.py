@@ -0,0 +1,26 @@
+# Generated by Django 6.0.7 on 2026-10-19 01:48
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    """Index ``TrackingEvent.modified`` for the dashboard rollup refresh.
+
+    Every refresh reads ``WHERE modified >= <watermark>``; without the index
+    that is a sequential scan of the whole events table every few minutes.
+    """
+
+    dependencies = [
+        ("tracking", "0004_alter_trackingevent_app_event_type"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="trackingevent",
+            index=models.Index(
+                fields=["modified"],
+                name="tracking_event_modified_idx",
+            ),
+        ),
+    ]
@@ -81,6 +81,9 @@ class TrackingEvent(BaseEvent):
             # (TruncHour/TruncDay with org filter). Without this index,
             # 90-day queries can table-scan the entire events table.
             models.Index(fields=["org", "created"]),
+            # The dashboard rollup refresh finds events changed since its
+            # watermark every few minutes (validibot.dashboard.rollups).
+            models.Index(fields=["modified"], name="tracking_event_modified_idx"),
         ]
 
     event_type = models.CharField(
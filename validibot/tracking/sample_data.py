@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 from django.utils import timezone
 
+from validibot.core.write_buffer import flush_write_buffers
 from validibot.events.constants import AppEventType
 from validibot.tracking.constants import TrackingEventType
 from validibot.tracking.services import TrackingEventService
@@ -160,4 +161,6 @@ def seed_sample_tracking_data(
             if completion_event:
                 events.append(completion_event)
 
+    # Callers (the seed command, tests) read the rows straight back.
+    flush_write_buffers()
     return events
@@ -4,8 +4,11 @@ import logging
 from typing import TYPE_CHECKING
 from typing import Any
 
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
+from validibot.core.constants import WriteDurability
+from validibot.core.write_buffer import get_write_buffer
 from validibot.events.constants import AppEventType
 from validibot.tracking.constants import TrackingEventType
 from validibot.tracking.models import TrackingEvent
@@ -105,8 +108,9 @@ class TrackingEventService:
             extra_data: Optional structured metadata to store alongside the event.
 
         Returns:
-            TrackingEvent instance when recorded, otherwise ``None`` if skipped
-            or failed.
+            TrackingEvent instance when recorded (unsaved until the write
+            buffer flushes when durability is buffered), otherwise ``None``
+            if skipped or failed.
         """
         tracking_event = None
         try:
@@ -144,7 +148,16 @@ class TrackingEventService:
         extra_data: Mapping[str, Any] | None = None,
         channel: str | None = None,
         recorded_at: datetime | None = None,
+        durability: WriteDurability | str | None = None,
     ) -> TrackingEvent | None:
+        """
+        Build and write one tracking event, raising on failure.
+
+        ``durability`` defaults to ``TRACKING_EVENT_DURABILITY``. A buffered
+        event is returned unsaved and inserted with the rest of the
+        process's batch at the end of the request or task; errors in that
+        insert are logged by the buffer, not raised here.
+        """
         if not event_type:
             raise ValueError(_("Event type is required to log a tracking event"))
 
@@ -187,6 +200,15 @@ class TrackingEventService:
             create_kwargs["extra_data"] = create_kwargs.get("extra_data") or {}
             create_kwargs["extra_data"]["channel"] = derived_channel
 
+        durability = durability or settings.TRACKING_EVENT_DURABILITY
+        if durability == WriteDurability.BUFFERED:
+            tracking_event = TrackingEvent(**create_kwargs)
+            get_write_buffer(
+                "tracking_events",
+                write_batch=TrackingEvent.objects.bulk_create,
+            ).add(tracking_event)
+            return tracking_event
+
         tracking_event = TrackingEvent.objects.create(**create_kwargs)
         return tracking_event
 
@@ -5,6 +5,7 @@ from django.conf import settings
 from validibot.users.constants import PermissionCode
 from validibot.users.constants import UserKindGroup
 from validibot.users.models import ensure_personal_workspace
+from validibot.users.permissions import get_permission_snapshot
 from validibot.users.scoping import ensure_active_org_scope
 
 logger = logging.getLogger(__name__)
@@ -109,9 +110,12 @@ def _apply_organization_context(request):
             "has_any_org_roles": True,
         }
 
-    active_role_codes = (
-        set(active_membership.role_codes) if active_membership else set()
-    )
+    # Read from the permission snapshot, which also answers the has_perm
+    # checks below, instead of querying the membership's roles again.
+    active_role_codes = set()
+    if active_membership:
+        snapshot = get_permission_snapshot(request.user)
+        active_role_codes = set(snapshot.role_codes_by_org.get(active_org.id, ()))
     has_author_admin_owner = bool(
         active_org
         and request.user.has_perm(PermissionCode.WORKFLOW_EDIT.value, active_org)
@@ -0,0 +1,47 @@
+# Generated by Django 6.0.7 on 2026-10-19 00:46
+
+from django.db import migrations
+from django.db import models
+from django.db.models import Count
+from django.db.models import IntegerField
+from django.db.models import OuterRef
+from django.db.models import Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_unread_counts(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    Notification = apps.get_model("notifications", "Notification")
+    unread = (
+        Notification.objects.filter(
+            user=OuterRef("pk"),
+            read_at__isnull=True,
+            dismissed_at__isnull=True,
+        )
+        .order_by()
+        .values("user")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    User.objects.update(
+        unread_notification_count=Coalesce(
+            Subquery(unread, output_field=IntegerField()),
+            0,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0004_current_schema"),
+        ("notifications", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="unread_notification_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_unread_counts, migrations.RunPython.noop),
+    ]
@@ -412,6 +412,38 @@ class User(AbstractUser):
         ),
     )
 
+    # Denormalized count of unread, undismissed notifications, so the
+    # navbar badge reads it off ``request.user`` instead of running a COUNT
+    # on every page. Maintained by ``Notification`` create/mark_read/dismiss
+    # and repaired nightly by ``reconcile_notification_counts``.
+    unread_notification_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+    )
+
+    def save(self, **kwargs):
+        """Leave ``unread_notification_count`` out of whole-row saves.
+
+        The counter only moves through ``F()`` updates, so the value on an
+        instance loaded earlier (a profile form, an admin edit) is stale and
+        writing it back would undo concurrent increments. A save that names
+        the field in ``update_fields`` still writes it.
+        """
+        if (
+            kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+            and not self._state.adding
+        ):
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name != "unread_notification_count"
+            ]
+        super().save(**kwargs)
+
     def get_current_org(self) -> Organization | None:
         """
         Return the current_org (cached via select_related in callers).
@@ -978,6 +1010,7 @@ class MemberInvite(TimeStampedModel):
 
         from validibot.workflows.models import OrgGuestAccess
         from validibot.workflows.models import WorkflowAccessGrant
+        from validibot.workflows.services.access_index import sync_user_access
 
         now = timezone.now()
         with transaction.atomic():
@@ -991,6 +1024,8 @@ class MemberInvite(TimeStampedModel):
                 org=self.org,
                 is_active=True,
             ).update(is_active=False, modified=now)
+            # ``update()`` sends no signals; refresh the access index here.
+            sync_user_access(self.invitee_user.pk, self.org_id)
 
         return workflow_grant_count + org_grant_count
 
@@ -1,6 +1,24 @@
+"""Org-scoped RBAC for Django's ``has_perm``.
+
+``PERMISSION_DEFINITIONS`` binds each ``PermissionCode`` to the roles that
+grant it, and ``OrgPermissionBackend`` answers ``has_perm`` against the
+user's membership roles in the object's org.
+
+A page asks several permission questions about the same user (the
+organization context processor alone asks three), so the backend answers them
+from a ``PermissionSnapshot`` — the user's active memberships, their role
+codes, and, on first need, their workflow grants — loaded once and kept on the
+user object. ``request.user`` is built per request and tasks load their user
+per task, so a snapshot lives exactly one request or task. Any membership,
+role, or grant change in the process calls
+``invalidate_permission_snapshots()``, so a snapshot never outlives a change
+made earlier in the same request.
+"""
+
 from __future__ import annotations
 
 from dataclasses import dataclass
+from dataclasses import field
 
 from django.contrib.auth.backends import BaseBackend
 
@@ -233,6 +251,90 @@ def membership_grants_permission(
     return membership.has_any_role(set(definition.roles))
 
 
+# Bumped by ``invalidate_permission_snapshots``; a snapshot taken under an
+# older generation is reloaded on its next use.
+_snapshot_generation = 0
+
+_SNAPSHOT_ATTR = "_org_permission_snapshot"
+
+
+@dataclass
+class PermissionSnapshot:
+    """
+    One user's org roles and workflow grants, as of one load.
+    """
+
+    generation: int
+    # org_id -> role codes for each active membership. A membership with no
+    # roles maps to an empty set: it still counts for VIEW_OWN checks.
+    role_codes_by_org: dict[int, frozenset[str]]
+    user_id: int
+    # (org_id, slug) families the user holds an active grant on; loaded on
+    # the first launch check, since most pages never ask.
+    _grant_families: frozenset[tuple[int, str]] | None = field(
+        default=None,
+        repr=False,
+    )
+
+    @classmethod
+    def load(cls, user: User) -> PermissionSnapshot:
+        # Read the generation first: a change that lands while the snapshot
+        # is loading bumps it, so the snapshot is already stale on next use.
+        generation = _snapshot_generation
+        role_codes: dict[int, set[str]] = {}
+        for org_id, code in Membership.objects.filter(
+            user_id=user.pk,
+            is_active=True,
+        ).values_list("org_id", "membership_roles__role__code"):
+            codes = role_codes.setdefault(org_id, set())
+            if code is not None:
+                codes.add(code)
+        return cls(
+            generation=generation,
+            role_codes_by_org={
+                org_id: frozenset(codes) for org_id, codes in role_codes.items()
+            },
+            user_id=user.pk,
+        )
+
+    def has_family_grant(self, org_id: int, slug: str) -> bool:
+        if self._grant_families is None:
+            from validibot.workflows.models import WorkflowAccessGrant
+
+            self._grant_families = frozenset(
+                WorkflowAccessGrant.objects.filter(
+                    user_id=self.user_id,
+                    is_active=True,
+                ).values_list("workflow__org_id", "workflow__slug"),
+            )
+        return (org_id, slug) in self._grant_families
+
+
+def get_permission_snapshot(user: User) -> PermissionSnapshot:
+    """Return ``user``'s current snapshot, loading it if missing or stale."""
+    snapshot = getattr(user, _SNAPSHOT_ATTR, None)
+    if (
+        snapshot is None
+        or snapshot.generation != _snapshot_generation
+        or snapshot.user_id != user.pk
+    ):
+        snapshot = PermissionSnapshot.load(user)
+        setattr(user, _SNAPSHOT_ATTR, snapshot)
+    return snapshot
+
+
+def invalidate_permission_snapshots() -> None:
+    """
+    Mark every permission snapshot in this process stale.
+
+    Called whenever a membership, membership role, or workflow grant changes.
+    Changes are rare next to permission checks, so dropping every snapshot
+    rather than tracking which users changed keeps this simple.
+    """
+    global _snapshot_generation  # noqa: PLW0603 — intentional module-level state
+    _snapshot_generation += 1
+
+
 class OrgPermissionBackend(BaseBackend):
     """
     Permission backend that evaluates Django ``has_perm`` calls against
@@ -245,6 +347,9 @@ class OrgPermissionBackend(BaseBackend):
     Special cases:
     - WORKFLOW_LAUNCH: Also grants permission for public workflows and
       users with active WorkflowAccessGrant (guests).
+
+    Roles and grants come from the user's ``PermissionSnapshot``, so repeated
+    checks in one request cost one membership query in total.
     """
 
     supports_object_permissions = True
@@ -266,25 +371,22 @@ class OrgPermissionBackend(BaseBackend):
         if not perm_definition:
             return False
 
+        snapshot = get_permission_snapshot(user)
+
         # Special handling for workflow launch permission - check public
         # workflows and guest access grants before requiring membership.
         if perm_code == PermissionCode.WORKFLOW_LAUNCH and obj is not None:
-            if self._check_workflow_launch_special_access(user, obj):
+            if self._check_workflow_launch_special_access(snapshot, obj):
                 return True
 
-        org = self._resolve_org(user=user, obj=obj)
-        if org is None:
+        org_id = self._resolve_org_id(user=user, obj=obj)
+        if org_id is None:
             return False
 
-        membership = (
-            Membership.objects.filter(user=user, org=org, is_active=True)
-            .select_related("org")
-            .prefetch_related("membership_roles__role")
-            .first()
-        )
-        if membership is None:
+        role_codes = snapshot.role_codes_by_org.get(org_id)
+        if role_codes is None:
             return False
-        if membership.has_role(RoleCode.OWNER):
+        if RoleCode.OWNER in role_codes:
             return True
 
         if (
@@ -294,9 +396,13 @@ class OrgPermissionBackend(BaseBackend):
         ):
             return True
 
-        return membership.has_any_role(set(perm_definition.roles))
+        return bool(role_codes & perm_definition.roles)
 
-    def _check_workflow_launch_special_access(self, user: User, obj) -> bool:
+    def _check_workflow_launch_special_access(
+        self,
+        snapshot: PermissionSnapshot,
+        obj,
+    ) -> bool:
         """
         Check if user has launch access via public workflow or guest grant.
 
@@ -310,7 +416,6 @@ class OrgPermissionBackend(BaseBackend):
         # Import here to avoid circular imports
         from validibot.workflows.constants import WorkflowVisibility
         from validibot.workflows.models import Workflow
-        from validibot.workflows.models import WorkflowAccessGrant
 
         if not isinstance(obj, Workflow):
             return False
@@ -334,12 +439,7 @@ class OrgPermissionBackend(BaseBackend):
         # don't go through ``Workflow.can_execute``, so the model-level
         # check alone is not sufficient — visibility, model methods,
         # and the auth backend must all agree on the family-grant rule.
-        return WorkflowAccessGrant.objects.filter(
-            user=user,
-            is_active=True,
-            workflow__org_id=obj.org_id,
-            workflow__slug=obj.slug,
-        ).exists()
+        return snapshot.has_family_grant(obj.org_id, obj.slug)
 
     def get_all_permissions(
         self,
@@ -352,39 +452,37 @@ class OrgPermissionBackend(BaseBackend):
 
         if not user_obj or not getattr(user_obj, "is_authenticated", False):
             return set()
-        org = self._resolve_org(user=user_obj, obj=obj)
-        if org is None:
+        org_id = self._resolve_org_id(user=user_obj, obj=obj)
+        if org_id is None:
             return set()
 
-        membership = (
-            Membership.objects.filter(user=user_obj, org=org, is_active=True)
-            .prefetch_related("membership_roles__role")
-            .first()
-        )
-        if membership is None:
+        role_codes = get_permission_snapshot(user_obj).role_codes_by_org.get(org_id)
+        if role_codes is None:
             return set()
-        codes = set()
-        for definition in PERMISSION_DEFINITIONS:
-            if membership.has_any_role(set(definition.roles)):
-                codes.add(f"{definition.app_label}.{definition.code.value}")
-        return codes
+        return {
+            f"{definition.app_label}.{definition.code.value}"
+            for definition in PERMISSION_DEFINITIONS
+            if role_codes & definition.roles
+        }
 
-    def _resolve_org(
+    def _resolve_org_id(
         self,
         *,
         user: User,
         obj,
-    ) -> Organization | None:
+    ) -> int | None:
+        # Prefer ids over relations: the snapshot is keyed by org id, so
+        # there is no need to fetch the Organization row.
         if isinstance(obj, Organization):
-            return obj
+            return obj.pk
+
+        org_id = getattr(obj, "org_id", None) if obj is not None else None
+        if org_id:
+            return org_id
 
         if hasattr(obj, "org"):
             org = obj.org
             if isinstance(org, Organization):
-                return org
-
-        org_id = getattr(obj, "org_id", None) if obj is not None else None
-        if org_id:
-            return Organization.objects.filter(id=org_id).first()
+                return org.pk
 
-        return getattr(user, "current_org", None)
+        return getattr(user, "current_org_id", None)
@@ -1,10 +1,16 @@
+from http import HTTPStatus
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 
 from validibot.projects.tests.factories import ProjectFactory
 from validibot.submissions.tests.factories import SubmissionFactory
 from validibot.users.constants import PermissionCode
 from validibot.users.constants import RoleCode
 from validibot.users.models import Membership
+from validibot.users.permissions import OrgPermissionBackend
 from validibot.users.tests.factories import OrganizationFactory
 from validibot.users.tests.factories import UserFactory
 from validibot.users.tests.factories import grant_role
@@ -212,3 +218,105 @@ class OrgPermissionBackendTests(TestCase):
         self.assertFalse(
             random_user.has_perm(PermissionCode.WORKFLOW_LAUNCH.value, workflow),
         )
+
+
+class PermissionSnapshotTests(TestCase):
+    """
+    Repeated permission checks for one user are answered from one load of
+    their memberships, and any membership, role, or grant change is seen by
+    the next check.
+    """
+
+    def setUp(self):
+        self.org = OrganizationFactory()
+        self.user = UserFactory()
+        grant_role(self.user, self.org, RoleCode.AUTHOR)
+        self.backend = OrgPermissionBackend()
+
+    def test_repeated_checks_share_one_query(self):
+        with self.assertNumQueries(1):
+            for perm in PermissionCode:
+                self.backend.has_perm(self.user, perm.value, self.org)
+            self.backend.get_all_permissions(self.user, self.org)
+
+        self.assertTrue(
+            self.backend.has_perm(self.user, PermissionCode.WORKFLOW_EDIT, self.org),
+        )
+        self.assertFalse(
+            self.backend.has_perm(self.user, PermissionCode.ADMIN_MANAGE_ORG, self.org),
+        )
+
+    def test_role_change_invalidates_the_snapshot(self):
+        self.assertFalse(
+            self.backend.has_perm(self.user, PermissionCode.ADMIN_MANAGE_ORG, self.org),
+        )
+
+        Membership.objects.get(user=self.user, org=self.org).add_role(RoleCode.ADMIN)
+
+        self.assertTrue(
+            self.backend.has_perm(self.user, PermissionCode.ADMIN_MANAGE_ORG, self.org),
+        )
+
+    def test_deactivated_membership_invalidates_the_snapshot(self):
+        self.assertTrue(
+            self.backend.has_perm(self.user, PermissionCode.WORKFLOW_EDIT, self.org),
+        )
+
+        membership = Membership.objects.get(user=self.user, org=self.org)
+        membership.is_active = False
+        membership.save()
+
+        self.assertFalse(
+            self.backend.has_perm(self.user, PermissionCode.WORKFLOW_EDIT, self.org),
+        )
+        self.assertEqual(self.backend.get_all_permissions(self.user, self.org), set())
+
+    def test_new_grant_invalidates_the_snapshot(self):
+        from validibot.workflows.constants import WorkflowVisibility
+
+        owner = UserFactory()
+        grant_role(owner, self.org, RoleCode.OWNER)
+        workflow = Workflow.objects.create(
+            org=self.org,
+            user=owner,
+            project=ProjectFactory(org=self.org),
+            name="Private Workflow",
+            workflow_visibility=WorkflowVisibility.PRIVATE,
+        )
+        guest = UserFactory()
+        self.assertFalse(
+            self.backend.has_perm(guest, PermissionCode.WORKFLOW_LAUNCH, workflow),
+        )
+
+        WorkflowAccessGrant.objects.create(
+            workflow=workflow,
+            user=guest,
+            granted_by=owner,
+            is_active=True,
+        )
+
+        self.assertTrue(
+            self.backend.has_perm(guest, PermissionCode.WORKFLOW_LAUNCH, workflow),
+        )
+
+    def test_page_queries_role_codes_once(self):
+        """
+        The workflow list used to run 34 role queries: a membership load plus
+        two role lookups for every ``has_perm`` call. It now runs one.
+        """
+        self.client.force_login(self.user)
+        self.user.set_current_org(self.org)
+        session = self.client.session
+        session["active_org_id"] = self.org.id
+        session.save()
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("workflows:workflow_list"))
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        role_lookups = [
+            query["sql"]
+            for query in ctx.captured_queries
+            if '"users_membershiprole"' in query["sql"]
+        ]
+        self.assertEqual(len(role_lookups), 1, role_lookups)
@@ -2,8 +2,10 @@
 Callback API endpoint for container-based validators.
 
 Validator containers (EnergyPlus, FMU) POST completion callbacks to the worker
-service when they finish. This API view is intentionally thin and delegates
-processing to ValidationCallbackService.
+service when they finish. High-fanout backends (e.g. a large FMU parameter
+sweep) may instead POST many callbacks at once to the batch endpoint. Both API
+views are intentionally thin and delegate processing to
+ValidationCallbackService.
 
 Security is enforced at the infrastructure level (e.g., Cloud Run IAM, network
 isolation). This endpoint also includes a defense-in-depth guard (WorkerOnlyAPIView)
@@ -29,3 +31,24 @@ class ValidationCallbackView(WorkerOnlyAPIView):
             payload=request.data,
             caller_email=caller_email,
         )
+
+
+class ValidationCallbackBatchView(WorkerOnlyAPIView):
+    """
+    Handle many validation completion callbacks in one request.
+
+    The body is ``{"callbacks": [<callback payload>, ...]}``; each entry has
+    the same shape as a single callback. Per-callback outcomes are returned in
+    request order (see ValidationCallbackService.process_batch).
+    """
+
+    def post(self, request):
+        """Process a batch of validator callback payloads."""
+        caller_email = str(getattr(request.auth, "email", "") or "")
+        payloads = (
+            request.data.get("callbacks") if isinstance(request.data, dict) else None
+        )
+        return ValidationCallbackService().process_batch(
+            payloads=payloads,
+            caller_email=caller_email,
+        )
@@ -18,10 +18,10 @@ from validibot.actions.constants import CredentialActionType
 from validibot.core.utils import truthy
 from validibot.users.permissions import PermissionCode
 from validibot.validations.constants import ValidationRunStatus
-from validibot.validations.models import ValidationFinding
 from validibot.validations.models import ValidationRun
 from validibot.validations.models import ValidationStepRun
 from validibot.validations.serializers import ValidationRunSerializer
+from validibot.validations.services.findings_keyset import inline_findings_prefetch
 from validibot.workflows.models import WorkflowStep
 
 logger = logging.getLogger(__name__)
@@ -171,6 +171,7 @@ class ValidationRunViewSet(viewsets.ReadOnlyModelViewSet):
                 "org",
                 "user",
                 "submission",
+                "summary_record",
             )
             .annotate(
                 _has_credential_action=Exists(
@@ -200,8 +201,7 @@ class ValidationRunViewSet(viewsets.ReadOnlyModelViewSet):
                 "workflow_step__validator",
             )
             .prefetch_related(
-                "findings",
-                "findings__ruleset_assertion",
+                inline_findings_prefetch(),
                 # See refactor-step item ``[review-#5]`` (amendment).
                 # ``_build_step_output_map`` and
                 # ``_build_template_param_meta`` iterate these per
@@ -213,12 +213,4 @@ class ValidationRunViewSet(viewsets.ReadOnlyModelViewSet):
             )
             .order_by("step_order", "pk"),
         )
-        findings_prefetch = Prefetch(
-            "findings",
-            queryset=ValidationFinding.objects.select_related(
-                "validation_step_run",
-                "validation_step_run__workflow_step",
-                "ruleset_assertion",
-            ).order_by("severity", "-created"),
-        )
-        return qs.prefetch_related(step_run_prefetch, findings_prefetch)
+        return qs.prefetch_related(step_run_prefetch)
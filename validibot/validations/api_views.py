@@ -19,12 +19,15 @@ from django.db.models import OuterRef
 from django.db.models import Prefetch
 from django.http import Http404
 from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from rest_framework import permissions
 from rest_framework import viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 
 from validibot.actions.constants import CredentialActionType
 from validibot.core.api.org_scoped import OrgMembershipPermission
@@ -40,6 +43,16 @@ from validibot.validations.credential_utils import (
 from validibot.validations.models import ValidationRun
 from validibot.validations.models import ValidationStepRun
 from validibot.validations.serializers import ValidationRunSerializer
+from validibot.validations.services.findings_keyset import FindingsCursor
+from validibot.validations.services.findings_keyset import InvalidFindingsCursorError
+from validibot.validations.services.findings_keyset import get_findings_page
+from validibot.validations.services.findings_keyset import inline_findings_prefetch
+from validibot.validations.services.findings_keyset import serialize_export_finding
+from validibot.validations.services.findings_keyset import stream_findings_csv
+from validibot.validations.services.findings_keyset import stream_findings_ndjson
+from validibot.validations.services.run_completion import RUN_WAIT_HEADER
+from validibot.validations.services.run_completion import parse_wait_seconds
+from validibot.validations.services.run_completion import wait_and_reload
 from validibot.workflows.models import WorkflowStep
 
 if TYPE_CHECKING:
@@ -90,6 +103,10 @@ class OrgScopedRunViewSet(OrgScopedMixin, viewsets.ReadOnlyModelViewSet):
         org = self.get_org()
 
         qs = ValidationRun.objects.for_user(user, org=org)
+        if self.action in {"findings", "findings_export"}:
+            # These address one run by pk and read its findings by keyset;
+            # none of the serializer joins below apply.
+            return qs
 
         # Default recent-only (last 30 days) unless:
         # - ?all=1 provided, or
@@ -122,6 +139,8 @@ class OrgScopedRunViewSet(OrgScopedMixin, viewsets.ReadOnlyModelViewSet):
                 "org",
                 "user",
                 "submission",
+                # The serializer's ``profile`` field reads the summary.
+                "summary_record",
             )
             .prefetch_related(
                 Prefetch(
@@ -130,7 +149,9 @@ class OrgScopedRunViewSet(OrgScopedMixin, viewsets.ReadOnlyModelViewSet):
                         ValidationStepRun.objects.select_related(
                             "workflow_step__validator",
                         ).prefetch_related(
-                            "findings",
+                            # Capped per step (RUN_FINDINGS_INLINE_LIMIT);
+                            # the ``findings`` action pages the rest.
+                            inline_findings_prefetch(),
                             # ``_build_step_output_map`` and
                             # ``_build_template_param_meta`` iterate
                             # these to enrich output_values /
@@ -158,6 +179,28 @@ class OrgScopedRunViewSet(OrgScopedMixin, viewsets.ReadOnlyModelViewSet):
             )
         )
 
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Return one run.
+
+        Pass `?wait=<seconds>` to hold the request until the run finishes
+        (capped server-side); the response then carries an
+        `X-Validibot-Run-Wait` header with the seconds actually waited.
+        """
+        validation_run = self.get_object()
+        wait = parse_wait_seconds(request.query_params.get("wait"))
+        waited = None
+        if wait:
+            validation_run, waited = wait_and_reload(
+                validation_run,
+                wait=wait,
+                reload=self.get_object,
+            )
+        response = Response(self.get_serializer(validation_run).data)
+        if waited is not None:
+            response[RUN_WAIT_HEADER] = str(waited)
+        return response
+
     @action(
         detail=True,
         methods=["get"],
@@ -194,3 +237,77 @@ class OrgScopedRunViewSet(OrgScopedMixin, viewsets.ReadOnlyModelViewSet):
         )
         response["Content-Disposition"] = f'attachment; filename="{download_name}"'
         return response
+
+    @action(detail=True, methods=["get"], url_path="findings")
+    def findings(self, request, org_slug=None, pk=None):
+        """Page through a run's findings in keyset order.
+
+        Findings come step by step, most severe first, then by id. Pass the
+        returned ``next`` cursor back as ``?cursor=`` for the following page;
+        ``page_size`` defaults to 200 and is capped at 1000.
+        """
+        run = self.get_object()
+        limit = _findings_page_size(request.query_params.get("page_size"))
+        token = request.query_params.get("cursor")
+        if not run.are_outputs_viewable:
+            return Response({"next": None, "results": []})
+        try:
+            after = FindingsCursor.decode(token) if token else None
+            page = get_findings_page(run, limit=limit, after=after)
+        except InvalidFindingsCursorError as exc:
+            raise ValidationError({"cursor": "Invalid cursor."}) from exc
+        return Response(
+            {
+                "next": page.next_cursor.encode() if page.next_cursor else None,
+                "results": [
+                    serialize_export_finding(
+                        finding,
+                        step_order=page.step_orders[finding.validation_step_run_id],
+                    )
+                    for finding in page.findings
+                ],
+            },
+        )
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="findings/export",
+        url_name="findings-export",
+    )
+    def findings_export(self, request, org_slug=None, pk=None):
+        """Stream every finding of a run as NDJSON (default) or ``?output=csv``.
+
+        The export reads findings in keyset batches, so memory stays flat
+        regardless of how many findings the run has.
+        """
+        run = self.get_object()
+        output = request.query_params.get("output", "ndjson")
+        if output not in _FINDINGS_EXPORT_FORMATS:
+            raise ValidationError({"output": "Choose 'ndjson' or 'csv'."})
+        stream, content_type = _FINDINGS_EXPORT_FORMATS[output]
+        response = StreamingHttpResponse(
+            stream(run) if run.are_outputs_viewable else iter(()),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="run-{run.pk}-findings.{output}"'
+        )
+        return response
+
+
+FINDINGS_PAGE_SIZE_DEFAULT = 200
+FINDINGS_PAGE_SIZE_MAX = 1000
+
+_FINDINGS_EXPORT_FORMATS = {
+    "ndjson": (stream_findings_ndjson, "application/x-ndjson"),
+    "csv": (stream_findings_csv, "text/csv"),
+}
+
+
+def _findings_page_size(raw: str | None) -> int:
+    try:
+        size = int(raw) if raw else FINDINGS_PAGE_SIZE_DEFAULT
+    except ValueError:
+        size = FINDINGS_PAGE_SIZE_DEFAULT
+    return max(1, min(size, FINDINGS_PAGE_SIZE_MAX))
@@ -0,0 +1,7 @@
+"""Throughput benchmarks for the in-process validator hot paths.
+
+Covers ``TabularValidator.validate``, ``evaluate_cel_expression``, the JSON
+Schema and XML Schema validators, and the EnergyPlus ``idf_facts`` parser over
+deterministic generated inputs. Run with ``manage.py benchmark_validators``
+and compare two reports with ``manage.py compare_validator_benchmarks``.
+"""
@@ -0,0 +1,499 @@
+"""Deterministic generated inputs for the validator benchmarks.
+
+Every generator is a pure function of its size arguments: values come from a
+``random.Random`` seeded with :data:`SEED`, so two machines (or two runs a
+month apart) benchmark byte-identical inputs and a timing change can only come
+from the code under test. Nothing here reads the network or the filesystem.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import random
+from typing import Any
+
+SEED = 20260526
+
+# A Table Schema for :func:`generate_csv`. The constraints make the native lane
+# check every cell rather than only parse it.
+CSV_TABLE_SCHEMA: dict[str, Any] = {
+    "fields": [
+        {"name": "id", "type": "integer", "constraints": {"required": True}},
+        {
+            "name": "lat",
+            "type": "number",
+            "constraints": {"minimum": -90, "maximum": 90},
+        },
+        {
+            "name": "lon",
+            "type": "number",
+            "constraints": {"minimum": -180, "maximum": 180},
+        },
+        {
+            "name": "status",
+            "type": "string",
+            "constraints": {"enum": ["active", "inactive", "retired"]},
+        },
+    ],
+    "primaryKey": ["id"],
+}
+
+_STATUSES = ("active", "inactive", "retired")
+
+XML_SCHEMA = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="meters">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="meter" maxOccurs="unbounded">
+          <xs:complexType>
+            <xs:sequence>
+              <xs:element name="serial" type="xs:string"/>
+              <xs:element name="reading" type="xs:decimal"/>
+              <xs:element name="unit">
+                <xs:simpleType>
+                  <xs:restriction base="xs:string">
+                    <xs:enumeration value="kWh"/>
+                    <xs:enumeration value="MWh"/>
+                  </xs:restriction>
+                </xs:simpleType>
+              </xs:element>
+            </xs:sequence>
+            <xs:attribute name="id" type="xs:positiveInteger" use="required"/>
+          </xs:complexType>
+        </xs:element>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>
+"""
+
+# Recursive schema for :func:`generate_deep_json`: every level is checked
+# against the same ``$defs`` node, so validation cost grows with the tree.
+JSON_SCHEMA: dict[str, Any] = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$ref": "#/$defs/node",
+    "$defs": {
+        "node": {
+            "type": "object",
+            "required": ["name", "value"],
+            "properties": {
+                "name": {"type": "string", "minLength": 1},
+                "value": {"type": "number", "minimum": 0},
+                "children": {
+                    "type": "array",
+                    "items": {"$ref": "#/$defs/node"},
+                },
+            },
+        },
+    },
+}
+
+
+def _csv_records(rows: int) -> list[tuple[int, float, float, str]]:
+    rng = random.Random(SEED)  # noqa: S311
+    return [
+        (
+            index,
+            round(rng.uniform(-90, 90), 5),
+            round(rng.uniform(-180, 180), 5),
+            _STATUSES[rng.randrange(len(_STATUSES))],
+        )
+        for index in range(1, rows + 1)
+    ]
+
+
+def generate_csv(rows: int) -> bytes:
+    """Return a header plus ``rows`` valid rows matching :data:`CSV_TABLE_SCHEMA`."""
+
+    lines = ["id,lat,lon,status"]
+    lines.extend(
+        f"{index},{lat:.5f},{lon:.5f},{status}"
+        for index, lat, lon, status in _csv_records(rows)
+    )
+    lines.append("")
+    return "\n".join(lines).encode("utf-8")
+
+
+def generate_parquet(rows: int) -> bytes:
+    """Return the :func:`generate_csv` table as Parquet, with typed columns.
+
+    Needs pyarrow (the ``tabular-columnar`` extra).
+    """
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    ids, lats, lons, statuses = zip(*_csv_records(rows), strict=True)
+    table = pa.table(
+        {
+            "id": pa.array(ids, type=pa.int64()),
+            "lat": pa.array(lats, type=pa.float64()),
+            "lon": pa.array(lons, type=pa.float64()),
+            "status": pa.array(statuses, type=pa.string()),
+        },
+    )
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink)
+    return sink.getvalue().to_pybytes()
+
+
+def generate_row_assertions(count: int) -> list[str]:
+    """Return ``count`` distinct, passing row CEL expressions over the CSV."""
+
+    templates = (
+        "row.lat >= {low} && row.lat <= 90",
+        "row.lon >= {low} * 2 && row.lon <= 180",
+        "row.id > {offset}",
+        'row.status != "decommissioned-{offset}"',
+    )
+    return [
+        templates[index % len(templates)].format(
+            low=-90 - index,
+            offset=-index - 1,
+        )
+        for index in range(count)
+    ]
+
+
+def generate_cel_context(fields: int = 50) -> dict[str, Any]:
+    """Return a ``p.*`` context shaped like a validator's output values."""
+
+    rng = random.Random(SEED)  # noqa: S311
+    return {
+        "p": {
+            f"metric_{index}": round(rng.uniform(0, 1000), 3) for index in range(fields)
+        },
+    }
+
+
+def generate_cel_expressions(count: int, fields: int = 50) -> list[str]:
+    """Return ``count`` expressions over :func:`generate_cel_context`."""
+
+    return [
+        f"p.metric_{index % fields} >= 0.0 && p.metric_{(index + 1) % fields} < 1000.5"
+        for index in range(count)
+    ]
+
+
+def generate_path_workload(paths: int) -> tuple[dict[str, Any], list[str]]:
+    """Return a building payload and ``paths`` distinct paths into it.
+
+    The paths are what assertions and signal mappings address: dotted keys,
+    list indices and quoted metadata keys, most sharing a long prefix with
+    their neighbours (every metric of one zone, say).
+    """
+
+    rng = random.Random(SEED)  # noqa: S311
+    metrics = 10
+    zones = 10
+    floors = max(1, -(-paths // (zones * metrics)))
+    payload = {
+        "submission": {"metadata": {"schema.version": "2.1"}},
+        "building": {
+            "floors": [
+                {
+                    "zones": [
+                        {
+                            "id": f"zone-{floor}-{zone}",
+                            "metrics": {
+                                f"m{metric}": round(rng.uniform(0, 100), 3)
+                                for metric in range(metrics)
+                            },
+                        }
+                        for zone in range(zones)
+                    ],
+                }
+                for floor in range(floors)
+            ],
+        },
+    }
+    selected = [
+        f"building.floors[{index // (zones * metrics)}]"
+        f".zones[{index // metrics % zones}].metrics.m{index % metrics}"
+        for index in range(paths - 1)
+    ]
+    selected.append('submission.metadata["schema.version"]')
+    return payload, selected
+
+
+def generate_deep_json(depth: int, breadth: int = 2) -> str:
+    """Return a JSON tree ``depth`` levels deep with ``breadth`` children each.
+
+    The node count is ``breadth ** depth - 1`` over ``breadth - 1``, so keep
+    ``breadth`` small for deep trees.
+    """
+
+    rng = random.Random(SEED)  # noqa: S311
+
+    def node(level: int) -> dict[str, Any]:
+        item: dict[str, Any] = {
+            "name": f"node-{level}-{rng.randrange(1_000_000)}",
+            "value": round(rng.uniform(0, 100), 3),
+        }
+        if level < depth:
+            item["children"] = [node(level + 1) for _ in range(breadth)]
+        return item
+
+    return json.dumps(node(1))
+
+
+def generate_xml(elements: int) -> str:
+    """Return a ``<meters>`` document with ``elements`` valid meters."""
+
+    rng = random.Random(SEED)  # noqa: S311
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>', "<meters>"]
+    parts.extend(
+        f'<meter id="{index}"><serial>SN-{rng.randrange(10**8):08d}</serial>'
+        f"<reading>{rng.uniform(0, 10_000):.2f}</reading>"
+        f"<unit>{'kWh' if index % 2 else 'MWh'}</unit></meter>"
+        for index in range(1, elements + 1)
+    )
+    parts.append("</meters>")
+    return "\n".join(parts)
+
+
+def generate_idf(zones: int, surfaces_per_zone: int = 6) -> str:
+    """Return IDF text with ``zones`` zones and their surfaces and windows.
+
+    Mirrors IDF Editor output (``!-`` field comments) so the comment stripping
+    in ``idf_facts`` is part of what is measured.
+    """
+
+    rng = random.Random(SEED)  # noqa: S311
+    parts = [
+        "!-Generator IDFEditor 1.51",
+        "Version,",
+        "    24.2;                    !- Version Identifier",
+        "",
+        "Building,",
+        "    Benchmark Building,      !- Name",
+        f"    {rng.uniform(0, 360):.1f},  !- North Axis {{deg}}",
+        "    Suburbs,                 !- Terrain",
+        "    0.04,                    !- Loads Convergence Tolerance Value",
+        "    0.4,                     !- Temperature Convergence Tolerance Value",
+        "    FullExterior,            !- Solar Distribution",
+        "    25,                      !- Maximum Number of Warmup Days",
+        "    6;                       !- Minimum Number of Warmup Days",
+        "",
+        "Timestep,",
+        "    4;                       !- Number of Timesteps per Hour",
+        "",
+        "RunPeriod,",
+        "    Annual,                  !- Name",
+        "    1,                       !- Begin Month",
+        "    1,                       !- Begin Day of Month",
+        "    ,                        !- Begin Year",
+        "    12,                      !- End Month",
+        "    31;                      !- End Day of Month",
+        "",
+        "Construction,",
+        "    Exterior Wall,           !- Name",
+        "    Brick;                   !- Outside Layer",
+        "",
+    ]
+    for zone in range(zones):
+        parts.extend(
+            [
+                "Zone,",
+                f"    Zone {zone},              !- Name",
+                "    0,                       !- Direction of Relative North {deg}",
+                f"    {zone * 10},             !- X Origin {{m}}",
+                "    0,                       !- Y Origin {m}",
+                "    0;                       !- Z Origin {m}",
+                "",
+            ],
+        )
+        for surface in range(surfaces_per_zone):
+            parts.extend(
+                [
+                    "BuildingSurface:Detailed,",
+                    f"    Zone {zone} Surface {surface},  !- Name",
+                    "    Wall,                    !- Surface Type",
+                    "    Exterior Wall,           !- Construction Name",
+                    f"    Zone {zone},              !- Zone Name",
+                    "    ,                        !- Space Name",
+                    "    Outdoors,                !- Outside Boundary Condition",
+                    "    ,                        !- Outside Boundary Condition Object",
+                    "    SunExposed,              !- Sun Exposure",
+                    "    WindExposed,             !- Wind Exposure",
+                    "    0.5,                     !- View Factor to Ground",
+                    "    4,                       !- Number of Vertices",
+                    f"    0,0,{rng.uniform(2, 4):.2f},  !- X,Y,Z Vertex 1 {{m}}",
+                    "    0,0,0,                   !- X,Y,Z Vertex 2 {m}",
+                    "    10,0,0,                  !- X,Y,Z Vertex 3 {m}",
+                    "    10,0,3;                  !- X,Y,Z Vertex 4 {m}",
+                    "",
+                ],
+            )
+        parts.extend(
+            [
+                "Window,",
+                f"    Zone {zone} Window,        !- Name",
+                "    Exterior Window,         !- Construction Name",
+                f"    Zone {zone} Surface 0,  !- Building Surface Name",
+                "    ,                        !- Frame and Divider Name",
+                "    1,                       !- Multiplier",
+                "    1,                       !- Starting X Coordinate {m}",
+                "    1,                       !- Starting Z Coordinate {m}",
+                "    2,                       !- Length {m}",
+                "    1.5;                     !- Height {m}",
+                "",
+            ],
+        )
+    return "\n".join(parts)
+
+
+def generate_model_description(variables: int) -> str:
+    """Return an FMI 2.0 ``modelDescription.xml`` with ``variables`` scalars.
+
+    Shaped like a large co-simulation FMU: mostly locals and parameters, with
+    a fifth inputs and a fifth outputs, across every value type.
+    """
+
+    rng = random.Random(SEED)  # noqa: S311
+    causalities = ("input", "output", "local", "parameter", "local")
+    types = ('<Real unit="K"/>', "<Integer/>", "<Boolean/>", "<Real/>")
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        (
+            '<fmiModelDescription fmiVersion="2.0" modelName="Benchmark"'
+            ' guid="{00000000-0000-0000-0000-000000000000}">'
+        ),
+        '<CoSimulation modelIdentifier="Benchmark"/>',
+        '<DefaultExperiment startTime="0" stopTime="86400" stepSize="60"/>',
+        "<ModelVariables>",
+    ]
+    for index in range(variables):
+        causality = causalities[index % len(causalities)]
+        variability = "fixed" if causality == "parameter" else "continuous"
+        parts.append(
+            f'<ScalarVariable name="zone{index // 20}.node{index % 20}.'
+            f'v{rng.randrange(10**6):06d}" valueReference="{index}"'
+            f' causality="{causality}" variability="{variability}">'
+            f"{types[index % len(types)]}</ScalarVariable>",
+        )
+    parts.extend(["</ModelVariables>", "</fmiModelDescription>"])
+    return "\n".join(parts)
+
+
+def generate_thmx(polygons: int) -> bytes:
+    """Return a THERM ``.thmx`` document with ``polygons`` four-sided polygons.
+
+    Laid out like the THERM test fixtures: materials and boundary conditions,
+    then the polygons as a strip of cross-sections, each with its boundary
+    polygons and U-factor tags.
+    """
+
+    rng = random.Random(SEED)  # noqa: S311
+    materials = ("Aluminum", "PVC", "Glass", "Foam", "Steel")
+    parts = [
+        '<?xml version="1.0"?>',
+        '<THERM-XML xmlns="http://windows.lbl.gov">',
+        "<ThermVersion>Version 8.0.20.0</ThermVersion>",
+        "<FileVersion>1</FileVersion>",
+        "<Title>Benchmark Cross Sections</Title>",
+        "<Units>SI</Units>",
+        (
+            '<MeshControl MeshLevel="6" ErrorCheckFlag="1" ErrorLimit="10.0"'
+            ' MaxIterations="5" CMAflag="0" />'
+        ),
+        "<Materials>",
+    ]
+    parts.extend(
+        f'<Material Name="{name}" Type="0" Conductivity="{rng.uniform(0.02, 200):.3f}"'
+        ' Tir="0" EmissivityFront="0.9" EmissivityBack="0.9" RGBColor="0xC0C0C0" />'
+        for name in materials
+    )
+    parts.extend(
+        [
+            "</Materials>",
+            "<BoundaryConditions>",
+            '<BoundaryCondition Name="Interior" H="8.14" Temperature="21.1" />',
+            '<BoundaryCondition Name="Exterior" H="26.0" Temperature="-17.8" />',
+            "</BoundaryConditions>",
+            "<Polygons>",
+        ],
+    )
+    for index in range(polygons):
+        x0 = index * 10.0
+        height = rng.uniform(50, 150)
+        corners = ((x0, 0.0), (x0 + 10, 0.0), (x0 + 10, height), (x0, height))
+        parts.append(
+            f'<Polygon ID="{index + 1}" Material="{materials[index % len(materials)]}"'
+            ' NSides="4" Type="1" units="mm">',
+        )
+        parts.extend(
+            f'<Point index="{point}" x="{x:.3f}" y="{y:.3f}" />'
+            for point, (x, y) in enumerate((*corners, corners[0]))
+        )
+        parts.append("</Polygon>")
+    parts.extend(["</Polygons>", "<Boundaries>"])
+    for index in range(polygons):
+        side = "Interior" if index % 2 else "Exterior"
+        parts.append(
+            f'<BCPolygon ID="{index + 1}" BC="{side}" units="mm"'
+            f' PolygonID="{index + 1}" EnclosureID="0" UFactorTag="Section{index}"'
+            ' Emissivity="0.9" IlluminatedSurface="FALSE">'
+            f'<Point index="0" x="{index * 10.0:.3f}" y="0.000" />'
+            f'<Point index="1" x="{index * 10.0 + 10:.3f}" y="0.000" />'
+            "</BCPolygon>",
+        )
+    parts.extend(["</Boundaries>", "</THERM-XML>"])
+    return "\n".join(parts).encode()
+
+
+def generate_input_schema(properties: int) -> dict[str, Any]:
+    """Return a workflow ``input_schema`` with ``properties`` flat fields.
+
+    Cycles through every supported type and constraint so building the launch
+    form and Pydantic model exercises each branch.
+    """
+
+    shapes = (
+        {"type": "number", "minimum": 0, "exclusiveMaximum": 1000, "units": "W"},
+        {"type": "integer", "exclusiveMinimum": 0, "maximum": 100},
+        {"type": "string", "description": "Free text"},
+        {"type": "integer", "enum": [1, 2, 3, 5, 8]},
+        {"type": "boolean"},
+    )
+    schema_properties = {
+        f"field_{index}": dict(shapes[index % len(shapes)])
+        for index in range(properties)
+    }
+    return {
+        "type": "object",
+        "properties": schema_properties,
+        "required": list(schema_properties),
+    }
+
+
+def generate_input_form_data(properties: int) -> dict[str, str]:
+    """Return launch-form POST data that satisfies :func:`generate_input_schema`."""
+
+    values = ("12.5", "7", "text", "5", "on")
+    return {
+        f"field_{index}": values[index % len(values)] for index in range(properties)
+    }
+
+
+def generate_upload(size: int) -> bytes:
+    """Return ``size`` bytes of JSON-looking text for upload benchmarks."""
+
+    record = b'{"meter": "SN-00000000", "reading": 1234.56, "unit": "kWh"},\n'
+    repeats, remainder = divmod(size, len(record))
+    return record * repeats + record[:remainder]
+
+
+class CountingReader(io.BytesIO):
+    """In-memory file that counts every byte read from it."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
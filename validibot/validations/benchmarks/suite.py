@@ -0,0 +1,778 @@
+"""Benchmark cases, the timing runner, and baseline comparison.
+
+A case prepares its inputs (untimed), then the runner times the validator hot
+path ``repeat`` times and records every sample. Reports compare on the fastest
+sample, which is the least sensitive to a noisy neighbour on a shared CI host.
+
+Validators read their ``Validator``/``Ruleset``/``RulesetAssertion`` rows from
+the database, so each case prepares and runs inside a transaction that is
+always rolled back: benchmarking against a real database leaves nothing
+behind. Submissions are built unsaved, which keeps multi-megabyte payloads out
+of the database entirely.
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib.util
+import json
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from validibot.validations.benchmarks import fixtures
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+REPORT_SCHEMA_VERSION = 1
+
+# Sizes per profile. ``quick`` finishes in well under a minute and is what CI
+# runs on every change; ``full`` covers the documented ranges (CSV up to one
+# million rows, up to 500 assertions) for release qualification.
+PROFILES: dict[str, dict[str, list[int]]] = {
+    "quick": {
+        "tabular_rows": [1_000, 10_000],
+        "tabular_assertions": [1, 10],
+        "cel_expressions": [1, 10, 100],
+        "resolution_paths": [100, 1_000],
+        "json_depth": [6, 10],
+        "xml_elements": [1_000, 10_000],
+        "idf_zones": [100, 1_000],
+        "launch_properties": [200],
+        "ingest_megabytes": [1, 16],
+        "purge_rows": [500],
+        "fmu_variables": [5_000],
+        "therm_polygons": [1_000, 10_000],
+    },
+    "full": {
+        "tabular_rows": [1_000, 10_000, 100_000, 1_000_000],
+        "tabular_assertions": [1, 10, 100, 500],
+        "cel_expressions": [1, 10, 100, 500],
+        "resolution_paths": [100, 1_000, 4_000],
+        "json_depth": [8, 12, 16],
+        "xml_elements": [1_000, 10_000, 100_000],
+        "idf_zones": [100, 1_000, 10_000],
+        "launch_properties": [20, 200],
+        "ingest_megabytes": [1, 16, 256],
+        "purge_rows": [500, 5_000],
+        "fmu_variables": [5_000, 50_000],
+        "therm_polygons": [1_000, 10_000, 100_000],
+    },
+}
+
+# Row count for the assertion-count sweep, and assertions for the row sweep.
+_ASSERTION_SWEEP_ROWS = 1_000
+_ROW_SWEEP_ASSERTIONS = 1
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One measured configuration of one hot path.
+
+    ``prepare`` builds inputs and returns the zero-argument callable to time.
+    ``units`` is the amount of work one call does (rows, nodes, expressions),
+    reported as throughput next to the timings. If the callable returns a
+    dict, it is reported as the case's ``counters``. A case whose call
+    consumes its inputs (a purge, say) sets ``fresh_inputs`` so ``prepare``
+    runs again, untimed, before every sample.
+    """
+
+    name: str
+    prepare: Callable[[], Callable[[], Any]]
+    units: int
+    unit: str
+    fresh_inputs: bool = False
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A case whose fastest sample slowed down by more than the threshold."""
+
+    name: str
+    baseline_seconds: float
+    current_seconds: float
+
+    @property
+    def slowdown(self) -> float:
+        return self.current_seconds / self.baseline_seconds - 1
+
+
+@dataclass
+class Comparison:
+    regressions: list[Regression] = field(default_factory=list)
+    compared: int = 0
+    # Cases present on only one side; a renamed or dropped case is not a
+    # regression, but it should not go unnoticed either.
+    missing: list[str] = field(default_factory=list)
+    added: list[str] = field(default_factory=list)
+
+
+# ── Cases ─────────────────────────────────────────────────────────────
+
+
+def build_cases(profile: str) -> list[BenchmarkCase]:
+    """Return every case for ``profile`` in a stable order."""
+
+    sizes = PROFILES[profile]
+    cases: list[BenchmarkCase] = []
+    cases.extend(
+        _tabular_case(rows=rows, assertions=_ROW_SWEEP_ASSERTIONS)
+        for rows in sizes["tabular_rows"]
+    )
+    cases.extend(
+        _tabular_case(rows=_ASSERTION_SWEEP_ROWS, assertions=count)
+        for count in sizes["tabular_assertions"]
+        if count != _ROW_SWEEP_ASSERTIONS
+    )
+    # The same rows as Parquet, to compare the columnar reader with CSV. Only
+    # where the optional ``tabular-columnar`` extra is installed.
+    if importlib.util.find_spec("pyarrow") is not None:
+        cases.extend(
+            _tabular_case(
+                rows=rows,
+                assertions=_ROW_SWEEP_ASSERTIONS,
+                source_format="parquet",
+            )
+            for rows in sizes["tabular_rows"]
+        )
+    cases.extend(_cel_case(count) for count in sizes["cel_expressions"])
+    for count in sizes["resolution_paths"]:
+        cases.append(_path_resolution_case(count, batch=False))
+        cases.append(_path_resolution_case(count, batch=True))
+    cases.extend(_json_schema_case(depth) for depth in sizes["json_depth"])
+    cases.extend(_xml_schema_case(elements) for elements in sizes["xml_elements"])
+    cases.extend(_idf_facts_case(zones) for zones in sizes["idf_zones"])
+    cases.extend(_therm_case(polygons) for polygons in sizes["therm_polygons"])
+    cases.extend(
+        _launch_input_case(properties) for properties in sizes["launch_properties"]
+    )
+    cases.extend(_ingest_case(megabytes) for megabytes in sizes["ingest_megabytes"])
+    for rows in sizes["purge_rows"]:
+        cases.append(_purge_case("submissions", rows))
+        cases.append(_purge_case("outputs", rows))
+    for variables in sizes["fmu_variables"]:
+        cases.append(_fmu_variables_case(variables, reprobe=False))
+        cases.append(_fmu_variables_case(variables, reprobe=True))
+    return cases
+
+
+def _tabular_case(
+    *,
+    rows: int,
+    assertions: int,
+    source_format: str = "csv",
+) -> BenchmarkCase:
+    def prepare():
+        from django.core.files.base import ContentFile
+
+        from validibot.submissions.constants import SubmissionFileType
+        from validibot.submissions.models import Submission
+        from validibot.validations.constants import AssertionType
+        from validibot.validations.constants import RulesetType
+        from validibot.validations.constants import Severity
+        from validibot.validations.constants import ValidationType
+        from validibot.validations.models import RulesetAssertion
+        from validibot.validations.validators.tabular.validator import TabularValidator
+
+        validator = _validator(ValidationType.TABULAR)
+        ruleset = _ruleset(
+            RulesetType.TABULAR,
+            json.dumps(fixtures.CSV_TABLE_SCHEMA),
+            metadata={"delimiter": ",", "has_header": True},
+        )
+        RulesetAssertion.objects.bulk_create(
+            [
+                RulesetAssertion(
+                    ruleset=ruleset,
+                    order=index,
+                    assertion_type=AssertionType.CEL_EXPRESSION,
+                    rhs={"expr": expression},
+                    options={"tabular_stage": "row"},
+                    severity=Severity.ERROR,
+                    message_template="Benchmark assertion failed.",
+                )
+                for index, expression in enumerate(
+                    fixtures.generate_row_assertions(assertions),
+                )
+            ],
+        )
+        if source_format == "parquet":
+            submission = Submission(
+                file_type=SubmissionFileType.BINARY,
+                input_file=ContentFile(
+                    fixtures.generate_parquet(rows),
+                    name="benchmark.parquet",
+                ),
+            )
+        else:
+            submission = Submission(
+                content=fixtures.generate_csv(rows).decode("utf-8"),
+                file_type=SubmissionFileType.TEXT,
+            )
+        return lambda: TabularValidator().validate(validator, submission, ruleset)
+
+    # CSV case names predate the format parameter; keep them stable so
+    # existing baselines still line up.
+    prefix = "" if source_format == "csv" else f"format={source_format},"
+    return BenchmarkCase(
+        name=f"tabular.validate[{prefix}rows={rows},assertions={assertions}]",
+        prepare=prepare,
+        units=rows,
+        unit="rows",
+    )
+
+
+def _cel_case(count: int) -> BenchmarkCase:
+    def prepare():
+        from validibot.validations.cel_eval import evaluate_cel_expression
+
+        context = fixtures.generate_cel_context()
+        expressions = fixtures.generate_cel_expressions(count)
+
+        def run():
+            for expression in expressions:
+                evaluate_cel_expression(expression=expression, context=context)
+
+        return run
+
+    return BenchmarkCase(
+        name=f"cel.evaluate_cel_expression[expressions={count}]",
+        prepare=prepare,
+        units=count,
+        unit="expressions",
+    )
+
+
+def _path_resolution_case(count: int, *, batch: bool) -> BenchmarkCase:
+    """Resolve ``count`` assertion-style paths against one payload.
+
+    Per path through ``resolve_path`` (compiled-path cache warm after the
+    first sample), or all at once through ``resolve_paths``.
+    """
+
+    def prepare():
+        from validibot.validations.services.path_resolution import resolve_path
+        from validibot.validations.services.path_resolution import resolve_paths
+
+        payload, paths = fixtures.generate_path_workload(count)
+        if batch:
+            return lambda: resolve_paths(payload, paths)
+
+        def run():
+            for path in paths:
+                resolve_path(payload, path)
+
+        return run
+
+    name = "resolve_paths" if batch else "resolve_path"
+    return BenchmarkCase(
+        name=f"paths.{name}[paths={count}]",
+        prepare=prepare,
+        units=count,
+        unit="paths",
+    )
+
+
+def _json_schema_case(depth: int) -> BenchmarkCase:
+    def prepare():
+        from validibot.submissions.constants import SubmissionFileType
+        from validibot.submissions.models import Submission
+        from validibot.validations.constants import RulesetType
+        from validibot.validations.constants import ValidationType
+        from validibot.validations.validators.json_schema.validator import (
+            JsonSchemaValidator,
+        )
+
+        validator = _validator(ValidationType.JSON_SCHEMA)
+        ruleset = _ruleset(RulesetType.JSON_SCHEMA, json.dumps(fixtures.JSON_SCHEMA))
+        submission = Submission(
+            content=fixtures.generate_deep_json(depth),
+            file_type=SubmissionFileType.JSON,
+        )
+        return lambda: JsonSchemaValidator().validate(validator, submission, ruleset)
+
+    return BenchmarkCase(
+        name=f"json_schema.validate[depth={depth}]",
+        prepare=prepare,
+        units=2**depth - 1,
+        unit="nodes",
+    )
+
+
+def _xml_schema_case(elements: int) -> BenchmarkCase:
+    def prepare():
+        from validibot.submissions.constants import SubmissionFileType
+        from validibot.submissions.models import Submission
+        from validibot.validations.constants import RulesetType
+        from validibot.validations.constants import ValidationType
+        from validibot.validations.constants import XMLSchemaType
+        from validibot.validations.validators.xml_schema.validator import (
+            XmlSchemaValidator,
+        )
+
+        validator = _validator(ValidationType.XML_SCHEMA)
+        ruleset = _ruleset(
+            RulesetType.XML_SCHEMA,
+            fixtures.XML_SCHEMA,
+            metadata={"schema_type": XMLSchemaType.XSD.value},
+        )
+        submission = Submission(
+            content=fixtures.generate_xml(elements),
+            file_type=SubmissionFileType.XML,
+        )
+        return lambda: XmlSchemaValidator().validate(validator, submission, ruleset)
+
+    return BenchmarkCase(
+        name=f"xml_schema.validate[elements={elements}]",
+        prepare=prepare,
+        units=elements,
+        unit="elements",
+    )
+
+
+def _idf_facts_case(zones: int) -> BenchmarkCase:
+    def prepare():
+        from validibot.validations.validators.energyplus.idf_facts import extract_facts
+
+        idf_text = fixtures.generate_idf(zones)
+        return lambda: extract_facts(idf_text)
+
+    return BenchmarkCase(
+        name=f"idf_facts.extract_facts[zones={zones}]",
+        prepare=prepare,
+        units=zones,
+        unit="zones",
+    )
+
+
+def _therm_case(polygons: int) -> BenchmarkCase:
+    def prepare():
+        from validibot.validations.validators.therm.parser import parse_therm_file
+
+        thmx = fixtures.generate_thmx(polygons)
+        return lambda: parse_therm_file(thmx, filename="bench.thmx")
+
+    return BenchmarkCase(
+        name=f"therm.parse_therm_file[polygons={polygons}]",
+        prepare=prepare,
+        units=polygons,
+        unit="polygons",
+    )
+
+
+def _launch_input_case(properties: int) -> BenchmarkCase:
+    def prepare():
+        from validibot.workflows.form_builder import schema_to_django_form
+        from validibot.workflows.schema_builder import build_pydantic_model
+
+        schema = fixtures.generate_input_schema(properties)
+        data = fixtures.generate_input_form_data(properties)
+
+        def run():
+            # What a form-mode launch POST does before creating the submission:
+            # bind and clean the generated form, then run the Pydantic model.
+            form = schema_to_django_form(schema)(data=data)
+            if not form.is_valid():
+                raise AssertionError(form.errors)
+            build_pydantic_model(schema)(**form.cleaned_data)
+
+        return run
+
+    return BenchmarkCase(
+        name=f"launch.validate_input[properties={properties}]",
+        prepare=prepare,
+        units=1,
+        unit="launches",
+    )
+
+
+def _ingest_case(megabytes: int) -> BenchmarkCase:
+    size = megabytes * 1024 * 1024
+
+    def prepare():
+        from django.core.files.storage import InMemoryStorage
+        from django.core.files.uploadedfile import InMemoryUploadedFile
+
+        from validibot.submissions.constants import SubmissionFileType
+        from validibot.submissions.ingest import ingest_uploaded_file
+        from validibot.submissions.models import Submission
+
+        data = fixtures.generate_upload(size)
+
+        def run():
+            source = fixtures.CountingReader(data)
+            upload = InMemoryUploadedFile(
+                source,
+                field_name="file",
+                name="bench.json",
+                content_type="application/json",
+                size=size,
+                charset=None,
+            )
+            # The upload path needs an org id; nothing is saved.
+            submission = Submission(org_id=1)
+            # Keep benchmark uploads out of the deployment's media storage.
+            submission.input_file.storage = InMemoryStorage()
+            ingest_uploaded_file(
+                submission,
+                uploaded_file=upload,
+                filename="bench.json",
+                content_type="application/json",
+                max_bytes=size,
+                file_type=SubmissionFileType.JSON,
+            )
+            return {"bytes_read_per_byte": round(source.bytes_read / size, 4)}
+
+        return run
+
+    return BenchmarkCase(
+        name=f"submissions.ingest_uploaded_file[megabytes={megabytes}]",
+        prepare=prepare,
+        units=size,
+        unit="bytes",
+    )
+
+
+def _purge_case(kind: str, rows: int) -> BenchmarkCase:
+    """One retention-purge chunk of ``rows`` rows on local filesystem storage.
+
+    Each submission has a stored file and each run an execution bundle, in a
+    temporary ``MEDIA_ROOT``. The rows expire in 2000 and the purge runs "as
+    of" then, so nothing real in the database is ever claimed, and neither
+    are its files.
+    """
+
+    as_of = datetime(2000, 1, 2, tzinfo=UTC)
+
+    def prepare():
+        from django.core.files.base import ContentFile
+        from django.core.files.storage import default_storage
+        from django.test import override_settings
+
+        from validibot.projects.models import Project
+        from validibot.submissions.constants import OutputRetention
+        from validibot.submissions.constants import SubmissionFileType
+        from validibot.submissions.constants import SubmissionRetention
+        from validibot.submissions.models import Submission
+        from validibot.users.models import Organization
+        from validibot.users.models import User
+        from validibot.validations.constants import ValidationRunStatus
+        from validibot.validations.models import ValidationRun
+        from validibot.validations.services.retention_purge import (
+            purge_expired_output_chunk,
+        )
+        from validibot.validations.services.retention_purge import (
+            purge_expired_submission_chunk,
+        )
+        from validibot.workflows.models import Workflow
+
+        root = Path(tempfile.mkdtemp(prefix="validibot-bench-purge-"))
+        atexit.register(shutil.rmtree, root, ignore_errors=True)
+        local_storage = override_settings(
+            MEDIA_ROOT=str(root),
+            GCS_VALIDATION_BUCKET="",
+            STORAGES={
+                **settings.STORAGES,
+                "default": {
+                    "BACKEND": "django.core.files.storage.FileSystemStorage",
+                    "OPTIONS": {"location": str(root)},
+                },
+            },
+        )
+
+        # Named after the temp dir: prepare runs once per sample, and org
+        # slugs and usernames are unique.
+        org = Organization.objects.create(name=f"Benchmark {root.name}")
+        user = User.objects.create(username=f"benchmark-{root.name}")
+        project = Project.objects.create(org=org, name="Benchmark purge")
+        workflow = Workflow.objects.create(
+            org=org,
+            user=user,
+            project=project,
+            name="Benchmark purge",
+        )
+        expired = as_of - timedelta(days=1)
+        payload = fixtures.generate_csv(100)
+        with local_storage:
+            submissions = Submission.objects.bulk_create(
+                [
+                    Submission(
+                        org=org,
+                        project=project,
+                        workflow=workflow,
+                        file_type=SubmissionFileType.TEXT,
+                        retention_policy=SubmissionRetention.STORE_7_DAYS,
+                        expires_at=expired,
+                        input_file=default_storage.save(
+                            f"submissions/benchmark/{index}.csv",
+                            ContentFile(payload),
+                        ),
+                    )
+                    for index in range(rows)
+                ],
+            )
+            runs = ValidationRun.objects.bulk_create(
+                [
+                    ValidationRun(
+                        org=org,
+                        project=project,
+                        workflow=workflow,
+                        submission=submission,
+                        status=ValidationRunStatus.SUCCEEDED,
+                        ended_at=expired,
+                        output_retention_policy=OutputRetention.STORE_7_DAYS,
+                        output_expires_at=expired,
+                    )
+                    for submission in submissions
+                ],
+            )
+        for run in runs:
+            bundle = root / "files" / "runs" / str(org.id) / str(run.id)
+            for relative in ("input/model.csv", "output/output.json"):
+                (bundle / relative).parent.mkdir(parents=True, exist_ok=True)
+                (bundle / relative).write_bytes(payload)
+
+        purge = (
+            purge_expired_submission_chunk
+            if kind == "submissions"
+            else purge_expired_output_chunk
+        )
+
+        def run():
+            with local_storage:
+                result = purge(now=as_of, limit=rows)
+            if len(result.purged) != rows:
+                msg = f"Purged {len(result.purged)} of {rows} benchmark rows."
+                raise AssertionError(msg)
+
+        return run
+
+    return BenchmarkCase(
+        name=f"retention.purge_expired_{kind}[rows={rows}]",
+        prepare=prepare,
+        units=rows,
+        unit="rows",
+        fresh_inputs=True,
+    )
+
+
+def _fmu_variables_case(variables: int, *, reprobe: bool) -> BenchmarkCase:
+    """Persist a synthetic FMU's variables and step I/O rows.
+
+    The upload case persists onto a fresh validator each sample; the re-probe
+    case refreshes a validator whose rows already match, which is the diff
+    with nothing to write. Both report the statement count, which should not
+    grow with the variable count beyond one per bulk batch.
+    """
+
+    def prepare():
+        import uuid
+
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from validibot.validations.constants import ValidationType
+        from validibot.validations.models import FMUModel
+        from validibot.validations.models import Validator
+        from validibot.validations.services.fmu import _parse_model_description
+        from validibot.validations.services.fmu import _persist_variables
+        from validibot.validations.services.fmu import _refresh_variables_from_probe
+        from validibot.validations.services.fmu import _variable_info_to_model
+
+        _name, _version, infos, _defaults = _parse_model_description(
+            fixtures.generate_model_description(variables),
+        )
+        fmu_model = FMUModel.objects.create(name="Benchmark FMU")
+        # prepare runs once per sample for the upload case; slugs are unique.
+        validator = Validator.objects.create(
+            slug=f"benchmark-fmu-{uuid.uuid4().hex}",
+            name="Benchmark FMU",
+            validation_type=ValidationType.FMU,
+            fmu_model=fmu_model,
+            is_system=False,
+            supports_assertions=True,
+        )
+        if reprobe:
+            _persist_variables(
+                fmu_model,
+                validator,
+                [_variable_info_to_model(info) for info in infos],
+            )
+
+        def run():
+            with CaptureQueriesContext(connection) as queries:
+                if reprobe:
+                    _refresh_variables_from_probe(fmu_model, infos)
+                else:
+                    _persist_variables(
+                        fmu_model,
+                        validator,
+                        [_variable_info_to_model(info) for info in infos],
+                    )
+            return {"queries": len(queries)}
+
+        return run
+
+    path = "refresh_variables_from_probe" if reprobe else "persist_variables"
+    return BenchmarkCase(
+        name=f"fmu.{path}[variables={variables}]",
+        prepare=prepare,
+        units=variables,
+        unit="variables",
+        fresh_inputs=not reprobe,
+    )
+
+
+def _validator(validation_type: str):
+    from validibot.validations.models import Validator
+
+    return Validator.objects.create(
+        slug=f"benchmark-{validation_type.lower()}",
+        name=f"Benchmark {validation_type}",
+        validation_type=validation_type,
+        is_system=False,
+        supports_assertions=True,
+    )
+
+
+def _ruleset(ruleset_type: str, rules_text: str, *, metadata=None):
+    from validibot.validations.models import Ruleset
+
+    return Ruleset.objects.create(
+        name=f"Benchmark {ruleset_type}",
+        ruleset_type=ruleset_type,
+        rules_text=rules_text,
+        metadata=metadata or {},
+    )
+
+
+# ── Running ───────────────────────────────────────────────────────────
+
+
+def run_case(case: BenchmarkCase, *, repeat: int) -> dict[str, Any]:
+    """Time ``case`` ``repeat`` times and return its report entry."""
+
+    samples: list[float] = []
+    counters = None
+    with transaction.atomic():
+        try:
+            call = case.prepare()
+            for index in range(repeat):
+                if index and case.fresh_inputs:
+                    call = case.prepare()
+                started = time.perf_counter()
+                counters = call()
+                samples.append(time.perf_counter() - started)
+        finally:
+            transaction.set_rollback(True)
+
+    fastest = min(samples)
+    result = {
+        "name": case.name,
+        "units": case.units,
+        "unit": case.unit,
+        "samples": [round(sample, 6) for sample in samples],
+        "min_seconds": round(fastest, 6),
+        "median_seconds": round(statistics.median(samples), 6),
+        "units_per_second": round(case.units / fastest, 1) if fastest else None,
+    }
+    # A case may return work counters (e.g. bytes read) from its timed call;
+    # they are deterministic, so the last call's values are reported.
+    if isinstance(counters, dict):
+        result["counters"] = counters
+    return result
+
+
+def run_benchmarks(
+    *,
+    profile: str,
+    repeat: int,
+    select: str = "",
+    on_result: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Run every ``profile`` case whose name contains ``select``."""
+
+    results = []
+    for case in build_cases(profile):
+        if select and select not in case.name:
+            continue
+        result = run_case(case, repeat=repeat)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "generated_at": timezone.now().isoformat(),
+        "profile": profile,
+        "repeat": repeat,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "results": results,
+    }
+
+
+# ── Comparison ────────────────────────────────────────────────────────
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float,
+) -> Comparison:
+    """Flag cases whose fastest sample grew by more than ``threshold``.
+
+    ``threshold`` is a fraction: ``0.25`` tolerates a 25% slowdown.
+    """
+
+    for report in (baseline, current):
+        if report.get("schema_version") != REPORT_SCHEMA_VERSION:
+            msg = (
+                "Unsupported benchmark report schema version "
+                f"{report.get('schema_version')!r}"
+            )
+            raise ValueError(msg)
+
+    baseline_by_name = _by_name(baseline["results"])
+    current_by_name = _by_name(current["results"])
+    comparison = Comparison(
+        missing=sorted(baseline_by_name.keys() - current_by_name.keys()),
+        added=sorted(current_by_name.keys() - baseline_by_name.keys()),
+    )
+    for name, result in current_by_name.items():
+        reference = baseline_by_name.get(name)
+        if reference is None or not reference["min_seconds"]:
+            continue
+        comparison.compared += 1
+        regression = Regression(
+            name=name,
+            baseline_seconds=reference["min_seconds"],
+            current_seconds=result["min_seconds"],
+        )
+        if regression.slowdown > threshold:
+            comparison.regressions.append(regression)
+    return comparison
+
+
+def _by_name(results: Iterable[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    return {result["name"]: result for result in results}
@@ -16,6 +16,7 @@ import celpy
 from lark import Token
 from lark import Tree
 
+from validibot.core import metrics
 from validibot.validations._bounded_eval import ExpressionEvaluationTimeoutError
 from validibot.validations._bounded_eval import run_with_timeout
 from validibot.validations.cel_helpers import build_cel_functions
@@ -32,6 +33,18 @@ if TYPE_CHECKING:
     # annotations`` makes the hint a string, so the import is type-only.
     from datetime import datetime
 
+# ``rejected`` covers expressions and contexts refused by the shape caps before
+# any evaluation; a rising rate there usually means a ruleset needs attention.
+CEL_EVALUATIONS = metrics.counter(
+    "validibot_cel_evaluations_total",
+    "CEL expression evaluations by outcome.",
+    labelnames=("outcome",),
+)
+_CEL_SUCCESS = CEL_EVALUATIONS.labels(outcome="success")
+_CEL_ERROR = CEL_EVALUATIONS.labels(outcome="error")
+_CEL_TIMEOUT = CEL_EVALUATIONS.labels(outcome="timeout")
+_CEL_REJECTED = CEL_EVALUATIONS.labels(outcome="rejected")
+
 
 @dataclass(frozen=True)
 class CelEvaluationResult:
@@ -342,16 +355,19 @@ def evaluate_cel_expression(
     """
     normalized = (expression or "").strip()
     if not normalized:
+        _CEL_REJECTED.inc()
         return CelEvaluationResult(
             success=False, value=None, error="Empty CEL expression."
         )
     if len(normalized) > CEL_MAX_EXPRESSION_CHARS:
+        _CEL_REJECTED.inc()
         return CelEvaluationResult(
             success=False,
             value=None,
             error="CEL expression is too long.",
         )
     if len(context) > CEL_MAX_CONTEXT_SYMBOLS:
+        _CEL_REJECTED.inc()
         return CelEvaluationResult(
             success=False,
             value=None,
@@ -370,6 +386,7 @@ def evaluate_cel_expression(
             max_total_symbols=CEL_MAX_CONTEXT_TOTAL_SYMBOLS,
         )
     except _CelContextShapeError as exc:
+        _CEL_REJECTED.inc()
         return CelEvaluationResult(success=False, value=None, error=str(exc))
 
     # Compile (with AST shape check) on the request thread — a hostile
@@ -381,9 +398,11 @@ def evaluate_cel_expression(
     try:
         ast = _compile_ast(normalized)
     except _CelExpressionShapeError as exc:
+        _CEL_REJECTED.inc()
         return CelEvaluationResult(success=False, value=None, error=str(exc))
     except Exception as exc:
         # Lark parse errors / invalid CEL syntax / other celpy failures.
+        _CEL_REJECTED.inc()
         return CelEvaluationResult(success=False, value=None, error=str(exc))
 
     # Bind helper functions onto the parsed AST. This is the runtime half
@@ -394,6 +413,7 @@ def evaluate_cel_expression(
     try:
         program = _build_program(ast, build_cel_functions(now=now))
     except Exception as exc:  # pragma: no cover - defensive; valid AST builds
+        _CEL_ERROR.inc()
         return CelEvaluationResult(success=False, value=None, error=str(exc))
 
     def _evaluate() -> Any:
@@ -425,15 +445,18 @@ def evaluate_cel_expression(
         value = run_with_timeout(_evaluate, timeout_s=eval_timeout)
     except ExpressionEvaluationTimeoutError:
         # The orphaned worker drains in the background; its result is discarded.
+        _CEL_TIMEOUT.inc()
         return CelEvaluationResult(
             success=False,
             value=None,
             error="CEL evaluation timed out.",
         )
     except Exception as exc:
+        _CEL_ERROR.inc()
         return CelEvaluationResult(
             success=False,
             value=None,
             error=str(exc),
         )
+    _CEL_SUCCESS.inc()
     return CelEvaluationResult(success=True, value=value)
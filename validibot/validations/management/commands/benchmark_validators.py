@@ -0,0 +1,84 @@
+"""Benchmark the in-process validator hot paths.
+
+Runs the cases in ``validibot.validations.benchmarks`` against deterministic
+generated inputs and writes a JSON report. Commit a report from a known-good
+build as the baseline and check later builds against it with
+``compare_validator_benchmarks``. Everything a case creates in the database is
+rolled back, so this is safe to run against any environment, though timings
+are only comparable between reports taken on the same hardware.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from validibot.validations.benchmarks.suite import PROFILES
+from validibot.validations.benchmarks.suite import run_benchmarks
+
+
+class Command(BaseCommand):
+    """Time each validator benchmark case and emit a JSON report."""
+
+    help = "Benchmark validator hot paths and write a machine-readable report."
+
+    def add_arguments(self, parser):
+        """Register profile, repetition, selection, and output options."""
+        parser.add_argument(
+            "--profile",
+            choices=sorted(PROFILES),
+            default="quick",
+            help="Input sizes to run: quick (CI) or full (default: quick).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Timed repetitions per case; reports keep the fastest (default: 5).",
+        )
+        parser.add_argument(
+            "--case",
+            default="",
+            help="Only run cases whose name contains this text.",
+        )
+        parser.add_argument(
+            "--output",
+            default="",
+            help="Write the JSON report to this path instead of stdout.",
+        )
+
+    def handle(self, *args, **options):
+        """Run the selected cases and write the report."""
+        repeat = options["repeat"]
+        if repeat < 1:
+            raise CommandError("--repeat must be greater than zero")
+        output = options["output"]
+
+        def progress(result):
+            # With --output the report goes to a file, so stdout is free for
+            # a line per case; without it stdout must stay valid JSON.
+            if output:
+                self.stdout.write(
+                    f"{result['name']}: min={result['min_seconds']}s "
+                    f"median={result['median_seconds']}s "
+                    f"({result['units_per_second']} {result['unit']}/s)"
+                )
+
+        report = run_benchmarks(
+            profile=options["profile"],
+            repeat=repeat,
+            select=options["case"],
+            on_result=progress,
+        )
+        if not report["results"]:
+            raise CommandError(f"No benchmark case matches {options['case']!r}")
+
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+        if output:
+            Path(output).write_text(rendered + "\n", encoding="utf-8")
+            self.stdout.write(f"Wrote {len(report['results'])} results to {output}")
+            return
+        self.stdout.write(rendered)
@@ -0,0 +1,82 @@
+"""Fail when a validator benchmark report regressed against its baseline.
+
+Both arguments are reports written by ``benchmark_validators``. A case
+regresses when its fastest sample exceeds the baseline's by more than the
+threshold (``--threshold``, or ``VALIDATOR_BENCHMARK_REGRESSION_THRESHOLD``).
+The command exits non-zero on any regression, so CI can gate on it.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from validibot.validations.benchmarks.suite import compare_reports
+
+
+class Command(BaseCommand):
+    """Compare a benchmark report with a baseline report."""
+
+    help = "Compare two validator benchmark reports and fail on regressions."
+
+    def add_arguments(self, parser):
+        """Register the two report paths and the threshold override."""
+        parser.add_argument("baseline", help="Path to the baseline report.")
+        parser.add_argument("current", help="Path to the report to check.")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=None,
+            help=(
+                "Allowed slowdown as a fraction, e.g. 0.25 for 25% "
+                "(default: VALIDATOR_BENCHMARK_REGRESSION_THRESHOLD)."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        """Report per-case changes and raise on regressions."""
+        threshold = options["threshold"]
+        if threshold is None:
+            threshold = settings.VALIDATOR_BENCHMARK_REGRESSION_THRESHOLD
+        if threshold < 0:
+            raise CommandError("--threshold must not be negative")
+
+        baseline = self._load(options["baseline"])
+        current = self._load(options["current"])
+        try:
+            comparison = compare_reports(baseline, current, threshold=threshold)
+        except (KeyError, ValueError) as exc:
+            raise CommandError(f"Invalid benchmark report: {exc}") from exc
+
+        for name in comparison.missing:
+            self.stdout.write(f"{name}: missing from current report")
+        for name in comparison.added:
+            self.stdout.write(f"{name}: new, no baseline")
+        for regression in comparison.regressions:
+            self.stdout.write(
+                f"{regression.name}: {regression.baseline_seconds}s -> "
+                f"{regression.current_seconds}s ({regression.slowdown:+.1%})"
+            )
+
+        if comparison.regressions:
+            raise CommandError(
+                f"{len(comparison.regressions)} of {comparison.compared} "
+                f"benchmark cases regressed by more than {threshold:.0%}"
+            )
+        self.stdout.write(
+            f"No regressions across {comparison.compared} cases "
+            f"(threshold {threshold:.0%})."
+        )
+
+    @staticmethod
+    def _load(path: str) -> dict:
+        try:
+            return json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            raise CommandError(
+                f"Could not read benchmark report {path}: {exc}"
+            ) from exc
@@ -9,12 +9,16 @@ This is separate from purge_expired_submissions, which handles user-submitted
 files. Authors configure the two windows independently and both default to no
 post-processing retention.
 
+Runs are claimed in chunks with ``FOR UPDATE SKIP LOCKED``, their stored files
+are deleted concurrently, and their outputs are redacted in bulk (see
+``validibot.validations.services.retention_purge``).
+
 This command should be scheduled to run frequently (every five minutes via
 Cloud Scheduler or cron).
 
 Usage:
     python manage.py purge_expired_outputs
-    python manage.py purge_expired_outputs --batch-size 100
+    python manage.py purge_expired_outputs --batch-size 500
     python manage.py purge_expired_outputs --dry-run
 
 Environment:
@@ -22,21 +26,15 @@ Environment:
     to storage for deleting run files and artifacts.
 """
 
-import logging
-from datetime import timedelta
-
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from django.db.models import Q
 from django.utils import timezone
 
 from validibot.submissions.constants import OutputRetention
 from validibot.validations.constants import VALIDATION_RUN_TERMINAL_STATUSES
 from validibot.validations.models import ValidationRun
-from validibot.validations.services.retention import purge_run_outputs
 from validibot.validations.services.retention import schedule_terminal_retention
-
-logger = logging.getLogger(__name__)
+from validibot.validations.services.retention_purge import expired_outputs
+from validibot.validations.services.retention_purge import purge_expired_output_chunk
 
 
 class Command(BaseCommand):
@@ -46,8 +44,8 @@ class Command(BaseCommand):
         parser.add_argument(
             "--batch-size",
             type=int,
-            default=100,
-            help="Number of runs to process per batch (default: 100)",
+            default=500,
+            help="Number of runs to claim per batch (default: 500)",
         )
         parser.add_argument(
             "--dry-run",
@@ -57,8 +55,8 @@ class Command(BaseCommand):
         parser.add_argument(
             "--max-batches",
             type=int,
-            default=10,
-            help="Maximum number of batches to process (default: 10, 0=unlimited)",
+            default=20,
+            help="Maximum number of batches to process (default: 20, 0=unlimited)",
         )
 
     def handle(self, *args, **options):
@@ -69,7 +67,9 @@ class Command(BaseCommand):
         now = timezone.now()
         self._repair_missing_expiries()
         total_purged = 0
-        total_failed = 0
+        # Runs that failed stay expired; skip them for the rest of this run so
+        # a persistent storage error cannot make every batch re-claim them.
+        failed: dict[str, str] = {}
         batch_count = 0
 
         while True:
@@ -78,84 +78,58 @@ class Command(BaseCommand):
                 self.stdout.write(
                     self.style.WARNING(
                         f"Reached max batch limit ({max_batches}). "
-                        f"Purged {total_purged}, failed {total_failed}."
+                        f"Purged {total_purged}, failed {len(failed)}."
                     )
                 )
                 break
 
-            # Terminal status is a hard safety boundary: launch-time clocks or
-            # corrupt rows must never let a sweeper delete a running bundle.
-            # DO_NOT_STORE rows are independently discoverable even if their
-            # terminal signal failed before writing output_expires_at.
-            expired_runs = (
-                ValidationRun.objects.filter(
-                    status__in=VALIDATION_RUN_TERMINAL_STATUSES,
-                    output_purged_at__isnull=True,
+            if dry_run:
+                offset = batch_count * batch_size
+                batch = list(
+                    expired_outputs(now).values_list(
+                        "id",
+                        "output_retention_policy",
+                        "output_expires_at",
+                    )[offset : offset + batch_size],
                 )
-                .filter(
-                    (
-                        Q(output_expires_at__lte=now)
-                        & ~Q(
-                            output_retention_policy=OutputRetention.DO_NOT_STORE,
-                        )
+                for run_id, policy, expires_at in batch:
+                    self.stdout.write(
+                        f"  [DRY RUN] Would purge outputs: {run_id} "
+                        f"(policy={policy}, expires={expires_at})"
                     )
-                    | (
-                        Q(output_retention_policy=OutputRetention.DO_NOT_STORE)
-                        & Q(ended_at__lte=now - timedelta(minutes=1))
-                    ),
-                )
-                .exclude(
-                    output_retention_policy=OutputRetention.STORE_PERMANENTLY,
+                purged, batch_failed = len(batch), {}
+            else:
+                chunk = purge_expired_output_chunk(
+                    now=now,
+                    limit=batch_size,
+                    skip_ids=failed,
                 )
-                .order_by("output_expires_at")[:batch_size]
-            )
-
-            # Convert to list to avoid queryset changes during iteration
-            runs_to_process = list(expired_runs)
+                purged, batch_failed = len(chunk.purged), chunk.failed
 
-            if not runs_to_process:
-                if total_purged == 0 and total_failed == 0:
+            if not purged and not batch_failed:
+                if total_purged == 0 and not failed:
                     self.stdout.write(
                         self.style.SUCCESS("No expired outputs to purge.")
                     )
                 else:
                     self.stdout.write(
                         self.style.SUCCESS(
-                            f"Completed. Purged {total_purged}, failed {total_failed}."
+                            f"Completed. Purged {total_purged}, failed {len(failed)}."
                         )
                     )
                 break
 
             batch_count += 1
+            total_purged += purged
+            failed.update(batch_failed)
             self.stdout.write(
-                f"Processing batch {batch_count}: {len(runs_to_process)} run(s)"
+                f"Processed batch {batch_count}: {purged} purged, "
+                f"{len(batch_failed)} failed"
             )
-
-            for run in runs_to_process:
-                if dry_run:
-                    self.stdout.write(
-                        f"  [DRY RUN] Would purge outputs: {run.id} "
-                        f"(policy={run.output_retention_policy}, "
-                        f"expires={run.output_expires_at})"
-                    )
-                    total_purged += 1
-                    continue
-
-                try:
-                    with transaction.atomic():
-                        purge_run_outputs(run)
-                    total_purged += 1
-                    self.stdout.write(self.style.SUCCESS(f"  Purged outputs: {run.id}"))
-                except Exception as e:
-                    total_failed += 1
-                    self.stdout.write(
-                        self.style.ERROR(f"  Failed to purge outputs {run.id}: {e}")
-                    )
-                    logger.exception(
-                        "Failed to purge expired run outputs",
-                        extra={"run_id": str(run.id)},
-                    )
-                    # Continue with other runs - don't stop on failure
+            for run_id, error in batch_failed.items():
+                self.stdout.write(
+                    self.style.ERROR(f"  Failed to purge outputs {run_id}: {error}")
+                )
 
         if dry_run:
             self.stdout.write(
@@ -166,15 +140,15 @@ class Command(BaseCommand):
         else:
             self.stdout.write(
                 self.style.SUCCESS(
-                    f"Purge complete. Purged: {total_purged}, Failed: {total_failed}"
+                    f"Purge complete. Purged: {total_purged}, Failed: {len(failed)}"
                 )
             )
 
         # Return non-zero exit code if there were failures
-        if total_failed > 0:
+        if failed:
             self.stderr.write(
                 self.style.ERROR(
-                    f"{total_failed} run(s) failed to purge. Check logs and retry."
+                    f"{len(failed)} run(s) failed to purge. Check logs and retry."
                 )
             )
 
@@ -0,0 +1,161 @@
+"""Report where profiled validation runs spent their time.
+
+Reads the execution profiles the step orchestrator stores on run summaries
+when ``VALIDATION_RUN_PROFILING_ENABLED`` is on, and ranks phases by total
+time across the report window. Step spans are grouped by validation type
+(``step:TABULAR``) so one slow validator is not diluted across step orders.
+Times are inclusive: a ``step`` includes the ``assertions`` and
+``persistence`` spans recorded inside it.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections import defaultdict
+from datetime import timedelta
+from typing import Any
+from typing import TypedDict
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from validibot.core.spans import iter_spans
+from validibot.validations.models import ValidationRunSummary
+
+
+class _PhaseRow(TypedDict):
+    """Stable output row used by both JSON and human renderers."""
+
+    phase: str
+    runs: int
+    total_ms: float
+    share_of_run_time: float
+    p50_ms: float | None
+    p95_ms: float | None
+    max_ms: float | None
+
+
+def _percentile(values: list[float], percentile: float) -> float | None:
+    """Return the deterministic nearest-rank percentile."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percentile * len(ordered)))
+    return round(ordered[rank - 1], 3)
+
+
+def _phase_key(node: dict[str, Any]) -> str:
+    """Group step spans by validation type and every other span by name."""
+    name = str(node.get("name", ""))
+    if name == "step":
+        _order, _sep, step_type = str(node.get("label", "")).partition(":")
+        return f"step:{step_type or 'unknown'}"
+    return name
+
+
+def _run_phase_times(profile: dict[str, Any]) -> dict[str, float]:
+    """Sum one run's time per phase across every place the phase appears."""
+    totals: dict[str, float] = defaultdict(float)
+    for _parents, node in iter_spans(profile):
+        totals[_phase_key(node)] += float(node.get("ms") or 0.0)
+    return totals
+
+
+class Command(BaseCommand):
+    """Rank execution phases of recently profiled runs by time spent."""
+
+    help = "Aggregate the slowest phases across recently profiled runs."
+
+    def add_arguments(self, parser):
+        """Register report-window, size, and output-format options."""
+        parser.add_argument(
+            "--since-hours",
+            type=int,
+            default=24,
+            help="Include runs completed in the last N hours (default: 24).",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=15,
+            help="Show at most N phases (default: 15).",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Emit stable JSON for retention or dashboard ingestion.",
+        )
+
+    def handle(self, *args, **options):
+        """Aggregate per-run phase totals into ranked percentiles."""
+        since_hours = options["since_hours"]
+        limit = options["limit"]
+        if since_hours < 1:
+            raise CommandError("--since-hours must be greater than zero")
+        if limit < 1:
+            raise CommandError("--limit must be greater than zero")
+
+        generated_at = timezone.now()
+        since = generated_at - timedelta(hours=since_hours)
+        samples: dict[str, list[float]] = defaultdict(list)
+        run_count = 0
+        run_ms = 0.0
+        profiles = (
+            ValidationRunSummary.objects.filter(
+                completed_at__gte=since,
+                extras__has_key="profile",
+            )
+            .order_by("completed_at", "pk")
+            .values_list("extras", flat=True)
+            .iterator()
+        )
+        for extras in profiles:
+            profile = extras.get("profile")
+            if not isinstance(profile, dict):
+                continue
+            run_count += 1
+            run_ms += float(profile.get("ms") or 0.0)
+            for phase, elapsed_ms in _run_phase_times(profile).items():
+                samples[phase].append(elapsed_ms)
+
+        rows: list[_PhaseRow] = []
+        for phase, values in samples.items():
+            total_ms = sum(values)
+            rows.append(
+                {
+                    "phase": phase,
+                    "runs": len(values),
+                    "total_ms": round(total_ms, 3),
+                    "share_of_run_time": (
+                        round(total_ms / run_ms, 4) if run_ms else 0.0
+                    ),
+                    "p50_ms": _percentile(values, 0.50),
+                    "p95_ms": _percentile(values, 0.95),
+                    "max_ms": round(max(values), 3),
+                }
+            )
+        rows.sort(key=lambda row: (-row["total_ms"], row["phase"]))
+        rows = rows[:limit]
+
+        report = {
+            "generated_at": generated_at.isoformat(),
+            "since": since.isoformat(),
+            "profiled_runs": run_count,
+            "phases": rows,
+        }
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
+            return
+        if not rows:
+            self.stdout.write("No profiled runs in the report window.")
+            return
+        self.stdout.write(f"Profiled runs: {run_count}")
+        for row in rows:
+            self.stdout.write(
+                f"{row['phase']}: total={row['total_ms']}ms "
+                f"({row['share_of_run_time']:.1%} of run time), "
+                f"runs={row['runs']}, p50={row['p50_ms']}ms "
+                f"p95={row['p95_ms']}ms max={row['max_ms']}ms"
+            )
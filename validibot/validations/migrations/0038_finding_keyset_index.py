@@ -0,0 +1,31 @@
+# Generated by Django 6.0.7 on 2026-10-18 22:02
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    """Extend the (step run, severity) findings index with ``id``.
+
+    The keyset findings API and exports read ``WHERE validation_step_run_id = ?
+    AND severity = ? AND id > ? ORDER BY id``; the wider index serves that as
+    a range scan and still covers every query the old index did.
+    """
+
+    dependencies = [
+        ("validations", "0037_validationrun_definition_released_at"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="validationfinding",
+            name="validations_validat_8354a9_idx",
+        ),
+        migrations.AddIndex(
+            model_name="validationfinding",
+            index=models.Index(
+                fields=["validation_step_run", "severity", "id"],
+                name="finding_step_severity_id_idx",
+            ),
+        ),
+    ]
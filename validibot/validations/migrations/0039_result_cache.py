@@ -0,0 +1,46 @@
+# Generated by Django 6.0.7 on 2026-10-18 23:21
+
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    """Record result-cache keys on runs and link cache hits to their source."""
+
+    dependencies = [
+        ("validations", "0038_finding_keyset_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="validationrun",
+            name="cached_from",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="The executed run whose results were cloned into this run. Null for runs whose validators actually ran.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="cache_hits",
+                to="validations.validationrun",
+            ),
+        ),
+        migrations.AddField(
+            model_name="validationrun",
+            name="result_cache_key",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="SHA-256 over everything that determines this run's result: submission content, workflow definition, validator versions and step resources. Empty when the workflow does not cache results.",
+                max_length=64,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="validationrun",
+            index=models.Index(
+                condition=models.Q(("result_cache_key", ""), _negated=True),
+                fields=["org", "result_cache_key"],
+                name="run_result_cache_key_idx",
+            ),
+        ),
+    ]
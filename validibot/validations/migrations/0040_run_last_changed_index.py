@@ -0,0 +1,30 @@
+# Generated by Django 6.0.7 on 2026-10-19 01:48
+
+from django.db import migrations
+from django.db import models
+from django.db.models.functions import Greatest
+
+
+class Migration(migrations.Migration):
+    """Index when each run last changed, for the dashboard rollup refresh.
+
+    Status transitions go through ``QuerySet.update()`` and move
+    ``started_at``/``ended_at`` without touching ``modified``, so the refresh
+    reads ``WHERE GREATEST(modified, started_at, ended_at) >= <watermark>``.
+    This expression index serves that as a range scan instead of a
+    sequential scan of every run.
+    """
+
+    dependencies = [
+        ("validations", "0039_result_cache"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="validationrun",
+            index=models.Index(
+                Greatest("modified", "started_at", "ended_at"),
+                name="run_last_changed_idx",
+            ),
+        ),
+    ]
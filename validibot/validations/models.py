@@ -12,6 +12,7 @@ from django.core.validators import MinValueValidator
 from django.db import models
 from django.db.models import Q
 from django.db.models import Value
+from django.db.models.functions import Greatest
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from model_utils.models import TimeStampedModel
@@ -25,6 +26,7 @@ from validibot.submissions.constants import SubmissionDataFormat
 from validibot.submissions.constants import SubmissionFileType
 from validibot.submissions.constants import data_format_allowed_file_types
 from validibot.submissions.models import Submission
+from validibot.users.models import Membership
 from validibot.users.models import Organization
 from validibot.users.models import User
 from validibot.validations.constants import CLOUD_RUN_SERVICE_DISPATCH_DEADLINE_SECONDS
@@ -71,7 +73,9 @@ from validibot.validations.constants import ValidatorTrustTier
 from validibot.validations.constants import ValidatorWeight
 from validibot.validations.constants import XMLSchemaType
 from validibot.validations.constants import get_resource_types_for_validator
+from validibot.workflows.constants import WorkflowVisibility
 from validibot.workflows.models import Workflow
+from validibot.workflows.models import WorkflowAccessIndex
 from validibot.workflows.models import WorkflowStep
 
 _INPUT_NAMESPACE_PATTERN = re.compile(
@@ -3563,46 +3567,52 @@ class ValidationRunQuerySet(models.QuerySet):
             return queryset
 
         from validibot.users.constants import PermissionCode
-        from validibot.users.permissions import membership_grants_permission
-
-        memberships = user.memberships.filter(is_active=True).select_related("org")
-        if org_id is not None:
-            memberships = memberships.filter(org_id=org_id)
+        from validibot.users.constants import RoleCode
+        from validibot.users.permissions import roles_for_permission
+
+        # Result visibility comes from membership roles. Resolving it in SQL
+        # keeps the whole policy one query instead of a Python pass over
+        # memberships; OWNER is listed explicitly because it implies every
+        # permission (see ``membership_grants_permission``).
+        def result_access_org_ids(permission: PermissionCode):
+            memberships = Membership.objects.filter(
+                user_id=user.pk,
+                is_active=True,
+                roles__code__in={*roles_for_permission(permission), RoleCode.OWNER},
+            )
+            if org_id is not None:
+                memberships = memberships.filter(org_id=org_id)
+            return memberships.values("org_id")
 
-        full_access_org_ids: set[int] = set()
-        own_access_org_ids: set[int] = set()
-        for membership in memberships:
-            if membership_grants_permission(
-                membership,
+        access_filter = Q(
+            org_id__in=result_access_org_ids(
                 PermissionCode.VALIDATION_RESULTS_VIEW_ALL,
-            ):
-                full_access_org_ids.add(membership.org_id)
-            elif membership_grants_permission(
-                membership,
+            ),
+        ) | Q(
+            org_id__in=result_access_org_ids(
                 PermissionCode.VALIDATION_RESULTS_VIEW_OWN,
-            ):
-                own_access_org_ids.add(membership.org_id)
-
-        access_filter = Q(pk__in=[])
-        if full_access_org_ids:
-            access_filter |= Q(org_id__in=full_access_org_ids)
-        if own_access_org_ids:
-            access_filter |= Q(
-                org_id__in=own_access_org_ids,
-                user_id=user.pk,
-            )
+            ),
+            user_id=user.pk,
+        )
 
         # Workflow grants, organization-wide guest access, and ALL_USERS
         # visibility can all authorize a non-member launch. Keep polling
-        # symmetrical with launch access, but never widen it beyond the
-        # launcher's own rows.
-        accessible_workflows = Workflow.objects.for_user(user)
-        access_filter |= Q(
-            user_id=user.pk,
-            workflow__in=accessible_workflows,
+        # symmetrical with launch access (``Workflow.objects.for_user``,
+        # whose per-user paths are precomputed in ``WorkflowAccessIndex``),
+        # but never widen it beyond the launcher's own rows.
+        access_filter |= Q(user_id=user.pk) & (
+            Q(
+                workflow_id__in=WorkflowAccessIndex.objects.filter(
+                    user_id=user.pk,
+                ).values("workflow_id"),
+            )
+            | Q(
+                workflow__workflow_visibility=WorkflowVisibility.ALL_USERS,
+                workflow__org__workflow_visibility_cap=WorkflowVisibility.ALL_USERS,
+            )
         )
 
-        return queryset.filter(access_filter).distinct()
+        return queryset.filter(access_filter)
 
 
 class ValidationRun(TimeStampedModel):
@@ -3624,6 +3634,19 @@ class ValidationRun(TimeStampedModel):
                 name="run_unreleased_workflow_idx",
                 condition=Q(definition_released_at__isnull=True),
             ),
+            models.Index(
+                fields=["org", "result_cache_key"],
+                name="run_result_cache_key_idx",
+                condition=~Q(result_cache_key=""),
+            ),
+            # The dashboard rollup refresh finds runs changed since its
+            # watermark; status transitions move started_at/ended_at without
+            # touching modified, so it filters on the latest of the three
+            # (validibot.dashboard.rollups).
+            models.Index(
+                Greatest("modified", "started_at", "ended_at"),
+                name="run_last_changed_idx",
+            ),
         ]
         constraints = [
             # ended_at cannot be before started_at (allow nulls)
@@ -3764,6 +3787,34 @@ class ValidationRun(TimeStampedModel):
         ),
     )
 
+    # Result cache fields
+    # ~---------------------------------------------------------------
+    # Only populated for workflows with ``result_cache_enabled``. See
+    # ``validations/services/result_cache.py``.
+
+    result_cache_key = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text=_(
+            "SHA-256 over everything that determines this run's result: "
+            "submission content, workflow definition, validator versions and "
+            "step resources. Empty when the workflow does not cache results."
+        ),
+    )
+
+    cached_from = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="cache_hits",
+        help_text=_(
+            "The executed run whose results were cloned into this run. "
+            "Null for runs whose validators actually ran."
+        ),
+    )
+
     objects = ValidationRunQuerySet.as_manager()
 
     def clean(self):
@@ -4304,7 +4355,12 @@ class ValidationFinding(TimeStampedModel):
     class Meta:
         indexes = [
             models.Index(fields=["validation_run", "severity"]),
-            models.Index(fields=["validation_step_run", "severity"]),
+            # Keyset order for paging and exporting a step's findings; see
+            # validibot.validations.services.findings_keyset.
+            models.Index(
+                fields=["validation_step_run", "severity", "id"],
+                name="finding_step_severity_id_idx",
+            ),
             models.Index(fields=["validation_step_run", "code"]),
         ]
         ordering = [
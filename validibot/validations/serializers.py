@@ -7,6 +7,7 @@ from typing import Any
 
 from django.apps import apps
 from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
 from django.urls import NoReverseMatch
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
@@ -22,7 +23,8 @@ from validibot.validations.constants import ValidationRunResult
 from validibot.validations.constants import ValidationRunStatus
 from validibot.validations.constants import project_run_state
 from validibot.validations.models import ValidationRun
-from validibot.validations.services.findings_display import summarize_failed_rows
+from validibot.validations.services.findings_keyset import attach_inline_findings
+from validibot.validations.services.findings_keyset import serialize_finding
 from validibot.workflows.constants import SUPPORTED_CONTENT_TYPES
 
 CONTENT_TYPE_BY_FILE_TYPE = {
@@ -68,6 +70,8 @@ class ValidationRunSerializer(serializers.ModelSerializer):
 
     credential = serializers.SerializerMethodField()
 
+    profile = serializers.SerializerMethodField()
+
     def get_state(self, obj: ValidationRun) -> str:
         # Delegated to ``project_run_state`` so this projection has one
         # implementation across the community API and the cloud agent
@@ -119,10 +123,11 @@ class ValidationRunSerializer(serializers.ModelSerializer):
         if not step_runs:
             return []
         step_runs.sort(key=lambda sr: (sr.step_order or 0, sr.pk))
+        attach_inline_findings(step_runs)
         payload: list[dict] = []
         for step_run in step_runs:
             workflow_step = getattr(step_run, "workflow_step", None)
-            findings = list(step_run.findings.all())
+            findings = step_run.display_findings
             output = step_run.output or {}
 
             # Enrich with display-ready step outputs and template parameters.
@@ -134,21 +139,11 @@ class ValidationRunSerializer(serializers.ModelSerializer):
                     "step_id": step_run.workflow_step_id or step_run.pk,
                     "name": getattr(workflow_step, "name", _("Step")),
                     "status": step_run.status,
-                    "issues": [
-                        {
-                            "id": finding.id,
-                            "message": finding.message,
-                            "path": finding.path,
-                            "severity": finding.severity,
-                            "code": finding.code,
-                            "assertion_id": finding.ruleset_assertion_id,
-                            # Structured failing-row examples ({sample_rows,
-                            # count, truncated}) for validators that aggregate a
-                            # bulk failure into one finding; None otherwise.
-                            "failed_rows": summarize_failed_rows(finding.meta),
-                        }
-                        for finding in findings
-                    ],
+                    "issues": [serialize_finding(finding) for finding in findings],
+                    # True when the step has more findings than are embedded
+                    # here (RUN_FINDINGS_INLINE_LIMIT); page through the rest
+                    # with the run's ``findings`` endpoint.
+                    "issues_truncated": step_run.findings_truncated,
                     "error": step_run.error,
                     "output_values": [
                         {
@@ -177,6 +172,19 @@ class ValidationRunSerializer(serializers.ModelSerializer):
             )
         return payload
 
+    def get_profile(self, obj: ValidationRun) -> dict | None:
+        """Return the stored execution profile, when the run was profiled.
+
+        Profiles are opt-in (``VALIDATION_RUN_PROFILING_ENABLED``) and live in
+        the run summary's ``extras``; see ``validibot.core.spans`` for the
+        span tree shape. Runs without one omit the field entirely.
+        """
+        try:
+            summary = obj.summary_record
+        except ObjectDoesNotExist:
+            return None
+        return (summary.extras or {}).get("profile")
+
     def _has_credential_action(self, instance: ValidationRun) -> bool:
         """Return whether the run's workflow has a signed-credential step.
 
@@ -282,6 +290,8 @@ class ValidationRunSerializer(serializers.ModelSerializer):
         data = super().to_representation(instance)
         if not self._has_credential_action(instance):
             data.pop("credential", None)
+        if data.get("profile") is None:
+            data.pop("profile", None)
         if not instance.are_outputs_viewable:
             data["error"] = ""
             data["user_friendly_error"] = ""
@@ -310,12 +320,14 @@ class ValidationRunSerializer(serializers.ModelSerializer):
             # "summary", # We use "steps" field to dig into summary and get steps.
             "steps",
             "credential",
+            "profile",
             "error",
             "user_friendly_error",
             "output_hash",
             "output_retention_policy",
             "output_expires_at",
             "output_purged_at",
+            "cached_from",
         ]
         read_only_fields = fields
 
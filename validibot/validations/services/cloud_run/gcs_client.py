@@ -21,6 +21,7 @@ from pydantic import BaseModel
 
 from validibot.validations.services.create_only_storage import StorageConflictError
 from validibot.validations.services.create_only_storage import create_local_bytes
+from validibot.validations.services.envelope_stream import EnvelopeSpool
 from validibot.validations.services.file_identity import FILE_IDENTITY_CHUNK_SIZE
 from validibot.validations.services.file_identity import FileIdentity
 from validibot.validations.services.file_identity import local_bytes_identity
@@ -135,7 +136,8 @@ def download_envelope(
     envelope_class: type[BaseModel],
     *,
     max_bytes: int | None = None,
-) -> BaseModel:
+    stream_threshold_bytes: int | None = None,
+) -> BaseModel | EnvelopeSpool:
     """
     Download and deserialize a Pydantic envelope from GCS.
 
@@ -148,9 +150,15 @@ def download_envelope(
             worker uses this to protect itself from a compromised or buggy
             validator writing an oversized ``output.json`` that
             ``download_as_text()`` would otherwise buffer fully into memory.
+        stream_threshold_bytes: Optional size at or above which the object is
+            NOT parsed. It is copied in chunks to a local ``EnvelopeSpool``
+            instead, and the caller opens it with
+            ``envelope_stream.open_streamed_spool`` so findings can be
+            persisted in batches without holding the whole envelope in memory.
 
     Returns:
-        Deserialized envelope instance
+        Deserialized envelope instance, or an ``EnvelopeSpool`` when the
+        object reached ``stream_threshold_bytes``.
 
     Raises:
         ValueError: If URI is invalid, file doesn't exist, or the object
@@ -181,8 +189,9 @@ def download_envelope(
     # populate metadata, so ``reload()`` to learn ``blob.size``, then refuse
     # anything over the limit — we never want ``download_as_text()`` to pull an
     # unbounded object into worker memory.
-    if max_bytes is not None:
+    if max_bytes is not None or stream_threshold_bytes is not None:
         blob.reload()
+    if max_bytes is not None:
         if blob.size is not None and blob.size > max_bytes:
             msg = (
                 f"Refusing to download {uri}: object size {blob.size} bytes "
@@ -190,6 +199,13 @@ def download_envelope(
             )
             raise ValueError(msg)
 
+    if (
+        stream_threshold_bytes is not None
+        and blob.size is not None
+        and blob.size >= stream_threshold_bytes
+    ):
+        return _spool_blob(blob, uri=uri, max_bytes=max_bytes)
+
     # Download JSON
     json_data = blob.download_as_text()
 
@@ -198,6 +214,36 @@ def download_envelope(
     return envelope
 
 
+def _spool_blob(blob, *, uri: str, max_bytes: int | None) -> EnvelopeSpool:
+    """Copy a blob to a local spool file in chunks, enforcing ``max_bytes``.
+
+    The metadata size check above can be raced by an object rewrite, so the
+    cap is enforced again on the bytes actually streamed.
+    """
+    spool = EnvelopeSpool()
+    try:
+        with (
+            blob.open("rb", chunk_size=FILE_IDENTITY_CHUNK_SIZE) as source,
+            spool.path.open("wb") as target,
+        ):
+            while chunk := source.read(FILE_IDENTITY_CHUNK_SIZE):
+                spool.size_bytes += len(chunk)
+                if max_bytes is not None and spool.size_bytes > max_bytes:
+                    break
+                target.write(chunk)
+    except Exception:
+        spool.close()
+        raise
+    if max_bytes is not None and spool.size_bytes > max_bytes:
+        spool.close()
+        msg = (
+            f"Refusing to download {uri}: streamed more than "
+            f"the configured limit of {max_bytes} bytes."
+        )
+        raise ValueError(msg)
+    return spool
+
+
 def gcs_object_exists(uri: str) -> bool:
     """Return whether an exact GCS object exists without downloading it."""
     bucket_name, blob_path = parse_gcs_uri(uri)
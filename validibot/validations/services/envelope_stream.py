@@ -0,0 +1,530 @@
+"""
+Streaming reader for large advanced-validator output envelopes.
+
+``download_envelope`` and ``parse_and_verify_output_envelope`` validate the
+whole ``output.json`` as one Pydantic model. That is fine for typical
+EnergyPlus/FMU results, but a Schematron or SHACL run with hundreds of
+thousands of findings keeps the JSON text, the Pydantic objects, and the
+derived ``ValidationIssue`` list resident at the same time.
+
+This module reads the envelope incrementally instead:
+
+1. **Header pass.** The JSON is walked once with the large arrays
+   (``messages`` and, when the envelope class declares it,
+   ``outputs.findings``) streamed item by item. Every item is validated
+   against its Pydantic item type and then discarded. Everything else is
+   assembled into a *header* — the envelope with those arrays empty — which
+   is validated with the trusted envelope class and checked against the
+   expected run/validator/attempt identity. Nothing is persisted until this
+   pass succeeds, so a malformed or mismatched envelope is rejected exactly as
+   the non-streaming path would reject it.
+2. **Item passes.** ``StreamedOutputEnvelope.iter_items()`` walks the source
+   again and yields typed items, so callers can persist findings in batches.
+
+Peak memory is bounded by the largest single JSON value outside the streamed
+arrays plus one persistence batch, not by the envelope size. The source is a
+local file (the Docker Compose workspace path, or a spool file that the GCS
+download wrote to disk), so repeated passes never re-download anything.
+
+The canonical SHA-256 recorded on the execution attempt is also computed
+incrementally and matches ``output_envelope_sha256`` for the equivalent fully
+parsed model.
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import types
+import typing
+import weakref
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+from validibot_shared.canonicalization import canonicalize_dict
+
+from validibot.validations.services.output_envelope_verifier import (
+    OutputEnvelopeVerificationError,
+)
+from validibot.validations.services.output_envelope_verifier import (
+    verify_output_envelope,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from validibot_shared.validations.envelopes import ValidationOutputEnvelope
+
+    from validibot.validations.services.output_envelope_verifier import (
+        ExpectedOutputEnvelope,
+    )
+
+logger = logging.getLogger(__name__)
+
+ArrayPath = tuple[str, ...]
+
+MESSAGES_PATH: ArrayPath = ("messages",)
+FINDINGS_PATH: ArrayPath = ("outputs", "findings")
+
+# Read granularity for the incremental decoder. A value that straddles a chunk
+# boundary triggers a geometrically growing refill, so even a multi-megabyte
+# header string is decoded in O(n log n) rather than O(n^2).
+STREAM_READ_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class EnvelopeStreamError(ValueError):
+    """The envelope bytes are not a well-formed JSON object."""
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Incremental JSON walker
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class _JsonStreamWalker:
+    """Walk a JSON object, streaming the items of selected arrays.
+
+    Only the objects on the way to a streamed array are walked structurally;
+    every other value is decoded whole with ``json.JSONDecoder.raw_decode``.
+    The walker is a generator: it yields ``(path, raw_item)`` for each item of
+    a streamed array and returns the assembled header dict (with the streamed
+    arrays replaced by ``[]``) when the document ends.
+    """
+
+    def __init__(
+        self,
+        source: IO[bytes],
+        stream_paths: Iterable[ArrayPath],
+        *,
+        read_size: int | None = None,
+    ) -> None:
+        self._source = source
+        self._stream_paths = frozenset(stream_paths)
+        self._walk_prefixes = frozenset(
+            path[:depth] for path in self._stream_paths for depth in range(1, len(path))
+        )
+        self._read_size = read_size or STREAM_READ_SIZE
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def walk(self) -> Iterator[tuple[ArrayPath, Any]]:
+        """Yield streamed items; the generator's return value is the header."""
+        if self._peek() != "{":
+            msg = "Output envelope must be a JSON object."
+            raise EnvelopeStreamError(msg)
+        header = yield from self._walk_object(())
+        if self._peek() != "":
+            msg = "Unexpected data after the output envelope object."
+            raise EnvelopeStreamError(msg)
+        return header
+
+    # ── buffer management ────────────────────────────────────────────────
+
+    def _fill(self, size: int) -> bool:
+        """Append at least ``size`` more bytes of text; False at EOF."""
+        if self._eof:
+            return False
+        if self._pos:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        chunk = self._source.read(max(size, self._read_size))
+        if not chunk:
+            self._buf += self._text.decode(b"", final=True)
+            self._eof = True
+            return False
+        self._buf += self._text.decode(chunk)
+        return True
+
+    def _peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill(self._read_size):
+                return ""
+
+    def _next(self, expected: str) -> str:
+        """Consume one structural character from ``expected``."""
+        char = self._peek()
+        if not char or char not in expected:
+            msg = f"Malformed output envelope: expected one of {expected!r}."
+            raise EnvelopeStreamError(msg)
+        self._pos += 1
+        return char
+
+    def _decode_value(self) -> Any:
+        """Decode one complete JSON value at the cursor, refilling as needed."""
+        self._peek()
+        need = self._read_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                if not self._fill(need):
+                    msg = "Malformed output envelope JSON."
+                    raise EnvelopeStreamError(msg) from exc
+                need *= 2
+                continue
+            # A number that ends exactly at the buffer edge may continue in
+            # the next chunk ("12" + "34"); only accept it once more text (or
+            # EOF) proves the token is complete.
+            if end == len(self._buf) and not self._eof:
+                self._fill(need)
+                need *= 2
+                continue
+            self._pos = end
+            return value
+
+    # ── structure ────────────────────────────────────────────────────────
+
+    def _walk_object(self, path: ArrayPath):
+        self._next("{")
+        result: dict[str, Any] = {}
+        if self._peek() == "}":
+            self._pos += 1
+            return result
+        while True:
+            if self._peek() != '"':
+                msg = "Malformed output envelope: object keys must be strings."
+                raise EnvelopeStreamError(msg)
+            key = self._decode_value()
+            if key in result:
+                # Pydantic's JSON parser keeps the last duplicate; a streamed
+                # array cannot be "replaced" after its items were consumed, so
+                # ambiguous documents are rejected outright.
+                msg = f"Duplicate key in output envelope: {key!r}."
+                raise EnvelopeStreamError(msg)
+            self._next(":")
+            child = (*path, key)
+            next_char = self._peek()
+            if child in self._stream_paths and next_char == "[":
+                result[key] = []
+                yield from self._walk_array(child)
+            elif child in self._walk_prefixes and next_char == "{":
+                result[key] = yield from self._walk_object(child)
+            else:
+                result[key] = self._decode_value()
+            if self._next(",}") == "}":
+                return result
+
+    def _walk_array(self, path: ArrayPath):
+        self._next("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield path, self._decode_value()
+            if self._next(",]") == "]":
+                return
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Streamed envelope
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _unwrap_model(annotation: Any) -> type[BaseModel] | None:
+    """Return the BaseModel inside ``Model | None`` annotations, if any."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        for arg in typing.get_args(annotation):
+            model = _unwrap_model(arg)
+            if model is not None:
+                return model
+    return None
+
+
+def _list_item_type(model: type[BaseModel], name: str) -> Any | None:
+    """Return ``T`` for a ``list[T]`` field declared on ``model``."""
+    field_info = model.model_fields.get(name)
+    if field_info is None:
+        return None
+    if typing.get_origin(field_info.annotation) is not list:
+        return None
+    (item_type,) = typing.get_args(field_info.annotation) or (Any,)
+    return item_type
+
+
+def streamed_item_adapters(
+    envelope_class: type[BaseModel],
+) -> dict[ArrayPath, TypeAdapter]:
+    """Map each streamable array of ``envelope_class`` to its item validator.
+
+    ``messages`` is part of the base output envelope. ``outputs.findings`` is
+    streamed only when the envelope's typed ``outputs`` model declares a
+    ``findings`` list (Schematron, SHACL); untyped ``dict`` outputs are left
+    in the header.
+    """
+    adapters: dict[ArrayPath, TypeAdapter] = {}
+    message_type = _list_item_type(envelope_class, "messages")
+    if message_type is not None:
+        adapters[MESSAGES_PATH] = TypeAdapter(message_type)
+    outputs_field = envelope_class.model_fields.get("outputs")
+    outputs_model = _unwrap_model(outputs_field.annotation) if outputs_field else None
+    if outputs_model is not None:
+        finding_type = _list_item_type(outputs_model, "findings")
+        if finding_type is not None:
+            adapters[FINDINGS_PATH] = TypeAdapter(finding_type)
+    return adapters
+
+
+@dataclass(eq=False)
+class StreamedOutputEnvelope:
+    """A verified output envelope whose large arrays stay on disk.
+
+    ``header`` is the trusted envelope model with every streamed array empty;
+    identity, status, timing, metrics, artifacts and the scalar ``outputs``
+    fields are all available on it. ``item_counts`` records how many items
+    each streamed array held so consumers can report totals without a pass.
+    """
+
+    header: ValidationOutputEnvelope
+    item_counts: dict[ArrayPath, int]
+    _path: Path
+    _adapters: dict[ArrayPath, TypeAdapter]
+    _cleanup: Callable[[], None] | None = field(default=None, repr=False)
+
+    @property
+    def status(self):
+        return self.header.status
+
+    @property
+    def timing(self):
+        return self.header.timing
+
+    @property
+    def streamed_paths(self) -> tuple[ArrayPath, ...]:
+        return tuple(self._adapters)
+
+    def iter_items(
+        self,
+        paths: Iterable[ArrayPath] | None = None,
+    ) -> Iterator[tuple[ArrayPath, Any]]:
+        """Yield ``(path, typed_item)`` in document order for ``paths``."""
+        wanted = set(self._adapters if paths is None else paths)
+        if not wanted:
+            return
+        with self._path.open("rb") as source:
+            walker = _JsonStreamWalker(source, self._adapters)
+            for path, raw in walker.walk():
+                if path in wanted:
+                    yield path, self._adapters[path].validate_python(raw)
+
+    def canonical_sha256(self) -> str:
+        """Return the RFC 8785 SHA-256 of the full envelope, streamed.
+
+        The header is canonicalized with a unique placeholder string in place
+        of each streamed array. The canonical bytes are split at those
+        placeholders and the array items are canonicalized one at a time in
+        between, which reproduces ``output_envelope_sha256`` exactly without
+        materializing the arrays.
+        """
+        dump = self.header.model_dump(mode="json", by_alias=True)
+        markers: dict[bytes, ArrayPath] = {}
+        nonce = os.urandom(8).hex()
+        for index, path in enumerate(self._adapters):
+            parent = dump
+            for key in path[:-1]:
+                parent = parent.get(key) if isinstance(parent, dict) else None
+            if not isinstance(parent, dict) or path[-1] not in parent:
+                continue
+            marker = f"__validibot_stream_{nonce}_{index}__"
+            parent[path[-1]] = marker
+            markers[json.dumps(marker).encode("ascii")] = path
+
+        canonical = canonicalize_dict(dump)
+        digest = hashlib.sha256()
+        located = sorted((canonical.index(marker), marker) for marker in markers)
+        cursor = 0
+        for offset, marker in located:
+            digest.update(canonical[cursor:offset])
+            digest.update(b"[")
+            path = markers[marker]
+            adapter = self._adapters[path]
+            for position, (_path, item) in enumerate(self.iter_items([path])):
+                if position:
+                    digest.update(b",")
+                digest.update(
+                    canonicalize_dict(
+                        adapter.dump_python(item, mode="json", by_alias=True),
+                    ),
+                )
+            digest.update(b"]")
+            cursor = offset + len(marker)
+        digest.update(canonical[cursor:])
+        return digest.hexdigest()
+
+    def close(self) -> None:
+        """Release the spool file, if this envelope owns one."""
+        if self._cleanup is not None:
+            self._cleanup()
+            self._cleanup = None
+
+
+def open_streamed_output_envelope(
+    path: Path,
+    *,
+    expected: ExpectedOutputEnvelope,
+    cleanup: Callable[[], None] | None = None,
+) -> StreamedOutputEnvelope:
+    """Validate the envelope at ``path`` and return a streamed view of it.
+
+    Runs the header pass described in the module docstring: every streamed
+    item is schema-checked, the header is validated with the trusted envelope
+    class, and the run/validator/attempt identity is verified before this
+    function returns.
+
+    Raises:
+        OutputEnvelopeVerificationError: With code ``invalid_envelope`` for
+            malformed JSON or schema violations, or the verifier's code for an
+            identity mismatch.
+    """
+    adapters = streamed_item_adapters(expected.envelope_class)
+    counts = dict.fromkeys(adapters, 0)
+    try:
+        with path.open("rb") as source:
+            walker = _JsonStreamWalker(source, adapters)
+            items = walker.walk()
+            while True:
+                try:
+                    item_path, raw = next(items)
+                except StopIteration as stop:
+                    header_data = stop.value
+                    break
+                adapters[item_path].validate_python(raw)
+                counts[item_path] += 1
+        header = expected.envelope_class.model_validate(header_data)
+    except (EnvelopeStreamError, ValidationError, UnicodeDecodeError) as exc:
+        raise OutputEnvelopeVerificationError(
+            "invalid_envelope",
+            "Output envelope does not match the expected schema.",
+        ) from exc
+    header = verify_output_envelope(header, expected=expected)
+    logger.info(
+        "Opened streamed output envelope for run %s (%s)",
+        expected.run_id,
+        ", ".join(f"{'.'.join(p)}={n}" for p, n in counts.items()),
+    )
+    return StreamedOutputEnvelope(
+        header=header,
+        item_counts=counts,
+        _path=path,
+        _adapters=adapters,
+        _cleanup=cleanup,
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Spool files
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class EnvelopeSpool:
+    """A temporary on-disk copy of a downloaded output envelope.
+
+    The file is deleted by ``close()`` or, failing that, when the spool is
+    garbage collected, so an exception between download and processing cannot
+    leak worker disk space.
+    """
+
+    def __init__(self) -> None:
+        handle, name = tempfile.mkstemp(prefix="validibot-envelope-", suffix=".json")
+        os.close(handle)
+        self.path = Path(name)
+        self.size_bytes = 0
+        self._finalizer = weakref.finalize(self, _unlink_quietly, name)
+
+    def close(self) -> None:
+        self._finalizer()
+
+    def read_bytes(self) -> bytes:
+        return self.path.read_bytes()
+
+
+def _unlink_quietly(name: str) -> None:
+    Path(name).unlink(missing_ok=True)
+
+
+def open_streamed_spool(
+    spool: EnvelopeSpool,
+    *,
+    expected: ExpectedOutputEnvelope,
+) -> StreamedOutputEnvelope:
+    """Open a downloaded spool; the returned envelope owns its cleanup."""
+    try:
+        return open_streamed_output_envelope(
+            spool.path,
+            expected=expected,
+            cleanup=spool.close,
+        )
+    except Exception:
+        spool.close()
+        raise
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Helpers for code that accepts either envelope shape
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def envelope_header(envelope: Any) -> Any:
+    """Return the Pydantic model to read scalar envelope fields from."""
+    if isinstance(envelope, StreamedOutputEnvelope):
+        return envelope.header
+    return envelope
+
+
+def envelope_sha256(envelope: Any) -> str:
+    """Canonical SHA-256 for a fully parsed or streamed output envelope."""
+    if isinstance(envelope, StreamedOutputEnvelope):
+        return envelope.canonical_sha256()
+    from validibot.validations.services.output_envelope_verifier import (
+        output_envelope_sha256,
+    )
+
+    return output_envelope_sha256(envelope)
+
+
+def should_stream_envelope(size_bytes: int | None) -> bool:
+    """Return whether an envelope of ``size_bytes`` takes the streaming path."""
+    from django.conf import settings
+
+    threshold = getattr(settings, "VALIDATION_RESULT_STREAM_THRESHOLD_BYTES", None)
+    return threshold is not None and size_bytes is not None and size_bytes >= threshold
+
+
+__all__ = [
+    "FINDINGS_PATH",
+    "MESSAGES_PATH",
+    "EnvelopeSpool",
+    "EnvelopeStreamError",
+    "StreamedOutputEnvelope",
+    "envelope_header",
+    "envelope_sha256",
+    "open_streamed_output_envelope",
+    "open_streamed_spool",
+    "should_stream_envelope",
+    "streamed_item_adapters",
+]
@@ -24,6 +24,7 @@ from validibot_shared.evidence import EvidenceManifest
 from validibot_shared.evidence import WorkflowReceipt
 from validibot_shared.evidence import WorkflowStepReceipt
 
+from validibot.core import spans
 from validibot.core.filesafety import sha256_hexdigest
 
 if TYPE_CHECKING:
@@ -146,6 +147,7 @@ class EvidenceManifestBuilder:
         return artifact
 
 
+@spans.traced("evidence")
 def stamp_evidence_manifest(run: ValidationRun) -> RunEvidenceArtifact | None:
     """Best-effort manifest stamp called from run-completion hooks."""
 
@@ -36,6 +36,7 @@ if TYPE_CHECKING:
     from validibot.submissions.models import Submission
     from validibot.validations.models import ValidationRun
     from validibot.validations.models import Validator
+    from validibot.validations.services.envelope_stream import StreamedOutputEnvelope
     from validibot.validations.services.file_identity import FileIdentity
     from validibot.validations.services.runners.base import ExecutionStatus
     from validibot.workflows.models import WorkflowStep
@@ -99,8 +100,11 @@ class ExecutionResponse:
     """Whether execution has completed (True for sync, False for async pending)."""
 
     # Result (only populated for sync backends or completed async)
-    output_envelope: ValidationOutputEnvelope | None = None
-    """Full output envelope if execution completed."""
+    output_envelope: ValidationOutputEnvelope | StreamedOutputEnvelope | None = None
+    """Full output envelope if execution completed.
+
+    Large results are a ``StreamedOutputEnvelope`` (see ``envelope_stream``).
+    """
 
     # Error info (if execution failed)
     error_message: str | None = None
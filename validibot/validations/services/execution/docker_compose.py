@@ -40,8 +40,12 @@ from django.conf import settings
 from django.utils import timezone
 from validibot_shared.canonicalization import sha256_hex_for_model
 
+from validibot.core.db_pool import released_connection
 from validibot.core.storage import get_data_storage
 from validibot.validations.services.create_only_storage import create_local_bytes
+from validibot.validations.services.envelope_stream import envelope_sha256
+from validibot.validations.services.envelope_stream import open_streamed_output_envelope
+from validibot.validations.services.envelope_stream import should_stream_envelope
 from validibot.validations.services.execution.base import ExecutionBackend
 from validibot.validations.services.execution.base import ExecutionRequest
 from validibot.validations.services.execution.base import ExecutionResponse
@@ -54,9 +58,6 @@ from validibot.validations.services.output_envelope_verifier import (
 from validibot.validations.services.output_envelope_verifier import (
     build_expected_output_envelope,
 )
-from validibot.validations.services.output_envelope_verifier import (
-    output_envelope_sha256,
-)
 from validibot.validations.services.output_envelope_verifier import (
     parse_and_verify_output_envelope,
 )
@@ -65,6 +66,7 @@ from validibot.validations.services.runners import get_validator_runner
 if TYPE_CHECKING:
     from validibot_shared.validations.envelopes import ValidationOutputEnvelope
 
+    from validibot.validations.services.envelope_stream import StreamedOutputEnvelope
     from validibot.validations.services.file_identity import FileIdentity
 
 logger = logging.getLogger(__name__)
@@ -345,16 +347,19 @@ class DockerComposeExecutionBackend(ExecutionBackend):
             # the validator row so the runner can apply tier-aware
             # hardening for partner-authored backends. Tier-1 is the
             # default for everything we ship today; Tier-2 layers
-            # tighter caps + optional gVisor runtime on top.
-            result = self.runner.run(
-                container_image=container_image,
-                input_uri=workspace.input_envelope_container_uri,
-                output_uri=workspace.output_envelope_container_uri,
-                run_id=str(request.run_id),
-                validator_slug=request.validator_type.lower(),
-                workspace=workspace,
-                trust_tier=request.validator.trust_tier,
-            )
+            # tighter caps + optional gVisor runtime on top. The container
+            # can run for an hour without touching the database, so the
+            # pooled connection goes back to the pool meanwhile.
+            with released_connection():
+                result = self.runner.run(
+                    container_image=container_image,
+                    input_uri=workspace.input_envelope_container_uri,
+                    output_uri=workspace.output_envelope_container_uri,
+                    run_id=str(request.run_id),
+                    validator_slug=request.validator_type.lower(),
+                    workspace=workspace,
+                    trust_tier=request.validator.trust_tier,
+                )
 
             # 7. Process the result.
             if not result.succeeded:
@@ -448,7 +453,7 @@ class DockerComposeExecutionBackend(ExecutionBackend):
                 ExecutionAttemptState.COMPLETED,
                 provider_finished_at=timezone.now(),
                 output_envelope_uri=workspace.output_envelope_container_uri,
-                output_envelope_sha256=output_envelope_sha256(output_envelope),
+                output_envelope_sha256=envelope_sha256(output_envelope),
                 backend_image_digest=result.validator_backend_image_digest,
             )
 
@@ -683,7 +688,7 @@ class DockerComposeExecutionBackend(ExecutionBackend):
         expected_run,
         expected_validator,
         expected_attempt,
-    ) -> ValidationOutputEnvelope | None:
+    ) -> ValidationOutputEnvelope | StreamedOutputEnvelope | None:
         """Read and parse the output envelope from a host path.
 
         The container writes ``output.json`` into its attempt output mount,
@@ -694,7 +699,9 @@ class DockerComposeExecutionBackend(ExecutionBackend):
         the host path back to a storage-relative path for no benefit.
 
         Returns ``None`` if the file is missing, too large, unparseable,
-        or mismatched against the trusted run/validator identity.
+        or mismatched against the trusted run/validator identity. Files at or
+        above ``VALIDATION_RESULT_STREAM_THRESHOLD_BYTES`` come back as a
+        ``StreamedOutputEnvelope`` whose findings are read in batches.
         """
 
         try:
@@ -703,20 +710,25 @@ class DockerComposeExecutionBackend(ExecutionBackend):
                 return None
 
             max_bytes = getattr(settings, "VALIDATION_RESULT_MAX_BYTES", None)
-            if max_bytes is not None and host_path.stat().st_size > max_bytes:
+            size_bytes = host_path.stat().st_size
+            if max_bytes is not None and size_bytes > max_bytes:
                 logger.error(
                     "Output envelope at %s exceeds VALIDATION_RESULT_MAX_BYTES",
                     host_path,
                 )
                 return None
 
-            output_data = host_path.read_bytes()
-
             expected = build_expected_output_envelope(
                 run=expected_run,
                 validator=expected_validator,
                 attempt=expected_attempt,
             )
+            if should_stream_envelope(size_bytes):
+                # Large results stay on the workspace disk; the processor
+                # persists their findings in batches.
+                return open_streamed_output_envelope(host_path, expected=expected)
+
+            output_data = host_path.read_bytes()
             output_envelope = parse_and_verify_output_envelope(
                 output_data,
                 expected=expected,
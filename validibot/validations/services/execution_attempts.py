@@ -31,6 +31,7 @@ from validibot.validations.constants import ValidatorExecutionProfile
 from validibot.validations.services.execution_logging import execution_log_context
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from datetime import datetime
 
     from validibot.validations.models import ExecutionAttempt
@@ -156,12 +157,8 @@ def resolve_callback_attempt(
     """
     from validibot.validations.models import ExecutionAttempt
 
-    if not callback_id or not callback_id.startswith(ATTEMPT_CALLBACK_PREFIX):
-        return None
-    raw_attempt_id = callback_id.removeprefix(ATTEMPT_CALLBACK_PREFIX)
-    try:
-        attempt_id = UUID(raw_attempt_id)
-    except ValueError:
+    attempt_id = _parse_attempt_callback_id(callback_id)
+    if attempt_id is None:
         return None
     return (
         ExecutionAttempt.objects.select_related("step_run__validation_run")
@@ -170,6 +167,47 @@ def resolve_callback_attempt(
     )
 
 
+def resolve_callback_attempts(
+    callbacks: Iterable[tuple[str | None, UUID | str]],
+) -> dict[str, ExecutionAttempt]:
+    """Resolve many ``(callback_id, run_id)`` pairs in a single query.
+
+    The batch counterpart of ``resolve_callback_attempt``: the same database
+    relationship back to the claimed run is enforced, so a callback id whose
+    attempt belongs to another run is simply absent from the result. The
+    step's validator is loaded too, since batch callers need its envelope
+    class before any per-callback processing starts.
+    """
+    from validibot.validations.models import ExecutionAttempt
+
+    wanted: dict[UUID, tuple[str, str]] = {}
+    for callback_id, run_id in callbacks:
+        attempt_id = _parse_attempt_callback_id(callback_id)
+        if attempt_id is not None:
+            wanted[attempt_id] = (str(callback_id), str(run_id))
+    if not wanted:
+        return {}
+    attempts = ExecutionAttempt.objects.select_related(
+        "step_run__validation_run",
+        "step_run__workflow_step__validator",
+    ).in_bulk(list(wanted))
+    resolved: dict[str, ExecutionAttempt] = {}
+    for attempt_id, (callback_id, run_id) in wanted.items():
+        attempt = attempts.get(attempt_id)
+        if attempt is not None and str(attempt.step_run.validation_run_id) == run_id:
+            resolved[callback_id] = attempt
+    return resolved
+
+
+def _parse_attempt_callback_id(callback_id: str | None) -> UUID | None:
+    if not callback_id or not callback_id.startswith(ATTEMPT_CALLBACK_PREFIX):
+        return None
+    try:
+        return UUID(callback_id.removeprefix(ATTEMPT_CALLBACK_PREFIX))
+    except ValueError:
+        return None
+
+
 def get_or_create_execution_attempt(
     step_run: ValidationStepRun,
     *,
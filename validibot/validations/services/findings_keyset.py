@@ -0,0 +1,354 @@
+"""Keyset access to a run's findings — pages, exports, and the inline cap.
+
+A tabular run can persist hundreds of thousands of findings, so nothing that
+serves findings may load "all of them". This module reads them in the order the
+run pages show them — step by step (``step_order``, then step-run id), most
+severe first within a step, then by finding id — as a sequence of
+``(step run, severity)`` groups. Each read is a bounded range scan on the
+``(validation_step_run, severity, id)`` index::
+
+    WHERE validation_step_run_id = %s AND severity = %s AND id > %s
+    ORDER BY id LIMIT n
+
+so the cost of a page, and the memory an export holds, stays flat however many
+findings the run has. Three consumers sit on top:
+
+* :func:`get_findings_page` / :class:`FindingsCursor` — the paginated findings
+  API. The cursor is an opaque token naming the last finding served.
+* :func:`iter_findings`, :func:`stream_findings_ndjson`,
+  :func:`stream_findings_csv` — streaming exports, one keyset batch at a time.
+* :func:`attach_inline_findings` — the capped per-step slice run pages and the
+  run serializer embed (``RUN_FINDINGS_INLINE_LIMIT``), with a flag telling the
+  reader there is more than what's shown.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import csv
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.conf import settings
+from django.db.models import Case
+from django.db.models import IntegerField
+from django.db.models import Prefetch
+from django.db.models import Value
+from django.db.models import When
+from django.db.models import prefetch_related_objects
+
+from validibot.validations.constants import Severity
+from validibot.validations.models import ValidationFinding
+from validibot.validations.services.findings_display import summarize_failed_rows
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from validibot.validations.models import ValidationRun
+    from validibot.validations.models import ValidationStepRun
+
+# Severity order within a step, most severe first. Matches the run pages.
+FINDING_SEVERITY_ORDER: tuple[str, ...] = (
+    Severity.ERROR,
+    Severity.WARNING,
+    Severity.INFO,
+    Severity.SUCCESS,
+)
+
+# Findings fetched per keyset query by the streaming exports. Large enough to
+# amortise the round trip, small enough that one batch is a few MB at most.
+FINDINGS_EXPORT_BATCH_SIZE = 2000
+
+FINDINGS_CSV_FIELDS = (
+    "id",
+    "step_run_id",
+    "step_order",
+    "severity",
+    "code",
+    "message",
+    "path",
+    "assertion_id",
+    "failed_row_count",
+    "failed_row_sample",
+)
+
+# Same spreadsheet formula-injection guard as the audit log export: finding
+# messages and paths echo submitted content, so a cell starting with one of
+# these is prefixed with a quote to force literal text.
+_CSV_FORMULA_TRIGGERS = ("=", "+", "-", "@", "\t", "\r")
+
+
+class InvalidFindingsCursorError(ValueError):
+    """Raised when a findings cursor token is malformed or not from this run."""
+
+
+@dataclass(frozen=True)
+class FindingsCursor:
+    """Keyset position: just after ``finding_id`` in its (step run, severity)."""
+
+    step_run_id: int
+    severity: str
+    finding_id: int
+
+    @classmethod
+    def after(cls, finding: ValidationFinding) -> FindingsCursor:
+        return cls(
+            step_run_id=finding.validation_step_run_id,
+            severity=finding.severity,
+            finding_id=finding.pk,
+        )
+
+    def encode(self) -> str:
+        raw = f"{self.step_run_id}:{self.severity}:{self.finding_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> FindingsCursor:
+        padded = token + "=" * (-len(token) % 4)
+        try:
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            step_run_id, severity, finding_id = raw.split(":")
+            return cls(
+                step_run_id=int(step_run_id),
+                severity=severity,
+                finding_id=int(finding_id),
+            )
+        except (binascii.Error, UnicodeError, ValueError) as exc:
+            raise InvalidFindingsCursorError(token) from exc
+
+
+@dataclass(frozen=True)
+class FindingsPage:
+    findings: list[ValidationFinding]
+    next_cursor: FindingsCursor | None
+    # step_run_id -> step_order for every step run of the run.
+    step_orders: dict[int, int]
+
+
+def _ordered_step_runs(run: ValidationRun) -> list[tuple[int, int]]:
+    """Return ``(step_run_id, step_order)`` pairs in display order."""
+    return list(
+        run.step_runs.order_by("step_order", "pk").values_list("pk", "step_order"),
+    )
+
+
+def _group_queryset(step_run_id: int, severity: str, after_id: int):
+    return ValidationFinding.objects.filter(
+        validation_step_run_id=step_run_id,
+        severity=severity,
+        pk__gt=after_id,
+    ).order_by("pk")
+
+
+def _groups_from(
+    step_run_ids: Iterable[int],
+    after: FindingsCursor | None,
+) -> Iterator[tuple[int, str, int]]:
+    """Yield ``(step_run_id, severity, after_id)`` for every group to read."""
+    groups = [
+        (step_run_id, severity)
+        for step_run_id in step_run_ids
+        for severity in FINDING_SEVERITY_ORDER
+    ]
+    start = 0
+    if after is not None:
+        try:
+            start = groups.index((after.step_run_id, after.severity))
+        except ValueError as exc:
+            raise InvalidFindingsCursorError(after.encode()) from exc
+    for index, (step_run_id, severity) in enumerate(groups[start:]):
+        after_id = after.finding_id if after is not None and index == 0 else 0
+        yield step_run_id, severity, after_id
+
+
+def get_findings_page(
+    run: ValidationRun,
+    *,
+    limit: int,
+    after: FindingsCursor | None = None,
+) -> FindingsPage:
+    """Return up to ``limit`` findings after ``after``, in keyset order.
+
+    Reads one row past the page to decide whether a next cursor exists, so a
+    client never receives a cursor that leads to an empty page.
+
+    Raises:
+        InvalidFindingsCursorError: ``after`` names a step run outside ``run``
+            or an unknown severity.
+    """
+    step_orders = dict(_ordered_step_runs(run))
+    wanted = limit + 1
+    findings: list[ValidationFinding] = []
+    for step_run_id, severity, after_id in _groups_from(step_orders, after):
+        findings.extend(
+            _group_queryset(step_run_id, severity, after_id)[: wanted - len(findings)],
+        )
+        if len(findings) >= wanted:
+            break
+    next_cursor = None
+    if len(findings) > limit:
+        findings = findings[:limit]
+        next_cursor = FindingsCursor.after(findings[-1])
+    return FindingsPage(
+        findings=findings,
+        next_cursor=next_cursor,
+        step_orders=step_orders,
+    )
+
+
+def iter_findings(
+    run: ValidationRun,
+    *,
+    batch_size: int = FINDINGS_EXPORT_BATCH_SIZE,
+) -> Iterator[tuple[ValidationFinding, int]]:
+    """Yield ``(finding, step_order)`` for every finding of ``run``.
+
+    Holds at most one keyset batch in memory. Each batch is its own short
+    query, so no transaction or server-side cursor stays open while a slow
+    client drains the stream.
+    """
+    for step_run_id, step_order in _ordered_step_runs(run):
+        for severity in FINDING_SEVERITY_ORDER:
+            after_id = 0
+            while True:
+                batch = list(
+                    _group_queryset(step_run_id, severity, after_id)[:batch_size],
+                )
+                for finding in batch:
+                    yield finding, step_order
+                if len(batch) < batch_size:
+                    break
+                after_id = batch[-1].pk
+
+
+def serialize_finding(finding: ValidationFinding) -> dict[str, Any]:
+    """Return the API shape of one finding (an ``issues`` entry)."""
+    return {
+        "id": finding.pk,
+        "message": finding.message,
+        "path": finding.path,
+        "severity": finding.severity,
+        "code": finding.code,
+        "assertion_id": finding.ruleset_assertion_id,
+        # Structured failing-row examples ({sample_rows, count, truncated}) for
+        # validators that aggregate a bulk failure into one finding; None
+        # otherwise.
+        "failed_rows": summarize_failed_rows(finding.meta),
+    }
+
+
+def serialize_export_finding(
+    finding: ValidationFinding,
+    *,
+    step_order: int | None,
+) -> dict[str, Any]:
+    """Return :func:`serialize_finding` plus the step the finding belongs to."""
+    return {
+        **serialize_finding(finding),
+        "step_run_id": finding.validation_step_run_id,
+        "step_order": step_order,
+    }
+
+
+def stream_findings_ndjson(run: ValidationRun) -> Iterator[str]:
+    """Yield one JSON object per finding, newline-terminated."""
+    for finding, step_order in iter_findings(run):
+        row = serialize_export_finding(finding, step_order=step_order)
+        yield json.dumps(row, default=str) + "\n"
+
+
+class _LineBuffer:
+    """``csv.writer`` target that hands back the single line just written."""
+
+    def __init__(self) -> None:
+        self._line = ""
+
+    def write(self, value: str) -> int:
+        self._line = value
+        return len(value)
+
+    def drain(self) -> str:
+        line, self._line = self._line, ""
+        return line
+
+
+def _csv_cell(value: Any) -> Any:
+    if isinstance(value, str) and value.startswith(_CSV_FORMULA_TRIGGERS):
+        return f"'{value}"
+    return value
+
+
+def stream_findings_csv(run: ValidationRun) -> Iterator[str]:
+    """Yield a CSV header, then one line per finding.
+
+    ``failed_rows`` is flattened into a total count and a space-separated
+    sample of row numbers so every cell stays scalar.
+    """
+    buffer = _LineBuffer()
+    writer = csv.DictWriter(buffer, fieldnames=FINDINGS_CSV_FIELDS)
+    writer.writeheader()
+    yield buffer.drain()
+    for finding, step_order in iter_findings(run):
+        row = serialize_export_finding(finding, step_order=step_order)
+        failed_rows = row.pop("failed_rows") or {}
+        row["failed_row_count"] = failed_rows.get("count", "")
+        row["failed_row_sample"] = " ".join(
+            str(number) for number in failed_rows.get("sample_rows", [])
+        )
+        writer.writerow({key: _csv_cell(row[key]) for key in FINDINGS_CSV_FIELDS})
+        yield buffer.drain()
+
+
+def severity_rank() -> Case:
+    """Order expression putting :data:`FINDING_SEVERITY_ORDER` first to last."""
+    return Case(
+        *[
+            When(severity=severity, then=Value(rank))
+            for rank, severity in enumerate(FINDING_SEVERITY_ORDER)
+        ],
+        default=Value(len(FINDING_SEVERITY_ORDER)),
+        output_field=IntegerField(),
+    )
+
+
+def _inline_limit(limit: int | None) -> int:
+    return settings.RUN_FINDINGS_INLINE_LIMIT if limit is None else limit
+
+
+def inline_findings_prefetch(limit: int | None = None) -> Prefetch:
+    """Prefetch each step run's first findings into ``inline_findings``.
+
+    A sliced prefetch, so a page of step runs costs one query however many
+    findings they hold. One row past ``limit`` is kept so
+    :func:`attach_inline_findings` can tell whether the slice is complete.
+    """
+    return Prefetch(
+        "findings",
+        queryset=ValidationFinding.objects.select_related(
+            "ruleset_assertion",
+        ).order_by(severity_rank(), "pk")[: _inline_limit(limit) + 1],
+        to_attr="inline_findings",
+    )
+
+
+def attach_inline_findings(
+    step_runs: list[ValidationStepRun],
+    *,
+    limit: int | None = None,
+) -> None:
+    """Set ``display_findings`` and ``findings_truncated`` on each step run.
+
+    Uses ``inline_findings`` when the caller already prefetched it with
+    :func:`inline_findings_prefetch`, and prefetches it otherwise.
+    """
+    limit = _inline_limit(limit)
+    pending = [sr for sr in step_runs if not hasattr(sr, "inline_findings")]
+    if pending:
+        prefetch_related_objects(pending, inline_findings_prefetch(limit))
+    for step_run in step_runs:
+        step_run.display_findings = step_run.inline_findings[:limit]
+        step_run.findings_truncated = len(step_run.inline_findings) > limit
@@ -18,10 +18,13 @@ the orchestrator decides *when* to persist findings, this module handles *how*.
 from __future__ import annotations
 
 import logging
+import time
 from collections import Counter
 from typing import TYPE_CHECKING
 from typing import Any
 
+from validibot.core import metrics
+from validibot.core import spans
 from validibot.validations.constants import Severity
 from validibot.validations.models import ValidationFinding
 from validibot.validations.validators.base import ValidationIssue
@@ -32,6 +35,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+FINDINGS_PERSISTED = metrics.counter(
+    "validibot_findings_persisted_total",
+    "Validation findings written to the database, by severity.",
+    labelnames=("severity",),
+)
+FINDINGS_PERSIST_SECONDS = metrics.histogram(
+    "validibot_findings_persist_seconds",
+    "Wall-clock time to normalise and bulk-insert one step's findings.",
+)
+
 
 def normalize_issue(issue: Any) -> ValidationIssue:
     """Ensure every issue is a ValidationIssue dataclass."""
@@ -77,6 +90,7 @@ def severity_value(value: Severity | str | None) -> str:
     return Severity.ERROR
 
 
+@spans.traced("persistence")
 def persist_findings(
     *,
     validation_run: ValidationRun,
@@ -102,6 +116,7 @@ def persist_findings(
     Returns:
         Tuple of (severity_counts Counter, assertion_failure_count int).
     """
+    started = time.monotonic()
     severity_counts: Counter = Counter()
     assertion_failures = 0
     findings: list[ValidationFinding] = []
@@ -132,4 +147,7 @@ def persist_findings(
         findings.append(finding)
     if findings:
         ValidationFinding.objects.bulk_create(findings, batch_size=500)
+    FINDINGS_PERSIST_SECONDS.observe(time.monotonic() - started)
+    for sev_value, count in severity_counts.items():
+        FINDINGS_PERSISTED.labels(severity=sev_value).inc(count)
     return severity_counts, assertion_failures
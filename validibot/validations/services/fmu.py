@@ -13,6 +13,7 @@ from defusedxml import ElementTree as ET  # noqa: N817
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.db import transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from slugify import slugify
 from validibot_shared.fmu import FMUProbeResult as FMUProbeResultSchema
@@ -537,8 +538,10 @@ def _fmu_model_port_step_io_defaults() -> dict[str, Any]:
     }
 
 
-def _seed_parser_fact_io_definitions(validator: Validator) -> None:
-    """Seed parser-fact and file-port rows on a user-created FMU validator.
+def _seed_parser_fact_io_definitions(
+    desired: dict[tuple[str, str], dict[str, Any]],
+) -> None:
+    """Seed parser-fact and file-port rows for a user-created FMU validator.
 
     These rows declare the ``fmu_model`` artifact input port and
     INPUT-direction parser facts (one per spec in ``PARSER_FACT_SPECS``) so
@@ -550,31 +553,21 @@ def _seed_parser_fact_io_definitions(validator: Validator) -> None:
     the same FMU — a footgun for workflow authors who organise reusable
     assertion logic.
 
-    Identity-stable: keyed by ``(validator, contract_key, direction)``
-    via ``update_or_create``. Probe refreshes
-    (``_refresh_variables_from_probe``) reuse the same rows rather
-    than recreating them, preserving downstream FK relationships
-    (StepInputBinding, WorkflowStepIOPromotion) that cascade rules
-    would otherwise nuke on every re-probe.
-
-    Collision tracking lives in the caller's ``survivors`` set, not
-    here — this helper is concerned only with the parser-fact rows
-    themselves, and the caller separately records the
-    (contract_key, INPUT) tuples it claimed.
+    The rows are added to the caller's ``desired`` map, keyed by
+    ``(contract_key, direction)``, and written by
+    ``_reconcile_step_io_definitions`` together with the variable rows.
+    Identity-stable: probe refreshes (``_refresh_variables_from_probe``)
+    update the same rows rather than recreating them, preserving
+    downstream FK relationships (StepInputBinding,
+    WorkflowStepIOPromotion) that cascade rules would otherwise nuke on
+    every re-probe.
     """
-    StepIODefinition.objects.update_or_create(
-        validator=validator,
-        contract_key=FMU_MODEL_PORT_KEY,
-        direction=StepIODirection.INPUT,
-        defaults=_fmu_model_port_step_io_defaults(),
+    desired[(FMU_MODEL_PORT_KEY, StepIODirection.INPUT)] = (
+        _fmu_model_port_step_io_defaults()
     )
-
     for spec in PARSER_FACT_SPECS:
-        StepIODefinition.objects.update_or_create(
-            validator=validator,
-            contract_key=spec.contract_key,
-            direction=StepIODirection.INPUT,
-            defaults=_parser_fact_step_io_defaults(spec),
+        desired[(spec.contract_key, StepIODirection.INPUT)] = (
+            _parser_fact_step_io_defaults(spec)
         )
 
 
@@ -725,12 +718,19 @@ def _persist_variables(
     """Persist FMUVariable rows and reconcile step I/O definitions.
 
     Identity-stable: ``StepIODefinition`` rows are reconciled by
-    ``(validator, contract_key, direction)`` via ``update_or_create``.
-    Existing rows for variables that survive re-upload keep their
-    primary key, so downstream FKs — ``StepInputBinding``,
-    ``WorkflowStepIOPromotion``, ``RulesetAssertion`` — keep
-    pointing at the same row instead of getting nuked by a
-    delete-then-recreate cycle.
+    ``(validator, contract_key, direction)``. Existing rows for
+    variables that survive re-upload keep their primary key, so
+    downstream FKs — ``StepInputBinding``, ``WorkflowStepIOPromotion``,
+    ``RulesetAssertion`` — keep pointing at the same row instead of
+    getting nuked by a delete-then-recreate cycle.
+
+    The reconcile is a diff, not a per-variable ``update_or_create``:
+    the existing rows are read in one query and compared with the
+    desired set, then new rows go through ``bulk_create``, changed rows
+    through ``bulk_update`` and orphans through one DELETE. The same
+    diff applies to the ``FMUVariable`` rows themselves. A co-simulation
+    FMU with tens of thousands of variables costs a handful of round
+    trips instead of one or two per variable.
 
     Orphans (rows whose contract_key didn't appear in this call) are
     deleted at the end — that's the only path that cascades.
@@ -739,44 +739,33 @@ def _persist_variables(
     for var in variables:
         var.fmu_model = fmu_model
         prepared.append(var)
-    FMUVariable.objects.bulk_create(prepared)
 
-    # ``survivors`` tracks every (contract_key, direction) tuple we
-    # touched in THIS call — both parser facts and FMU variables.
-    # Two distinct uses:
+    # ``desired`` maps every (contract_key, direction) tuple this call
+    # claims — parser facts and FMU variables — to the field values its
+    # row should carry. Two distinct uses:
     #   1. In-batch collision detection. When two variables slugify to
     #      the same key with the same direction (e.g., ``T_outdoor`` and
     #      ``t_outdoor`` both → ``t_outdoor`` INPUT), the second gets a
-    #      ``-2`` suffix. Cross-direction (``T`` INPUT + ``T`` OUTPUT) is
+    #      ``_2`` suffix. Cross-direction (``T`` INPUT + ``T`` OUTPUT) is
     #      allowed by the model's (workflow_step|validator, contract_key,
     #      direction) uniqueness, so we don't suffix across directions.
     #   2. Orphan-detection at the end. Rows already in the DB whose
-    #      tuple isn't in survivors correspond to variables that have
+    #      tuple isn't in ``desired`` correspond to variables that have
     #      disappeared and get deleted.
     #
     # CRITICAL: we do NOT check pre-existing DB keys for collisions
-    # here. ``update_or_create`` reuses the existing row when
-    # (validator, contract_key, direction) match — that's how we get
-    # identity stability across re-probes. The May 2026 review's P1
-    # finding caught that the prior check against DB keys defeated this:
-    # a re-probe of T_outdoor would suffix to T_outdoor-2, leaving the
-    # original as an orphan to be deleted, cascading any StepInputBinding,
-    # WorkflowStepIOPromotion, or RulesetAssertion FKs on every probe.
-    survivors: set[tuple[str, str]] = set()
-
-    # Seed parser-fact StepIODefinition rows on this user-created FMU
-    # validator so ``i.fmi_version`` / ``i.input_variable_count`` /
-    # etc. resolve consistently whether the workflow author picked the
-    # system FMU validator (whose catalog entries come from config.py
-    # via sync_validators) or a user-created FMU validator (which is
-    # seeded here, per FMU upload). Without this branch, the same
-    # input-stage CEL assertion would pass on one validator and silently
-    # resolve to null on another.
-    _seed_parser_fact_io_definitions(validator)
-    survivors.add((FMU_MODEL_PORT_KEY, StepIODirection.INPUT))
-    survivors.update(
-        (spec.contract_key, StepIODirection.INPUT) for spec in PARSER_FACT_SPECS
-    )
+    # here. An existing row whose (contract_key, direction) matches is
+    # updated in place — that's how we get identity stability across
+    # re-probes. The May 2026 review's P1 finding caught that the prior
+    # check against DB keys defeated this: a re-probe of T_outdoor would
+    # suffix to T_outdoor-2, leaving the original as an orphan to be
+    # deleted, cascading any StepInputBinding, WorkflowStepIOPromotion,
+    # or RulesetAssertion FKs on every probe.
+    #
+    # The parser-fact rows are claimed first, so a variable that slugifies
+    # onto one of their keys is the one that gets suffixed.
+    desired: dict[tuple[str, str], dict[str, Any]] = {}
+    _seed_parser_fact_io_definitions(desired)
 
     for var in prepared:
         direction = _direction_for_causality(var.causality)
@@ -787,66 +776,180 @@ def _persist_variables(
         counter = 2
         # Only suffix when THIS (key, direction) has already been
         # claimed in this batch — never against pre-existing DB rows.
-        # Letting update_or_create reuse existing rows naturally is
-        # what keeps StepIODefinition.pk stable across re-probes.
+        # Letting the diff reuse existing rows naturally is what keeps
+        # StepIODefinition.pk stable across re-probes.
         #
         # Underscore separator matches ``services.fmu_step_io``'s
         # step-level path so CEL identifier-safe contract_keys stay
         # the convention across both seeding paths. Hyphenated keys
         # would force authors into bracket-access (``i["t_outdoor-2"]``)
         # instead of dot-access (``i.t_outdoor_2``).
-        while (key, direction) in survivors:
+        while (key, direction) in desired:
             key = f"{base_key}_{counter}"
             counter += 1
-        survivors.add((key, direction))
-        StepIODefinition.objects.update_or_create(
-            validator=validator,
-            contract_key=key,
-            direction=direction,
-            defaults={
-                "native_name": var.name,
-                "origin_kind": StepIOOriginKind.FMU,
-                "source_kind": (
-                    StepIOSourceKind.PAYLOAD_PATH
-                    if direction == StepIODirection.INPUT
-                    else StepIOSourceKind.INTERNAL
-                ),
-                "is_path_editable": direction == StepIODirection.INPUT,
-                "data_type": _data_type_for_variable(var.value_type),
-                "provider_binding": FMUProviderBinding(
-                    causality=var.causality,
-                ).model_dump(),
-                "metadata": FMUStepIOMetadata(
-                    variability=var.variability,
-                    value_reference=var.value_reference,
-                    value_type=var.value_type,
-                ).model_dump(),
-            },
+        desired[(key, direction)] = _fmu_variable_step_io_defaults(var, direction)
+
+    with transaction.atomic():
+        # Serialise concurrent persists for the same validator (an upload
+        # racing a re-probe): both would otherwise diff against the same
+        # snapshot and collide on the unique constraint when inserting.
+        Validator.objects.select_for_update().only("pk").get(pk=validator.pk)
+        _reconcile_fmu_variables(fmu_model, prepared)
+        _reconcile_step_io_definitions(validator, desired)
+
+
+# Rows per statement for the bulk writes above. ``bulk_update`` renders one
+# CASE per field per row, so unbounded batches of tens of thousands of rows
+# would build multi-megabyte statements.
+_BULK_BATCH_SIZE = 1000
+
+
+_FMU_VARIABLE_FIELDS = (
+    "causality",
+    "variability",
+    "value_reference",
+    "value_type",
+    "unit",
+)
+
+
+def _reconcile_fmu_variables(
+    fmu_model: FMUModel,
+    variables: list[FMUVariable],
+) -> None:
+    """Make ``fmu_model``'s FMUVariable rows match ``variables`` in bulk.
+
+    Rows are matched by name. FMI requires names to be unique, but a
+    malformed modelDescription.xml may repeat one, so repeats are
+    matched pairwise in order and every introspected variable still
+    ends up as exactly one row.
+    """
+    existing: dict[str, list[FMUVariable]] = {}
+    for row in fmu_model.variables.order_by("pk"):
+        existing.setdefault(row.name, []).append(row)
+    now = timezone.now()
+    to_create: list[FMUVariable] = []
+    to_update: list[FMUVariable] = []
+    for var in variables:
+        matches = existing.get(var.name)
+        if not matches:
+            to_create.append(var)
+            continue
+        row = matches.pop(0)
+        if all(
+            getattr(row, name) == getattr(var, name) for name in _FMU_VARIABLE_FIELDS
+        ):
+            continue
+        for name in _FMU_VARIABLE_FIELDS:
+            setattr(row, name, getattr(var, name))
+        row.modified = now
+        to_update.append(row)
+
+    orphan_ids = [row.pk for rows in existing.values() for row in rows]
+    if orphan_ids:
+        fmu_model.variables.filter(pk__in=orphan_ids).delete()
+    if to_update:
+        FMUVariable.objects.bulk_update(
+            to_update,
+            [*_FMU_VARIABLE_FIELDS, "modified"],
+            batch_size=_BULK_BATCH_SIZE,
         )
+    if to_create:
+        FMUVariable.objects.bulk_create(to_create, batch_size=_BULK_BATCH_SIZE)
+
 
-    # ── Orphan cleanup ───────────────────────────────────────────
-    # Delete StepIODefinition rows whose (contract_key, direction)
-    # tuple didn't appear in this call — they correspond to variables
-    # (or legacy parser facts) that no longer exist in this FMU.
+def _fmu_variable_step_io_defaults(
+    var: FMUVariable,
+    direction: str,
+) -> dict[str, Any]:
+    """Return StepIODefinition field values for one FMU model variable."""
+
+    return {
+        "native_name": var.name,
+        "origin_kind": StepIOOriginKind.FMU,
+        "source_kind": (
+            StepIOSourceKind.PAYLOAD_PATH
+            if direction == StepIODirection.INPUT
+            else StepIOSourceKind.INTERNAL
+        ),
+        "is_path_editable": direction == StepIODirection.INPUT,
+        "data_type": _data_type_for_variable(var.value_type),
+        "provider_binding": FMUProviderBinding(
+            causality=var.causality,
+        ).model_dump(),
+        "metadata": FMUStepIOMetadata(
+            variability=var.variability,
+            value_reference=var.value_reference,
+            value_type=var.value_type,
+        ).model_dump(),
+    }
+
+
+def _reconcile_step_io_definitions(
+    validator: Validator,
+    desired: dict[tuple[str, str], dict[str, Any]],
+) -> None:
+    """Make the validator's step I/O rows match ``desired`` in bulk.
+
+    Same semantics as an ``update_or_create`` per key followed by an
+    orphan delete: a missing row is created with the given values (and
+    model defaults for everything else), an existing row has only the
+    given fields overwritten, and rows not in ``desired`` are deleted.
+    Rows whose values already match are left alone.
+
+    Composite (contract_key, direction) membership matters: the same
+    contract_key can legitimately appear in both INPUT and OUTPUT
+    directions, so keying by contract_key alone would either
+    over-delete (drop a valid surviving direction) or under-delete
+    (miss a row whose key matches but direction doesn't).
+    """
+    existing = {
+        (row.contract_key, row.direction): row
+        for row in validator.step_io_definitions.all()
+    }
+    now = timezone.now()
+    to_create: list[StepIODefinition] = []
+    to_update: list[StepIODefinition] = []
+    update_fields: set[str] = set()
+    for (key, direction), values in desired.items():
+        row = existing.pop((key, direction), None)
+        if row is None:
+            to_create.append(
+                StepIODefinition(
+                    validator=validator,
+                    contract_key=key,
+                    direction=direction,
+                    **values,
+                ),
+            )
+            continue
+        changed = [
+            name for name, value in values.items() if getattr(row, name) != value
+        ]
+        if not changed:
+            continue
+        for name in changed:
+            setattr(row, name, values[name])
+        row.modified = now
+        update_fields.update(changed)
+        to_update.append(row)
+
+    # Whatever is left in ``existing`` was not claimed by this call.
     # Identity for surviving rows is preserved (they were updated in
-    # place via ``update_or_create``), so downstream FKs to
-    # StepInputBinding / WorkflowStepIOPromotion / RulesetAssertion
-    # stay intact.
-    #
-    # Composite (contract_key, direction) membership matters: the same
-    # contract_key can legitimately appear in both INPUT and OUTPUT
-    # directions, so filtering by contract_key alone would either
-    # over-delete (drop a valid surviving direction) or under-delete
-    # (miss a row whose key matches but direction doesn't). The
-    # explicit Python walk handles the tuple check; the queryset is
-    # tiny (one validator) so the O(n) scan is fine.
-    orphan_ids = [
-        io_definition.pk
-        for io_definition in validator.step_io_definitions.all()
-        if (io_definition.contract_key, io_definition.direction) not in survivors
-    ]
-    if orphan_ids:
-        validator.step_io_definitions.filter(pk__in=orphan_ids).delete()
+    # place), so downstream FKs to StepInputBinding /
+    # WorkflowStepIOPromotion / RulesetAssertion stay intact.
+    if existing:
+        validator.step_io_definitions.filter(
+            pk__in=[row.pk for row in existing.values()],
+        ).delete()
+    if to_update:
+        StepIODefinition.objects.bulk_update(
+            to_update,
+            [*sorted(update_fields), "modified"],
+            batch_size=_BULK_BATCH_SIZE,
+        )
+    if to_create:
+        StepIODefinition.objects.bulk_create(to_create, batch_size=_BULK_BATCH_SIZE)
 
 
 def _read_fmu_bytes(fmu_model: FMUModel) -> bytes:
@@ -996,8 +1099,10 @@ def _refresh_variables_from_probe(
     Drops the legacy delete-then-recreate cycle (May 2026 review's
     P1/P2 finding). Instead:
 
-    1. ``FMUVariable`` rows are deleted (they're identity-less —
-       authors don't FK into them) and rebuilt — cheap and harmless.
+    1. ``FMUVariable`` rows are diffed against the probe output by
+       name: changed rows are updated, new ones created and vanished
+       ones deleted. They're identity-less (authors don't FK into
+       them), so this is about round trips, not identity.
     2. ``StepIODefinition`` rows are reconciled in-place by
        ``_persist_variables``' identity-stable upsert. Surviving
        (validator, contract_key, direction) tuples keep their PK so
@@ -1012,9 +1117,6 @@ def _refresh_variables_from_probe(
     validator = fmu_model.validators.first()
     if validator is None:
         return
-    # FMUVariable rows have no FK from author-facing models, so the
-    # delete-and-rebuild is safe here (unlike StepIODefinition).
-    FMUVariable.objects.filter(fmu_model=fmu_model).delete()
     shaped_vars = [
         FMUVariable(
             fmu_model=fmu_model,
@@ -19,6 +19,8 @@ from typing import Protocol
 
 from django.core.exceptions import ImproperlyConfigured
 
+from validibot.core import spans
+
 if TYPE_CHECKING:
     from validibot.validations.models import ValidationRun
 
@@ -178,6 +180,7 @@ def stamp_output_hash(run: ValidationRun) -> str:
     return digest
 
 
+@spans.traced("output_hash")
 def safe_stamp_output_hash(run: ValidationRun) -> None:
     """Stamp the output hash, logging but never raising on failure.
 
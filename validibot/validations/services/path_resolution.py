@@ -20,6 +20,10 @@ notation for array indexing:
 Negative indices are rejected (return not-found). Wildcards, filters,
 and slice notation are not supported.
 
+Each distinct path string is parsed once per process into a
+``CompiledPath`` (see ``compile_path()``); ``resolve_paths()`` resolves a
+batch of paths against one payload, walking shared prefixes once.
+
 See Also:
     - ``validibot/validations/tests/test_resolve_path.py`` — 60+ tests
 """
@@ -28,10 +32,13 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from validibot.validations.models import ResolvedInputTrace
     from validibot.validations.models import StepInputBinding
     from validibot.validations.models import StepIODefinition
@@ -85,51 +92,78 @@ def _split_path_tokens(path: str) -> list[str]:
     return tokens
 
 
-def resolve_path(data: Any, path: str | None) -> tuple[Any, bool]:
-    """Resolve a dotted/bracket path against a nested data structure.
+# Distinct paths kept compiled. Paths come from authored assertions, signal
+# mappings and bindings, so the working set is small; the bound keeps a
+# stream of one-off paths (message-template keys, say) from growing it.
+COMPILED_PATH_CACHE_SIZE = 4096
 
-    Traverses dicts by key and lists/tuples by integer index, following
-    the path expression from left to right. Returns the resolved value
-    and a boolean indicating whether the path was found.
+# A quoted bracket key needs at least the two surrounding quote chars.
+_MIN_QUOTED_LEN = 2
 
-    Args:
-        data: The root data structure to traverse. Can be a dict, list,
-            or any value (non-traversable types return not-found for
-            any non-empty path).
-        path: Dot-separated path with optional bracket indices.
-            Examples: ``"building.floor_area"``, ``"items[0].name"``,
-            ``"floors[0].zones[1].id"``, ``"[0].id"`` (root is list).
-            When ``None`` or empty, returns ``(data, True)``.
 
-    Returns:
-        A tuple of ``(resolved_value, was_found)``:
-        - ``(value, True)`` when the path resolves successfully.
-        - ``(None, False)`` when any segment is missing, out of bounds,
-          or the wrong type.
+@dataclass(frozen=True, slots=True)
+class CompiledPath:
+    """A path parsed once into the accessors that walk it.
 
-    Examples:
-        >>> resolve_path({"a": {"b": 42}}, "a.b")
-        (42, True)
-        >>> resolve_path({"items": [{"id": 1}]}, "items[0].id")
-        (1, True)
-        >>> resolve_path({"a": 1}, "a.b.c")
-        (None, False)
-        >>> resolve_path({"a": 1}, None)
-        ({"a": 1}, True)
+    ``steps`` holds one ``(is_index, key)`` pair per hop: a dict-key lookup
+    (``key`` is a ``str``, from a plain token or a quoted bracket) or a
+    list/tuple index (``key`` is an ``int``). Two flags cover paths that
+    are not a plain accessor chain:
+
+    - ``never_found`` — the path has an unquoted, non-integer bracket
+      (``items[x]``), which never resolves.
+    - ``jsonpath`` — the path has a filter (``[?``), resolved by the
+      restricted JSONPath environment instead.
+
+    Instances are shared through :func:`compile_path`'s cache and are
+    immutable.
     """
-    if not path:
-        return data, True
 
-    # Delegate filter expressions to the restricted JSONPath environment.
-    if "[?" in str(path):
-        from validibot.validations.services._jsonpath_env import resolve_jsonpath
+    path: str
+    steps: tuple[tuple[bool, str | int], ...] = ()
+    never_found: bool = False
+    jsonpath: bool = False
+
+    def resolve(self, data: Any) -> tuple[Any, bool]:
+        """Walk ``data`` along this path; same contract as :func:`resolve_path`."""
+        if self.jsonpath:
+            from validibot.validations.services._jsonpath_env import resolve_jsonpath
+
+            return resolve_jsonpath(data, self.path)
+        if self.never_found:
+            return None, False
 
-        return resolve_jsonpath(data, str(path))
+        current = data
+        for is_index, key in self.steps:
+            found, current = _step(current, is_index=is_index, key=key)
+            if not found:
+                return None, False
+        return current, True
 
-    current = data
-    tokens = _split_path_tokens(str(path))
 
-    for token in tokens:
+def _step(current: Any, *, is_index: bool, key: str | int) -> tuple[bool, Any]:
+    """Take one hop from ``current``; returns ``(found, value)``."""
+    if is_index:
+        if isinstance(current, (list, tuple)) and 0 <= key < len(current):
+            return True, current[key]
+    elif isinstance(current, dict) and key in current:
+        return True, current[key]
+    return False, None
+
+
+@lru_cache(maxsize=COMPILED_PATH_CACHE_SIZE)
+def compile_path(path: str) -> CompiledPath:
+    """Parse ``path`` into a :class:`CompiledPath`, once per distinct string.
+
+    The parse mirrors the token rules :func:`resolve_path` has always
+    applied, so a compiled path resolves exactly as the string did.
+    """
+    # Delegate filter expressions to the restricted JSONPath environment.
+    if "[?" in path:
+        return CompiledPath(path, jsonpath=True)
+
+    steps: list[tuple[bool, str | int]] = []
+    for token in _split_path_tokens(path):
         if not token:
             continue
 
@@ -141,18 +175,11 @@ def resolve_path(data: Any, path: str | None) -> tuple[Any, bool]:
             # "[0][1]" → key="", brackets="[0][1]"
             first_bracket = token.index("[")
             key = token[:first_bracket]
-            brackets = token[first_bracket:]
-
-            # Navigate dict key first (if present)
             if key:
-                if isinstance(current, dict) and key in current:
-                    current = current[key]
-                else:
-                    return None, False
+                steps.append((False, key))
 
-            # Apply each bracket segment in sequence.
             # "[0][1]" → ["0", "1"]; '["a-b"]' → ['"a-b"'] after splitting.
-            for segment in brackets.split("["):
+            for segment in token[first_bracket:].split("["):
                 if not segment:
                     continue
                 index_str = segment.rstrip("]")
@@ -163,36 +190,157 @@ def resolve_path(data: Any, path: str | None) -> tuple[Any, bool]:
                 # ``m["key"]`` so basic assertions address the same keys as CEL
                 # (ADR-2026-06-03b). A non-integer bracket that is NOT quoted is
                 # still rejected below by int(), preserving prior behaviour.
-                # A quoted key needs at least the two surrounding quote chars.
-                min_quoted_len = 2
                 if (
-                    len(index_str) >= min_quoted_len
+                    len(index_str) >= _MIN_QUOTED_LEN
                     and index_str[0] in "\"'"
                     and index_str[-1] == index_str[0]
                 ):
-                    dict_key = index_str[1:-1]
-                    if isinstance(current, dict) and dict_key in current:
-                        current = current[dict_key]
-                        continue
-                    return None, False
+                    steps.append((False, index_str[1:-1]))
+                    continue
 
                 try:
-                    position = int(index_str)
+                    steps.append((True, int(index_str)))
                 except ValueError:
-                    return None, False
-
-                if isinstance(current, (list, tuple)) and 0 <= position < len(current):
-                    current = current[position]
-                else:
-                    return None, False
+                    # Whatever precedes it, the walk ends not-found here.
+                    return CompiledPath(path, never_found=True)
 
         # Plain dict key traversal
-        elif isinstance(current, dict) and token in current:
-            current = current[token]
         else:
-            return None, False
+            steps.append((False, token))
+
+    return CompiledPath(path, tuple(steps))
+
 
-    return current, True
+def resolve_path(data: Any, path: str | None) -> tuple[Any, bool]:
+    """Resolve a dotted/bracket path against a nested data structure.
+
+    Traverses dicts by key and lists/tuples by integer index, following
+    the path expression from left to right. Returns the resolved value
+    and a boolean indicating whether the path was found. The path is
+    parsed once per process (see :func:`compile_path`), so repeated
+    assertions and mappings over the same path only pay for the walk.
+
+    Args:
+        data: The root data structure to traverse. Can be a dict, list,
+            or any value (non-traversable types return not-found for
+            any non-empty path).
+        path: Dot-separated path with optional bracket indices.
+            Examples: ``"building.floor_area"``, ``"items[0].name"``,
+            ``"floors[0].zones[1].id"``, ``"[0].id"`` (root is list).
+            When ``None`` or empty, returns ``(data, True)``.
+
+    Returns:
+        A tuple of ``(resolved_value, was_found)``:
+        - ``(value, True)`` when the path resolves successfully.
+        - ``(None, False)`` when any segment is missing, out of bounds,
+          or the wrong type.
+
+    Examples:
+        >>> resolve_path({"a": {"b": 42}}, "a.b")
+        (42, True)
+        >>> resolve_path({"items": [{"id": 1}]}, "items[0].id")
+        (1, True)
+        >>> resolve_path({"a": 1}, "a.b.c")
+        (None, False)
+        >>> resolve_path({"a": 1}, None)
+        ({"a": 1}, True)
+    """
+    if not path:
+        return data, True
+    return compile_path(str(path)).resolve(data)
+
+
+# Distinct path batches kept compiled. A batch is one workflow's signal
+# mappings or one validator's declared outputs, so far fewer recur than
+# single paths do.
+COMPILED_PATH_SET_CACHE_SIZE = 256
+
+_NOT_FOUND = (None, False)
+
+
+class _PrefixNode:
+    """One shared prefix in a :class:`CompiledPathSet`."""
+
+    __slots__ = ("children", "paths")
+
+    def __init__(self) -> None:
+        self.children: dict[tuple[bool, str | int], _PrefixNode] = {}
+        self.paths: list[Any] = []
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledPathSet:
+    """A batch of paths merged into a prefix tree of their accessors.
+
+    ``order`` is the distinct paths in the order given. Paths that are not a
+    plain accessor chain (empty, filters, never-found) sit in ``direct`` and
+    resolve on their own; the rest end at a node under ``root``.
+    """
+
+    order: tuple[Any, ...]
+    root: _PrefixNode
+    direct: tuple[tuple[Any, CompiledPath | None], ...]
+
+    def resolve(self, data: Any) -> dict[Any, tuple[Any, bool]]:
+        """Resolve every path against ``data``; see :func:`resolve_paths`."""
+        # Every path starts not-found; the walk only visits prefixes that
+        # exist, so a missing prefix settles everything beneath it for free.
+        results = dict.fromkeys(self.order, _NOT_FOUND)
+        for path, compiled in self.direct:
+            results[path] = (data, True) if compiled is None else compiled.resolve(data)
+
+        # Iterative, so path depth is not bounded by the recursion limit.
+        stack: list[tuple[_PrefixNode, Any]] = [(self.root, data)]
+        while stack:
+            node, value = stack.pop()
+            for path in node.paths:
+                results[path] = (value, True)
+            for (is_index, key), child in node.children.items():
+                found, child_value = _step(value, is_index=is_index, key=key)
+                if found:
+                    stack.append((child, child_value))
+        return results
+
+
+@lru_cache(maxsize=COMPILED_PATH_SET_CACHE_SIZE)
+def compile_paths(paths: tuple[str | None, ...]) -> CompiledPathSet:
+    """Merge ``paths`` into a :class:`CompiledPathSet`, once per distinct batch."""
+    order = tuple(dict.fromkeys(paths))
+    root = _PrefixNode()
+    direct: list[tuple[Any, CompiledPath | None]] = []
+    for path in order:
+        if not path:
+            direct.append((path, None))
+            continue
+        compiled = compile_path(str(path))
+        if compiled.jsonpath or compiled.never_found:
+            direct.append((path, compiled))
+            continue
+        node = root
+        for step in compiled.steps:
+            child = node.children.get(step)
+            if child is None:
+                child = node.children[step] = _PrefixNode()
+            node = child
+        node.paths.append(path)
+    return CompiledPathSet(order, root, tuple(direct))
+
+
+def resolve_paths(
+    data: Any,
+    paths: Iterable[str | None],
+) -> dict[Any, tuple[Any, bool]]:
+    """Resolve many paths against one payload, walking shared prefixes once.
+
+    Returns ``{path: (value, found)}``, in the order given, with exactly
+    what :func:`resolve_path` would return for each path. The compiled
+    paths are merged into a prefix tree (cached per batch, see
+    :func:`compile_paths`), so ``building.floors[0].zones[1].area`` and
+    ``building.floors[0].zones[1].volume`` descend ``building.floors[0]``
+    ``.zones[1]`` a single time, and a missing prefix settles every path
+    beneath it without walking them.
+    """
+    return compile_paths(tuple(paths)).resolve(data)
 
 
 # ── Step input resolution engine ─────────────────────────────────────
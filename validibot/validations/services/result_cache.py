@@ -0,0 +1,393 @@
+"""Opt-in memoization of validation run results.
+
+CI pipelines and scheduled jobs often re-validate an untouched file against an
+unchanged workflow, re-executing every validator for an answer that cannot
+differ. A workflow with ``result_cache_enabled`` instead answers such a launch
+by cloning the findings, summaries, step records and output hash of an earlier
+completed run into the new run, which records that source in ``cached_from``.
+
+The cache key (:func:`compute_result_cache_key`) is a SHA-256 over everything
+that determines a run's result:
+
+* the submission: content checksum, file type, metadata and any artifact-port
+  files;
+* the workflow: its definition hash (``compute_workflow_definition_hash``)
+  and input schema;
+* each validation step's validator: slug, version and semantic digest;
+* each step's effective ruleset: its type, metadata and a digest of its rules
+  (``rules_text``, or the bytes of ``rules_file``), since schemas are edited
+  in place and the definition hash covers only their assertions;
+* each step resource: its role and content hash.
+
+Invalidation is therefore exact: changing any one of these produces a new key,
+and a run is only reused under the key it was executed with. Lookups are
+scoped to the launching organization and workflow, and only a run that
+completed normally (succeeded, or failed validation) with its detailed outputs
+still retained can serve as a source. Workflows with action steps are never
+cached, since serving from cache would skip the actions' side effects.
+
+Artifacts and execution attempts are not cloned; a cache hit has no execution
+of its own.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from validibot_shared.canonicalization import sha256_hex_for_dict
+
+from validibot.validations.constants import ValidationRunErrorCategory
+from validibot.validations.constants import ValidationRunStatus
+
+if TYPE_CHECKING:
+    from validibot.submissions.models import Submission
+    from validibot.validations.models import Ruleset
+    from validibot.validations.models import ValidationRun
+    from validibot.workflows.models import Workflow
+    from validibot.workflows.models import WorkflowStep
+
+logger = logging.getLogger(__name__)
+
+RULES_FILE_CHUNK_SIZE = 1024 * 1024
+
+# Runs whose outcome depends only on the key. Timeouts, crashes and
+# cancellations say nothing about the content and are never reused.
+_CACHEABLE_OUTCOMES = Q(status=ValidationRunStatus.SUCCEEDED) | Q(
+    status=ValidationRunStatus.FAILED,
+    error_category=ValidationRunErrorCategory.VALIDATION_FAILED,
+)
+
+# Summary extras that describe how the source run executed rather than what
+# it found. A clone did none of that work, so they are not copied.
+_PER_EXECUTION_EXTRAS = frozenset({"profile"})
+
+
+def build_workflow_cache_components(workflow: Workflow) -> dict[str, Any] | None:
+    """Return the workflow half of the cache key, or ``None`` if uncacheable.
+
+    Computed once per launch batch; every submission in the batch shares it.
+    """
+
+    from validibot.workflows.models import WorkflowStepResource
+    from validibot.workflows.services.contract_snapshot import (
+        compute_workflow_definition_hash,
+    )
+
+    if not workflow.result_cache_enabled:
+        return None
+    steps = list(
+        workflow.steps.select_related(
+            "validator__default_ruleset",
+            "ruleset",
+        ).order_by("order", "pk"),
+    )
+    if not steps or any(step.action_id for step in steps):
+        return None
+
+    resources = (
+        WorkflowStepResource.objects.filter(step__workflow=workflow)
+        .select_related("validator_resource_file")
+        .order_by("step_id", "role", "pk")
+    )
+    resources_by_step: dict[int, list[dict[str, str]]] = {}
+    for resource in resources:
+        content_hash = (
+            resource.validator_resource_file.content_hash
+            if resource.validator_resource_file_id
+            else resource.content_hash
+        )
+        resources_by_step.setdefault(resource.step_id, []).append(
+            {"role": resource.role, "content_hash": content_hash},
+        )
+
+    return {
+        "definition_hash": compute_workflow_definition_hash(workflow),
+        "input_schema": workflow.input_schema or {},
+        "steps": [
+            {
+                "step_key": step.step_key or "",
+                "validator_slug": step.validator.slug if step.validator else "",
+                "validator_version": step.validator.version if step.validator else 0,
+                "validator_semantic_digest": (
+                    step.validator.semantic_digest if step.validator else ""
+                ),
+                "ruleset": _ruleset_components(_effective_ruleset(step)),
+                "resources": resources_by_step.get(step.pk, []),
+            }
+            for step in steps
+        ],
+    }
+
+
+def _effective_ruleset(step: WorkflowStep) -> Ruleset | None:
+    """Return the ruleset the step validates against, as the runner resolves it."""
+
+    if step.ruleset_id:
+        return step.ruleset
+    return getattr(step.validator, "default_ruleset", None)
+
+
+def _ruleset_components(ruleset: Ruleset | None) -> dict[str, Any]:
+    """Return the parts of ``ruleset`` that decide what a step checks."""
+
+    if ruleset is None:
+        return {}
+    return {
+        "ruleset_type": ruleset.ruleset_type,
+        "metadata": ruleset.metadata or {},
+        "rules_sha256": _rules_digest(ruleset),
+    }
+
+
+def _rules_digest(ruleset: Ruleset) -> str:
+    """SHA-256 of the inline rules, or of the uploaded rules file's bytes."""
+
+    digest = hashlib.sha256()
+    text = (ruleset.rules_text or "").strip()
+    if text or not ruleset.rules_file:
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+    with ruleset.rules_file.open("rb") as rules_file:
+        while chunk := rules_file.read(RULES_FILE_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_result_cache_key(
+    workflow: Workflow,
+    submission: Submission,
+    *,
+    workflow_components: dict[str, Any] | None = None,
+) -> str:
+    """Return the cache key for validating ``submission`` with ``workflow``.
+
+    Returns ``""`` when the result must not be cached: the workflow has not
+    opted in, has action steps, or the submission has no content checksum.
+    Pass ``workflow_components`` to reuse one
+    :func:`build_workflow_cache_components` result across a batch.
+    """
+
+    if workflow_components is None:
+        workflow_components = build_workflow_cache_components(workflow)
+    if workflow_components is None or not submission.checksum_sha256:
+        return ""
+
+    port_files = [
+        {
+            "step_key": port_file.workflow_step.step_key
+            if port_file.workflow_step_id
+            else "",
+            "port_key": port_file.port_key,
+            "checksum_sha256": port_file.checksum_sha256,
+        }
+        for port_file in submission.input_files.select_related(
+            "workflow_step",
+        ).order_by("workflow_step_id", "port_key")
+    ]
+    if any(not port_file["checksum_sha256"] for port_file in port_files):
+        return ""
+
+    return sha256_hex_for_dict(
+        {
+            "submission": {
+                "checksum_sha256": submission.checksum_sha256,
+                "file_type": submission.file_type,
+                "metadata": submission.metadata or {},
+                "port_files": port_files,
+            },
+            "workflow": workflow_components,
+        },
+    )
+
+
+def find_cached_run(validation_run: ValidationRun) -> ValidationRun | None:
+    """Return the most recent run that can answer ``validation_run``, if any."""
+
+    from validibot.validations.models import ValidationRun
+
+    if not validation_run.result_cache_key:
+        return None
+    return (
+        ValidationRun.objects.filter(
+            _CACHEABLE_OUTCOMES,
+            org_id=validation_run.org_id,
+            workflow_id=validation_run.workflow_id,
+            result_cache_key=validation_run.result_cache_key,
+            output_purged_at__isnull=True,
+        )
+        .exclude(pk=validation_run.pk)
+        .order_by("-ended_at")
+        .first()
+    )
+
+
+def serve_from_result_cache(validation_run: ValidationRun) -> bool:
+    """Answer ``validation_run`` from the cache if a source run exists.
+
+    Returns whether the run was served. On a hit the run is terminal, carries
+    the source's outcome and cloned outputs, and its finalized signal has been
+    emitted; the caller must not dispatch it.
+    """
+
+    source = find_cached_run(validation_run)
+    if source is None:
+        return False
+
+    with transaction.atomic():
+        # Purge locks the run row too: holding the lock while cloning means
+        # the source's findings cannot disappear halfway through the copy.
+        source = (
+            type(validation_run)
+            .objects.select_for_update()
+            .filter(pk=source.pk, output_purged_at__isnull=True)
+            .first()
+        )
+        if source is None:
+            return False
+        _clone_run_results(source=source, target=validation_run)
+
+    logger.info(
+        "Validation run %s served from result cache (source run %s)",
+        validation_run.id,
+        validation_run.cached_from_id,
+    )
+
+    from validibot.tracking.services import TrackingEventService
+
+    TrackingEventService().log_validation_run_status(
+        run=validation_run,
+        status=validation_run.status,
+        actor=validation_run.user,
+        extra_data={
+            "served_from_cache": True,
+            "cached_from": str(validation_run.cached_from_id),
+        },
+    )
+
+    from validibot.validations.services.run_admission import (
+        emit_validation_run_finalized,
+    )
+
+    emit_validation_run_finalized(
+        sender=serve_from_result_cache,
+        validation_run=validation_run,
+    )
+    return True
+
+
+def _clone_run_results(*, source: ValidationRun, target: ValidationRun) -> None:
+    """Copy ``source``'s outcome and detailed outputs onto ``target``."""
+
+    from validibot.validations.models import ValidationFinding
+    from validibot.validations.models import ValidationRunSummary
+    from validibot.validations.models import ValidationStepRun
+    from validibot.validations.models import ValidationStepRunSummary
+
+    now = timezone.now()
+    source_step_runs = list(source.step_runs.order_by("step_order"))
+    cloned_step_runs = ValidationStepRun.objects.bulk_create(
+        [
+            ValidationStepRun(
+                validation_run=target,
+                workflow_step_id=step_run.workflow_step_id,
+                step_order=step_run.step_order,
+                status=step_run.status,
+                started_at=now,
+                ended_at=now,
+                output=step_run.output,
+                input_values=step_run.input_values,
+                output_values=step_run.output_values,
+                error=step_run.error,
+                validator_backend_image_digest=(
+                    step_run.validator_backend_image_digest
+                ),
+            )
+            for step_run in source_step_runs
+        ],
+    )
+    step_run_map = {
+        source_step_run.pk: cloned.pk
+        for source_step_run, cloned in zip(
+            source_step_runs,
+            cloned_step_runs,
+            strict=True,
+        )
+    }
+
+    ValidationFinding.objects.bulk_create(
+        [
+            ValidationFinding(
+                validation_run=target,
+                validation_step_run_id=step_run_map[finding.validation_step_run_id],
+                ruleset_assertion_id=finding.ruleset_assertion_id,
+                severity=finding.severity,
+                code=finding.code,
+                message=finding.message,
+                path=finding.path,
+                meta=finding.meta,
+            )
+            for finding in source.findings.order_by("pk").iterator()
+        ],
+        batch_size=1000,
+    )
+
+    source_summary = ValidationRunSummary.objects.filter(run=source).first()
+    if source_summary is not None:
+        summary = ValidationRunSummary.objects.create(
+            run=target,
+            status=source_summary.status,
+            completed_at=now,
+            total_findings=source_summary.total_findings,
+            error_count=source_summary.error_count,
+            warning_count=source_summary.warning_count,
+            info_count=source_summary.info_count,
+            assertion_failure_count=source_summary.assertion_failure_count,
+            assertion_total_count=source_summary.assertion_total_count,
+            extras={
+                key: value
+                for key, value in (source_summary.extras or {}).items()
+                if key not in _PER_EXECUTION_EXTRAS
+            },
+        )
+        ValidationStepRunSummary.objects.bulk_create(
+            [
+                ValidationStepRunSummary(
+                    summary=summary,
+                    step_run_id=step_run_map.get(step_summary.step_run_id),
+                    step_name=step_summary.step_name,
+                    step_order=step_summary.step_order,
+                    status=step_summary.status,
+                    error_count=step_summary.error_count,
+                    warning_count=step_summary.warning_count,
+                    info_count=step_summary.info_count,
+                )
+                for step_summary in source_summary.step_summaries.all()
+            ],
+        )
+
+    target.status = source.status
+    target.error = source.error
+    target.error_category = source.error_category
+    target.started_at = now
+    target.ended_at = now
+    target.duration_ms = 0
+    target.output_hash = source.output_hash
+    target.cached_from_id = source.cached_from_id or source.pk
+    target.save(
+        update_fields=[
+            "status",
+            "error",
+            "error_category",
+            "started_at",
+            "ended_at",
+            "duration_ms",
+            "output_hash",
+            "cached_from",
+        ],
+    )
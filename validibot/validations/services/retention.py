@@ -22,6 +22,8 @@ from validibot.submissions.constants import get_submission_retention_timedelta
 from validibot.validations.constants import VALIDATION_RUN_TERMINAL_STATUSES
 
 if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
     from validibot.validations.models import ValidationRun
 
 logger = logging.getLogger(__name__)
@@ -134,13 +136,7 @@ def purge_run_outputs(run: ValidationRun) -> ValidationRun:
     """
 
     from validibot.submissions.models import _delete_run_files
-    from validibot.validations.models import Artifact
-    from validibot.validations.models import CallbackReceipt
-    from validibot.validations.models import ExecutionAttempt
-    from validibot.validations.models import ValidationFinding
     from validibot.validations.models import ValidationRun
-    from validibot.validations.models import ValidationRunSummary
-    from validibot.validations.models import ValidationStepRun
 
     locked_run = ValidationRun.objects.select_for_update().get(pk=run.pk)
     if locked_run.output_purged_at:
@@ -174,38 +170,16 @@ def purge_run_outputs(run: ValidationRun) -> ValidationRun:
     _delete_run_files(locked_run)
 
     findings_count = locked_run.findings.count()
-    ValidationFinding.objects.filter(validation_run=locked_run).delete()
-    Artifact.objects.filter(validation_run=locked_run).delete()
-
-    ValidationStepRun.objects.filter(validation_run=locked_run).update(
-        output={},
-        input_values={},
-        output_values={},
-        error="",
-    )
-    ExecutionAttempt.objects.filter(step_run__validation_run=locked_run).update(
-        execution_bundle_uri="",
-        input_envelope_uri="",
-        output_envelope_uri="",
-        output_envelope_sha256="",
-        last_error="",
+    purged_at = timezone.now()
+    redact_run_outputs(
+        ValidationRun.objects.filter(pk=locked_run.pk),
+        purged_at=purged_at,
     )
-    CallbackReceipt.objects.filter(validation_run=locked_run).update(result_uri="")
-    ValidationRunSummary.objects.filter(run=locked_run).update(extras={})
-
     locked_run.error = ""
     locked_run.output_hash = ""
-    locked_run.output_purged_at = timezone.now()
+    locked_run.output_purged_at = purged_at
     locked_run.output_expires_at = None
-    locked_run.save(
-        update_fields=[
-            "error",
-            "output_hash",
-            "output_purged_at",
-            "output_expires_at",
-            "modified",
-        ],
-    )
+    locked_run.modified = purged_at
 
     logger.info(
         "Purged detailed validation outputs",
@@ -219,6 +193,48 @@ def purge_run_outputs(run: ValidationRun) -> ValidationRun:
     return locked_run
 
 
+def redact_run_outputs(runs: QuerySet[ValidationRun], *, purged_at) -> None:
+    """Delete and redact the database side of output purge for ``runs``.
+
+    Callers delete the runs' stored files first and hold the run rows locked;
+    this only issues set-based statements, so it costs the same for one run as
+    for a chunk of thousands.
+    """
+
+    from validibot.validations.models import Artifact
+    from validibot.validations.models import CallbackReceipt
+    from validibot.validations.models import ExecutionAttempt
+    from validibot.validations.models import ValidationFinding
+    from validibot.validations.models import ValidationRunSummary
+    from validibot.validations.models import ValidationStepRun
+
+    ValidationFinding.objects.filter(validation_run__in=runs).delete()
+    Artifact.objects.filter(validation_run__in=runs).delete()
+
+    ValidationStepRun.objects.filter(validation_run__in=runs).update(
+        output={},
+        input_values={},
+        output_values={},
+        error="",
+    )
+    ExecutionAttempt.objects.filter(step_run__validation_run__in=runs).update(
+        execution_bundle_uri="",
+        input_envelope_uri="",
+        output_envelope_uri="",
+        output_envelope_sha256="",
+        last_error="",
+    )
+    CallbackReceipt.objects.filter(validation_run__in=runs).update(result_uri="")
+    ValidationRunSummary.objects.filter(run__in=runs).update(extras={})
+    runs.update(
+        error="",
+        output_hash="",
+        output_purged_at=purged_at,
+        output_expires_at=None,
+        modified=purged_at,
+    )
+
+
 def redact_run_input_records(run: ValidationRun) -> None:
     """Remove payload-derived input context after submission bytes are deleted.
 
@@ -227,13 +243,20 @@ def redact_run_input_records(run: ValidationRun) -> None:
     input values, and input-envelope storage identities do not.
     """
 
-    from validibot.validations.models import ExecutionAttempt
     from validibot.validations.models import ValidationRun
+
+    redact_input_records(ValidationRun.objects.filter(pk=run.pk))
+
+
+def redact_input_records(runs: QuerySet[ValidationRun]) -> None:
+    """Set-based form of :func:`redact_run_input_records` for many runs."""
+
+    from validibot.validations.models import ExecutionAttempt
     from validibot.validations.models import ValidationStepRun
 
-    ValidationRun.objects.filter(pk=run.pk).update(short_description="")
-    ValidationStepRun.objects.filter(validation_run=run).update(input_values={})
-    ExecutionAttempt.objects.filter(step_run__validation_run=run).update(
+    runs.update(short_description="")
+    ValidationStepRun.objects.filter(validation_run__in=runs).update(input_values={})
+    ExecutionAttempt.objects.filter(step_run__validation_run__in=runs).update(
         execution_bundle_uri="",
         input_envelope_uri="",
         input_envelope_sha256="",
@@ -243,7 +266,9 @@ def redact_run_input_records(run: ValidationRun) -> None:
 
 __all__ = [
     "purge_run_outputs",
+    "redact_input_records",
     "redact_run_input_records",
+    "redact_run_outputs",
     "schedule_submission_retention",
     "schedule_terminal_retention",
 ]
@@ -0,0 +1,382 @@
+"""Set-based retention purge for expired submissions and run outputs.
+
+The scheduled purge commands drain whatever has expired since their last run.
+Purging one object at a time, with its own lock, queries and storage calls,
+cannot keep up once expiries pile up (after an outage, or when a large sweep's
+review window closes at once), so this engine works in chunks:
+
+1. **Claim.** One ``SELECT … FOR UPDATE SKIP LOCKED`` takes up to ``limit``
+   expired rows. Rows another invocation holds are skipped, not waited on, so
+   overlapping runs of the same command split the backlog between them.
+2. **Plan.** The storage identities each claimed row needs deleted are read
+   in a few set-based queries rather than per row.
+3. **Delete.** Storage deletions run on a bounded thread pool
+   (``RETENTION_PURGE_STORAGE_CONCURRENCY``). Workers touch storage only; all
+   database work stays on the calling thread and its transaction.
+4. **Redact.** Rows whose storage deletion succeeded are redacted and stamped
+   with set-based ``UPDATE``/``DELETE`` statements.
+
+The per-object guarantees are unchanged: a row whose storage deletion fails is
+left unstamped for a later retry, a submission still used by an active run is
+never touched, and only terminal runs lose their outputs. The claim locks are
+held until the chunk's transaction commits, so nothing else can start a run
+on a submission being purged.
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists
+from django.db.models import OuterRef
+from django.db.models import Q
+from django.utils import timezone
+
+from validibot.submissions import models as submission_models
+from validibot.submissions.constants import OutputRetention
+from validibot.validations.constants import VALIDATION_RUN_TERMINAL_STATUSES
+from validibot.validations.services.retention import redact_input_records
+from validibot.validations.services.retention import redact_run_outputs
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from datetime import datetime
+
+    from django.db.models import QuerySet
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PurgeChunkResult:
+    """Outcome of one claimed chunk.
+
+    ``purged`` and ``failed`` hold primary keys as strings; ``failed`` maps
+    each to its storage error. A chunk with neither found nothing to claim.
+    """
+
+    purged: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.purged or self.failed)
+
+
+# ── Submissions ───────────────────────────────────────────────────────
+
+
+def expired_submissions(now: datetime) -> QuerySet:
+    """Submissions past ``expires_at`` whose runs have all finished."""
+
+    from validibot.validations.models import ValidationRun
+
+    active_runs = ValidationRun.objects.filter(
+        submission_id=OuterRef("pk"),
+    ).exclude(status__in=VALIDATION_RUN_TERMINAL_STATUSES)
+    return (
+        submission_models.Submission.objects.filter(
+            expires_at__lte=now,
+            content_purged_at__isnull=True,
+        )
+        .filter(~Exists(active_runs))
+        .order_by("expires_at")
+    )
+
+
+@dataclass
+class _SubmissionDeletion:
+    submission: Any
+    run_inputs: list[Any] = field(default_factory=list)
+    port_files: list[Any] = field(default_factory=list)
+
+
+@transaction.atomic
+def purge_expired_submission_chunk(
+    *,
+    now: datetime,
+    limit: int,
+    skip_ids: Iterable[str] = (),
+) -> PurgeChunkResult:
+    """Claim and purge up to ``limit`` expired submissions.
+
+    ``skip_ids`` excludes rows that already failed in this invocation, so a
+    persistent storage error cannot make a caller claim the same rows forever.
+    Clears the same content and submitter context as
+    :meth:`Submission.purge_content`.
+    """
+
+    from validibot.validations.models import Artifact
+    from validibot.validations.models import ExecutionAttempt
+    from validibot.validations.models import ValidationRun
+
+    Submission = submission_models.Submission  # noqa: N806
+    claimed = list(
+        expired_submissions(now)
+        .exclude(pk__in=list(skip_ids))
+        .select_for_update(skip_locked=True)
+        .only("id", "org_id", "input_file")[:limit],
+    )
+    if not claimed:
+        return PurgeChunkResult()
+
+    # The claim's snapshot may predate a run that started just before the lock
+    # was taken; recheck now that no new run can reference these rows.
+    busy = set(
+        ValidationRun.objects.filter(submission__in=claimed)
+        .exclude(status__in=VALIDATION_RUN_TERMINAL_STATUSES)
+        .values_list("submission_id", flat=True),
+    )
+    deletions = {
+        submission.pk: _SubmissionDeletion(submission)
+        for submission in claimed
+        if submission.pk not in busy
+    }
+    if not deletions:
+        return PurgeChunkResult()
+
+    runs = list(
+        ValidationRun.objects.filter(submission_id__in=deletions).values_list(
+            "id",
+            "org_id",
+            "submission_id",
+        ),
+    )
+    run_ids = [run_id for run_id, _org_id, _submission_id in runs]
+    attempts: dict[Any, list[tuple[Any, str]]] = {}
+    for run_id, attempt_id, output_uri in ExecutionAttempt.objects.filter(
+        step_run__validation_run_id__in=run_ids,
+    ).values_list("step_run__validation_run_id", "id", "output_envelope_uri"):
+        attempts.setdefault(run_id, []).append((attempt_id, output_uri))
+    artifact_uris: dict[Any, list[str]] = {}
+    for run_id, storage_uri, manifest_uri in Artifact.objects.filter(
+        validation_run_id__in=run_ids,
+    ).values_list("validation_run_id", "storage_uri", "manifest_uri"):
+        artifact_uris.setdefault(run_id, []).extend((storage_uri, manifest_uri))
+    for run_id, org_id, submission_id in runs:
+        deletions[submission_id].run_inputs.append(
+            submission_models._plan_run_input_deletion(
+                org_id=org_id,
+                run_id=run_id,
+                attempts=attempts.get(run_id, ()),
+                artifact_uris=artifact_uris.get(run_id, ()),
+            ),
+        )
+    for port_file in submission_models.SubmissionInputFile.objects.filter(
+        submission_id__in=deletions,
+        file_purged_at__isnull=True,
+    ).only("id", "submission_id", "input_file"):
+        deletions[port_file.submission_id].port_files.append(port_file)
+
+    errors = _run_storage_deletions(
+        _delete_submission_storage,
+        deletions.values(),
+        key=lambda deletion: deletion.submission.pk,
+    )
+    purged = [pk for pk in deletions if pk not in errors]
+    if purged:
+        purged_at = timezone.now()
+        submission_models.SubmissionInputFile.objects.filter(
+            submission_id__in=purged,
+            file_purged_at__isnull=True,
+        ).update(
+            input_file=None,
+            original_filename="",
+            content_type="",
+            metadata={},
+            file_purged_at=purged_at,
+            modified=purged_at,
+        )
+        redact_input_records(ValidationRun.objects.filter(submission_id__in=purged))
+        Submission.objects.filter(pk__in=purged).update(
+            name="",
+            content="",
+            input_file=None,
+            original_filename="",
+            metadata={},
+            content_purged_at=purged_at,
+            expires_at=None,
+        )
+
+    result = PurgeChunkResult(
+        purged=[str(pk) for pk in purged],
+        failed={str(pk): str(error) for pk, error in errors.items()},
+    )
+    logger.info(
+        "Purged expired submission content",
+        extra={"purged": len(result.purged), "failed": len(result.failed)},
+    )
+    return result
+
+
+def _delete_submission_storage(deletion: _SubmissionDeletion) -> None:
+    # Same order as ``Submission.purge_content``: copied run inputs first, so
+    # a failure never leaves a bundle copy behind a deleted original.
+    for plan in deletion.run_inputs:
+        submission_models._delete_run_input_prefix(plan)
+    if deletion.submission.input_file:
+        deletion.submission.input_file.delete(save=False)
+    for port_file in deletion.port_files:
+        if port_file.input_file:
+            port_file.input_file.delete(save=False)
+
+
+# ── Run outputs ───────────────────────────────────────────────────────
+
+
+def expired_outputs(now: datetime) -> QuerySet:
+    """Terminal runs whose output retention has lapsed.
+
+    Terminal status is a hard safety boundary: launch-time clocks or corrupt
+    rows must never let a sweeper delete a running bundle. DO_NOT_STORE rows
+    are independently discoverable even if their terminal signal failed
+    before writing ``output_expires_at``.
+    """
+
+    from validibot.validations.models import ValidationRun
+
+    return (
+        ValidationRun.objects.filter(
+            status__in=VALIDATION_RUN_TERMINAL_STATUSES,
+            output_purged_at__isnull=True,
+        )
+        .filter(
+            (
+                Q(output_expires_at__lte=now)
+                & ~Q(output_retention_policy=OutputRetention.DO_NOT_STORE)
+            )
+            | (
+                Q(output_retention_policy=OutputRetention.DO_NOT_STORE)
+                & Q(ended_at__lte=now - timedelta(minutes=1))
+            ),
+        )
+        .exclude(output_retention_policy=OutputRetention.STORE_PERMANENTLY)
+        .order_by("output_expires_at")
+    )
+
+
+@dataclass
+class _OutputDeletion:
+    run: Any
+    artifacts: list[Any] = field(default_factory=list)
+
+
+@transaction.atomic
+def purge_expired_output_chunk(
+    *,
+    now: datetime,
+    limit: int,
+    skip_ids: Iterable[str] = (),
+) -> PurgeChunkResult:
+    """Claim and purge the outputs of up to ``limit`` expired runs.
+
+    Deletes and redacts the same state as
+    :func:`~validibot.validations.services.retention.purge_run_outputs`.
+    """
+
+    from validibot.validations.models import Artifact
+    from validibot.validations.models import ValidationRun
+
+    claimed = list(
+        expired_outputs(now)
+        .exclude(pk__in=list(skip_ids))
+        .select_for_update(skip_locked=True)
+        .only("id", "org_id")[:limit],
+    )
+    if not claimed:
+        return PurgeChunkResult()
+
+    deletions = {run.pk: _OutputDeletion(run) for run in claimed}
+    for artifact in (
+        Artifact.objects.filter(validation_run_id__in=deletions)
+        .exclude(file="")
+        .only("id", "validation_run_id", "file")
+    ):
+        deletions[artifact.validation_run_id].artifacts.append(artifact)
+
+    errors = _run_storage_deletions(
+        _delete_output_storage,
+        deletions.values(),
+        key=lambda deletion: deletion.run.pk,
+    )
+    purged = [pk for pk in deletions if pk not in errors]
+    if purged:
+        redact_run_outputs(
+            ValidationRun.objects.filter(pk__in=purged),
+            purged_at=timezone.now(),
+        )
+
+    result = PurgeChunkResult(
+        purged=[str(pk) for pk in purged],
+        failed={str(pk): str(error) for pk, error in errors.items()},
+    )
+    logger.info(
+        "Purged expired validation outputs",
+        extra={"purged": len(result.purged), "failed": len(result.failed)},
+    )
+    return result
+
+
+def _delete_output_storage(deletion: _OutputDeletion) -> None:
+    # Artifact files before the bundle, as in ``purge_run_outputs``.
+    for artifact in deletion.artifacts:
+        if artifact.file:
+            artifact.file.delete(save=False)
+    submission_models._delete_run_files(deletion.run)
+
+
+# ── Storage pool ──────────────────────────────────────────────────────
+
+
+def _run_storage_deletions(
+    delete: Callable[[Any], None],
+    items: Iterable[Any],
+    *,
+    key: Callable[[Any], Any],
+) -> dict[Any, Exception]:
+    """Run ``delete`` over ``items`` concurrently; return failures by key.
+
+    A failure is logged and recorded against its item only; the others still
+    run, so one unreachable object does not hold back the rest of the chunk.
+    """
+
+    items = list(items)
+    if not items:
+        return {}
+    max_workers = max(
+        1,
+        min(settings.RETENTION_PURGE_STORAGE_CONCURRENCY, len(items)),
+    )
+    errors: dict[Any, Exception] = {}
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="retention-purge",
+    ) as pool:
+        futures = {pool.submit(delete, item): key(item) for item in items}
+        for future, item_key in futures.items():
+            try:
+                future.result()
+            except Exception as exc:
+                logger.exception(
+                    "Failed to delete expired data from storage",
+                    extra={"id": str(item_key)},
+                )
+                errors[item_key] = exc
+    return errors
+
+
+__all__ = [
+    "PurgeChunkResult",
+    "expired_outputs",
+    "expired_submissions",
+    "purge_expired_output_chunk",
+    "purge_expired_submission_chunk",
+]
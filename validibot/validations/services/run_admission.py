@@ -1,6 +1,7 @@
 """Race-safe admission and definition-release lifecycle for validation runs.
 
-Every production run creator must enter through :func:`admit_validation_run`.
+Every production run creator must enter through :func:`admit_validation_run`
+(or :func:`admit_validation_runs` for a batch of submissions to one workflow).
 Admission locks the workflow before the submission so it serializes with
 editing-policy transitions and Mutable semantic mutations. The run remains an
 active definition user until :func:`emit_validation_run_finalized` has invoked
@@ -58,24 +59,87 @@ def admit_validation_run(
     """
 
     from validibot.submissions.models import Submission as SubmissionModel
-    from validibot.workflows.models import Workflow as WorkflowModel
 
-    locked_workflow = WorkflowModel.objects.select_for_update().get(pk=workflow.pk)
-    if locked_workflow.org_id != org.pk:
-        raise ValueError("Run organization must match workflow organization")
+    locked_workflow = _lock_workflow(org=org, workflow=workflow)
+    run_extra = _checked_run_extra(extra)
 
     locked_submission = SubmissionModel.objects.select_for_update().get(
         pk=submission.pk,
     )
-    if locked_submission.workflow_id != locked_workflow.pk:
-        raise ValueError("Submission must match the admitted workflow")
-    if locked_submission.org_id != org.pk:
-        raise ValueError("Run organization must match submission organization")
-    if locked_submission.content_purged_at:
-        raise ValueError("Submission content is no longer available for validation")
+    _check_submission(org=org, workflow=locked_workflow, submission=locked_submission)
 
-    run_extra = dict(extra or {})
-    reserved_fields = {
+    run = _build_run(
+        org=org,
+        workflow=locked_workflow,
+        submission=locked_submission,
+        user=user,
+        source=source,
+        extra=run_extra,
+    )
+    run.save(force_insert=True)
+    return run
+
+
+@transaction.atomic
+def admit_validation_runs(
+    *,
+    org: Organization,
+    workflow: Workflow,
+    submissions: list[Submission],
+    user: User | None,
+    source: str,
+    extra: dict[str, Any] | None = None,
+) -> list[ValidationRun]:
+    """Create one unreleased run per submission with a single INSERT.
+
+    Same lock order and checks as :func:`admit_validation_run`: the workflow is
+    locked once, then every submission in primary-key order (so two batches
+    over overlapping submissions cannot deadlock). Any failed check rejects the
+    whole batch; callers validate per-file input before admission.
+
+    Returns:
+        The new runs, in the order of ``submissions``.
+
+    Raises:
+        ValueError: If tenant relationships disagree or input was purged.
+    """
+
+    from validibot.submissions.models import Submission as SubmissionModel
+
+    locked_workflow = _lock_workflow(org=org, workflow=workflow)
+    run_extra = _checked_run_extra(extra)
+
+    submission_ids = [submission.pk for submission in submissions]
+    locked_submissions = SubmissionModel.objects.select_for_update().in_bulk(
+        sorted(submission_ids),
+    )
+    runs = []
+    for submission_id in submission_ids:
+        locked_submission = locked_submissions.get(submission_id)
+        if locked_submission is None:
+            raise ValueError("Submission no longer exists")
+        _check_submission(
+            org=org,
+            workflow=locked_workflow,
+            submission=locked_submission,
+        )
+        run = _build_run(
+            org=org,
+            workflow=locked_workflow,
+            submission=locked_submission,
+            user=user,
+            source=source,
+            extra=run_extra,
+        )
+        # ``bulk_create`` skips ``save()``, which is where the model enforces
+        # its tenant invariants; keep that guarantee for batched runs.
+        run._validate_tenant_relationships()
+        runs.append(run)
+    return ValidationRun.objects.bulk_create(runs)
+
+
+_RESERVED_RUN_FIELDS = frozenset(
+    {
         "definition_released_at",
         "org",
         "project",
@@ -84,25 +148,64 @@ def admit_validation_run(
         "submission",
         "user",
         "workflow",
-    }
-    conflicts = reserved_fields.intersection(run_extra)
+    },
+)
+
+
+def _lock_workflow(*, org: Organization, workflow: Workflow) -> Workflow:
+    from validibot.workflows.models import Workflow as WorkflowModel
+
+    locked_workflow = WorkflowModel.objects.select_for_update().get(pk=workflow.pk)
+    if locked_workflow.org_id != org.pk:
+        raise ValueError("Run organization must match workflow organization")
+    return locked_workflow
+
+
+def _check_submission(
+    *,
+    org: Organization,
+    workflow: Workflow,
+    submission: Submission,
+) -> None:
+    if submission.workflow_id != workflow.pk:
+        raise ValueError("Submission must match the admitted workflow")
+    if submission.org_id != org.pk:
+        raise ValueError("Run organization must match submission organization")
+    if submission.content_purged_at:
+        raise ValueError("Submission content is no longer available for validation")
+
+
+def _checked_run_extra(extra: dict[str, Any] | None) -> dict[str, Any]:
+    run_extra = dict(extra or {})
+    conflicts = _RESERVED_RUN_FIELDS.intersection(run_extra)
     if conflicts:
         conflict_names = ", ".join(sorted(conflicts))
         raise ValueError(f"Run admission received reserved fields: {conflict_names}")
+    return run_extra
 
+
+def _build_run(
+    *,
+    org: Organization,
+    workflow: Workflow,
+    submission: Submission,
+    user: User | None,
+    source: str,
+    extra: dict[str, Any],
+) -> ValidationRun:
     from validibot.validations.constants import ValidationRunStatus
 
-    return ValidationRun.objects.create(
+    return ValidationRun(
         org=org,
-        workflow=locked_workflow,
-        submission=locked_submission,
-        project=locked_submission.project or locked_workflow.project,
+        workflow=workflow,
+        submission=submission,
+        project=submission.project or workflow.project,
         user=user,
         status=ValidationRunStatus.PENDING,
         source=source,
-        output_retention_policy=locked_workflow.output_retention,
+        output_retention_policy=workflow.output_retention,
         definition_released_at=None,
-        **run_extra,
+        **extra,
     )
 
 
@@ -0,0 +1,203 @@
+"""Server-side waiting for validation runs to reach a terminal status.
+
+API and MCP clients used to poll a run's detail endpoint until it finished,
+paying an authenticated request and a full run read per poll. Run detail
+endpoints now accept ``?wait=<seconds>``: the request is held open until the
+run is terminal or the wait expires, then answers with the run as usual.
+
+Completion is pushed over Postgres ``LISTEN``/``NOTIFY``. The
+``validation_run_finalized`` receiver publishes the run id on
+:data:`RUN_FINALIZED_CHANNEL`; ``NOTIFY`` is transactional, so the message is
+delivered only once the finalizing transaction commits. Postgres is used
+rather than Redis pub/sub because it is the one broker every deployment
+target is guaranteed to run.
+
+A waiter listens *before* it first reads the run, so a run that finishes
+between the read and the ``LISTEN`` cannot be missed. It also re-reads the run
+every ``RUN_COMPLETION_RECHECK_SECONDS``, so a terminal transition that skips
+the finalized signal (a repair command, say) delays the answer by at most that
+long instead of stranding the waiter until its timeout.
+
+Each waiter holds a web worker thread and one extra database connection for
+up to ``RUN_COMPLETION_MAX_WAIT_SECONDS``, so waiting is off by default: with
+gunicorn's sync workers a handful of waiters would block every other request.
+Turn it on only where the web tier runs threaded or async workers. Even then
+at most ``RUN_COMPLETION_MAX_WAITERS`` requests wait at once per process; a
+request over the cap, like any request while waiting is off, gets an
+immediate answer without the ``X-Validibot-Run-Wait`` header, and the client
+falls back to polling.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import connection
+
+from validibot.validations.constants import VALIDATION_RUN_TERMINAL_STATUSES
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+
+    from validibot.validations.models import ValidationRun
+
+RUN_FINALIZED_CHANNEL = "validibot_run_finalized"
+
+# Set on run detail responses that honoured ``?wait=``. Its value is the
+# number of seconds the server actually waited, rounded down. Clients use the
+# header's presence to tell a long-polling server from one that ignores
+# ``wait`` and must be polled.
+RUN_WAIT_HEADER = "X-Validibot-Run-Wait"
+
+
+_waiter_slots_lock = threading.Lock()
+_waiter_slots: tuple[int, threading.BoundedSemaphore] | None = None
+
+
+def parse_wait_seconds(raw: str | None) -> float:
+    """Clamp a ``?wait=`` query value to ``[0, RUN_COMPLETION_MAX_WAIT_SECONDS]``.
+
+    Missing or malformed values mean "don't wait", matching how the other
+    run endpoints treat unparseable paging parameters.
+    """
+
+    if not raw:
+        return 0.0
+    try:
+        requested = float(raw)
+    except ValueError:
+        return 0.0
+    return max(0.0, min(requested, float(settings.RUN_COMPLETION_MAX_WAIT_SECONDS)))
+
+
+def publish_run_finalized(run_id: int) -> None:
+    """Wake every waiter on ``run_id`` once the current transaction commits."""
+
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_notify(%s, %s)",
+            [RUN_FINALIZED_CHANNEL, str(run_id)],
+        )
+
+
+def wait_for_run_finalized(run_id: int, *, timeout: float) -> bool:
+    """Block until run ``run_id`` is terminal or ``timeout`` seconds pass.
+
+    Returns whether the run was terminal when the wait ended. The caller
+    re-reads the run for its response either way.
+    """
+
+    deadline = time.monotonic() + timeout
+    payload = str(run_id)
+    with _listener() as notifications:
+        while True:
+            if _is_terminal(run_id):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            slice_seconds = min(remaining, settings.RUN_COMPLETION_RECHECK_SECONDS)
+            for notified_payload in notifications(slice_seconds):
+                if notified_payload == payload:
+                    break
+
+
+def wait_and_reload(
+    run: ValidationRun,
+    *,
+    wait: float,
+    reload: Callable[[], ValidationRun],
+) -> tuple[ValidationRun, int | None]:
+    """Hold a run detail request until ``run`` is terminal, then re-read it.
+
+    ``reload`` re-runs the view's own access-checked lookup. Returns the run
+    to serialize and the whole seconds waited, for :data:`RUN_WAIT_HEADER`;
+    the seconds are ``None`` when this process already has
+    ``RUN_COMPLETION_MAX_WAITERS`` requests waiting and ``run`` is answered
+    as is, so the header must be left off.
+    """
+
+    if run.status in VALIDATION_RUN_TERMINAL_STATUSES:
+        return run, 0
+    slots = _waiter_semaphore()
+    if not slots.acquire(blocking=False):
+        return run, None
+    try:
+        started = time.monotonic()
+        wait_for_run_finalized(run.pk, timeout=wait)
+        return reload(), int(time.monotonic() - started)
+    finally:
+        slots.release()
+
+
+def _waiter_semaphore() -> threading.BoundedSemaphore:
+    """Return this process's waiter slots, rebuilt if the cap setting changed."""
+
+    global _waiter_slots  # noqa: PLW0603
+    size = max(1, int(settings.RUN_COMPLETION_MAX_WAITERS))
+    with _waiter_slots_lock:
+        if _waiter_slots is None or _waiter_slots[0] != size:
+            _waiter_slots = (size, threading.BoundedSemaphore(size))
+        return _waiter_slots[1]
+
+
+def _is_terminal(run_id: int) -> bool:
+    from validibot.validations.models import ValidationRun
+
+    return ValidationRun.objects.filter(
+        pk=run_id,
+        status__in=VALIDATION_RUN_TERMINAL_STATUSES,
+    ).exists()
+
+
+class _PostgresListener:
+    """A dedicated autocommit connection subscribed to the finalized channel.
+
+    The request's own connection cannot ``LISTEN``: it may be inside a
+    transaction, and notifications are only delivered between transactions.
+    The connection is opened directly rather than through
+    ``get_new_connection``, which would check it out of the connection pool
+    when one is configured; closing it here would then leak the pool slot.
+    """
+
+    def __enter__(self):
+        params = connection.get_connection_params()
+        self._conn = connection.Database.connect(**params)
+        self._conn.autocommit = True
+        self._conn.execute(f"LISTEN {RUN_FINALIZED_CHANNEL}")
+        return self._notifications
+
+    def __exit__(self, *exc_info) -> None:
+        self._conn.close()
+
+    def _notifications(self, timeout: float) -> Iterator[str]:
+        for notify in self._conn.notifies(timeout=timeout):
+            yield notify.payload
+
+
+class _SleepingListener:
+    """Fallback for non-Postgres databases: re-check on a timer only."""
+
+    def __enter__(self):
+        return self._notifications
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    @staticmethod
+    def _notifications(timeout: float) -> Iterator[str]:
+        time.sleep(timeout)
+        yield from ()
+
+
+def _listener() -> AbstractContextManager:
+    if connection.vendor == "postgresql":
+        return _PostgresListener()
+    return _SleepingListener()
@@ -18,7 +18,7 @@ from typing import Any
 
 from validibot.validations.cel import CEL_NAMESPACE_ROOTS
 from validibot.validations.cel import CUSTOM_HELPER_NAMES
-from validibot.validations.services.path_resolution import resolve_path
+from validibot.validations.services.path_resolution import resolve_paths
 
 if TYPE_CHECKING:
     from validibot.workflows.models import Workflow
@@ -58,7 +58,7 @@ def resolve_workflow_signals(
 
     Iterates over ``WorkflowSignalMapping`` rows ordered by position,
     resolves each source path against the submission data using
-    ``resolve_path()``, applies default values, and handles
+    ``resolve_paths()``, applies default values, and handles
     ``on_missing`` behavior.
 
     Args:
@@ -75,14 +75,20 @@ def resolve_workflow_signals(
     """
     from validibot.workflows.models import WorkflowSignalMapping
 
-    mappings = WorkflowSignalMapping.objects.filter(
-        workflow=workflow,
-    ).order_by("position")
+    mappings = list(
+        WorkflowSignalMapping.objects.filter(
+            workflow=workflow,
+        ).order_by("position"),
+    )
+    resolved = resolve_paths(
+        submission_data,
+        [mapping.source_path for mapping in mappings],
+    )
 
     result = SignalResolutionResult()
 
     for mapping in mappings:
-        value, found = resolve_path(submission_data, mapping.source_path)
+        value, found = resolved[mapping.source_path]
 
         if found:
             result.signals[mapping.name] = value
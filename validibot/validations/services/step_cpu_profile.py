@@ -0,0 +1,125 @@
+"""Capture CPU profiles of slow validator steps as run artifacts.
+
+Operators enable this per organization or per workflow when a tenant reports
+pathologically slow runs. Every validator step in a flagged run executes under
+a ``StackSampler``; if the step takes at least
+``STEP_CPU_PROFILE_MIN_SECONDS`` the collapsed stacks are saved as an
+``Artifact`` on the step run, downloadable from the run like any other
+artifact and loadable straight into a flame-graph viewer. Faster steps
+discard their samples, so a flagged workflow only accumulates profiles for
+the submissions worth looking at.
+
+Settings:
+    STEP_CPU_PROFILE_ORGS: Organization slugs whose runs are profiled.
+    STEP_CPU_PROFILE_WORKFLOWS: ``"<org-slug>/<workflow-slug>"`` entries;
+        every version of a matching workflow is profiled.
+    STEP_CPU_PROFILE_MIN_SECONDS: Step duration that keeps a profile.
+    STEP_CPU_PROFILE_INTERVAL_MS: Sampling interval.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+
+from validibot.core.filesafety import sha256_hexdigest
+from validibot.core.sampling_profiler import StackSampler
+from validibot.validations.constants import ArtifactKind
+from validibot.validations.models import Artifact
+
+if TYPE_CHECKING:
+    from validibot.validations.models import ValidationRun
+    from validibot.validations.models import ValidationStepRun
+
+logger = logging.getLogger(__name__)
+
+CPU_PROFILE_ROLE = "cpu_profile"
+CPU_PROFILE_DATA_FORMAT = "collapsed-stacks"
+
+
+def is_cpu_profiling_enabled(validation_run: ValidationRun) -> bool:
+    """Return whether the run's org or workflow is flagged for profiling."""
+    org_slugs = settings.STEP_CPU_PROFILE_ORGS
+    workflow_keys = settings.STEP_CPU_PROFILE_WORKFLOWS
+    if not org_slugs and not workflow_keys:
+        return False
+    org_slug = validation_run.org.slug
+    if org_slug in org_slugs:
+        return True
+    return f"{org_slug}/{validation_run.workflow.slug}" in workflow_keys
+
+
+def start_step_cpu_profile(validation_run: ValidationRun) -> StackSampler | None:
+    """Start sampling the current thread if the run is flagged, else ``None``."""
+    if not is_cpu_profiling_enabled(validation_run):
+        return None
+    sampler = StackSampler(
+        interval_s=settings.STEP_CPU_PROFILE_INTERVAL_MS / 1000.0,
+    )
+    sampler.start()
+    return sampler
+
+
+def finish_step_cpu_profile(
+    sampler: StackSampler,
+    *,
+    step_run: ValidationStepRun,
+) -> Artifact | None:
+    """Stop ``sampler`` and keep its stacks if the step was slow enough.
+
+    Profiling is diagnostic, so a storage failure is logged and swallowed
+    rather than failing a step that otherwise completed.
+    """
+    sampler.stop()
+    if sampler.elapsed_s < settings.STEP_CPU_PROFILE_MIN_SECONDS:
+        return None
+    if not sampler.samples:
+        return None
+    try:
+        return _store_profile(sampler, step_run=step_run)
+    except Exception:
+        logger.exception(
+            "Failed to store CPU profile for step run %s",
+            step_run.pk,
+        )
+        return None
+
+
+def _store_profile(sampler: StackSampler, *, step_run: ValidationStepRun) -> Artifact:
+    payload = sampler.collapsed().encode("utf-8")
+    validation_run = step_run.validation_run
+    artifact = Artifact(
+        org_id=validation_run.org_id,
+        validation_run=validation_run,
+        step_run=step_run,
+        workflow_step_id=step_run.workflow_step_id,
+        label=f"CPU profile (step {step_run.step_order})",
+        content_type="text/plain",
+        role=CPU_PROFILE_ROLE,
+        kind=ArtifactKind.REPORT,
+        data_format=CPU_PROFILE_DATA_FORMAT,
+        size_bytes=len(payload),
+        sha256=sha256_hexdigest(payload),
+        metadata={
+            "duration_seconds": round(sampler.elapsed_s, 3),
+            "interval_ms": round(sampler.interval_s * 1000, 3),
+            "sample_count": sampler.sample_count,
+            "sampling_mode": sampler.mode.removesuffix("-stopped"),
+        },
+    )
+    artifact.file.save(
+        f"cpu-profile-step-{step_run.step_order}.folded",
+        ContentFile(payload),
+        save=False,
+    )
+    artifact.save()
+    logger.info(
+        "Stored CPU profile for step run %s (%s samples, %.2fs)",
+        step_run.pk,
+        sampler.sample_count,
+        sampler.elapsed_s,
+    )
+    return artifact
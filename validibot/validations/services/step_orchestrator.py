@@ -29,18 +29,22 @@ handles execution.
 from __future__ import annotations
 
 import logging
+import time
 from collections import Counter
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import cast
 
 from django.apps import apps
+from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import gettext as _
 
 from validibot.actions.constants import ActionFailureMode
 from validibot.actions.constants import CredentialActionType
+from validibot.core import metrics
+from validibot.core import spans
 from validibot.tracking.services import TrackingEventService
 from validibot.validations.constants import Severity
 from validibot.validations.constants import StepStatus
@@ -48,12 +52,15 @@ from validibot.validations.constants import ValidationRunErrorCategory
 from validibot.validations.constants import ValidationRunStatus
 from validibot.validations.models import ValidationFinding
 from validibot.validations.models import ValidationRun
+from validibot.validations.models import ValidationRunSummary
 from validibot.validations.models import ValidationStepRun
 from validibot.validations.services.findings_persistence import normalize_issue
 from validibot.validations.services.findings_persistence import persist_findings
 from validibot.validations.services.models import ValidationRunTaskResult
 from validibot.validations.services.output_hash import safe_stamp_output_hash
 from validibot.validations.services.run_context import RunContextBuilder
+from validibot.validations.services.step_cpu_profile import finish_step_cpu_profile
+from validibot.validations.services.step_cpu_profile import start_step_cpu_profile
 from validibot.validations.services.step_processor.result import StepProcessingResult
 from validibot.validations.services.summary_builder import build_run_summary_record
 from validibot.validations.services.summary_builder import extract_assertion_total
@@ -75,6 +82,14 @@ GENERIC_EXECUTION_ERROR = _(
 
 RUN_CANCELED_MESSAGE = _("Run canceled by user.")
 
+STEP_DURATION_SECONDS = metrics.histogram(
+    "validibot_step_duration_seconds",
+    "Wall-clock time for the worker to execute one validator step. Async "
+    "steps are measured to dispatch; their completion is in the callback "
+    "metrics.",
+    labelnames=("validation_type", "outcome"),
+)
+
 
 class StepOrchestrator:
     """
@@ -119,6 +134,13 @@ class StepOrchestrator:
             - Task queues may deliver the same task multiple times. Step-level
               idempotency is handled by _start_step_run() using get_or_create.
 
+        Profiling:
+            With ``VALIDATION_RUN_PROFILING_ENABLED`` on, the pass is recorded
+            as a span tree (steps, validator phases, persistence, summary,
+            evidence, output hash) and stored on the run summary. A pass that
+            ends with an async step pending has no summary yet and is not
+            stored; the resumed pass that finalizes the run is.
+
         Args:
             validation_run_id: ID of the ValidationRun to execute (UUID).
             user_id: ID of the user who initiated the run (for tracking).
@@ -129,7 +151,32 @@ class StepOrchestrator:
         Returns:
             ValidationRunTaskResult with the final (or current) run status.
         """
+        if not settings.VALIDATION_RUN_PROFILING_ENABLED:
+            return self._execute_workflow_steps(
+                validation_run_id,
+                user_id,
+                resume_from_step,
+            )
+        with spans.recording() as recorder:
+            result = self._execute_workflow_steps(
+                validation_run_id,
+                user_id,
+                resume_from_step,
+            )
+        self._store_run_profile(
+            run_id=result.run_id,
+            profile=recorder.as_dict(),
+            resume_from_step=resume_from_step,
+        )
+        return result
 
+    def _execute_workflow_steps(
+        self,
+        validation_run_id: UUID | str,
+        user_id: int | None,
+        resume_from_step: int | None,
+    ) -> ValidationRunTaskResult:
+        """Run one execution pass; see ``execute_workflow_steps``."""
         # Look up the validation run
         try:
             validation_run: ValidationRun = ValidationRun.objects.select_related(
@@ -308,12 +355,13 @@ class StepOrchestrator:
                         step_metrics.append(result)
                         continue
                     try:
-                        validation_result: ValidationResult = (
-                            self.execute_workflow_step(
-                                step=wf_step,
-                                validation_run=validation_run,
+                        with spans.span("step", label=f"{wf_step.order}:action"):
+                            validation_result: ValidationResult = (
+                                self.execute_workflow_step(
+                                    step=wf_step,
+                                    validation_run=validation_run,
+                                )
                             )
-                        )
                     except Exception as exc:
                         # Persist failure and keep step_metrics in sync.
                         self._finalize_step_run(
@@ -1059,11 +1107,55 @@ class StepOrchestrator:
         """
         from validibot.validations.services.step_processor import get_step_processor
 
-        processor = get_step_processor(validation_run, step_run)
-        return processor.execute()
+        validator = step_run.workflow_step.validator
+        validation_type = getattr(validator, "validation_type", "") or ""
+        started = time.perf_counter()
+        outcome = "error"
+        sampler = start_step_cpu_profile(validation_run)
+        try:
+            with spans.span("step", label=f"{step_run.step_order}:{validation_type}"):
+                processor = get_step_processor(validation_run, step_run)
+                result = processor.execute()
+            if result.passed is None:
+                outcome = "pending"
+            else:
+                outcome = "passed" if result.passed else "failed"
+            return result
+        finally:
+            if sampler is not None:
+                finish_step_cpu_profile(sampler, step_run=step_run)
+            STEP_DURATION_SECONDS.labels(
+                validation_type=validation_type,
+                outcome=outcome,
+            ).observe(time.perf_counter() - started)
 
     # ---------- Helpers ----------
 
+    def _store_run_profile(
+        self,
+        *,
+        run_id: UUID | str,
+        profile: dict[str, Any],
+        resume_from_step: int | None,
+    ) -> None:
+        """Attach a pass's span tree to the run summary, if one exists.
+
+        Profiling is diagnostic: a failure here is logged and never affects
+        the run. The profile lives in ``ValidationRunSummary.extras`` because
+        the summary survives finding purges and is not covered by the output
+        hash, so adding timings cannot change a run's sealed result.
+        """
+        if resume_from_step is not None:
+            profile["resume_from_step"] = resume_from_step
+        try:
+            summary = ValidationRunSummary.objects.filter(run_id=run_id).first()
+            if summary is None:
+                return
+            summary.extras = {**(summary.extras or {}), "profile": profile}
+            summary.save(update_fields=["extras", "modified"])
+        except Exception:
+            logger.exception("Failed to store execution profile for run %s", run_id)
+
     def _resolve_run_actor(
         self,
         validation_run: ValidationRun,
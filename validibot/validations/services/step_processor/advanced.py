@@ -9,13 +9,19 @@ from __future__ import annotations
 
 import logging
 from collections import Counter
+from dataclasses import dataclass
+from dataclasses import field
 from typing import Any
 
+from django.conf import settings
+
 from validibot.validations.constants import ExecutionAttemptState
 from validibot.validations.constants import Severity
 from validibot.validations.constants import StepStatus
 from validibot.validations.constants import ValidatorExecutionProfile
 from validibot.validations.models import ValidationFinding
+from validibot.validations.services.envelope_stream import MESSAGES_PATH
+from validibot.validations.services.envelope_stream import StreamedOutputEnvelope
 from validibot.validations.services.step_processor.base import ValidationStepProcessor
 from validibot.validations.services.step_processor.result import StepProcessingResult
 from validibot.validations.validators.base import ValidationIssue
@@ -23,6 +29,25 @@ from validibot.validations.validators.base import ValidationResult
 
 logger = logging.getLogger(__name__)
 
+# Findings persisted per bulk_create when a streamed envelope is drained. This
+# bounds how many ValidationIssue / ValidationFinding objects are alive at once.
+DEFAULT_STREAM_BATCH_SIZE = 1000
+
+# A failed streamed envelope may carry an enormous number of ERROR messages;
+# only this many are folded into ``step_run.error``.
+STREAMED_ERROR_MESSAGE_LIMIT = 100
+
+
+@dataclass
+class _StreamedIssueTotals:
+    """Running totals gathered while draining a streamed envelope."""
+
+    severity_counts: Counter = field(default_factory=Counter)
+    assertion_failures: int = 0
+    container_errors: int = 0
+    error_messages: list[str] = field(default_factory=list)
+    omitted_error_messages: int = 0
+
 
 class AdvancedValidationProcessor(ValidationStepProcessor):
     """
@@ -309,7 +334,20 @@ class AdvancedValidationProcessor(ValidationStepProcessor):
         Complete the step using the output envelope.
 
         Called by both sync execution and async callback paths.
+
+        A ``StreamedOutputEnvelope`` is processed in two parts: its header goes
+        through ``post_execute_validate()`` like any envelope, and its large
+        arrays are drained into findings in batches by
+        ``_persist_streamed_issues()``.
         """
+        streamed = (
+            output_envelope
+            if isinstance(output_envelope, StreamedOutputEnvelope)
+            else None
+        )
+        if streamed is not None:
+            output_envelope = streamed.header
+
         # Call validator.post_execute_validate() - this:
         # 1. Extracts step output values from the envelope
         # 2. Evaluates output-stage assertions using those values
@@ -320,6 +358,15 @@ class AdvancedValidationProcessor(ValidationStepProcessor):
             run_context,
         )
 
+        # Streamed findings are persisted first so they keep the same
+        # relative order (container findings, then assertion findings) as the
+        # in-memory path.
+        streamed_totals = (
+            self._persist_streamed_issues(validator_instance, streamed)
+            if streamed is not None
+            else _StreamedIssueTotals()
+        )
+
         from validibot_shared.validations.envelopes import ValidationStatus
 
         # ── Container-reported ERROR findings on a SUCCESS envelope ──
@@ -344,9 +391,12 @@ class AdvancedValidationProcessor(ValidationStepProcessor):
             for issue in post_result.issues
             if issue.severity == Severity.ERROR and issue.assertion_id is None
         ]
+        container_error_count = (
+            len(container_error_issues) + streamed_totals.container_errors
+        )
         success_with_container_errors = (
             output_envelope.status == ValidationStatus.SUCCESS
-            and bool(container_error_issues)
+            and container_error_count > 0
         )
         custom_container_failure = (
             success_with_container_errors and not self.validator.is_system
@@ -356,7 +406,7 @@ class AdvancedValidationProcessor(ValidationStepProcessor):
                 "Advanced validator reported SUCCESS with ERROR findings: "
                 "step_run_id=%s error_count=%s is_system=%s",
                 self.step_run.id,
-                len(container_error_issues),
+                container_error_count,
                 self.validator.is_system,
             )
             if custom_container_failure:
@@ -390,7 +440,9 @@ class AdvancedValidationProcessor(ValidationStepProcessor):
         )
 
         # Merge severity counts
-        severity_counts = existing_severity_counts + output_counts
+        severity_counts = (
+            existing_severity_counts + streamed_totals.severity_counts + output_counts
+        )
 
         # Store canonical values for downstream steps.
         self.store_output_values(post_result.output_values or {})
@@ -413,7 +465,10 @@ class AdvancedValidationProcessor(ValidationStepProcessor):
         has_assertion_errors = post_result.assertion_stats.failures > 0
         if has_assertion_errors or custom_container_failure:
             status = StepStatus.FAILED
-        error = self._extract_error(output_envelope)
+        if streamed is not None:
+            error = self._streamed_error(output_envelope, streamed_totals)
+        else:
+            error = self._extract_error(output_envelope)
         if custom_container_failure and not error:
             # A SUCCESS envelope yields no envelope-level error string, so give
             # the failed step a meaningful reason for the run record.
@@ -421,6 +476,12 @@ class AdvancedValidationProcessor(ValidationStepProcessor):
 
         # Include full envelope in step output (JSON-safe serialization)
         stats = self._serialize_envelope(output_envelope)
+        if streamed is not None:
+            # The header carries empty arrays; record how many items the
+            # container actually returned.
+            stats["streamed_item_counts"] = {
+                ".".join(path): count for path, count in streamed.item_counts.items()
+            }
         from validibot.validations.services.artifacts import register_output_artifacts
 
         artifact_refs = register_output_artifacts(
@@ -444,6 +505,77 @@ class AdvancedValidationProcessor(ValidationStepProcessor):
             assertion_total=assertion_total,
         )
 
+    def _persist_streamed_issues(
+        self,
+        validator_instance,
+        streamed: StreamedOutputEnvelope,
+    ) -> _StreamedIssueTotals:
+        """Drain a streamed envelope's arrays into findings, batch by batch.
+
+        The validator decides which arrays produce findings
+        (``streamed_issue_paths``) and how each item maps to an issue
+        (``issue_from_streamed_item``). ``messages`` is always walked for a
+        non-SUCCESS envelope so the step error can be built, mirroring
+        ``_extract_error``.
+        """
+        from validibot_shared.validations.envelopes import ValidationStatus
+
+        totals = _StreamedIssueTotals()
+        issue_paths = set(validator_instance.streamed_issue_paths(streamed.header))
+        collect_errors = streamed.status != ValidationStatus.SUCCESS
+        walk_paths = set(issue_paths)
+        if collect_errors:
+            walk_paths.add(MESSAGES_PATH)
+        batch_size = getattr(
+            settings,
+            "VALIDATION_RESULT_STREAM_BATCH_SIZE",
+            DEFAULT_STREAM_BATCH_SIZE,
+        )
+
+        batch: list[ValidationIssue] = []
+
+        def flush() -> None:
+            counts, failures = self.persist_findings(batch, append=True)
+            totals.severity_counts += counts
+            totals.assertion_failures += failures
+            batch.clear()
+
+        for path, item in streamed.iter_items(walk_paths):
+            if (
+                collect_errors
+                and path == MESSAGES_PATH
+                and str(item.severity).upper() == "ERROR"
+            ):
+                if len(totals.error_messages) < STREAMED_ERROR_MESSAGE_LIMIT:
+                    totals.error_messages.append(item.text)
+                else:
+                    totals.omitted_error_messages += 1
+            if path not in issue_paths:
+                continue
+            issue = validator_instance.issue_from_streamed_item(path, item)
+            if issue is None:
+                continue
+            if issue.severity == Severity.ERROR and issue.assertion_id is None:
+                totals.container_errors += 1
+            batch.append(issue)
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+        return totals
+
+    @staticmethod
+    def _streamed_error(output_envelope, totals: _StreamedIssueTotals) -> str:
+        """``_extract_error`` for a streamed envelope, capped in size."""
+        from validibot_shared.validations.envelopes import ValidationStatus
+
+        if output_envelope.status == ValidationStatus.SUCCESS:
+            return ""
+        lines = list(totals.error_messages)
+        if totals.omitted_error_messages:
+            lines.append(f"… {totals.omitted_error_messages} more error messages")
+        return "\n".join(lines)
+
     def _record_pending_state(self, result: ValidationResult) -> None:
         """Record execution metadata and input-stage assertion stats for async steps."""
         self.step_run.output = {
@@ -8,6 +8,7 @@ logic and assertion evaluation.
 from __future__ import annotations
 
 import logging
+import time
 from abc import ABC
 from abc import abstractmethod
 from collections import Counter
@@ -16,9 +17,12 @@ from typing import Any
 
 from django.utils import timezone
 
+from validibot.core import spans
 from validibot.validations.constants import Severity
 from validibot.validations.constants import StepStatus
 from validibot.validations.models import ValidationFinding
+from validibot.validations.services.findings_persistence import FINDINGS_PERSIST_SECONDS
+from validibot.validations.services.findings_persistence import FINDINGS_PERSISTED
 from validibot.validations.validators.base import AssertionStats
 from validibot.validations.validators.base import ValidationIssue
 
@@ -85,6 +89,7 @@ class ValidationStepProcessor(ABC):
             self.workflow_step,
         ).build()
 
+    @spans.traced("persistence")
     def persist_findings(
         self,
         issues: list[ValidationIssue],
@@ -102,6 +107,7 @@ class ValidationStepProcessor(ABC):
         Returns:
             Tuple of (severity_counts, assertion_failures)
         """
+        started = time.monotonic()
         if not append:
             # Delete existing findings for this step
             ValidationFinding.objects.filter(
@@ -141,6 +147,9 @@ class ValidationStepProcessor(ABC):
         if findings_to_create:
             ValidationFinding.objects.bulk_create(findings_to_create, batch_size=500)
 
+        FINDINGS_PERSIST_SECONDS.observe(time.monotonic() - started)
+        for severity, count in severity_counts.items():
+            FINDINGS_PERSISTED.labels(severity=severity).inc(count)
         return severity_counts, assertion_failures
 
     def _coerce_severity(self, severity: Any) -> str:
@@ -26,6 +26,7 @@ from typing import Any
 
 from django.db.models import Count
 
+from validibot.core import spans
 from validibot.validations.constants import Severity
 from validibot.validations.models import ValidationFinding
 from validibot.validations.models import ValidationRunSummary
@@ -76,6 +77,7 @@ def rebuild_run_summary_record(
     )
 
 
+@spans.traced("summary")
 def build_run_summary_record(
     *,
     validation_run: ValidationRun,
@@ -123,6 +125,8 @@ def build_run_summary_record(
         # assertion_total comes from stats under various keys
         assertion_total += extract_assertion_total(output)
 
+    # ``extras`` is deliberately not in ``defaults``: a rebuild recomputes the
+    # counts but keeps an execution profile attached by the orchestrator.
     summary_record, _ = ValidationRunSummary.objects.update_or_create(
         run=validation_run,
         defaults={
@@ -134,7 +138,6 @@ def build_run_summary_record(
             "info_count": severity_totals.get(Severity.INFO, 0),
             "assertion_failure_count": assertion_failures,
             "assertion_total_count": assertion_total,
-            "extras": {},
         },
     )
 
@@ -20,6 +20,9 @@ handles all assertion types (CEL, etc.) for the output stage.
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from dataclasses import field
 from datetime import UTC
@@ -27,6 +30,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import cast
+from uuid import UUID
 
 from django.conf import settings
 from django.db import DatabaseError
@@ -38,6 +42,7 @@ from rest_framework.response import Response
 from validibot_shared.validations.envelopes import ValidationCallback
 from validibot_shared.validations.envelopes import ValidationStatus
 
+from validibot.core import metrics
 from validibot.core.models import CallbackReceiptStatus
 from validibot.validations.constants import VALIDATION_RUN_TERMINAL_STATUSES
 from validibot.validations.constants import StepStatus
@@ -48,15 +53,15 @@ from validibot.validations.models import ValidationRun
 from validibot.validations.models import ValidationStepRun
 from validibot.validations.services.attempt_paths import validate_attempt_gcs_uri
 from validibot.validations.services.cloud_run.gcs_client import download_envelope
+from validibot.validations.services.envelope_stream import EnvelopeSpool
+from validibot.validations.services.envelope_stream import envelope_sha256
+from validibot.validations.services.envelope_stream import open_streamed_spool
 from validibot.validations.services.output_envelope_verifier import (
     OutputEnvelopeVerificationError,
 )
 from validibot.validations.services.output_envelope_verifier import (
     build_expected_output_envelope,
 )
-from validibot.validations.services.output_envelope_verifier import (
-    output_envelope_sha256,
-)
 from validibot.validations.services.output_envelope_verifier import (
     verify_output_envelope,
 )
@@ -69,6 +74,24 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# ``mode`` separates the single endpoint from batch items; a batch observes one
+# processing-time sample for the whole request, not one per callback.
+CALLBACKS = metrics.counter(
+    "validibot_callbacks_total",
+    "Validator callbacks handled, by delivery mode and HTTP status class.",
+    labelnames=("mode", "status_class"),
+)
+CALLBACK_SECONDS = metrics.histogram(
+    "validibot_callback_processing_seconds",
+    "Wall-clock time to handle one callback request.",
+    labelnames=("mode",),
+)
+
+
+def _record_callback(mode: str, status_code: int) -> None:
+    CALLBACKS.labels(mode=mode, status_class=f"{status_code // 100}xx").inc()
+
+
 # ── Allowlisted GCS prefix for callback result URIs ───────────────────
 #
 # The worker callback endpoint receives ``result_uri`` as a free-form string
@@ -129,9 +152,149 @@ class _CallbackRequest:
     result_uri: str
 
 
+@dataclass(slots=True)
+class _PrefetchedEnvelope:
+    """An output envelope downloaded ahead of its receipt lock by the batch path.
+
+    Holds either the downloaded value or the exception the download raised,
+    so the per-callback pipeline can surface the failure exactly as if it had
+    performed the read itself.
+    """
+
+    result_uri: str
+    envelope_class: type
+    value: Any = None
+    error: BaseException | None = None
+    consumed: bool = False
+
+    def matches(self, result_uri: str, envelope_class: type) -> bool:
+        return (
+            not self.consumed
+            and self.result_uri == result_uri
+            and self.envelope_class is envelope_class
+        )
+
+    def take(self):
+        """Hand the download to the pipeline, which then owns its cleanup."""
+        self.consumed = True
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def discard(self) -> None:
+        """Release a spool that was downloaded but never processed."""
+        if not self.consumed and isinstance(self.value, EnvelopeSpool):
+            self.value.close()
+        self.consumed = True
+        self.value = None
+
+
+class _EnvelopePrefetcher:
+    """Downloads a batch's envelopes a bounded window ahead of processing.
+
+    Callbacks are finalised one at a time in request order, so downloads are
+    submitted in that order and at most ``window`` of them are in flight or
+    downloaded-but-unprocessed at once. Memory therefore scales with the
+    download concurrency rather than with the batch size.
+    """
+
+    def __init__(
+        self,
+        downloads: dict[str, _PrefetchedEnvelope],
+        *,
+        window: int,
+    ) -> None:
+        self._downloads = downloads
+        self._order = list(downloads)
+        self._window = window
+        self._next = 0
+        self._futures: dict[str, Future] = {}
+        self._settled: set[str] = set()
+        self._released: set[str] = set()
+        self._pool = (
+            ThreadPoolExecutor(max_workers=window, thread_name_prefix="callback-batch")
+            if downloads
+            else None
+        )
+
+    def get(self, callback_id: str) -> _PrefetchedEnvelope | None:
+        """Return ``callback_id``'s download once it has finished."""
+        download = self._downloads.get(callback_id)
+        if download is None:
+            return None
+        self._fill()
+        if callback_id not in self._futures:
+            # Requested out of order; fetch it now rather than not at all.
+            self._submit(callback_id)
+        self._settle(callback_id)
+        return download
+
+    def release(self, callback_id: str) -> None:
+        """Free ``callback_id``'s window slot once it has been finalised."""
+        if callback_id not in self._futures or callback_id in self._released:
+            return
+        self._released.add(callback_id)
+        self._downloads[callback_id].discard()
+
+    def close(self) -> None:
+        """Cancel queued downloads and release everything still held."""
+        if self._pool is None:
+            return
+        for future in self._futures.values():
+            future.cancel()
+        self._pool.shutdown(wait=True)
+        for callback_id, download in self._downloads.items():
+            if callback_id not in self._released:
+                self._settle(callback_id)
+            download.discard()
+
+    def _fill(self) -> None:
+        while (
+            self._next < len(self._order)
+            and len(self._futures) - len(self._released) < self._window
+        ):
+            callback_id = self._order[self._next]
+            self._next += 1
+            if callback_id not in self._futures:
+                self._submit(callback_id)
+
+    def _submit(self, callback_id: str) -> None:
+        download = self._downloads[callback_id]
+        self._futures[callback_id] = self._pool.submit(
+            _fetch_envelope,
+            download.result_uri,
+            download.envelope_class,
+        )
+
+    def _settle(self, callback_id: str) -> None:
+        future = self._futures.get(callback_id)
+        if future is None or future.cancelled() or callback_id in self._settled:
+            return
+        self._settled.add(callback_id)
+        download = self._downloads[callback_id]
+        try:
+            download.value = future.result()
+        except Exception as exc:
+            download.error = exc
+
+
 # ── Helpers ───────────────────────────────────────────────────────────
 
 
+def _fetch_envelope(result_uri: str, envelope_class: type):
+    """Download one output envelope with the configured size limits."""
+    return download_envelope(
+        result_uri,
+        envelope_class,
+        max_bytes=getattr(settings, "VALIDATION_RESULT_MAX_BYTES", None),
+        stream_threshold_bytes=getattr(
+            settings,
+            "VALIDATION_RESULT_STREAM_THRESHOLD_BYTES",
+            None,
+        ),
+    )
+
+
 def _coerce_finished_at(finished_at_candidate) -> datetime:
     """Normalize finished_at to an aware datetime in UTC."""
     if finished_at_candidate is None:
@@ -218,6 +381,13 @@ class ValidationCallbackService:
         Returns:
             DRF Response with an appropriate status code and body.
         """
+        started = time.monotonic()
+        response = self._process_single(payload=payload, caller_email=caller_email)
+        CALLBACK_SECONDS.labels(mode="single").observe(time.monotonic() - started)
+        _record_callback("single", response.status_code)
+        return response
+
+    def _process_single(self, *, payload: dict, caller_email: str) -> Response:
         try:
             # The callback is intentionally minimal — it just says "run X
             # finished with status Y, go fetch the full results from this URI."
@@ -284,6 +454,282 @@ class ValidationCallbackService:
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def process_batch(
+        self,
+        *,
+        payloads: Any,
+        caller_email: str = "",
+    ) -> Response:
+        """
+        Validate and process many validator callbacks in one request.
+
+        A large parameter sweep can complete hundreds of runs at once. Sending
+        each completion through ``process`` separately costs one receipt
+        lookup, one storage round-trip and one set of transactions per
+        request, all serialised behind the worker. This path amortises the
+        lookups and overlaps the storage reads while keeping every
+        per-callback guarantee:
+
+        1. Payloads are validated individually; a bad item is a 400 for that
+           item only.
+        2. Runs, execution attempts and existing receipts are each loaded in
+           one query. Every callback is still authenticated against its own
+           attempt before anything else happens.
+        3. Callbacks whose receipt is already terminal get the same cached
+           response as a redelivery to the single endpoint, without locking.
+        4. Output envelopes for the remaining callbacks are downloaded
+           concurrently (after the result URI allowlist check), a bounded
+           window ahead of processing, while each callback is finalised in
+           its own atomic block under its receipt lock, exactly as
+           ``process`` would.
+
+        Returns:
+            DRF Response with a ``results`` list holding one
+            ``{"callback_id", "status_code", "body"}`` entry per payload, in
+            request order. The HTTP status is 503 when any item is worth
+            retrying (lock contention or a server error) so the delivering
+            queue redelivers the batch; completed items then replay as
+            idempotent no-ops.
+        """
+        started = time.monotonic()
+        max_size = settings.VALIDATION_CALLBACK_BATCH_MAX_SIZE
+        if not isinstance(payloads, list) or not payloads:
+            return Response(
+                {"error": "Invalid callback batch payload"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(payloads) > max_size:
+            return Response(
+                {"error": f"Callback batch exceeds {max_size} callbacks"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        responses: list[Response | None] = [None] * len(payloads)
+        callbacks: list[tuple[int, _CallbackRequest]] = []
+        for index, payload in enumerate(payloads):
+            try:
+                validated_callback = ValidationCallback.model_validate(payload)
+            except ValidationError:
+                logger.warning(
+                    "Invalid callback payload in batch",
+                    extra={"event": "validator_callback_failure"},
+                )
+                responses[index] = Response(
+                    {"error": "Invalid callback payload"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+                continue
+            callbacks.append(
+                (
+                    index,
+                    _CallbackRequest(
+                        run_id=validated_callback.run_id,
+                        callback_id=validated_callback.callback_id,
+                        callback_nonce=validated_callback.callback_nonce,
+                        status=validated_callback.status,
+                        result_uri=validated_callback.result_uri,
+                    ),
+                )
+            )
+
+        try:
+            pending = self._screen_batch(
+                callbacks,
+                responses,
+                caller_email=caller_email,
+            )
+            prefetcher = self._prefetch_envelopes(pending)
+        except Exception:
+            logger.exception(
+                "Unexpected error processing callback batch",
+                extra={"event": "validator_callback_failure"},
+            )
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        try:
+            for index, callback, run, attempt in pending:
+                try:
+                    responses[index] = self._process_with_receipt_lock(
+                        callback,
+                        run,
+                        attempt,
+                        prefetched=prefetcher.get(callback.callback_id),
+                    )
+                except Exception:
+                    logger.exception(
+                        "Unexpected error processing callback",
+                        extra={"event": "validator_callback_failure"},
+                    )
+                    responses[index] = Response(
+                        {"error": "Internal server error"},
+                        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    )
+                finally:
+                    prefetcher.release(callback.callback_id)
+        finally:
+            prefetcher.close()
+
+        results = []
+        for payload, response in zip(payloads, responses, strict=True):
+            callback_id = (
+                payload.get("callback_id") if isinstance(payload, dict) else None
+            )
+            results.append(
+                {
+                    "callback_id": callback_id,
+                    "status_code": response.status_code,
+                    "body": response.data,
+                }
+            )
+            _record_callback("batch", response.status_code)
+        CALLBACK_SECONDS.labels(mode="batch").observe(time.monotonic() - started)
+        retry = any(
+            status.is_server_error(result["status_code"])
+            or result["status_code"] == status.HTTP_409_CONFLICT
+            for result in results
+        )
+        logger.info(
+            "Processed callback batch of %s (retry=%s)",
+            len(results),
+            retry,
+        )
+        return Response(
+            {"results": results, "retry": retry},
+            status=(
+                status.HTTP_503_SERVICE_UNAVAILABLE if retry else status.HTTP_200_OK
+            ),
+        )
+
+    def _screen_batch(
+        self,
+        callbacks: list[tuple[int, _CallbackRequest]],
+        responses: list[Response | None],
+        *,
+        caller_email: str,
+    ) -> list[tuple[int, _CallbackRequest, ValidationRun, ExecutionAttempt]]:
+        """Resolve and authenticate a batch with one query per table.
+
+        Items settled here (unknown run, failed authentication, terminal
+        receipt) have their response written into ``responses``; the rest are
+        returned for processing in request order.
+        """
+        from validibot.validations.services.execution_attempts import (
+            resolve_callback_attempts,
+        )
+
+        run_ids = set()
+        for _index, callback in callbacks:
+            try:
+                run_ids.add(UUID(str(callback.run_id)))
+            except ValueError:
+                continue
+        runs = {
+            str(pk): run for pk, run in ValidationRun.objects.in_bulk(run_ids).items()
+        }
+        attempts = resolve_callback_attempts(
+            (callback.callback_id, callback.run_id) for _index, callback in callbacks
+        )
+        receipts = CallbackReceipt.objects.in_bulk(
+            {callback.callback_id for _index, callback in callbacks},
+            field_name="callback_id",
+        )
+
+        pending = []
+        for index, callback in callbacks:
+            run = runs.get(str(callback.run_id))
+            if run is None:
+                logger.warning("Validation run not found: %s", callback.run_id)
+                responses[index] = Response(
+                    {"error": "Validation run not found"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+                continue
+            attempt = attempts.get(callback.callback_id)
+            try:
+                self._authenticate_attempt(
+                    callback,
+                    run,
+                    attempt,
+                    require_callback_nonce=True,
+                    caller_email=caller_email,
+                )
+            except _CallbackProcessingError as exc:
+                responses[index] = Response(
+                    {"error": exc.detail},
+                    status=exc.status_code,
+                )
+                continue
+            receipt = receipts.get(callback.callback_id)
+            if (
+                receipt is not None
+                and receipt.status != CallbackReceiptStatus.PROCESSING
+                and receipt.execution_attempt_id == attempt.pk
+            ):
+                # Terminal receipts never return to PROCESSING, so the
+                # cached answer needs no row lock.
+                responses[index] = self._replayed_receipt_response(callback, receipt)
+                continue
+            pending.append((index, callback, run, attempt))
+        return pending
+
+    def _prefetch_envelopes(
+        self,
+        pending: list[tuple[int, _CallbackRequest, ValidationRun, ExecutionAttempt]],
+    ) -> _EnvelopePrefetcher:
+        """Plan the batch's output envelope downloads.
+
+        Only callbacks that will plausibly be processed are fetched: the run
+        and attempt must still be live, the URI must be the one the attempt
+        committed to and pass the allowlist, and the validator must have an
+        envelope class. Anything else is left to the per-callback pipeline,
+        which reaches the same verdict without a download. The returned
+        prefetcher runs the downloads a bounded window ahead of processing;
+        its worker threads touch storage only, never the database.
+        """
+        downloads: dict[str, _PrefetchedEnvelope] = {}
+        for _index, callback, run, attempt in pending:
+            if callback.callback_id in downloads:
+                continue
+            if (
+                attempt.is_terminal
+                or run.status in VALIDATION_RUN_TERMINAL_STATUSES
+                or (callback.result_uri or "") != attempt.output_envelope_uri
+            ):
+                continue
+            validator = attempt.step_run.workflow_step.validator
+            if validator is None:
+                continue
+            try:
+                self._validate_result_uri_allowlist(
+                    callback.result_uri or "",
+                    run,
+                    attempt,
+                )
+                expected = build_expected_output_envelope(
+                    run=run,
+                    validator=validator,
+                    attempt=attempt,
+                )
+            except (_CallbackProcessingError, OutputEnvelopeVerificationError):
+                continue
+            downloads[callback.callback_id] = _PrefetchedEnvelope(
+                result_uri=callback.result_uri,
+                envelope_class=expected.envelope_class,
+            )
+        return _EnvelopePrefetcher(
+            downloads,
+            window=max(
+                1,
+                min(
+                    settings.VALIDATION_CALLBACK_BATCH_DOWNLOAD_CONCURRENCY,
+                    len(downloads),
+                ),
+            ),
+        )
+
     def process_reconciliation(
         self,
         *,
@@ -374,54 +820,98 @@ class ValidationCallbackService:
             callback.callback_id,
             run_id=run.pk,
         )
+        try:
+            self._authenticate_attempt(
+                callback,
+                run,
+                attempt,
+                require_callback_nonce=require_callback_nonce,
+                caller_email=caller_email,
+            )
+        except _CallbackProcessingError as exc:
+            return Response({"error": exc.detail}, status=exc.status_code)
+        return self._process_with_receipt_lock(callback, run, attempt)
+
+    @staticmethod
+    def _authenticate_attempt(
+        callback: _CallbackRequest,
+        run: ValidationRun,
+        attempt: ExecutionAttempt | None,
+        *,
+        require_callback_nonce: bool,
+        caller_email: str,
+    ) -> None:
+        """Authenticate delivery against its attempt before reading any output.
+
+        Raises:
+            _CallbackProcessingError: If the callback is not bound to an
+                attempt of ``run``, its nonce does not verify, or a managed
+                deployment's pinned runtime identity does not match.
+        """
         if attempt is None:
             logger.warning(
                 "Rejected callback that was not bound to an execution attempt",
                 extra={"run_id": str(run.pk)},
             )
-            return Response(
-                {"error": "Callback does not identify a valid execution attempt"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        if require_callback_nonce:
-            from validibot.validations.services.execution_attempts import (
-                verify_attempt_callback_nonce,
+            raise _CallbackProcessingError(
+                status.HTTP_400_BAD_REQUEST,
+                "Callback does not identify a valid execution attempt",
             )
+        if not require_callback_nonce:
+            return
+
+        from validibot.validations.services.execution_attempts import (
+            verify_attempt_callback_nonce,
+        )
 
-            if not verify_attempt_callback_nonce(attempt, callback.callback_nonce):
+        if not verify_attempt_callback_nonce(attempt, callback.callback_nonce):
+            logger.warning(
+                "Rejected callback with invalid attempt credentials",
+                extra={
+                    "run_id": str(run.pk),
+                    "attempt_id": str(attempt.pk),
+                },
+            )
+            raise _CallbackProcessingError(
+                status.HTTP_400_BAD_REQUEST,
+                "Invalid callback credentials",
+            )
+        if attempt.deployment_id:
+            expected_identity = str(
+                attempt.deployment_snapshot.get(
+                    "expected_runtime_identity",
+                    "",
+                )
+            ).lower()
+            if not expected_identity or caller_email.lower() != expected_identity:
                 logger.warning(
-                    "Rejected callback with invalid attempt credentials",
+                    "Rejected callback from runtime identity not pinned to "
+                    "the execution attempt",
                     extra={
                         "run_id": str(run.pk),
                         "attempt_id": str(attempt.pk),
+                        "caller_email": caller_email,
+                        "deployment_id": str(attempt.deployment_id),
                     },
                 )
-                return Response(
-                    {"error": "Invalid callback credentials"},
-                    status=status.HTTP_400_BAD_REQUEST,
+                raise _CallbackProcessingError(
+                    status.HTTP_403_FORBIDDEN,
+                    "Callback runtime identity does not match attempt",
                 )
-            if attempt.deployment_id:
-                expected_identity = str(
-                    attempt.deployment_snapshot.get(
-                        "expected_runtime_identity",
-                        "",
-                    )
-                ).lower()
-                if not expected_identity or caller_email.lower() != expected_identity:
-                    logger.warning(
-                        "Rejected callback from runtime identity not pinned to "
-                        "the execution attempt",
-                        extra={
-                            "run_id": str(run.pk),
-                            "attempt_id": str(attempt.pk),
-                            "caller_email": caller_email,
-                            "deployment_id": str(attempt.deployment_id),
-                        },
-                    )
-                    return Response(
-                        {"error": "Callback runtime identity does not match attempt"},
-                        status=status.HTTP_403_FORBIDDEN,
-                    )
+
+    def _process_with_receipt_lock(
+        self,
+        callback: _CallbackRequest,
+        run: ValidationRun,
+        attempt: ExecutionAttempt,
+        *,
+        prefetched: _PrefetchedEnvelope | None = None,
+    ) -> Response:
+        """Run steps 3-6 of the idempotency guard for an authenticated callback.
+
+        ``prefetched`` carries an envelope the batch path already downloaded
+        concurrently; it replaces the storage read but not any of the checks.
+        """
         try:
             with transaction.atomic():
                 receipt, receipt_created = self._get_or_create_receipt(
@@ -445,33 +935,9 @@ class ValidationCallbackService:
                             status=status.HTTP_400_BAD_REQUEST,
                         )
                     if receipt.status != CallbackReceiptStatus.PROCESSING:
-                        was_rejected = receipt.status == CallbackReceiptStatus.REJECTED
-                        logger.info(
-                            "Callback %s already in terminal state %s "
-                            "(received at %s), returning cached response",
-                            callback.callback_id,
-                            receipt.status,
-                            receipt.received_at,
-                        )
-                        # Return a 200 even for a REJECTED receipt: the callback
-                        # was permanently rejected on the first attempt, so we
-                        # must stop Cloud Tasks from retrying it. Returning
-                        # inside the atomic block also exits cleanly, releasing
-                        # the row lock.
-                        return Response(
-                            {
-                                "message": (
-                                    "Callback already rejected"
-                                    if was_rejected
-                                    else "Callback already processed"
-                                ),
-                                "idempotent_replayed": True,
-                                "original_received_at": (
-                                    receipt.received_at.isoformat()
-                                ),
-                            },
-                            status=status.HTTP_200_OK,
-                        )
+                        # Returning inside the atomic block exits cleanly,
+                        # releasing the row lock.
+                        return self._replayed_receipt_response(callback, receipt)
 
                     logger.info(
                         "Callback %s still PROCESSING (previous attempt "
@@ -508,6 +974,7 @@ class ValidationCallbackService:
                     run=run,
                     receipt=receipt,
                     attempt=attempt,
+                    prefetched=prefetched,
                 )
 
         except DatabaseError:
@@ -525,6 +992,36 @@ class ValidationCallbackService:
                 status=status.HTTP_409_CONFLICT,
             )
 
+    @staticmethod
+    def _replayed_receipt_response(
+        callback: _CallbackRequest,
+        receipt: CallbackReceipt,
+    ) -> Response:
+        """Acknowledge a redelivery of a callback whose receipt is terminal."""
+        was_rejected = receipt.status == CallbackReceiptStatus.REJECTED
+        logger.info(
+            "Callback %s already in terminal state %s "
+            "(received at %s), returning cached response",
+            callback.callback_id,
+            receipt.status,
+            receipt.received_at,
+        )
+        # Return a 200 even for a REJECTED receipt: the callback was
+        # permanently rejected on the first attempt, so we must stop Cloud
+        # Tasks from retrying it.
+        return Response(
+            {
+                "message": (
+                    "Callback already rejected"
+                    if was_rejected
+                    else "Callback already processed"
+                ),
+                "idempotent_replayed": True,
+                "original_received_at": receipt.received_at.isoformat(),
+            },
+            status=status.HTTP_200_OK,
+        )
+
     @staticmethod
     def _get_or_create_receipt(
         callback: _CallbackRequest,
@@ -562,6 +1059,7 @@ class ValidationCallbackService:
         run: ValidationRun,
         receipt: CallbackReceipt,
         attempt,
+        prefetched: _PrefetchedEnvelope | None = None,
     ) -> Response:
         """
         Orchestrate the callback processing pipeline.
@@ -577,6 +1075,7 @@ class ValidationCallbackService:
         5. Mark the receipt as completed (idempotency bookkeeping)
         """
         callback_received_at = timezone.now()
+        output_envelope = None
         try:
             step_run, validator = self._resolve_active_step_run(run)
             output_envelope = self._download_and_validate_envelope(
@@ -584,9 +1083,11 @@ class ValidationCallbackService:
                 run,
                 validator,
                 attempt,
+                prefetched=prefetched,
             )
             result = self._complete_step(run, step_run, output_envelope)
             self._finalize_or_resume(run, result)
+            output_sha256 = envelope_sha256(output_envelope)
         except _CallbackProcessingError as exc:
             # A client-error (4xx) status means the callback is permanently
             # bad — the allowlist rejected its result_uri, no output envelope
@@ -623,6 +1124,12 @@ class ValidationCallbackService:
                 {"error": exc.detail},
                 status=exc.status_code,
             )
+        finally:
+            # A streamed envelope owns a local spool file; release it once
+            # findings are persisted and the canonical hash is recorded.
+            close = getattr(output_envelope, "close", None)
+            if callable(close):
+                close()
 
         from validibot.validations.constants import ExecutionAttemptState
         from validibot.validations.services.execution_attempts import (
@@ -640,7 +1147,7 @@ class ValidationCallbackService:
             ),
             callback_received_at=callback_received_at,
             output_envelope_uri=callback.result_uri or "",
-            output_envelope_sha256=output_envelope_sha256(output_envelope),
+            output_envelope_sha256=output_sha256,
         )
 
         self._mark_receipt_completed(callback, receipt, run)
@@ -768,6 +1275,8 @@ class ValidationCallbackService:
         run: ValidationRun,
         validator,
         attempt,
+        *,
+        prefetched: _PrefetchedEnvelope | None = None,
     ):
         """
         Download the output envelope from GCS and verify it matches expectations.
@@ -781,6 +1290,14 @@ class ValidationCallbackService:
         ``_validate_result_uri_allowlist``) so a misbehaving container cannot
         turn the worker into an arbitrary-object reader.
 
+        Envelopes at or above ``VALIDATION_RESULT_STREAM_THRESHOLD_BYTES`` are
+        spooled to local disk and returned as a ``StreamedOutputEnvelope``
+        whose header identity is verified here, before any findings are read.
+
+        A ``prefetched`` download (from ``process_batch``) is used in place
+        of the storage read only when it was fetched from the same URI for the
+        same envelope class; every check above and below still applies.
+
         Raises:
             _CallbackProcessingError: On allowlist violation, download failure,
                 missing envelope class, or validator/run ID mismatch.
@@ -816,18 +1333,16 @@ class ValidationCallbackService:
             ) from exc
 
         try:
-            output_envelope = cast(
-                "ValidationOutputEnvelope",
-                download_envelope(
+            if prefetched is not None and prefetched.matches(
+                callback.result_uri,
+                expected.envelope_class,
+            ):
+                downloaded = prefetched.take()
+            else:
+                downloaded = _fetch_envelope(
                     callback.result_uri,
                     expected.envelope_class,
-                    max_bytes=getattr(
-                        settings,
-                        "VALIDATION_RESULT_MAX_BYTES",
-                        None,
-                    ),
-                ),
-            )
+                )
         except Exception as exc:
             logger.exception("Failed to download output envelope")
             # Return a static message — the raw exception (which can carry the
@@ -840,6 +1355,9 @@ class ValidationCallbackService:
             ) from exc
 
         try:
+            if isinstance(downloaded, EnvelopeSpool):
+                return open_streamed_spool(downloaded, expected=expected)
+            output_envelope = cast("ValidationOutputEnvelope", downloaded)
             return verify_output_envelope(output_envelope, expected=expected)
         except OutputEnvelopeVerificationError as exc:
             logger.warning(
@@ -201,6 +201,13 @@ class ValidationRunLaunchResults:
     status: int | None = None
 
 
+@dataclass
+class ValidationRunBulkLaunchResults:
+    validation_runs: list[ValidationRun] = field(factory=list)
+    # Submission id -> reason, for submissions a run-created hook refused.
+    refused: dict[Any, str] = field(factory=dict)
+
+
 def fence_active_execution_attempt(
     run: ValidationRun,
     *,
@@ -316,6 +323,8 @@ class ValidationRunService:
             PermissionError: If user lacks execute permission on workflow.
         """
         from validibot.core.tasks import enqueue_validation_run
+        from validibot.validations.services.result_cache import compute_result_cache_key
+        from validibot.validations.services.result_cache import serve_from_result_cache
         from validibot.validations.services.run_admission import admit_validation_run
 
         start_time = time.perf_counter()
@@ -419,6 +428,13 @@ class ValidationRunService:
             except PermissionError as exc:
                 raise OrgPolicyDeniedError(str(exc)) from exc
 
+            # Keyed under the workflow lock, so the definition it hashes is
+            # the one this run would execute.
+            cache_key = compute_result_cache_key(workflow, submission)
+            if cache_key:
+                validation_run.result_cache_key = cache_key
+                validation_run.save(update_fields=["result_cache_key"])
+
             try:
                 if hasattr(submission, "latest_run_id"):
                     submission.latest_run = validation_run
@@ -459,42 +475,27 @@ class ValidationRunService:
             lambda: _send_run_created_signal(_run, _wtype),
         )
 
-        # Dispatch execution to the appropriate backend:
+        # Dispatch execution to the appropriate backend, unless an earlier
+        # run with the same result cache key already answers this one:
         # - Test: Synchronous inline execution
         # - Local dev: HTTP call to worker
         # - Docker Compose: Celery task queue
         # - GCP: Cloud Tasks
         # - AWS: TBD (future)
-        try:
-            enqueue_validation_run(
-                validation_run_id=validation_run.id,
-                user_id=request.user.id,
-            )
-        except Exception:
-            logger.exception(
-                "Failed to enqueue validation run %s",
-                validation_run.id,
-            )
-            validation_run.status = ValidationRunStatus.FAILED
-            validation_run.error = GENERIC_EXECUTION_ERROR
-            validation_run.error_category = ValidationRunErrorCategory.RUNTIME_ERROR
-            validation_run.ended_at = timezone.now()
-            validation_run.save(
-                update_fields=["status", "error", "error_category", "ended_at"],
-            )
-
-            # This is a terminal transition that bypasses the normal finalize
-            # paths, so emit the finalized signal here too — otherwise a launch
-            # that reserved a compute-credit hold (cloud) would not release it
-            # until the reaper runs. Idempotent with the reaper.
-            from validibot.validations.services.run_admission import (
-                emit_validation_run_finalized,
-            )
-
-            emit_validation_run_finalized(
-                sender=self.__class__,
-                validation_run=validation_run,
-            )
+        if not (
+            validation_run.result_cache_key and serve_from_result_cache(validation_run)
+        ):
+            try:
+                enqueue_validation_run(
+                    validation_run_id=validation_run.id,
+                    user_id=request.user.id,
+                )
+            except Exception:
+                logger.exception(
+                    "Failed to enqueue validation run %s",
+                    validation_run.id,
+                )
+                self._fail_undispatched_run(validation_run)
 
         # Refresh from DB to get any updates made during execution
         # This is primarily for test mode where execute_workflow_steps() runs
@@ -527,6 +528,220 @@ class ValidationRunService:
         )
         return results
 
+    def launch_many(
+        self,
+        request,
+        org: Organization,
+        workflow: Workflow,
+        submissions: list[Submission],
+        *,
+        metadata: dict | None = None,
+        extra: dict | None = None,
+        source: ValidationRunSource = ValidationRunSource.API,
+    ) -> ValidationRunBulkLaunchResults:
+        """
+        Create one ValidationRun per submission and dispatch them as a batch.
+
+        The bulk counterpart of ``launch()``. Permission and org policies are
+        checked once for the batch (policies see ``run_count`` in their
+        context), the runs are admitted with one INSERT, and dispatch goes
+        through ``enqueue_validation_runs`` so the backend can send the batch
+        in one go.
+
+        Run-created hooks still fire per run. A hook that refuses one run
+        (``PermissionError``) drops only that run; its submission's id maps to
+        the reason in ``refused``. Any other hook error aborts the batch.
+
+        Args:
+            request: The HTTP request (for the acting user).
+            org: The organization under which the runs are created.
+            workflow: The workflow every submission is validated against.
+            submissions: Saved submissions for ``workflow``, one run each.
+            metadata: Submitter metadata shared by the batch, if any.
+            extra: Additional ``ValidationRun`` fields applied to every run.
+            source: Origin of the runs.
+
+        Returns:
+            ValidationRunBulkLaunchResults with the admitted runs (refreshed
+            after dispatch) in submission order, and the refused submissions.
+
+        Raises:
+            PermissionError: If the user lacks execute permission.
+            OrgPolicyDeniedError: If an org policy blocks the batch.
+        """
+        from validibot.core.policies import check_org_policies
+        from validibot.core.run_hooks import has_run_created_hooks
+        from validibot.core.run_hooks import run_created_hooks
+        from validibot.core.tasks import enqueue_validation_runs
+        from validibot.validations.services.result_cache import (
+            build_workflow_cache_components,
+        )
+        from validibot.validations.services.result_cache import compute_result_cache_key
+        from validibot.validations.services.result_cache import serve_from_result_cache
+        from validibot.validations.services.run_admission import admit_validation_runs
+
+        start_time = time.perf_counter()
+        if not request or not getattr(request, "user", None):
+            err_msg = "Request user must be authenticated"
+            raise ValueError(err_msg)
+        if not submissions:
+            return ValidationRunBulkLaunchResults()
+        if not workflow.can_execute(user=request.user):
+            err_msg = "User does not have permission to execute this workflow"
+            raise PermissionError(err_msg)
+
+        workflow_type = getattr(workflow, "workflow_type", "BASIC")
+        allowed, reason = check_org_policies(
+            org,
+            "launch_validation_run",
+            user=request.user,
+            workflow_type=workflow_type,
+            run_count=len(submissions),
+        )
+        if not allowed:
+            raise OrgPolicyDeniedError(reason)
+
+        run_user = None
+        if getattr(submissions[0], "user_id", None):
+            run_user = submissions[0].user
+        elif getattr(request.user, "is_authenticated", False):
+            run_user = request.user
+
+        refused: dict[Any, str] = {}
+        with transaction.atomic():
+            runs = admit_validation_runs(
+                org=org,
+                workflow=workflow,
+                submissions=submissions,
+                user=run_user,
+                source=source,
+                extra=extra,
+            )
+
+            if has_run_created_hooks():
+                for run in runs:
+                    try:
+                        # A savepoint per run, so a refused run's
+                        # reservation rolls back without taking the
+                        # rest of the batch with it.
+                        with transaction.atomic():
+                            run_created_hooks(
+                                run,
+                                workflow_type=workflow_type,
+                                launching_user=request.user,
+                            )
+                    except PermissionError as exc:
+                        refused[run.submission_id] = str(exc)
+                if refused:
+                    ValidationRun.objects.filter(
+                        submission_id__in=list(refused),
+                        pk__in=[run.pk for run in runs],
+                    ).delete()
+                    runs = [run for run in runs if run.submission_id not in refused]
+
+            admitted_submissions = []
+            for run in runs:
+                run.submission.latest_run = run
+                admitted_submissions.append(run.submission)
+            type(submissions[0]).objects.bulk_update(
+                admitted_submissions,
+                ["latest_run"],
+            )
+
+            workflow_components = build_workflow_cache_components(workflow)
+            if workflow_components is not None:
+                for run in runs:
+                    run.result_cache_key = compute_result_cache_key(
+                        workflow,
+                        run.submission,
+                        workflow_components=workflow_components,
+                    )
+                ValidationRun.objects.bulk_update(runs, ["result_cache_key"])
+
+            tracking_service = TrackingEventService()
+            created_extra: dict[str, Any] = {}
+            if metadata:
+                created_extra["metadata_keys"] = sorted(metadata.keys())
+            org_had_runs = (
+                ValidationRun.objects.filter(org=org)
+                .exclude(pk__in=[run.pk for run in runs])
+                .exists()
+            )
+            for index, run in enumerate(runs):
+                tracking_service.log_validation_run_created(
+                    run=run,
+                    user=run_user,
+                    submission_id=run.submission_id,
+                    extra_data={
+                        **created_extra,
+                        "is_first_run": index == 0 and not org_had_runs,
+                    },
+                )
+
+        for run in runs:
+            transaction.on_commit(
+                lambda run=run: _send_run_created_signal(run, workflow_type),
+            )
+
+        # Runs answered from the result cache are already terminal. A batch
+        # of identical files is served by its first run once that finishes,
+        # so duplicates within one batch still execute.
+        to_dispatch = [
+            run
+            for run in runs
+            if not (run.result_cache_key and serve_from_result_cache(run))
+        ]
+        dispatch_errors = enqueue_validation_runs(
+            [run.id for run in to_dispatch],
+            user_id=request.user.id,
+        )
+        for run, error in zip(to_dispatch, dispatch_errors, strict=True):
+            if error is not None:
+                logger.error(
+                    "Failed to enqueue validation run %s: %s",
+                    run.id,
+                    error,
+                )
+                self._fail_undispatched_run(run)
+
+        # One read for the whole batch; synchronous dispatchers (tests) have
+        # already executed the runs.
+        refreshed = ValidationRun.objects.in_bulk([run.pk for run in runs])
+        results = ValidationRunBulkLaunchResults(
+            validation_runs=[refreshed[run.pk] for run in runs],
+            refused=refused,
+        )
+        logger.info(
+            "Bulk launch of %d validation runs (%d refused) completed in %.2f ms",
+            len(results.validation_runs),
+            len(refused),
+            (time.perf_counter() - start_time) * 1000,
+        )
+        return results
+
+    def _fail_undispatched_run(self, validation_run: ValidationRun) -> None:
+        """Fail a run whose dispatch failed, and emit its finalized signal."""
+        validation_run.status = ValidationRunStatus.FAILED
+        validation_run.error = GENERIC_EXECUTION_ERROR
+        validation_run.error_category = ValidationRunErrorCategory.RUNTIME_ERROR
+        validation_run.ended_at = timezone.now()
+        validation_run.save(
+            update_fields=["status", "error", "error_category", "ended_at"],
+        )
+
+        # This is a terminal transition that bypasses the normal finalize
+        # paths, so emit the finalized signal here too — otherwise a launch
+        # that reserved a compute-credit hold (cloud) would not release it
+        # until the reaper runs. Idempotent with the reaper.
+        from validibot.validations.services.run_admission import (
+            emit_validation_run_finalized,
+        )
+
+        emit_validation_run_finalized(
+            sender=self.__class__,
+            validation_run=validation_run,
+        )
+
     # ---------- Cancel ----------
 
     def cancel_run(
@@ -65,3 +65,13 @@ def _schedule_run_retention(sender, *, validation_run, **kwargs) -> None:
         stamp_evidence_manifest(validation_run)
 
     schedule_terminal_retention(validation_run)
+
+
+@receiver(validation_run_finalized, dispatch_uid="validibot_publish_run_finalized")
+def _publish_run_finalized(sender, *, validation_run, **kwargs) -> None:
+    """Wake long-polling run detail requests waiting on this run."""
+
+    del sender, kwargs
+    from validibot.validations.services.run_completion import publish_run_finalized
+
+    publish_run_finalized(validation_run.pk)
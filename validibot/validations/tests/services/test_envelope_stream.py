@@ -0,0 +1,420 @@
+"""Tests for the streaming output-envelope reader.
+
+Large Schematron/SHACL results are read incrementally so findings can be
+persisted in batches. These tests pin the three properties that make that safe
+to substitute for a full Pydantic parse:
+
+- the header and identity are verified before any item is handed out,
+- streamed items and the canonical SHA-256 are identical to the fully parsed
+  envelope, regardless of key order or chunk boundaries, and
+- the processor persists the same findings, in bounded batches.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from django.test import TestCase
+from django.test import override_settings
+from validibot_shared.shacl.envelopes import SHACLOutputEnvelope
+from validibot_shared.validations.envelopes import ValidationStatus
+
+from validibot.validations.constants import Severity
+from validibot.validations.constants import StepStatus
+from validibot.validations.constants import ValidationRunStatus
+from validibot.validations.constants import ValidationType
+from validibot.validations.models import ValidationFinding
+from validibot.validations.models import ValidationStepRun
+from validibot.validations.services import envelope_stream
+from validibot.validations.services.envelope_stream import FINDINGS_PATH
+from validibot.validations.services.envelope_stream import MESSAGES_PATH
+from validibot.validations.services.envelope_stream import EnvelopeSpool
+from validibot.validations.services.envelope_stream import StreamedOutputEnvelope
+from validibot.validations.services.envelope_stream import envelope_sha256
+from validibot.validations.services.envelope_stream import open_streamed_output_envelope
+from validibot.validations.services.envelope_stream import open_streamed_spool
+from validibot.validations.services.output_envelope_verifier import (
+    ExpectedOutputEnvelope,
+)
+from validibot.validations.services.output_envelope_verifier import (
+    OutputEnvelopeVerificationError,
+)
+from validibot.validations.services.output_envelope_verifier import (
+    output_envelope_sha256,
+)
+from validibot.validations.services.output_envelope_verifier import (
+    parse_and_verify_output_envelope,
+)
+from validibot.validations.tests.factories import ValidationRunFactory
+from validibot.validations.tests.factories import ValidatorFactory
+from validibot.workflows.tests.factories import WorkflowFactory
+from validibot.workflows.tests.factories import WorkflowStepFactory
+
+RUN_ID = "run-123"
+VALIDATOR_ID = "validator-456"
+STEP_RUN_ID = "step-run-789"
+ATTEMPT_ID = "attempt-012"
+INPUT_SHA256 = "a" * 64
+OUTPUT_URI = "gs://bucket/runs/run-123/output.json"
+FINDING_COUNT = 25
+STREAM_BATCH_SIZE = 7
+
+
+def _expected(**overrides) -> ExpectedOutputEnvelope:
+    values = {
+        "run_id": RUN_ID,
+        "validator_id": VALIDATOR_ID,
+        "validator_type": "SHACL",
+        "step_run_id": STEP_RUN_ID,
+        "execution_attempt_id": ATTEMPT_ID,
+        "attempt_contract_version": "validibot.attempt.v2",
+        "input_envelope_sha256": INPUT_SHA256,
+        "output_uri": OUTPUT_URI,
+        "envelope_class": SHACLOutputEnvelope,
+    }
+    values.update(overrides)
+    return ExpectedOutputEnvelope(**values)
+
+
+def _finding(index: int) -> dict:
+    return {
+        "path": f"urn:node:{index}",
+        "message": f"Finding {index} — ünïcode",
+        "severity": ["ERROR", "WARNING", "INFO"][index % 3],
+        "code": f"sh:Constraint{index % 5}",
+        "meta": {"focus_node": f"urn:node:{index}", "n": index},
+    }
+
+
+def _envelope_data(
+    *,
+    findings: int = FINDING_COUNT,
+    messages: int = 4,
+    run_id: str = RUN_ID,
+    step_run_id: str = STEP_RUN_ID,
+    execution_attempt_id: str = ATTEMPT_ID,
+    validator_id: str = VALIDATOR_ID,
+    status: str = "failed_validation",
+) -> dict:
+    return {
+        "schema_version": "validibot.output.v1",
+        "run_id": run_id,
+        "step_run_id": step_run_id,
+        "execution_attempt_id": execution_attempt_id,
+        "attempt_contract_version": "validibot.attempt.v2",
+        "input_envelope_sha256": INPUT_SHA256,
+        "output_uri": OUTPUT_URI,
+        "validator": {"id": validator_id, "type": "SHACL", "version": "1"},
+        "status": status,
+        "timing": {"finished_at": "2026-01-02T03:04:05Z"},
+        "messages": [
+            {"severity": "ERROR", "text": f"message {i}", "tags": ["t"]}
+            for i in range(messages)
+        ],
+        "metrics": [{"name": "triples", "value": 12}],
+        "outputs": {
+            "conforms": False,
+            "findings": [_finding(i) for i in range(findings)],
+            "parse_ok": True,
+            "parse_serialization": "turtle",
+            "triple_count": 12,
+            "shacl_violation_count": findings,
+            "shacl_total_count": findings,
+            "results_graph_turtle": "@prefix sh: <http://www.w3.org/ns/shacl#> .",
+        },
+    }
+
+
+def _write(tmp_path: Path, data: dict, *, reverse_keys: bool = False) -> Path:
+    if reverse_keys:
+        data = dict(reversed(list(data.items())))
+        data["outputs"] = dict(reversed(list(data["outputs"].items())))
+    path = tmp_path / "output.json"
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def _open(path: Path, **overrides) -> StreamedOutputEnvelope:
+    return open_streamed_output_envelope(path, expected=_expected(**overrides))
+
+
+# ── Header pass ──────────────────────────────────────────────────────────────
+
+
+def test_header_is_verified_with_arrays_emptied(tmp_path):
+    """The header carries every scalar field but none of the streamed arrays."""
+    streamed = _open(_write(tmp_path, _envelope_data()))
+
+    assert isinstance(streamed.header, SHACLOutputEnvelope)
+    assert streamed.status == ValidationStatus.FAILED_VALIDATION
+    assert streamed.header.messages == []
+    assert streamed.header.outputs.findings == []
+    assert streamed.header.outputs.shacl_total_count == FINDING_COUNT
+    assert streamed.header.metrics[0].name == "triples"
+    assert streamed.item_counts == {MESSAGES_PATH: 4, FINDINGS_PATH: FINDING_COUNT}
+
+
+@pytest.mark.parametrize(
+    ("override", "code"),
+    [
+        ({"run_id": "another-run"}, "run_mismatch"),
+        ({"validator_id": "another-validator"}, "validator_id_mismatch"),
+    ],
+)
+def test_identity_mismatch_is_rejected_before_items_are_read(tmp_path, override, code):
+    """A foreign envelope fails the header pass, exactly like a full parse."""
+    path = _write(tmp_path, _envelope_data(**override))
+
+    with pytest.raises(OutputEnvelopeVerificationError) as exc:
+        _open(path)
+    assert exc.value.code == code
+
+
+def test_identity_is_verified_even_when_arrays_come_first(tmp_path):
+    """Key order cannot smuggle findings past the identity check."""
+    path = _write(tmp_path, _envelope_data(run_id="another-run"), reverse_keys=True)
+
+    with pytest.raises(OutputEnvelopeVerificationError) as exc:
+        _open(path)
+    assert exc.value.code == "run_mismatch"
+
+
+def test_malformed_item_rejects_the_whole_envelope(tmp_path):
+    """One invalid finding fails the header pass; nothing is half-accepted."""
+    data = _envelope_data()
+    data["outputs"]["findings"][7] = {"message": "missing severity"}
+
+    with pytest.raises(OutputEnvelopeVerificationError) as exc:
+        _open(_write(tmp_path, data))
+    assert exc.value.code == "invalid_envelope"
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"",
+        b"[]",
+        b'{"run_id": "x"',
+        b'{"run_id": "x"} trailing',
+        b'{"messages": [], "messages": []}',
+    ],
+)
+def test_malformed_json_is_a_typed_verification_failure(tmp_path, payload):
+    path = tmp_path / "output.json"
+    path.write_bytes(payload)
+
+    with pytest.raises(OutputEnvelopeVerificationError) as exc:
+        _open(path)
+    assert exc.value.code == "invalid_envelope"
+
+
+# ── Equivalence with the full parse ──────────────────────────────────────────
+
+
+@pytest.mark.parametrize("reverse_keys", [False, True])
+@pytest.mark.parametrize("read_size", [1, 7, 4096])
+def test_items_and_hash_match_full_parse(
+    tmp_path, monkeypatch, reverse_keys, read_size
+):
+    """Streamed items and the canonical hash equal the fully parsed envelope.
+
+    Tiny read sizes force every token, multi-byte character, and number to
+    straddle a chunk boundary.
+    """
+    monkeypatch.setattr(envelope_stream, "STREAM_READ_SIZE", read_size)
+    data = _envelope_data()
+    path = _write(tmp_path, data, reverse_keys=reverse_keys)
+    full = parse_and_verify_output_envelope(path.read_bytes(), expected=_expected())
+
+    streamed = open_streamed_output_envelope(path, expected=_expected())
+    findings = [item for _path, item in streamed.iter_items([FINDINGS_PATH])]
+    messages = [item for _path, item in streamed.iter_items([MESSAGES_PATH])]
+
+    assert findings == full.outputs.findings
+    assert messages == full.messages
+    assert streamed.canonical_sha256() == output_envelope_sha256(full)
+    assert envelope_sha256(streamed) == envelope_sha256(full)
+
+
+def test_hash_matches_when_outputs_are_absent(tmp_path):
+    """An engine failure with ``outputs: null`` still hashes identically."""
+    data = _envelope_data()
+    data["outputs"] = None
+    path = _write(tmp_path, data)
+    full = parse_and_verify_output_envelope(path.read_bytes(), expected=_expected())
+
+    streamed = _open(path)
+
+    assert streamed.item_counts[FINDINGS_PATH] == 0
+    assert streamed.canonical_sha256() == output_envelope_sha256(full)
+
+
+def test_iter_items_yields_in_document_order(tmp_path):
+    streamed = _open(_write(tmp_path, _envelope_data(findings=3, messages=2)))
+
+    paths = [path for path, _item in streamed.iter_items()]
+
+    assert paths == [MESSAGES_PATH] * 2 + [FINDINGS_PATH] * 3
+
+
+# ── Spool lifecycle ──────────────────────────────────────────────────────────
+
+
+def test_spool_is_deleted_when_the_envelope_is_closed():
+    spool = EnvelopeSpool()
+    spool.path.write_text(json.dumps(_envelope_data()), encoding="utf-8")
+
+    streamed = open_streamed_spool(spool, expected=_expected())
+    assert spool.path.exists()
+
+    streamed.close()
+    assert not spool.path.exists()
+
+
+def test_spool_is_deleted_when_verification_fails():
+    spool = EnvelopeSpool()
+    spool.path.write_text(
+        json.dumps(_envelope_data(run_id="another-run")),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(OutputEnvelopeVerificationError):
+        open_streamed_spool(spool, expected=_expected())
+    assert not spool.path.exists()
+
+
+# ── Processor integration ────────────────────────────────────────────────────
+
+
+class StreamedEnvelopeProcessorTests(TestCase):
+    """The advanced processor persists streamed findings like in-memory ones."""
+
+    def setUp(self):
+        self.validator = ValidatorFactory(validation_type=ValidationType.SHACL)
+        self.workflow = WorkflowFactory()
+        self.step = WorkflowStepFactory(
+            workflow=self.workflow,
+            validator=self.validator,
+            ruleset=None,
+        )
+
+    def _step_run(self):
+        run = ValidationRunFactory(
+            workflow=self.workflow,
+            status=ValidationRunStatus.RUNNING,
+        )
+        step_run = ValidationStepRun.objects.create(
+            validation_run=run,
+            workflow_step=self.step,
+            step_order=self.step.order,
+            status=StepStatus.RUNNING,
+        )
+        return run, step_run
+
+    def _expected_for(self, run, step_run) -> ExpectedOutputEnvelope:
+        return _expected(
+            run_id=str(run.pk),
+            step_run_id=str(step_run.pk),
+            validator_id=str(self.validator.pk),
+        )
+
+    def _data_for(self, run, step_run, **kwargs) -> dict:
+        return _envelope_data(
+            run_id=str(run.pk),
+            step_run_id=str(step_run.pk),
+            validator_id=str(self.validator.pk),
+            **kwargs,
+        )
+
+    def _findings(self, step_run) -> list[tuple]:
+        return list(
+            ValidationFinding.objects.filter(validation_step_run=step_run)
+            .order_by("pk")
+            .values_list("severity", "code", "message", "path", "meta"),
+        )
+
+    def _complete(self, run, step_run, envelope):
+        from validibot.validations.services.step_processor.advanced import (
+            AdvancedValidationProcessor,
+        )
+
+        return AdvancedValidationProcessor(run, step_run).complete_from_callback(
+            envelope,
+        )
+
+    @override_settings(VALIDATION_RESULT_STREAM_BATCH_SIZE=STREAM_BATCH_SIZE)
+    def test_streamed_findings_match_in_memory_findings(self):
+        import tempfile
+
+        from validibot.validations.services.step_processor.base import (
+            ValidationStepProcessor,
+        )
+
+        memory_run, memory_step_run = self._step_run()
+        memory_payload = json.dumps(self._data_for(memory_run, memory_step_run))
+        full = parse_and_verify_output_envelope(
+            memory_payload.encode("utf-8"),
+            expected=self._expected_for(memory_run, memory_step_run),
+        )
+        memory_result = self._complete(memory_run, memory_step_run, full)
+
+        stream_run, stream_step_run = self._step_run()
+        with tempfile.TemporaryDirectory() as directory:
+            path = _write(Path(directory), self._data_for(stream_run, stream_step_run))
+            streamed = open_streamed_output_envelope(
+                path,
+                expected=self._expected_for(stream_run, stream_step_run),
+            )
+            batch_sizes: list[int] = []
+            original = ValidationStepProcessor.persist_findings
+
+            def recording(processor, issues, *, append=False):
+                batch_sizes.append(len(issues))
+                return original(processor, issues, append=append)
+
+            from unittest.mock import patch
+
+            with patch.object(ValidationStepProcessor, "persist_findings", recording):
+                stream_result = self._complete(stream_run, stream_step_run, streamed)
+
+        assert self._findings(stream_step_run) == self._findings(memory_step_run)
+        assert stream_result.severity_counts == memory_result.severity_counts
+        assert stream_result.passed == memory_result.passed
+        # 25 findings in batches of 7, then the (empty) header-issue flush.
+        assert batch_sizes[:4] == [7, 7, 7, 4]
+        assert max(batch_sizes) <= STREAM_BATCH_SIZE
+
+        stream_step_run.refresh_from_db()
+        memory_step_run.refresh_from_db()
+        assert stream_step_run.status == memory_step_run.status
+        assert stream_step_run.output["streamed_item_counts"] == {
+            "messages": 4,
+            "outputs.findings": FINDING_COUNT,
+        }
+        assert stream_step_run.output["outputs"]["findings"] == []
+
+    def test_success_with_streamed_errors_still_flags_the_step(self):
+        """Container ERROR findings found only in the stream count as errors."""
+        self.validator.is_system = False
+        self.validator.save(update_fields=["is_system"])
+        import tempfile
+
+        run, step_run = self._step_run()
+        with tempfile.TemporaryDirectory() as directory:
+            path = _write(
+                Path(directory),
+                self._data_for(run, step_run, findings=3, status="success"),
+            )
+            streamed = open_streamed_output_envelope(
+                path,
+                expected=self._expected_for(run, step_run),
+            )
+            self._complete(run, step_run, streamed)
+
+        assert ValidationFinding.objects.filter(
+            validation_step_run=step_run,
+            code="advanced_validation_custom_success_with_errors",
+            severity=Severity.ERROR,
+        ).exists()
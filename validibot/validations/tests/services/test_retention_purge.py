@@ -0,0 +1,265 @@
+"""Tests for the set-based retention purge engine.
+
+The engine must keep every per-object guarantee of ``purge_content`` and
+``purge_run_outputs`` while working on whole chunks: storage is deleted before
+rows are stamped, a failure holds back only the row it belongs to, and a row
+another invocation has claimed is skipped rather than purged twice. The
+database work must not grow with the chunk size.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from io import StringIO
+from threading import Event
+from threading import Thread
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db import close_old_connections
+from django.db import connection
+from django.db import transaction
+from django.db.models.fields.files import FieldFile
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from validibot.submissions.constants import OutputRetention
+from validibot.submissions.constants import SubmissionRetention
+from validibot.submissions.models import Submission
+from validibot.submissions.tests.factories import SubmissionFactory
+from validibot.validations.constants import ValidationRunStatus
+from validibot.validations.models import ValidationFinding
+from validibot.validations.models import ValidationRun
+from validibot.validations.services.retention_purge import purge_expired_output_chunk
+from validibot.validations.services.retention_purge import (
+    purge_expired_submission_chunk,
+)
+from validibot.validations.tests.factories import ValidationFindingFactory
+from validibot.validations.tests.factories import ValidationRunFactory
+from validibot.validations.tests.factories import ValidationStepRunFactory
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CHUNK_LIMIT = 50
+SMALL_CHUNK = 2
+LARGE_CHUNK = 6
+THREAD_TIMEOUT_SECONDS = 5
+
+_original_delete = FieldFile.delete
+
+
+def _expired_submission(*, with_file: bool = True, **kwargs) -> Submission:
+    if with_file:
+        kwargs.setdefault("content", "")
+        kwargs.setdefault(
+            "input_file",
+            ContentFile(b'{"meter": 1}', name="meters.json"),
+        )
+    submission = SubmissionFactory(
+        retention_policy=SubmissionRetention.STORE_7_DAYS,
+        **kwargs,
+    )
+    Submission.objects.filter(pk=submission.pk).update(
+        expires_at=timezone.now() - timedelta(hours=1),
+        created=timezone.now() - timedelta(days=8),
+    )
+    return submission
+
+
+def _terminal_run(submission, media_root: Path) -> ValidationRun:
+    run = ValidationRunFactory(
+        submission=submission,
+        org=submission.org,
+        workflow=submission.workflow,
+        status=ValidationRunStatus.SUCCEEDED,
+        ended_at=timezone.now() - timedelta(days=8),
+        short_description="meters from site 4",
+    )
+    bundle = media_root / "files" / "runs" / str(run.org_id) / str(run.id)
+    (bundle / "input").mkdir(parents=True)
+    (bundle / "input" / "meters.json").write_bytes(b"{}")
+    (bundle / "output").mkdir()
+    (bundle / "output" / "output.json").write_bytes(b"{}")
+    return run
+
+
+@pytest.mark.django_db
+class TestPurgeExpiredSubmissionChunk:
+    def test_purges_files_rows_and_copied_run_inputs(self, tmp_path):
+        with override_settings(MEDIA_ROOT=str(tmp_path), GCS_VALIDATION_BUCKET=""):
+            submission = _expired_submission()
+            stored_name = submission.input_file.name
+            storage = submission.input_file.storage
+            run = _terminal_run(submission, tmp_path)
+
+            result = purge_expired_submission_chunk(
+                now=timezone.now(),
+                limit=CHUNK_LIMIT,
+            )
+
+        assert result.purged == [str(submission.pk)]
+        assert not result.failed
+        submission.refresh_from_db()
+        assert submission.content_purged_at is not None
+        assert not submission.input_file
+        assert submission.expires_at is None
+        assert not storage.exists(stored_name)
+        bundle = tmp_path / "files" / "runs" / str(run.org_id) / str(run.id)
+        assert not (bundle / "input").exists()
+        assert (bundle / "output" / "output.json").exists()
+        run.refresh_from_db()
+        assert run.short_description == ""
+
+    def test_query_count_does_not_grow_with_the_chunk(self, tmp_path):
+        def purge_queries(count: int) -> int:
+            for _ in range(count):
+                _terminal_run(_expired_submission(), tmp_path)
+            with CaptureQueriesContext(connection) as queries:
+                result = purge_expired_submission_chunk(
+                    now=timezone.now(),
+                    limit=CHUNK_LIMIT,
+                )
+            assert len(result.purged) == count
+            return len(queries)
+
+        with override_settings(MEDIA_ROOT=str(tmp_path), GCS_VALIDATION_BUCKET=""):
+            assert purge_queries(SMALL_CHUNK) == purge_queries(LARGE_CHUNK)
+
+    def test_storage_failure_holds_back_only_its_submission(self):
+        broken = _expired_submission()
+        healthy = _expired_submission()
+        broken_name = broken.input_file.name
+
+        def delete(self, *, save=True):
+            if self.name == broken_name:
+                raise OSError("storage unavailable")
+            return _original_delete(self, save=save)
+
+        with patch.object(FieldFile, "delete", delete):
+            result = purge_expired_submission_chunk(
+                now=timezone.now(),
+                limit=CHUNK_LIMIT,
+            )
+
+        assert result.purged == [str(healthy.pk)]
+        assert result.failed == {str(broken.pk): "storage unavailable"}
+        broken.refresh_from_db()
+        assert broken.content_purged_at is None
+        assert broken.input_file.name == broken_name
+
+    def test_skip_ids_are_not_claimed(self):
+        skipped = _expired_submission(with_file=False)
+        claimed = _expired_submission(with_file=False)
+
+        result = purge_expired_submission_chunk(
+            now=timezone.now(),
+            limit=CHUNK_LIMIT,
+            skip_ids=[str(skipped.pk)],
+        )
+
+        assert result.purged == [str(claimed.pk)]
+
+    def test_command_stops_when_only_failures_remain(self):
+        for _ in range(SMALL_CHUNK):
+            _expired_submission()
+        stderr = StringIO()
+
+        with patch.object(FieldFile, "delete", side_effect=OSError("down")):
+            call_command(
+                "purge_expired_submissions",
+                "--batch-size=1",
+                "--max-batches=0",
+                stdout=StringIO(),
+                stderr=stderr,
+            )
+
+        assert f"{SMALL_CHUNK} submission(s) failed to purge" in stderr.getvalue()
+
+
+@pytest.mark.django_db
+class TestPurgeExpiredOutputChunk:
+    @patch("validibot.submissions.models._delete_run_files")
+    def test_redacts_every_claimed_run(self, delete_run_files):
+        runs = []
+        for _ in range(SMALL_CHUNK):
+            run = ValidationRunFactory(
+                status=ValidationRunStatus.SUCCEEDED,
+                ended_at=timezone.now() - timedelta(days=8),
+                output_retention_policy=OutputRetention.STORE_7_DAYS,
+                output_expires_at=timezone.now() - timedelta(hours=1),
+                error="boom",
+            )
+            ValidationFindingFactory(
+                validation_run=run,
+                validation_step_run=ValidationStepRunFactory(validation_run=run),
+            )
+            runs.append(run)
+
+        result = purge_expired_output_chunk(now=timezone.now(), limit=CHUNK_LIMIT)
+
+        assert sorted(result.purged) == sorted(str(run.pk) for run in runs)
+        assert delete_run_files.call_count == SMALL_CHUNK
+        assert not ValidationFinding.objects.filter(validation_run__in=runs).exists()
+        for run in runs:
+            run.refresh_from_db()
+            assert run.output_purged_at is not None
+            assert run.output_expires_at is None
+            assert run.error == ""
+
+    @patch("validibot.submissions.models._delete_run_files")
+    def test_storage_failure_leaves_the_run_for_retry(self, delete_run_files):
+        delete_run_files.side_effect = OSError("bucket unavailable")
+        run = ValidationRunFactory(
+            status=ValidationRunStatus.SUCCEEDED,
+            ended_at=timezone.now() - timedelta(days=8),
+            output_retention_policy=OutputRetention.STORE_7_DAYS,
+            output_expires_at=timezone.now() - timedelta(hours=1),
+        )
+
+        result = purge_expired_output_chunk(now=timezone.now(), limit=CHUNK_LIMIT)
+
+        assert result.failed == {str(run.pk): "bucket unavailable"}
+        run.refresh_from_db()
+        assert run.output_purged_at is None
+        assert run.output_expires_at is not None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rows_claimed_by_another_invocation_are_skipped():
+    """Overlapping purges split the backlog instead of purging a row twice."""
+
+    held = _expired_submission(with_file=False)
+    free = _expired_submission(with_file=False)
+    locked = Event()
+    release = Event()
+
+    def hold_lock():
+        close_old_connections()
+        try:
+            with transaction.atomic():
+                Submission.objects.select_for_update().get(pk=held.pk)
+                locked.set()
+                release.wait(THREAD_TIMEOUT_SECONDS)
+        finally:
+            close_old_connections()
+
+    holder = Thread(target=hold_lock, daemon=True)
+    holder.start()
+    try:
+        assert locked.wait(THREAD_TIMEOUT_SECONDS)
+        result = purge_expired_submission_chunk(
+            now=timezone.now(),
+            limit=CHUNK_LIMIT,
+        )
+    finally:
+        release.set()
+        holder.join(THREAD_TIMEOUT_SECONDS)
+
+    assert result.purged == [str(free.pk)]
+    held.refresh_from_db()
+    assert held.content_purged_at is None
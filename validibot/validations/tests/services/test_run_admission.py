@@ -15,6 +15,7 @@ from validibot.submissions.tests.factories import SubmissionFactory
 from validibot.users.tests.factories import OrganizationFactory
 from validibot.validations.constants import ValidationRunSource
 from validibot.validations.services.run_admission import admit_validation_run
+from validibot.validations.services.run_admission import admit_validation_runs
 from validibot.validations.services.run_admission import emit_validation_run_finalized
 from validibot.validations.services.run_admission import (
     release_validation_run_definition,
@@ -94,6 +95,41 @@ def test_admission_rejects_internally_inconsistent_submission_tenant():
         )
 
 
+def test_batch_admission_creates_one_unreleased_run_per_submission():
+    """Bulk launch keeps the single-run invariants, in submission order."""
+
+    workflow = WorkflowFactory()
+    submissions = [SubmissionFactory(workflow=workflow) for _ in range(3)]
+
+    runs = admit_validation_runs(
+        org=workflow.org,
+        workflow=workflow,
+        submissions=submissions,
+        user=workflow.user,
+        source=ValidationRunSource.API,
+    )
+
+    assert [run.submission_id for run in runs] == [s.pk for s in submissions]
+    assert all(run.pk for run in runs)
+    assert all(run.definition_released_at is None for run in runs)
+
+
+def test_batch_admission_rejects_the_batch_on_a_foreign_submission():
+    """One cross-workflow submission must not slip through with its batch."""
+
+    workflow = WorkflowFactory()
+    submissions = [SubmissionFactory(workflow=workflow), SubmissionFactory()]
+
+    with pytest.raises(ValueError, match="Submission must match"):
+        admit_validation_runs(
+            org=workflow.org,
+            workflow=workflow,
+            submissions=submissions,
+            user=workflow.user,
+            source=ValidationRunSource.API,
+        )
+
+
 def test_release_is_idempotent():
     """Duplicate callbacks and cleanup attempts must converge on one release."""
 
@@ -0,0 +1,277 @@
+"""
+Tests for the batch validator callback endpoint.
+
+A batch must behave, callback by callback, exactly like the same callbacks
+delivered one at a time: authentication before any read, terminal receipts
+replayed without reprocessing, and failures isolated to their own item. What
+changes is the cost — lookups are shared and envelope downloads overlap.
+"""
+
+import threading
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+from validibot_shared.validations.envelopes import ValidationStatus
+
+from validibot.core.models import CallbackReceiptStatus
+from validibot.users.tests.factories import OrganizationFactory
+from validibot.users.tests.factories import UserFactory
+from validibot.validations.constants import StepStatus
+from validibot.validations.constants import ValidationRunStatus
+from validibot.validations.constants import ValidationType
+from validibot.validations.models import CallbackReceipt
+from validibot.validations.services.execution_attempts import build_attempt_callback_id
+from validibot.validations.services.execution_attempts import (
+    build_callback_nonce_verifier,
+)
+from validibot.validations.services.validation_callback import ValidationCallbackService
+from validibot.validations.tests.factories import ExecutionAttemptFactory
+from validibot.validations.tests.factories import ValidationRunFactory
+from validibot.validations.tests.factories import ValidationStepRunFactory
+from validibot.validations.tests.factories import ValidatorFactory
+from validibot.workflows.tests.factories import WorkflowStepFactory
+
+TEST_CALLBACK_NONCE = "AAECAwQFBgcICQoLDA0ODxAREhMUFRYXGBkaGxwdHh8"
+WRONG_CALLBACK_NONCE = "Hh0cGxoZGBcWFRQTEhEQDw4NDAsKCQgHBgUEAwIBAAA"
+BATCH_URL = "/api/v1/validation-callbacks/batch/"
+DOWNLOAD_PATH = "validibot.validations.services.validation_callback.download_envelope"
+
+
+@override_settings(APP_IS_WORKER=True, ROOT_URLCONF="config.urls_worker")
+class CallbackBatchTestCase(TestCase):
+    """Batch callbacks preserve single-callback semantics per item."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.org = OrganizationFactory()
+        self.user = UserFactory(orgs=[self.org])
+        self.validator = ValidatorFactory(
+            validation_type=ValidationType.ENERGYPLUS,
+            is_system=True,
+        )
+        self.attempts = [self._running_attempt(i) for i in range(3)]
+        self.envelopes = {
+            attempt.output_envelope_uri: self._make_mock_envelope(attempt)
+            for attempt in self.attempts
+        }
+
+    def _running_attempt(self, index):
+        run = ValidationRunFactory(
+            org=self.org,
+            user=self.user,
+            status=ValidationRunStatus.RUNNING,
+        )
+        step_run = ValidationStepRunFactory(
+            validation_run=run,
+            workflow_step=WorkflowStepFactory(
+                workflow=run.workflow,
+                validator=self.validator,
+            ),
+            status=StepStatus.RUNNING,
+        )
+        return ExecutionAttemptFactory(
+            step_run=step_run,
+            state="RUNNING",
+            output_envelope_uri=f"gs://bucket/{index}/output.json",
+            callback_nonce_hash=build_callback_nonce_verifier(TEST_CALLBACK_NONCE),
+        )
+
+    def _make_mock_envelope(self, attempt):
+        """A successful output envelope bound to ``attempt``'s identity."""
+        run = attempt.step_run.validation_run
+        envelope = MagicMock()
+        envelope.status = ValidationStatus.SUCCESS
+        envelope.validator.id = str(self.validator.id)
+        envelope.validator.type = ValidationType.ENERGYPLUS
+        envelope.validator.version = "1.0.0"
+        envelope.run_id = str(run.id)
+        envelope.step_run_id = str(attempt.step_run_id)
+        envelope.execution_attempt_id = str(attempt.pk)
+        envelope.attempt_contract_version = "validibot.attempt.v2"
+        envelope.input_envelope_sha256 = attempt.input_envelope_sha256
+        envelope.output_uri = attempt.output_envelope_uri
+        envelope.timing.finished_at = None
+        envelope.messages = []
+        envelope.outputs.output_values = {}
+        envelope.model_dump.return_value = {"status": "success", "run_id": str(run.id)}
+        return envelope
+
+    def _download(self, result_uri, envelope_class, **kwargs):
+        return self.envelopes[result_uri]
+
+    @staticmethod
+    def _payload(attempt, **overrides):
+        payload = {
+            "run_id": str(attempt.step_run.validation_run_id),
+            "callback_id": build_attempt_callback_id(attempt),
+            "callback_nonce": TEST_CALLBACK_NONCE,
+            "status": "success",
+            "result_uri": attempt.output_envelope_uri,
+        }
+        payload.update(overrides)
+        return payload
+
+    def _post(self, payloads):
+        return self.client.post(BATCH_URL, data={"callbacks": payloads}, format="json")
+
+    def _receipt_status(self, attempt):
+        return CallbackReceipt.objects.get(
+            callback_id=build_attempt_callback_id(attempt),
+        ).status
+
+    def test_batch_processes_every_callback(self):
+        """Each callback is finalised and gets its own result, in order."""
+        with patch(DOWNLOAD_PATH, side_effect=self._download) as download:
+            response = self._post([self._payload(a) for a in self.attempts])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["retry"] is False
+        assert [r["callback_id"] for r in response.data["results"]] == [
+            build_attempt_callback_id(a) for a in self.attempts
+        ]
+        for result in response.data["results"]:
+            assert result["status_code"] == status.HTTP_200_OK
+            assert result["body"]["message"] == "Callback processed successfully"
+        assert download.call_count == len(self.attempts)
+        for attempt in self.attempts:
+            assert self._receipt_status(attempt) == CallbackReceiptStatus.COMPLETED
+
+    @override_settings(VALIDATION_CALLBACK_BATCH_DOWNLOAD_CONCURRENCY=2)
+    def test_downloads_run_a_bounded_window_ahead(self):
+        """Only a window of envelopes is held at once, not the whole batch."""
+        self.attempts += [self._running_attempt(i) for i in range(3, 7)]
+        self.envelopes = {
+            attempt.output_envelope_uri: self._make_mock_envelope(attempt)
+            for attempt in self.attempts
+        }
+        held = 0
+        peak = 0
+        lock = threading.Lock()
+        process = ValidationCallbackService._process_with_receipt_lock
+
+        def download(result_uri, envelope_class, **kwargs):
+            nonlocal held, peak
+            with lock:
+                held += 1
+                peak = max(peak, held)
+            return self.envelopes[result_uri]
+
+        def finalise(service, *args, **kwargs):
+            nonlocal held
+            response = process(service, *args, **kwargs)
+            with lock:
+                held -= 1
+            return response
+
+        with (
+            patch(DOWNLOAD_PATH, side_effect=download) as fetch,
+            patch.object(
+                ValidationCallbackService,
+                "_process_with_receipt_lock",
+                autospec=True,
+                side_effect=finalise,
+            ),
+        ):
+            response = self._post([self._payload(a) for a in self.attempts])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert fetch.call_count == len(self.attempts)
+        assert peak <= 2  # noqa: PLR2004
+        for attempt in self.attempts:
+            assert self._receipt_status(attempt) == CallbackReceiptStatus.COMPLETED
+
+    def test_redelivered_batch_replays_without_downloading(self):
+        """Terminal receipts short-circuit before any storage read."""
+        payloads = [self._payload(a) for a in self.attempts]
+        with patch(DOWNLOAD_PATH, side_effect=self._download):
+            self._post(payloads)
+
+        with patch(DOWNLOAD_PATH, side_effect=self._download) as download:
+            response = self._post(payloads)
+
+        assert response.status_code == status.HTTP_200_OK
+        download.assert_not_called()
+        for result in response.data["results"]:
+            assert result["status_code"] == status.HTTP_200_OK
+            assert result["body"]["idempotent_replayed"] is True
+
+    def test_duplicate_within_batch_is_processed_once(self):
+        attempt = self.attempts[0]
+        with patch(DOWNLOAD_PATH, side_effect=self._download) as download:
+            response = self._post([self._payload(attempt), self._payload(attempt)])
+
+        first, second = response.data["results"]
+        assert first["body"]["message"] == "Callback processed successfully"
+        assert second["body"]["idempotent_replayed"] is True
+        download.assert_called_once()
+
+    def test_bad_items_do_not_affect_the_rest(self):
+        """Invalid payloads and bad credentials fail only their own item."""
+        good, wrong_nonce, _ = self.attempts
+        payloads = [
+            {"run_id": "not-a-callback"},
+            self._payload(wrong_nonce, callback_nonce=WRONG_CALLBACK_NONCE),
+            self._payload(good),
+        ]
+        with patch(DOWNLOAD_PATH, side_effect=self._download) as download:
+            response = self._post(payloads)
+
+        codes = [r["status_code"] for r in response.data["results"]]
+        assert codes == [
+            status.HTTP_400_BAD_REQUEST,
+            status.HTTP_400_BAD_REQUEST,
+            status.HTTP_200_OK,
+        ]
+        assert response.data["results"][1]["body"]["error"] == (
+            "Invalid callback credentials"
+        )
+        # Only the authenticated callback's envelope was read.
+        download.assert_called_once()
+        assert not CallbackReceipt.objects.filter(
+            callback_id=build_attempt_callback_id(wrong_nonce),
+        ).exists()
+
+    def test_download_failure_leaves_item_retryable(self):
+        """A transient storage error keeps the receipt PROCESSING for redelivery."""
+        failing = self.attempts[1]
+
+        def download(result_uri, envelope_class, **kwargs):
+            if result_uri == failing.output_envelope_uri:
+                raise OSError
+            return self.envelopes[result_uri]
+
+        with patch(DOWNLOAD_PATH, side_effect=download):
+            response = self._post([self._payload(a) for a in self.attempts])
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.data["retry"] is True
+        codes = [r["status_code"] for r in response.data["results"]]
+        assert codes == [
+            status.HTTP_200_OK,
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status.HTTP_200_OK,
+        ]
+        assert self._receipt_status(failing) == CallbackReceiptStatus.PROCESSING
+
+        # Redelivery completes the failed item and replays the others.
+        with patch(DOWNLOAD_PATH, side_effect=self._download):
+            retry = self._post([self._payload(a) for a in self.attempts])
+        assert retry.status_code == status.HTTP_200_OK
+        assert self._receipt_status(failing) == CallbackReceiptStatus.COMPLETED
+
+    @override_settings(VALIDATION_CALLBACK_BATCH_MAX_SIZE=2)
+    def test_oversized_batch_is_rejected(self):
+        with patch(DOWNLOAD_PATH) as download:
+            response = self._post([self._payload(a) for a in self.attempts])
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        download.assert_not_called()
+
+    def test_missing_callbacks_list_is_rejected(self):
+        response = self.client.post(BATCH_URL, data={}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -17,6 +17,7 @@ from uuid import uuid4
 
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
+from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -40,6 +41,7 @@ from validibot.users.tests.factories import OrganizationFactory
 from validibot.users.tests.factories import UserFactory
 from validibot.users.tests.factories import grant_role
 from validibot.validations.api.viewsets import ValidationRunViewSet
+from validibot.validations.constants import Severity
 from validibot.validations.constants import ValidationRunErrorCategory
 from validibot.validations.constants import ValidationRunStatus
 from validibot.validations.models import ValidationRun
@@ -120,6 +122,22 @@ def runs_credential_download_url(org, run) -> str:
     )
 
 
+def runs_findings_url(org, run) -> str:
+    """Return the org-scoped keyset findings URL for a run."""
+    return reverse(
+        "api:org-runs-findings",
+        kwargs={"org_slug": org.slug, "pk": run.pk},
+    )
+
+
+def runs_findings_export_url(org, run) -> str:
+    """Return the org-scoped streaming findings export URL for a run."""
+    return reverse(
+        "api:org-runs-findings-export",
+        kwargs={"org_slug": org.slug, "pk": run.pk},
+    )
+
+
 class ValidationRunViewSetTestCase(TestCase):
     @classmethod
     def setUpTestData(cls):
@@ -1020,7 +1038,7 @@ class ValidationRunViewSetTestCase(TestCase):
 
         # One-run baseline.
         _make_run_with_steps()
-        with self.assertNumQueries(10):
+        with self.assertNumQueries(7):
             response = self.client.get(runs_list_url(self.org))
             self.assertEqual(response.status_code, status.HTTP_200_OK)
             self.assertEqual(len(response.data["results"]), 1)
@@ -1029,7 +1047,7 @@ class ValidationRunViewSetTestCase(TestCase):
         # an N+1 has been reintroduced.
         for _ in range(4):
             _make_run_with_steps()
-        with self.assertNumQueries(10):
+        with self.assertNumQueries(7):
             response = self.client.get(runs_list_url(self.org))
             self.assertEqual(response.status_code, status.HTTP_200_OK)
             self.assertEqual(len(response.data["results"]), 5)
@@ -1171,7 +1189,7 @@ class ValidationRunViewSetTestCase(TestCase):
         self.client.force_authenticate(user=self.user)
         self.client.get(runs_list_url(self.org))  # warm
 
-        with self.assertNumQueries(10):
+        with self.assertNumQueries(7):
             response = self.client.get(runs_list_url(self.org))
             self.assertEqual(response.status_code, status.HTTP_200_OK)
             self.assertEqual(len(response.data["results"]), 1)
@@ -1210,7 +1228,7 @@ class ValidationRunViewSetTestCase(TestCase):
         # Runs with no step_runs — the findings prefetch short-circuits
         # on empty step_runs, so we see one fewer query than the
         # other tests that set up step runs.
-        with self.assertNumQueries(7):
+        with self.assertNumQueries(4):
             response = self.client.get(runs_list_url(self.org))
             self.assertEqual(response.status_code, status.HTTP_200_OK)
             self.assertEqual(len(response.data["results"]), 3)
@@ -1221,3 +1239,98 @@ class ValidationRunViewSetTestCase(TestCase):
         # returning ``None`` under the same key.
         for row in response.data["results"]:
             self.assertNotIn("credential", row)
+
+    def test_findings_endpoint_pages_by_cursor(self):
+        """``findings/`` serves every finding once, severest first per step."""
+        run = ValidationRunFactory(
+            org=self.org,
+            user=self.user,
+            workflow=self.workflow,
+            submission=self.submission,
+            status=ValidationRunStatus.SUCCEEDED,
+        )
+        step_run = ValidationStepRunFactory(validation_run=run)
+        info = ValidationFindingFactory(
+            validation_step_run=step_run,
+            severity=Severity.INFO,
+        )
+        errors = [
+            ValidationFindingFactory(
+                validation_step_run=step_run,
+                severity=Severity.ERROR,
+            )
+            for _ in range(2)
+        ]
+        self.client.force_authenticate(user=self.user)
+
+        first = self.client.get(runs_findings_url(self.org, run), {"page_size": 2})
+        second = self.client.get(
+            runs_findings_url(self.org, run),
+            {"page_size": 2, "cursor": first.data["next"]},
+        )
+        bad = self.client.get(
+            runs_findings_url(self.org, run),
+            {"cursor": "garbage"},
+        )
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row["id"] for row in first.data["results"]],
+            [finding.pk for finding in errors],
+        )
+        self.assertEqual(
+            [row["id"] for row in second.data["results"]],
+            [info.pk],
+        )
+        self.assertIsNone(second.data["next"])
+        self.assertEqual(bad.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_findings_export_streams_csv(self):
+        """``findings/export/?output=csv`` streams a header plus one row each."""
+        run = ValidationRunFactory(
+            org=self.org,
+            user=self.user,
+            workflow=self.workflow,
+            submission=self.submission,
+            status=ValidationRunStatus.SUCCEEDED,
+        )
+        finding = ValidationFindingFactory(
+            validation_step_run=ValidationStepRunFactory(validation_run=run),
+        )
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(
+            runs_findings_export_url(self.org, run),
+            {"output": "csv"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertTrue(lines[0].startswith("id,step_run_id,step_order,severity"))
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith(f"{finding.pk},"))
+
+    @override_settings(RUN_FINDINGS_INLINE_LIMIT=1)
+    def test_run_payload_caps_inline_issues(self):
+        """Embedded ``issues`` stop at the inline limit and say so."""
+        run = ValidationRunFactory(
+            org=self.org,
+            user=self.user,
+            workflow=self.workflow,
+            submission=self.submission,
+            status=ValidationRunStatus.SUCCEEDED,
+        )
+        step_run = ValidationStepRunFactory(validation_run=run)
+        ValidationFindingFactory(validation_step_run=step_run, severity=Severity.INFO)
+        error = ValidationFindingFactory(
+            validation_step_run=step_run,
+            severity=Severity.ERROR,
+        )
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(runs_detail_url(self.org, run))
+
+        step = response.data["steps"][0]
+        self.assertEqual([issue["id"] for issue in step["issues"]], [error.pk])
+        self.assertTrue(step["issues_truncated"])
@@ -22,10 +22,14 @@ from __future__ import annotations
 from pathlib import Path
 
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from slugify import slugify
 
 from validibot.projects.tests.factories import ProjectFactory
 from validibot.users.tests.factories import OrganizationFactory
+from validibot.validations.benchmarks.fixtures import generate_model_description
 from validibot.validations.constants import BindingSourceScope
 from validibot.validations.constants import CatalogValueType
 from validibot.validations.constants import StepIODirection
@@ -33,6 +37,9 @@ from validibot.validations.constants import StepIOMedium
 from validibot.validations.constants import StepIOOriginKind
 from validibot.validations.constants import StepIOSourceKind
 from validibot.validations.constants import ValidationType
+from validibot.validations.models import FMUVariable
+from validibot.validations.services.fmu import _parse_model_description
+from validibot.validations.services.fmu import _refresh_variables_from_probe
 from validibot.validations.services.fmu import create_fmu_validator
 from validibot.validations.services.fmu import run_fmu_probe
 
@@ -54,6 +61,11 @@ PARSER_FACT_KEYS = {
     "has_simulation_defaults",
 }
 
+# Both below the bulk batch size, so persisting either is the same number
+# of statements.
+SMALL_VARIABLE_COUNT = 20
+LARGE_VARIABLE_COUNT = 400
+
 
 def _make_fake_fmu(name: str = "demo") -> SimpleUploadedFile:
     """Load the canned Feedthrough FMU from test assets."""
@@ -158,7 +170,7 @@ class FMUServiceTests(TestCase):
         # ``len(PARSER_FACT_KEYS)`` parser facts + fmu_model port +
         # 4 FMU outputs.
         # ``_refresh_variables_from_probe`` reconciles in-place via
-        # ``_persist_variables`` (update_or_create on the
+        # ``_persist_variables`` (a diff keyed on the
         # (validator, contract_key, direction) tuple), so surviving
         # rows keep their PK across probes — identity-stable, no
         # cascade of downstream StepInputBinding / WorkflowStepIOPromotion /
@@ -365,7 +377,7 @@ class FMUServiceTests(TestCase):
         """Probe re-run keeps the same StepIODefinition.pk for surviving rows.
 
         Identity stability is the whole point of the May 2026 P1/P2
-        fix: ``_persist_variables`` uses ``update_or_create`` keyed on
+        fix: ``_persist_variables`` diffs existing rows keyed on
         ``(validator, contract_key, direction)`` so a re-probe of the
         same FMU reuses existing rows. Without this, every probe would
         recreate the rows with fresh PKs, cascading any
@@ -396,7 +408,7 @@ class FMUServiceTests(TestCase):
         self.assertTrue(any(k not in PARSER_FACT_KEYS for k, _ in pre_pks))
 
         # Re-probe the same FMU. Nothing has changed, so all rows
-        # should reconcile in place via update_or_create.
+        # should reconcile in place.
         run_fmu_probe(validator.fmu_model)
 
         post_pks = {
@@ -416,6 +428,85 @@ class FMUServiceTests(TestCase):
                 "reconciliation regression",
             )
 
+    def test_refresh_applies_only_the_variable_diff(self):
+        """A changed variable set updates, inserts and deletes in place.
+
+        Dropped variables lose their rows, a changed variable keeps its
+        row (and PK) with new values, a new variable gets a new row, and
+        rows whose values did not change are not rewritten at all.
+        """
+        validator = create_fmu_validator(
+            org=self.org,
+            project=self.project,
+            name="Test FMU",
+            upload=_make_fake_fmu(),
+        )
+        fmu_model = validator.fmu_model
+        variables = list(fmu_model.variables.order_by("pk"))
+        dropped = next(v for v in variables if v.causality == "input")
+        changed = next(v for v in variables if v.causality == "output")
+        changed.value_type = "Boolean"
+        added = FMUVariable(name="Added", causality="output", value_type="Real")
+        before = {
+            (row.contract_key, row.direction): (row.pk, row.modified)
+            for row in validator.step_io_definitions.all()
+        }
+        untouched_variable = next(v for v in variables if v not in (dropped, changed))
+
+        _refresh_variables_from_probe(
+            fmu_model,
+            [v for v in variables if v is not dropped] + [added],
+        )
+
+        after = {
+            (row.contract_key, row.direction): row
+            for row in validator.step_io_definitions.all()
+        }
+        dropped_key = (slugify(dropped.name, separator="_"), StepIODirection.INPUT)
+        changed_key = (slugify(changed.name, separator="_"), StepIODirection.OUTPUT)
+        self.assertIn(dropped_key, before)
+        self.assertNotIn(dropped_key, after)
+        self.assertEqual(after[changed_key].pk, before[changed_key][0])
+        self.assertEqual(after[changed_key].data_type, CatalogValueType.BOOLEAN)
+        self.assertGreater(after[changed_key].modified, before[changed_key][1])
+        self.assertIn(("added", StepIODirection.OUTPUT), after)
+        for key, (pk, modified) in before.items():
+            if key not in (dropped_key, changed_key):
+                self.assertEqual((after[key].pk, after[key].modified), (pk, modified))
+
+        rows = {v.name: v for v in fmu_model.variables.all()}
+        self.assertNotIn(dropped.name, rows)
+        self.assertEqual(rows[changed.name].value_type, "Boolean")
+        self.assertEqual(rows[changed.name].pk, changed.pk)
+        self.assertEqual(rows[untouched_variable.name].pk, untouched_variable.pk)
+        self.assertIn("Added", rows)
+
+    def test_persist_query_count_does_not_grow_with_variables(self):
+        """Persisting is a fixed number of bulk statements, not one per row."""
+
+        def queries_for(variable_count: int) -> int:
+            validator = create_fmu_validator(
+                org=self.org,
+                project=self.project,
+                name=f"FMU {variable_count}",
+                upload=_make_fake_fmu(),
+            )
+            _name, _version, infos, _defaults = _parse_model_description(
+                generate_model_description(variable_count),
+            )
+            with CaptureQueriesContext(connection) as queries:
+                _refresh_variables_from_probe(validator.fmu_model, infos)
+            self.assertEqual(
+                validator.fmu_model.variables.count(),
+                variable_count,
+            )
+            return len(queries)
+
+        self.assertEqual(
+            queries_for(SMALL_VARIABLE_COUNT),
+            queries_for(LARGE_VARIABLE_COUNT),
+        )
+
     def test_extract_input_values_filters_to_catalog_keys(self):
         """The hook drops keys not in PARSER_FACT_KEYS.
 
@@ -0,0 +1,201 @@
+"""Equivalence tests for compiled paths and the batch resolver.
+
+``resolve_path`` now walks a cached ``CompiledPath`` instead of
+re-tokenizing the string on every call, and ``resolve_paths`` resolves a
+batch through a shared prefix tree. Both must answer exactly as the
+tokenize-per-call resolver did, so these tests keep that resolver as a
+reference and compare the three over seeded random payloads and paths —
+including malformed brackets, quoted keys containing structure characters,
+empty tokens and negative indices.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from validibot.validations.services.path_resolution import _split_path_tokens
+from validibot.validations.services.path_resolution import compile_path
+from validibot.validations.services.path_resolution import resolve_path
+from validibot.validations.services.path_resolution import resolve_paths
+
+SEED = 20261019
+CASES = 3_000
+BATCH_SIZE = 40
+MAX_DEPTH = 4
+
+# Keys chosen to collide with path syntax: dots, brackets, quotes, digits.
+KEYS = ["a", "b", "c", "0", "1", "x.y", "a-b", "a[0", "a]", "'q'", "sp ace"]
+# Raw fragments for paths that need not describe the payload at all.
+FRAGMENTS = [
+    "a", "b", "c", "x", "0", "1", "-1", "+1", " 1", "1_0",
+    ".", ".", "[", "]", "[0]", "[1]", "[-1]", "[x]", "[]",
+    '"', "'", '["x.y"]', "['a-b']", '["a[0"]', '"a]"',
+]  # fmt: skip
+
+
+def _reference_resolve(data, path):
+    """The tokenize-per-call resolver, verbatim, minus the JSONPath branch."""
+    if not path:
+        return data, True
+    current = data
+    for token in _split_path_tokens(str(path)):
+        if not token:
+            continue
+        if "[" in token and token.endswith("]"):
+            first_bracket = token.index("[")
+            key = token[:first_bracket]
+            brackets = token[first_bracket:]
+            if key:
+                if isinstance(current, dict) and key in current:
+                    current = current[key]
+                else:
+                    return None, False
+            for segment in brackets.split("["):
+                if not segment:
+                    continue
+                index_str = segment.rstrip("]")
+                if (
+                    len(index_str) >= 2  # noqa: PLR2004
+                    and index_str[0] in "\"'"
+                    and index_str[-1] == index_str[0]
+                ):
+                    dict_key = index_str[1:-1]
+                    if isinstance(current, dict) and dict_key in current:
+                        current = current[dict_key]
+                        continue
+                    return None, False
+                try:
+                    position = int(index_str)
+                except ValueError:
+                    return None, False
+                if isinstance(current, (list, tuple)) and 0 <= position < len(current):
+                    current = current[position]
+                else:
+                    return None, False
+        elif isinstance(current, dict) and token in current:
+            current = current[token]
+        else:
+            return None, False
+    return current, True
+
+
+def _payload(rng: random.Random, depth: int = 0):
+    roll = rng.random()
+    if depth >= MAX_DEPTH or roll < 0.2:  # noqa: PLR2004
+        return rng.choice([rng.randrange(100), "leaf", None, 1.5])
+    if roll < 0.6:  # noqa: PLR2004
+        keys = rng.sample(KEYS, rng.randint(1, 4))
+        return {key: _payload(rng, depth + 1) for key in keys}
+    items = [_payload(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+    return tuple(items) if rng.random() < 0.2 else items  # noqa: PLR2004
+
+
+def _walked_path(rng: random.Random, data) -> str:
+    """A path that follows ``data``, spelled in a randomly chosen syntax."""
+    parts: list[str] = []
+    current = data
+    while rng.random() < 0.85:  # noqa: PLR2004
+        if isinstance(current, dict) and current:
+            key = rng.choice(list(current))
+            quote = rng.choice(['"', "'", ""])
+            parts.append(f"[{quote}{key}{quote}]" if quote else f".{key}")
+            current = current[key]
+        elif isinstance(current, (list, tuple)):
+            index = rng.randint(-1, len(current))
+            parts.append(f"[{index}]")
+            if not 0 <= index < len(current):
+                break
+            current = current[index]
+        else:
+            parts.append(f".{rng.choice(KEYS)}")
+            break
+    return "".join(parts).removeprefix(".")
+
+
+def _random_path(rng: random.Random) -> str:
+    return "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 8)))
+
+
+def _paths(rng: random.Random, data, count: int) -> list[str]:
+    return [
+        _walked_path(rng, data) if rng.random() < 0.6 else _random_path(rng)  # noqa: PLR2004
+        for _ in range(count)
+    ]
+
+
+class TestCompiledPathEquivalence:
+    def test_resolve_path_matches_the_reference(self):
+        rng = random.Random(SEED)  # noqa: S311
+
+        for _ in range(CASES):
+            data = _payload(rng)
+            (path,) = _paths(rng, data, 1)
+            assert resolve_path(data, path) == _reference_resolve(data, path), path
+
+    def test_resolve_paths_matches_the_reference(self):
+        rng = random.Random(SEED + 1)  # noqa: S311
+
+        for _ in range(CASES // BATCH_SIZE):
+            data = _payload(rng)
+            paths = _paths(rng, data, BATCH_SIZE)
+
+            resolved = resolve_paths(data, paths)
+
+            assert list(resolved) == list(dict.fromkeys(paths))
+            for path in paths:
+                assert resolved[path] == _reference_resolve(data, path), path
+
+
+class TestCompilePath:
+    def test_each_distinct_path_is_parsed_once(self):
+        assert compile_path("building.floors[0].name") is compile_path(
+            "building.floors[0].name",
+        )
+
+    @pytest.mark.parametrize(
+        ("path", "steps"),
+        [
+            ("a.b", ((False, "a"), (False, "b"))),
+            ("..a", ((False, "a"),)),
+            ("m[0][1]", ((False, "m"), (True, 0), (True, 1))),
+            ('meta["schema.version"]', ((False, "meta"), (False, "schema.version"))),
+            ("a[-1]", ((False, "a"), (True, -1))),
+            ("a[0]x", ((False, "a[0]x"),)),
+        ],
+    )
+    def test_steps(self, path, steps):
+        assert compile_path(path).steps == steps
+
+    def test_unquoted_word_bracket_never_resolves(self):
+        compiled = compile_path("items[x].name")
+
+        assert compiled.never_found
+        assert compiled.resolve({"items": {"x": {"name": 1}}}) == (None, False)
+
+
+class TestResolvePaths:
+    def test_missing_prefix_settles_every_path_beneath_it(self):
+        resolved = resolve_paths(
+            {"building": {"floors": []}},
+            ["building.floors[0].name", "building.floors[0].zones[1]", "building"],
+        )
+
+        assert resolved == {
+            "building.floors[0].name": (None, False),
+            "building.floors[0].zones[1]": (None, False),
+            "building": ({"floors": []}, True),
+        }
+
+    def test_empty_and_filter_paths(self):
+        data = {"items": [{"name": "a", "v": 1}, {"name": "b", "v": 2}]}
+
+        resolved = resolve_paths(data, [None, "", "items[?@.name=='b'].v"])
+
+        assert resolved[None] == (data, True)
+        assert resolved[""] == (data, True)
+        assert resolved["items[?@.name=='b'].v"] == resolve_path(
+            data,
+            "items[?@.name=='b'].v",
+        )
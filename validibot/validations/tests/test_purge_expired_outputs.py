@@ -206,14 +206,14 @@ class TestCompleteOutputPurge:
             assert manifest_file.read() == manifest_bytes
         delete_run_files.assert_called_once()
 
-    @patch(
-        "validibot.validations.management.commands.purge_expired_outputs."
-        "purge_run_outputs"
-    )
-    def test_active_run_is_never_purged_even_with_past_deadline(self, purge):
+    @patch("validibot.submissions.models._delete_run_files")
+    def test_active_run_is_never_purged_even_with_past_deadline(
+        self,
+        delete_run_files,
+    ):
         """A stale launch-time timestamp must not delete a running bundle."""
 
-        ValidationRunFactory(
+        run = ValidationRunFactory(
             status=ValidationRunStatus.RUNNING,
             output_retention_policy=OutputRetention.STORE_7_DAYS,
             output_expires_at=timezone.now() - timedelta(days=1),
@@ -221,7 +221,9 @@ class TestCompleteOutputPurge:
 
         call_command("purge_expired_outputs")
 
-        purge.assert_not_called()
+        delete_run_files.assert_not_called()
+        run.refresh_from_db()
+        assert run.output_purged_at is None
 
     @patch("validibot.submissions.models._delete_run_files")
     def test_do_not_store_terminal_run_is_repaired_without_signal(
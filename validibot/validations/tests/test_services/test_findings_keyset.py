@@ -0,0 +1,202 @@
+"""Tests for keyset findings access (``services/findings_keyset.py``).
+
+Covers the ordering contract (step, then severity rank, then id), cursor
+round-trips and rejection, the streaming exports, the inline per-step cap,
+and a seeded benchmark that pins export memory and page latency as flat in the
+run's finding count.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from validibot.validations.constants import Severity
+from validibot.validations.models import ValidationFinding
+from validibot.validations.services.findings_keyset import FINDING_SEVERITY_ORDER
+from validibot.validations.services.findings_keyset import FindingsCursor
+from validibot.validations.services.findings_keyset import InvalidFindingsCursorError
+from validibot.validations.services.findings_keyset import attach_inline_findings
+from validibot.validations.services.findings_keyset import get_findings_page
+from validibot.validations.services.findings_keyset import iter_findings
+from validibot.validations.services.findings_keyset import stream_findings_csv
+from validibot.validations.services.findings_keyset import stream_findings_ndjson
+from validibot.validations.tests.factories import ValidationFindingFactory
+from validibot.validations.tests.factories import ValidationRunFactory
+from validibot.validations.tests.factories import ValidationStepRunFactory
+
+pytestmark = pytest.mark.django_db
+
+PAGE_SIZE = 3
+INLINE_LIMIT = 2
+FAILED_ROW_COUNT = 40
+
+# The benchmark seeds this many findings. The default keeps the suite quick;
+# run with FINDINGS_BENCHMARK_COUNT=1000000 to reproduce the 1M-finding case.
+BENCHMARK_FINDINGS = int(os.environ.get("FINDINGS_BENCHMARK_COUNT", "20000"))
+BENCHMARK_STEPS = 2
+# Peak Python allocation allowed while streaming the whole export. One keyset
+# batch is a few MB; materialising 20k findings alone would exceed this.
+BENCHMARK_EXPORT_PEAK_BYTES = 16 * 1024 * 1024
+BENCHMARK_PAGE_SECONDS = 0.5
+
+
+def _expected_order(run) -> list[int]:
+    """Finding ids in keyset order, computed the slow way."""
+    rank = {severity: index for index, severity in enumerate(FINDING_SEVERITY_ORDER)}
+    findings = ValidationFinding.objects.filter(validation_run=run).select_related(
+        "validation_step_run",
+    )
+    return [
+        finding.pk
+        for finding in sorted(
+            findings,
+            key=lambda f: (
+                f.validation_step_run.step_order,
+                f.validation_step_run_id,
+                rank[f.severity],
+                f.pk,
+            ),
+        )
+    ]
+
+
+@pytest.fixture
+def run():
+    """A run with two steps whose findings interleave severities."""
+    run = ValidationRunFactory()
+    for step_order in (2, 1):
+        step_run = ValidationStepRunFactory(
+            validation_run=run,
+            step_order=step_order,
+        )
+        for severity in (
+            Severity.INFO,
+            Severity.ERROR,
+            Severity.WARNING,
+            Severity.ERROR,
+            Severity.SUCCESS,
+        ):
+            ValidationFindingFactory(
+                validation_step_run=step_run,
+                severity=severity,
+                message="=HYPERLINK()" if severity == Severity.INFO else "msg",
+                meta={"sample_rows": [3, 9], "count": FAILED_ROW_COUNT},
+            )
+    return run
+
+
+def test_pages_follow_step_severity_id_order(run):
+    seen: list[int] = []
+    cursor = None
+    while True:
+        page = get_findings_page(run, limit=PAGE_SIZE, after=cursor)
+        seen.extend(finding.pk for finding in page.findings)
+        if page.next_cursor is None:
+            break
+        cursor = FindingsCursor.decode(page.next_cursor.encode())
+
+    assert seen == _expected_order(run)
+    assert [finding.pk for finding, _ in iter_findings(run, batch_size=1)] == seen
+
+
+def test_last_full_page_has_no_next_cursor(run):
+    total = ValidationFinding.objects.filter(validation_run=run).count()
+
+    page = get_findings_page(run, limit=total)
+
+    assert len(page.findings) == total
+    assert page.next_cursor is None
+
+
+def test_cursor_from_another_run_is_rejected(run):
+    other = ValidationFindingFactory()
+    cursor = FindingsCursor.after(other)
+
+    with pytest.raises(InvalidFindingsCursorError):
+        get_findings_page(run, limit=PAGE_SIZE, after=cursor)
+    with pytest.raises(InvalidFindingsCursorError):
+        FindingsCursor.decode("not-a-cursor")
+
+
+def test_exports_cover_every_finding_and_escape_formulas(run):
+    ndjson_rows = [json.loads(line) for line in stream_findings_ndjson(run)]
+    csv_rows = list(csv.DictReader(io.StringIO("".join(stream_findings_csv(run)))))
+
+    expected = _expected_order(run)
+    assert [row["id"] for row in ndjson_rows] == expected
+    assert [int(row["id"]) for row in csv_rows] == expected
+    assert ndjson_rows[0]["step_order"] == 1
+    assert ndjson_rows[0]["failed_rows"]["count"] == FAILED_ROW_COUNT
+    info_row = next(row for row in csv_rows if row["severity"] == Severity.INFO)
+    assert info_row["message"] == "'=HYPERLINK()"
+    assert info_row["failed_row_sample"] == "3 9"
+
+
+def test_inline_findings_are_capped_per_step(run):
+    step_runs = list(run.step_runs.order_by("step_order"))
+
+    attach_inline_findings(step_runs, limit=INLINE_LIMIT)
+
+    for step_run in step_runs:
+        assert step_run.findings_truncated
+        assert [f.severity for f in step_run.display_findings] == [
+            Severity.ERROR,
+            Severity.ERROR,
+        ]
+
+
+def test_benchmark_export_memory_and_page_latency_stay_flat():
+    """Seed a large run; export memory and deep-page latency must stay bounded.
+
+    Both bounds are independent of the seeded count: the export holds one
+    keyset batch at a time, and a page near the end costs the same index range
+    scan as the first page.
+    """
+    run = ValidationRunFactory()
+    per_step = BENCHMARK_FINDINGS // BENCHMARK_STEPS
+    for step_order in range(BENCHMARK_STEPS):
+        step_run = ValidationStepRunFactory(validation_run=run, step_order=step_order)
+        ValidationFinding.objects.bulk_create(
+            (
+                ValidationFinding(
+                    validation_run=run,
+                    validation_step_run=step_run,
+                    severity=Severity.ERROR,
+                    code="tabular.row",
+                    message=f"Row {index} failed",
+                    path=f"rows[{index}]",
+                )
+                for index in range(per_step)
+            ),
+            batch_size=5000,
+        )
+
+    tracemalloc.start()
+    try:
+        exported = sum(1 for _ in stream_findings_ndjson(run))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert exported == per_step * BENCHMARK_STEPS
+    assert peak < BENCHMARK_EXPORT_PEAK_BYTES
+
+    last = ValidationFinding.objects.filter(validation_run=run).order_by("pk").last()
+    deep_cursor = FindingsCursor(
+        step_run_id=last.validation_step_run_id,
+        severity=last.severity,
+        finding_id=last.pk - PAGE_SIZE * 10,
+    )
+    started = time.perf_counter()
+    first_page = get_findings_page(run, limit=PAGE_SIZE * 10)
+    deep_page = get_findings_page(run, limit=PAGE_SIZE * 10, after=deep_cursor)
+    elapsed = time.perf_counter() - started
+    assert len(first_page.findings) == len(deep_page.findings)
+    assert deep_page.next_cursor is None
+    assert elapsed < BENCHMARK_PAGE_SECONDS
@@ -0,0 +1,303 @@
+"""Tests for run result memoization (``services/result_cache.py``).
+
+The key tests change one component at a time and check the key moves, which
+is what makes invalidation exact. The launch tests run the real service: a
+repeat launch is answered from the first run's results without dispatch, and
+a run whose key differs executes normally.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from validibot.actions.constants import ActionCategoryType
+from validibot.actions.constants import IntegrationActionType
+from validibot.actions.models import Action
+from validibot.actions.models import ActionDefinition
+from validibot.core.tasks import enqueue_validation_run
+from validibot.submissions.constants import OutputRetention
+from validibot.submissions.models import SubmissionInputFile
+from validibot.submissions.tests.factories import SubmissionFactory
+from validibot.users.constants import RoleCode
+from validibot.users.tests.factories import OrganizationFactory
+from validibot.users.tests.factories import UserFactory
+from validibot.users.tests.factories import grant_role
+from validibot.validations.constants import RulesetType
+from validibot.validations.constants import ValidationRunErrorCategory
+from validibot.validations.constants import ValidationRunStatus
+from validibot.validations.constants import ValidationType
+from validibot.validations.models import ValidationFinding
+from validibot.validations.models import Validator
+from validibot.validations.models import ValidatorResourceFile
+from validibot.validations.services.result_cache import compute_result_cache_key
+from validibot.validations.services.retention import purge_run_outputs
+from validibot.validations.services.validation_run import ValidationRunService
+from validibot.validations.tests.factories import RulesetFactory
+from validibot.validations.tests.factories import ValidatorFactory
+from validibot.workflows.models import Workflow
+from validibot.workflows.models import WorkflowStep
+from validibot.workflows.tests.factories import WorkflowFactory
+from validibot.workflows.tests.factories import WorkflowStepFactory
+from validibot.workflows.tests.factories import WorkflowStepResourceFactory
+
+REQUIRED_NAME_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "required": ["name"],
+}
+MISSING_NAME = '{"title": "example"}'
+WITH_NAME = '{"name": "example"}'
+
+
+def _submission(workflow, content=MISSING_NAME, **kwargs):
+    return SubmissionFactory(
+        workflow=workflow,
+        content=content,
+        checksum_sha256=hashlib.sha256(content.encode()).hexdigest(),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def user(db):
+    return UserFactory()
+
+
+@pytest.fixture
+def workflow(user):
+    org = OrganizationFactory()
+    grant_role(user, org, RoleCode.EXECUTOR)
+    wf = WorkflowFactory(
+        org=org,
+        user=user,
+        result_cache_enabled=True,
+        output_retention=OutputRetention.STORE_30_DAYS,
+    )
+    validator = ValidatorFactory(validation_type=ValidationType.JSON_SCHEMA)
+    ruleset = RulesetFactory(
+        org=org,
+        ruleset_type=RulesetType.JSON_SCHEMA,
+        rules_text=json.dumps(REQUIRED_NAME_SCHEMA),
+    )
+    step = WorkflowStepFactory(workflow=wf, validator=validator, ruleset=ruleset)
+    WorkflowStepResourceFactory(step=step)
+    return wf
+
+
+def _launch(workflow, submission):
+    request = APIRequestFactory().post("/api/v1/workflows/start/")
+    request.user = workflow.user
+    result = ValidationRunService().launch(
+        request=request,
+        org=workflow.org,
+        workflow=workflow,
+        submission=submission,
+        user_id=workflow.user_id,
+    )
+    return result.validation_run
+
+
+def _change_submission_content(workflow, submission):
+    return _submission(workflow, content=WITH_NAME)
+
+
+def _change_submission_metadata(workflow, submission):
+    return _submission(workflow, metadata={"batch": "nightly"})
+
+
+def _add_port_file(workflow, submission):
+    SubmissionInputFile.objects.create(
+        submission=submission,
+        workflow_step=workflow.steps.get(),
+        port_key="weather",
+        checksum_sha256="a" * 64,
+    )
+    return submission
+
+
+def _change_step_config(workflow, submission):
+    WorkflowStep.objects.filter(workflow=workflow).update(config={"strict": True})
+    return submission
+
+
+def _change_input_schema(workflow, submission):
+    Workflow.objects.filter(pk=workflow.pk).update(input_schema={"type": "object"})
+    return submission
+
+
+def _bump_validator_version(workflow, submission):
+    Validator.objects.filter(pk=workflow.steps.get().validator_id).update(version=2)
+    return submission
+
+
+def _change_validator_semantic_digest(workflow, submission):
+    Validator.objects.filter(pk=workflow.steps.get().validator_id).update(
+        semantic_digest="b" * 64,
+    )
+    return submission
+
+
+def _change_ruleset_rules_text(workflow, submission):
+    ruleset = workflow.steps.get().ruleset
+    ruleset.rules_text = json.dumps({**REQUIRED_NAME_SCHEMA, "minProperties": 2})
+    ruleset.save()
+    return submission
+
+
+def _change_resource_content(workflow, submission):
+    ValidatorResourceFile.objects.filter(
+        step_usages__step__workflow=workflow,
+    ).update(content_hash="c" * 64)
+    return submission
+
+
+@pytest.mark.django_db
+class TestResultCacheKey:
+    @pytest.mark.parametrize(
+        "change",
+        [
+            _change_submission_content,
+            _change_submission_metadata,
+            _add_port_file,
+            _change_step_config,
+            _change_input_schema,
+            _bump_validator_version,
+            _change_validator_semantic_digest,
+            _change_ruleset_rules_text,
+            _change_resource_content,
+        ],
+    )
+    def test_changing_any_component_changes_the_key(self, workflow, change):
+        submission = _submission(workflow)
+        before = compute_result_cache_key(workflow, submission)
+
+        changed_submission = change(workflow, submission)
+        changed_workflow = Workflow.objects.get(pk=workflow.pk)
+        after = compute_result_cache_key(changed_workflow, changed_submission)
+
+        assert before
+        assert after
+        assert after != before
+
+    def test_same_content_in_a_new_submission_has_the_same_key(self, workflow):
+        first = compute_result_cache_key(workflow, _submission(workflow))
+        second = compute_result_cache_key(workflow, _submission(workflow))
+
+        assert first == second
+
+    def test_workflows_that_did_not_opt_in_are_not_keyed(self, workflow):
+        workflow.result_cache_enabled = False
+
+        assert compute_result_cache_key(workflow, _submission(workflow)) == ""
+
+    def test_workflows_with_action_steps_are_not_keyed(self, workflow):
+        definition, _ = ActionDefinition.objects.get_or_create(
+            slug="integration-slack-message",
+            defaults={
+                "name": "Slack",
+                "action_category": ActionCategoryType.INTEGRATION,
+                "type": IntegrationActionType.SLACK_MESSAGE,
+            },
+        )
+        action = Action.objects.create(
+            definition=definition,
+            slug="notify",
+            name="Notify",
+        )
+        WorkflowStepFactory(workflow=workflow, validator=None, action=action)
+
+        assert compute_result_cache_key(workflow, _submission(workflow)) == ""
+
+
+@pytest.mark.django_db
+class TestLaunchFromResultCache:
+    def test_repeat_launch_is_cloned_from_the_first_run(
+        self,
+        workflow,
+        monkeypatch,
+    ):
+        first = _launch(workflow, _submission(workflow))
+        assert first.status == ValidationRunStatus.FAILED
+        assert first.error_category == ValidationRunErrorCategory.VALIDATION_FAILED
+        assert first.cached_from is None
+        first.summary_record.extras = {
+            **first.summary_record.extras,
+            "profile": {"total_ms": 120},
+        }
+        first.summary_record.save(update_fields=["extras"])
+
+        enqueued = []
+
+        def record_enqueue(**kwargs):
+            enqueued.append(kwargs["validation_run_id"])
+            enqueue_validation_run(**kwargs)
+
+        monkeypatch.setattr(
+            "validibot.core.tasks.enqueue_validation_run", record_enqueue
+        )
+        second = _launch(workflow, _submission(workflow))
+
+        assert enqueued == []
+        assert second.cached_from_id == first.pk
+        assert second.status == first.status
+        assert second.error_category == first.error_category
+        assert second.output_hash == first.output_hash
+        assert second.definition_released_at is not None
+        assert list(
+            ValidationFinding.objects.filter(validation_run=second).values_list(
+                "code",
+                "message",
+                "path",
+            ),
+        ) == list(
+            ValidationFinding.objects.filter(validation_run=first).values_list(
+                "code",
+                "message",
+                "path",
+            ),
+        )
+        assert second.summary_record.error_count == first.summary_record.error_count
+        # The clone did no work, so it has no execution profile of its own.
+        assert "profile" not in second.summary_record.extras
+        assert [
+            summary.step_run.validation_run_id
+            for summary in second.summary_record.step_summaries.all()
+        ] == [second.pk]
+
+    def test_changed_content_misses_the_cache(self, workflow):
+        first = _launch(workflow, _submission(workflow))
+        second = _launch(workflow, _submission(workflow, content=WITH_NAME))
+
+        assert second.cached_from is None
+        assert second.result_cache_key != first.result_cache_key
+        assert second.status == ValidationRunStatus.SUCCEEDED
+
+    def test_purged_outputs_are_not_reused(self, workflow):
+        first = _launch(workflow, _submission(workflow))
+        purge_run_outputs(first)
+
+        second = _launch(workflow, _submission(workflow))
+
+        assert second.cached_from is None
+        assert second.result_cache_key == first.result_cache_key
+
+    def test_cache_hits_are_not_shared_across_workflows(self, workflow, user):
+        _launch(workflow, _submission(workflow))
+        other = WorkflowFactory(
+            org=workflow.org,
+            user=user,
+            result_cache_enabled=True,
+            output_retention=OutputRetention.STORE_30_DAYS,
+        )
+        step = workflow.steps.get()
+        WorkflowStepFactory(
+            workflow=other, validator=step.validator, ruleset=step.ruleset
+        )
+
+        run = _launch(other, _submission(other))
+
+        assert run.cached_from is None
@@ -0,0 +1,210 @@
+"""Tests for run completion long-polling (``services/run_completion.py``).
+
+The notification test commits real transactions: Postgres only delivers a
+``NOTIFY`` when the sending transaction commits, which never happens inside a
+``TestCase`` wrapper.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from http import HTTPStatus
+
+import pytest
+from django.db import DEFAULT_DB_ALIAS
+from django.db import connection
+from django.db import connections
+from django.db import transaction
+from django.urls import reverse
+
+from validibot.mcp_api.refs import build_member_run_ref
+from validibot.users.services.api_keys import issue_api_key
+from validibot.validations.constants import ValidationRunStatus
+from validibot.validations.models import ValidationRun
+from validibot.validations.services import run_completion
+from validibot.validations.services.run_completion import RUN_WAIT_HEADER
+from validibot.validations.services.run_completion import _listener
+from validibot.validations.services.run_completion import _waiter_semaphore
+from validibot.validations.services.run_completion import parse_wait_seconds
+from validibot.validations.services.run_completion import publish_run_finalized
+from validibot.validations.services.run_completion import wait_for_run_finalized
+from validibot.validations.signals import validation_run_finalized
+from validibot.validations.tests.factories import ValidationRunFactory
+
+MCP_SERVICE_KEY = "test-mcp-run-wait-service-key"
+FINISH_AFTER_SECONDS = 0.3
+# Far longer than the run takes to finish, so only the notification can
+# explain a prompt return.
+LONG_RECHECK_SECONDS = 30
+WAIT_SECONDS = 10
+SHORT_WAIT_SECONDS = 0.2
+MAX_WAIT_SECONDS = 20
+POOL_MAX_SIZE = 2
+POOL_TIMEOUT_SECONDS = 1
+
+
+def _finish_run_later(run_id: int) -> threading.Thread:
+    def finish():
+        time.sleep(FINISH_AFTER_SECONDS)
+        try:
+            with transaction.atomic():
+                ValidationRun.objects.filter(pk=run_id).update(
+                    status=ValidationRunStatus.SUCCEEDED,
+                )
+                publish_run_finalized(run_id)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=finish)
+    thread.start()
+    return thread
+
+
+@pytest.mark.django_db(transaction=True)
+def test_waiter_wakes_on_the_finalized_notification(settings):
+    settings.RUN_COMPLETION_RECHECK_SECONDS = LONG_RECHECK_SECONDS
+    run = ValidationRunFactory(status=ValidationRunStatus.RUNNING)
+
+    thread = _finish_run_later(run.pk)
+    started = time.monotonic()
+    finished = wait_for_run_finalized(run.pk, timeout=WAIT_SECONDS)
+    elapsed = time.monotonic() - started
+    thread.join()
+
+    assert finished
+    assert elapsed < LONG_RECHECK_SECONDS / 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_finalized_signal_publishes_the_notification():
+    run = ValidationRunFactory(status=ValidationRunStatus.SUCCEEDED)
+
+    with _listener() as notifications:
+        with transaction.atomic():
+            validation_run_finalized.send_robust(
+                sender=ValidationRun,
+                validation_run=run,
+            )
+        received = next(iter(notifications(WAIT_SECONDS)), None)
+
+    assert received == str(run.pk)
+
+
+@pytest.mark.django_db
+def test_waits_do_not_take_slots_from_the_connection_pool(monkeypatch):
+    # A pooled copy of the default connection, as production runs with
+    # DB_POOL_ENABLED; a short checkout timeout turns a leaked slot into an
+    # error instead of a hang.
+    pooled = connections[DEFAULT_DB_ALIAS].copy()
+    pooled._connection_pools = {}
+    pooled.settings_dict.setdefault("OPTIONS", {})["pool"] = {
+        "min_size": 1,
+        "max_size": POOL_MAX_SIZE,
+        "timeout": POOL_TIMEOUT_SECONDS,
+    }
+    monkeypatch.setattr(run_completion, "connection", pooled)
+    run = ValidationRunFactory(status=ValidationRunStatus.RUNNING)
+    try:
+        for _ in range(POOL_MAX_SIZE + 1):
+            assert not wait_for_run_finalized(run.pk, timeout=SHORT_WAIT_SECONDS)
+
+        with pooled.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        assert pooled.pool.get_stats()["pool_size"] <= POOL_MAX_SIZE
+    finally:
+        pooled.close()
+        pooled.close_pool()
+
+
+@pytest.mark.django_db
+def test_wait_times_out_on_an_unfinished_run():
+    run = ValidationRunFactory(status=ValidationRunStatus.RUNNING)
+
+    assert not wait_for_run_finalized(run.pk, timeout=SHORT_WAIT_SECONDS)
+
+
+def test_waiting_is_off_by_default():
+    assert parse_wait_seconds("5") == 0
+
+
+def test_wait_parameter_is_clamped(settings):
+    settings.RUN_COMPLETION_MAX_WAIT_SECONDS = 5
+
+    assert parse_wait_seconds("60") == settings.RUN_COMPLETION_MAX_WAIT_SECONDS
+    assert parse_wait_seconds("-1") == 0
+    assert parse_wait_seconds("soon") == 0
+    assert parse_wait_seconds(None) == 0
+
+
+@pytest.mark.django_db
+class TestRunDetailWait:
+    """Both run detail surfaces honour ``?wait=`` and say so in a header."""
+
+    @pytest.fixture(autouse=True)
+    def _configure(self, settings):
+        settings.MCP_SERVICE_KEY = MCP_SERVICE_KEY
+        settings.RUN_COMPLETION_MAX_WAIT_SECONDS = MAX_WAIT_SECONDS
+
+    def _mcp_get(self, client, run, *, wait):
+        issued_key = issue_api_key(user=run.user)
+        run_ref = build_member_run_ref(org_slug=run.org.slug, run_id=str(run.pk))
+        return client.get(
+            reverse("api:mcp:run-detail", kwargs={"run_ref": run_ref}),
+            {"wait": wait},
+            HTTP_X_MCP_SERVICE_KEY=MCP_SERVICE_KEY,
+            HTTP_X_VALIDIBOT_API_TOKEN=issued_key.full_key,
+        )
+
+    def test_terminal_run_answers_without_waiting(self, client):
+        run = ValidationRunFactory(status=ValidationRunStatus.SUCCEEDED)
+
+        started = time.monotonic()
+        response = self._mcp_get(client, run, wait=WAIT_SECONDS)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response[RUN_WAIT_HEADER] == "0"
+        assert time.monotonic() - started < WAIT_SECONDS
+
+    def test_unfinished_run_is_returned_when_the_wait_expires(self, client):
+        run = ValidationRunFactory(status=ValidationRunStatus.RUNNING)
+
+        response = self._mcp_get(client, run, wait=SHORT_WAIT_SECONDS)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["status"] == ValidationRunStatus.RUNNING
+        assert RUN_WAIT_HEADER in response
+
+    def test_org_run_detail_honours_wait(self, client):
+        run = ValidationRunFactory(status=ValidationRunStatus.RUNNING)
+        client.force_login(run.user)
+
+        response = client.get(
+            reverse(
+                "api:org-runs-detail",
+                kwargs={"org_slug": run.org.slug, "pk": run.pk},
+            ),
+            {"wait": SHORT_WAIT_SECONDS},
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert RUN_WAIT_HEADER in response
+
+    def test_requests_over_the_waiter_cap_answer_without_waiting(
+        self,
+        client,
+        settings,
+    ):
+        settings.RUN_COMPLETION_MAX_WAITERS = 1
+        run = ValidationRunFactory(status=ValidationRunStatus.RUNNING)
+        slots = _waiter_semaphore()
+        assert slots.acquire(blocking=False)
+        try:
+            started = time.monotonic()
+            response = self._mcp_get(client, run, wait=WAIT_SECONDS)
+        finally:
+            slots.release()
+
+        assert response.status_code == HTTPStatus.OK
+        assert RUN_WAIT_HEADER not in response
+        assert time.monotonic() - started < WAIT_SECONDS
@@ -0,0 +1,165 @@
+"""Tests for opt-in execution profiles on validation runs.
+
+With ``VALIDATION_RUN_PROFILING_ENABLED`` the orchestrator stores a span tree
+on the run summary, the run API exposes it, and ``report_run_profiles`` ranks
+phases across runs. With the setting off nothing is recorded.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from validibot.submissions.tests.factories import SubmissionFactory
+from validibot.users.tests.factories import OrganizationFactory
+from validibot.users.tests.factories import UserFactory
+from validibot.validations.constants import ValidationRunStatus
+from validibot.validations.constants import ValidationType
+from validibot.validations.models import ValidationRun
+from validibot.validations.models import ValidationRunSummary
+from validibot.validations.serializers import ValidationRunSerializer
+from validibot.validations.services.summary_builder import rebuild_run_summary_record
+from validibot.validations.services.validation_run import ValidationRunService
+from validibot.validations.tests.factories import ValidationRunFactory
+from validibot.validations.tests.factories import ValidatorFactory
+from validibot.workflows.tests.factories import WorkflowFactory
+from validibot.workflows.tests.factories import WorkflowStepFactory
+
+pytestmark = pytest.mark.django_db
+
+SLOW_PHASE_MS = 900.0
+FAST_PHASE_MS = 100.0
+PROFILED_RUNS = 2
+
+
+def _run_one_step_workflow() -> ValidationRun:
+    """Execute a one-step run whose validator fails to load (a fast path)."""
+    org = OrganizationFactory()
+    user = UserFactory()
+    workflow = WorkflowFactory(org=org, user=user, is_active=True)
+    validator = ValidatorFactory(
+        org=org,
+        validation_type=ValidationType.CUSTOM_VALIDATOR,
+        is_system=False,
+    )
+    WorkflowStepFactory(workflow=workflow, validator=validator)
+    submission = SubmissionFactory(
+        org=org,
+        project=workflow.project,
+        user=user,
+        workflow=workflow,
+    )
+    validation_run = ValidationRun.objects.create(
+        org=org,
+        workflow=workflow,
+        submission=submission,
+        project=submission.project,
+        user=user,
+        status=ValidationRunStatus.PENDING,
+    )
+    with patch(
+        "validibot.validations.validators.base.config.get_validator_class",
+        side_effect=KeyError("CUSTOM_VALIDATOR"),
+    ):
+        ValidationRunService().execute_workflow_steps(
+            validation_run_id=validation_run.id,
+            user_id=user.id,
+        )
+    validation_run.refresh_from_db()
+    return validation_run
+
+
+def _stored_profile(run: ValidationRun) -> dict | None:
+    return ValidationRunSummary.objects.get(run=run).extras.get("profile")
+
+
+@override_settings(VALIDATION_RUN_PROFILING_ENABLED=True)
+def test_profiled_run_stores_phase_tree_on_summary():
+    run = _run_one_step_workflow()
+
+    profile = _stored_profile(run)
+
+    assert profile is not None
+    names = [child["name"] for child in profile["children"]]
+    assert names[0] == "step"
+    assert profile["children"][0]["label"].endswith(ValidationType.CUSTOM_VALIDATOR)
+    assert {"summary", "output_hash", "evidence"} <= set(names)
+
+
+@override_settings(VALIDATION_RUN_PROFILING_ENABLED=True)
+def test_profile_survives_summary_rebuild_and_is_served_by_the_api():
+    run = _run_one_step_workflow()
+
+    rebuild_run_summary_record(validation_run=run)
+    data = ValidationRunSerializer(ValidationRun.objects.get(pk=run.pk)).data
+
+    assert data["profile"] == _stored_profile(run)
+
+
+@override_settings(VALIDATION_RUN_PROFILING_ENABLED=False)
+def test_unprofiled_run_records_nothing_and_omits_the_field():
+    run = _run_one_step_workflow()
+
+    assert _stored_profile(run) is None
+    assert "profile" not in ValidationRunSerializer(run).data
+
+
+def _profiled_summary(step_ms: float, persistence_ms: float) -> None:
+    run = ValidationRunFactory(
+        status=ValidationRunStatus.SUCCEEDED,
+        ended_at=timezone.now(),
+    )
+    ValidationRunSummary.objects.create(
+        run=run,
+        status=run.status,
+        completed_at=timezone.now() - timedelta(minutes=1),
+        extras={
+            "profile": {
+                "version": 1,
+                "name": "run",
+                "ms": step_ms + 10,
+                "children": [
+                    {
+                        "name": "step",
+                        "label": "1:TABULAR",
+                        "ms": step_ms,
+                        "children": [
+                            {"name": "persistence", "ms": persistence_ms},
+                        ],
+                    },
+                ],
+            },
+        },
+    )
+
+
+def test_report_ranks_phases_across_profiled_runs():
+    _profiled_summary(step_ms=SLOW_PHASE_MS, persistence_ms=FAST_PHASE_MS)
+    _profiled_summary(step_ms=FAST_PHASE_MS, persistence_ms=FAST_PHASE_MS)
+    output = StringIO()
+
+    call_command("report_run_profiles", "--json", stdout=output)
+
+    report = json.loads(output.getvalue())
+    assert report["profiled_runs"] == PROFILED_RUNS
+    step, persistence = report["phases"]
+    assert step["phase"] == "step:TABULAR"
+    assert step["total_ms"] == SLOW_PHASE_MS + FAST_PHASE_MS
+    assert step["p95_ms"] == SLOW_PHASE_MS
+    assert persistence["phase"] == "persistence"
+    assert persistence["runs"] == PROFILED_RUNS
+
+
+def test_report_without_profiles_says_so():
+    output = StringIO()
+
+    call_command("report_run_profiles", stdout=output)
+
+    assert "No profiled runs" in output.getvalue()
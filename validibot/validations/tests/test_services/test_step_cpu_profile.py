@@ -0,0 +1,117 @@
+"""Tests for CPU profiles of slow validator steps.
+
+Runs of orgs or workflows flagged in the ``STEP_CPU_PROFILE_*`` settings store
+collapsed stacks as a step-run artifact once a validator step exceeds the
+duration threshold; unflagged runs and fast steps store nothing.
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+from django.test import override_settings
+
+from validibot.submissions.tests.factories import SubmissionFactory
+from validibot.users.tests.factories import OrganizationFactory
+from validibot.users.tests.factories import UserFactory
+from validibot.validations.constants import ArtifactKind
+from validibot.validations.constants import ValidationRunStatus
+from validibot.validations.constants import ValidationType
+from validibot.validations.models import Artifact
+from validibot.validations.models import ValidationRun
+from validibot.validations.services.step_cpu_profile import CPU_PROFILE_ROLE
+from validibot.validations.services.step_cpu_profile import is_cpu_profiling_enabled
+from validibot.validations.services.validation_run import ValidationRunService
+from validibot.validations.tests.factories import ValidatorFactory
+from validibot.workflows.tests.factories import WorkflowFactory
+from validibot.workflows.tests.factories import WorkflowStepFactory
+
+pytestmark = pytest.mark.django_db
+
+ORG_SLUG = "profiled-org"
+BUSY_SECONDS = 0.2
+
+
+def _slow_validator_lookup(*args, **kwargs):
+    """Burn CPU inside the step, then fail to load like a missing validator."""
+    deadline = time.process_time() + BUSY_SECONDS
+    while time.process_time() < deadline:
+        sum(range(200))
+    raise KeyError(ValidationType.CUSTOM_VALIDATOR)
+
+
+def _run_slow_step(*, org_slug: str = ORG_SLUG) -> ValidationRun:
+    org = OrganizationFactory(slug=org_slug)
+    user = UserFactory()
+    workflow = WorkflowFactory(org=org, user=user, is_active=True)
+    validator = ValidatorFactory(
+        org=org,
+        validation_type=ValidationType.CUSTOM_VALIDATOR,
+        is_system=False,
+    )
+    WorkflowStepFactory(workflow=workflow, validator=validator)
+    submission = SubmissionFactory(
+        org=org,
+        project=workflow.project,
+        user=user,
+        workflow=workflow,
+    )
+    validation_run = ValidationRun.objects.create(
+        org=org,
+        workflow=workflow,
+        submission=submission,
+        project=submission.project,
+        user=user,
+        status=ValidationRunStatus.PENDING,
+    )
+    with patch(
+        "validibot.validations.validators.base.config.get_validator_class",
+        side_effect=_slow_validator_lookup,
+    ):
+        ValidationRunService().execute_workflow_steps(
+            validation_run_id=validation_run.id,
+            user_id=user.id,
+        )
+    return validation_run
+
+
+@override_settings(STEP_CPU_PROFILE_ORGS=[ORG_SLUG], STEP_CPU_PROFILE_MIN_SECONDS=0)
+def test_flagged_org_stores_collapsed_stacks_as_step_artifact():
+    run = _run_slow_step()
+
+    artifact = Artifact.objects.get(validation_run=run, role=CPU_PROFILE_ROLE)
+
+    assert artifact.kind == ArtifactKind.REPORT
+    assert artifact.step_run.step_order == artifact.workflow_step.order
+    assert artifact.metadata["sample_count"] > 0
+    with artifact.file.open("rb") as handle:
+        payload = handle.read()
+    assert len(payload) == artifact.size_bytes
+    assert b"_slow_validator_lookup" in payload
+
+
+def test_flagged_workflow_is_profiled():
+    org = OrganizationFactory(slug=ORG_SLUG)
+    workflow = WorkflowFactory(org=org)
+    run = ValidationRun(org=org, workflow=workflow)
+
+    with override_settings(STEP_CPU_PROFILE_WORKFLOWS=[f"{ORG_SLUG}/{workflow.slug}"]):
+        assert is_cpu_profiling_enabled(run)
+    with override_settings(STEP_CPU_PROFILE_WORKFLOWS=[f"{ORG_SLUG}/other"]):
+        assert not is_cpu_profiling_enabled(run)
+
+
+@override_settings(STEP_CPU_PROFILE_ORGS=[ORG_SLUG], STEP_CPU_PROFILE_MIN_SECONDS=0)
+def test_unflagged_org_stores_no_profile():
+    run = _run_slow_step(org_slug="someone-else")
+
+    assert not Artifact.objects.filter(validation_run=run).exists()
+
+
+@override_settings(STEP_CPU_PROFILE_ORGS=[ORG_SLUG], STEP_CPU_PROFILE_MIN_SECONDS=60)
+def test_fast_step_discards_its_samples():
+    run = _run_slow_step()
+
+    assert not Artifact.objects.filter(validation_run=run).exists()
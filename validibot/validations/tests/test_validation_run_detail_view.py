@@ -7,6 +7,7 @@ from unittest.mock import patch
 
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
+from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
 from lxml import html as lxml_html
@@ -19,6 +20,7 @@ from validibot.users.constants import RoleCode
 from validibot.users.tests.factories import OrganizationFactory
 from validibot.users.tests.factories import UserFactory
 from validibot.users.tests.factories import grant_role
+from validibot.validations.constants import Severity
 from validibot.validations.constants import ValidationRunStatus
 from validibot.validations.tests.factories import ValidationFindingFactory
 from validibot.validations.tests.factories import ValidationRunFactory
@@ -491,6 +493,66 @@ class ValidationRunDetailViewTests(TestCase):
         assert len(medal) == 1
         assert medal[0].get("alt") == ""
 
+    def _run_with_two_findings(self):
+        org = OrganizationFactory()
+        user = UserFactory(orgs=[org], username="daniel")
+        grant_role(user, org, RoleCode.VALIDATION_RESULTS_VIEWER)
+        user.memberships.get(org=org).set_roles(
+            {RoleCode.VALIDATION_RESULTS_VIEWER},
+        )
+        user.set_current_org(org)
+        submission = SubmissionFactory(org=org, user=user, project__org=org)
+        run = ValidationRunFactory(
+            submission=submission,
+            org=org,
+            workflow=submission.workflow,
+            project=submission.project,
+            user=user,
+            status=ValidationRunStatus.FAILED,
+        )
+        step_run = ValidationStepRunFactory(validation_run=run)
+        ValidationFindingFactory(
+            validation_step_run=step_run,
+            severity=Severity.WARNING,
+            message="Hidden warning detail",
+        )
+        ValidationFindingFactory(
+            validation_step_run=step_run,
+            severity=Severity.ERROR,
+            message="Shown error detail",
+        )
+        self.client.force_login(user)
+        return run
+
+    @override_settings(RUN_FINDINGS_INLINE_LIMIT=1)
+    def test_findings_past_inline_limit_link_to_full_export(self):
+        """A step with more findings than the cap shows a slice plus export."""
+        run = self._run_with_two_findings()
+
+        response = self.client.get(
+            reverse("validations:validation_detail", kwargs={"pk": run.pk}),
+        )
+
+        self.assertContains(response, "Shown error detail")
+        self.assertNotContains(response, "Hidden warning detail")
+        self.assertContains(
+            response,
+            reverse("validations:validation_findings_export", kwargs={"pk": run.pk}),
+        )
+
+    def test_findings_export_streams_every_finding(self):
+        """The web export carries the findings the page leaves out."""
+        run = self._run_with_two_findings()
+
+        response = self.client.get(
+            reverse("validations:validation_findings_export", kwargs={"pk": run.pk}),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        body = b"".join(response.streaming_content).decode()
+        self.assertIn("Shown error detail", body)
+        self.assertIn("Hidden warning detail", body)
+
 
 def _fake_pro_modules(credential):
     """Return a minimal validibot_pro module tree for community tests."""
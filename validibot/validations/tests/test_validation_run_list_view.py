@@ -5,7 +5,9 @@ boundaries and ensure payload-derived submission labels disappear as soon as
 input retention no longer permits access.
 """
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from validibot.submissions.constants import SubmissionRetention
@@ -14,7 +16,13 @@ from validibot.users.constants import RoleCode
 from validibot.users.tests.factories import OrganizationFactory
 from validibot.users.tests.factories import UserFactory
 from validibot.users.tests.factories import grant_role
+from validibot.validations.models import ValidationFinding
+from validibot.validations.models import ValidationRunSummary
+from validibot.validations.tests.factories import ValidationFindingFactory
 from validibot.validations.tests.factories import ValidationRunFactory
+from validibot.validations.tests.factories import ValidationStepRunFactory
+
+SUMMARY_ERROR_COUNT = 7
 
 
 class ValidationRunListViewTests(TestCase):
@@ -142,3 +150,37 @@ class ValidationRunListViewTests(TestCase):
         validations = list(response.context["validations"])
         self.assertEqual(len(validations), 1)
         self.assertFalse(validations[0].curr_user_can_delete)
+
+    def test_list_shows_summary_counts_without_loading_findings(self):
+        """Rows carry per-severity counts from the summary, not findings."""
+
+        org = OrganizationFactory()
+        owner = UserFactory(orgs=[org])
+        grant_role(owner, org, RoleCode.OWNER)
+        owner.set_current_org(org)
+        submission = SubmissionFactory(org=org, user=owner, project__org=org)
+        run = ValidationRunFactory(
+            submission=submission,
+            org=org,
+            workflow=submission.workflow,
+            project=submission.project,
+            user=owner,
+        )
+        ValidationFindingFactory(
+            validation_step_run=ValidationStepRunFactory(validation_run=run),
+        )
+        ValidationRunSummary.objects.create(
+            run=run,
+            status=run.status,
+            error_count=SUMMARY_ERROR_COUNT,
+        )
+
+        self.client.force_login(owner)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("validations:validation_list"))
+
+        self.assertContains(response, f">{SUMMARY_ERROR_COUNT}</span>")
+        finding_table = ValidationFinding._meta.db_table
+        self.assertFalse(
+            [q for q in queries.captured_queries if finding_table in q["sql"]],
+        )
@@ -0,0 +1,263 @@
+"""Tests for the validator benchmark suite and its management commands.
+
+Timings themselves are not asserted; these cover what a CI gate relies on:
+inputs are byte-identical across runs, each hot path executes cleanly on them,
+the report is valid JSON that leaves no rows behind, and the comparison fails
+exactly when a case slows down by more than the threshold.
+"""
+
+from __future__ import annotations
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from validibot.validations.benchmarks import fixtures
+from validibot.validations.benchmarks.suite import PROFILES
+from validibot.validations.benchmarks.suite import REPORT_SCHEMA_VERSION
+from validibot.validations.benchmarks.suite import build_cases
+from validibot.validations.cel_eval import evaluate_cel_expression
+from validibot.validations.models import Ruleset
+from validibot.validations.models import Validator
+from validibot.validations.services.path_resolution import resolve_path
+from validibot.workflows.form_builder import schema_to_django_form
+
+SMALL_ROWS = 20
+SMALL_DEPTH = 4
+SMALL_ELEMENTS = 10
+SMALL_ZONES = 3
+SMALL_PROPERTIES = 10
+SMALL_PATHS = 25
+ASSERTION_COUNT = 7
+# The sniff peek re-reads at most 1 KB of a 1 MB upload.
+MAX_READS_PER_BYTE = 1.01
+
+
+def _report(**min_seconds: float) -> dict:
+    return {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "results": [
+            {"name": name, "min_seconds": seconds}
+            for name, seconds in min_seconds.items()
+        ],
+    }
+
+
+def _write(tmp_path, name: str, report: dict) -> str:
+    path = tmp_path / name
+    path.write_text(json.dumps(report), encoding="utf-8")
+    return str(path)
+
+
+class TestFixtures:
+    @pytest.mark.parametrize(
+        ("generate", "size"),
+        [
+            (fixtures.generate_csv, SMALL_ROWS),
+            (fixtures.generate_deep_json, SMALL_DEPTH),
+            (fixtures.generate_xml, SMALL_ELEMENTS),
+            (fixtures.generate_idf, SMALL_ZONES),
+            (fixtures.generate_input_schema, SMALL_PROPERTIES),
+            (fixtures.generate_path_workload, SMALL_PATHS),
+        ],
+    )
+    def test_generators_are_deterministic(self, generate, size):
+        assert generate(size) == generate(size)
+
+    def test_csv_has_one_line_per_row_plus_header(self):
+        lines = fixtures.generate_csv(SMALL_ROWS).decode().splitlines()
+
+        assert lines[0] == "id,lat,lon,status"
+        assert len(lines) == SMALL_ROWS + 1
+
+    def test_cel_expressions_pass_against_the_context(self):
+        context = fixtures.generate_cel_context()
+
+        for expression in fixtures.generate_cel_expressions(ASSERTION_COUNT):
+            result = evaluate_cel_expression(expression=expression, context=context)
+            assert result.success, result.error
+            assert bool(result.value)
+
+    def test_parquet_holds_the_csv_rows(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+        import pyarrow as pa
+
+        table = pq.read_table(pa.BufferReader(fixtures.generate_parquet(SMALL_ROWS)))
+
+        assert table.column_names == ["id", "lat", "lon", "status"]
+        assert table.num_rows == SMALL_ROWS
+
+    def test_input_form_data_satisfies_the_schema(self):
+        schema = fixtures.generate_input_schema(SMALL_PROPERTIES)
+        form = schema_to_django_form(schema)(
+            data=fixtures.generate_input_form_data(SMALL_PROPERTIES),
+        )
+
+        assert form.is_valid(), form.errors
+
+    def test_workload_paths_are_distinct_and_resolve(self):
+        payload, paths = fixtures.generate_path_workload(SMALL_PATHS)
+
+        assert len(set(paths)) == SMALL_PATHS
+        for path in paths:
+            assert resolve_path(payload, path)[1], path
+
+    def test_row_assertions_are_distinct(self):
+        assertions = fixtures.generate_row_assertions(ASSERTION_COUNT)
+
+        assert len(set(assertions)) == ASSERTION_COUNT
+
+
+class TestBuildCases:
+    def test_case_names_are_unique_in_every_profile(self):
+        for profile in PROFILES:
+            names = [case.name for case in build_cases(profile)]
+            assert len(names) == len(set(names))
+
+    def test_full_profile_covers_the_documented_ranges(self):
+        names = [case.name for case in build_cases("full")]
+
+        assert "tabular.validate[rows=1000000,assertions=1]" in names
+        assert "tabular.validate[rows=1000,assertions=500]" in names
+
+
+@pytest.mark.django_db
+class TestBenchmarkValidatorsCommand:
+    @pytest.mark.parametrize(
+        "case",
+        [
+            "tabular.validate[rows=1000,",
+            "tabular.validate[format=parquet,rows=1000,",
+            "json_schema",
+            "xml_schema",
+            "idf_facts",
+            "paths.",
+            "launch.validate_input",
+            "submissions.ingest_uploaded_file[megabytes=1]",
+            "retention.purge_expired_submissions",
+            "retention.purge_expired_outputs",
+            "fmu.",
+            "therm.parse_therm_file[polygons=1000]",
+        ],
+    )
+    def test_hot_paths_run_and_roll_back(self, case):
+        stdout = StringIO()
+
+        call_command(
+            "benchmark_validators",
+            "--repeat=1",
+            f"--case={case}",
+            stdout=stdout,
+        )
+
+        report = json.loads(stdout.getvalue())
+        assert report["schema_version"] == REPORT_SCHEMA_VERSION
+        assert report["results"]
+        for result in report["results"]:
+            assert result["min_seconds"] >= 0
+            assert len(result["samples"]) == 1
+        assert not Validator.objects.filter(slug__startswith="benchmark-").exists()
+        assert not Ruleset.objects.filter(name__startswith="Benchmark ").exists()
+
+    def test_ingest_reads_each_upload_byte_once(self):
+        stdout = StringIO()
+
+        call_command(
+            "benchmark_validators",
+            "--repeat=1",
+            "--case=submissions.ingest_uploaded_file[megabytes=1]",
+            stdout=stdout,
+        )
+
+        (result,) = json.loads(stdout.getvalue())["results"]
+        assert result["counters"]["bytes_read_per_byte"] < MAX_READS_PER_BYTE
+
+    def test_writes_report_to_output_path(self, tmp_path):
+        output = tmp_path / "report.json"
+
+        call_command(
+            "benchmark_validators",
+            "--repeat=1",
+            "--case=cel.evaluate_cel_expression[expressions=1]",
+            f"--output={output}",
+            stdout=StringIO(),
+        )
+
+        report = json.loads(output.read_text(encoding="utf-8"))
+        assert [result["name"] for result in report["results"]] == [
+            "cel.evaluate_cel_expression[expressions=1]",
+        ]
+
+    def test_unknown_case_is_an_error(self):
+        with pytest.raises(CommandError, match="No benchmark case"):
+            call_command("benchmark_validators", "--case=nope", stdout=StringIO())
+
+
+class TestCompareValidatorBenchmarksCommand:
+    def test_passes_within_threshold(self, tmp_path):
+        baseline = _write(tmp_path, "base.json", _report(a=1.0, b=2.0))
+        current = _write(tmp_path, "cur.json", _report(a=1.2, b=1.5))
+        stdout = StringIO()
+
+        call_command(
+            "compare_validator_benchmarks",
+            baseline,
+            current,
+            "--threshold=0.25",
+            stdout=stdout,
+        )
+
+        assert "No regressions across 2 cases" in stdout.getvalue()
+
+    def test_fails_over_threshold(self, tmp_path):
+        baseline = _write(tmp_path, "base.json", _report(a=1.0, b=2.0))
+        current = _write(tmp_path, "cur.json", _report(a=1.3, b=2.0))
+        stdout = StringIO()
+
+        with pytest.raises(CommandError, match="1 of 2 benchmark cases regressed"):
+            call_command(
+                "compare_validator_benchmarks",
+                baseline,
+                current,
+                "--threshold=0.25",
+                stdout=stdout,
+            )
+        assert "a: 1.0s -> 1.3s" in stdout.getvalue()
+
+    def test_threshold_defaults_to_setting(self, tmp_path, settings):
+        settings.VALIDATOR_BENCHMARK_REGRESSION_THRESHOLD = 0.5
+        baseline = _write(tmp_path, "base.json", _report(a=1.0))
+        current = _write(tmp_path, "cur.json", _report(a=1.4))
+
+        call_command(
+            "compare_validator_benchmarks",
+            baseline,
+            current,
+            stdout=StringIO(),
+        )
+
+    def test_reports_cases_missing_on_either_side(self, tmp_path):
+        baseline = _write(tmp_path, "base.json", _report(a=1.0, gone=1.0))
+        current = _write(tmp_path, "cur.json", _report(a=1.0, new=1.0))
+        stdout = StringIO()
+
+        call_command("compare_validator_benchmarks", baseline, current, stdout=stdout)
+
+        output = stdout.getvalue()
+        assert "gone: missing from current report" in output
+        assert "new: new, no baseline" in output
+
+    def test_rejects_unknown_schema_version(self, tmp_path):
+        baseline = _write(tmp_path, "base.json", {"schema_version": 99})
+        current = _write(tmp_path, "cur.json", _report(a=1.0))
+
+        with pytest.raises(CommandError, match="schema version"):
+            call_command(
+                "compare_validator_benchmarks",
+                baseline,
+                current,
+                stdout=StringIO(),
+            )
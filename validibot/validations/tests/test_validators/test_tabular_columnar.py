@@ -0,0 +1,303 @@
+"""
+Tests for the Tabular Validator's Parquet and Arrow IPC readers
+(:mod:`validibot.validations.validators.tabular.readers.columnar`).
+
+### What this suite covers and why
+
+The columnar readers feed the same validation core as CSV, so the behaviours
+pinned here are the ones that differ from the CSV path:
+
+- **Limits come from metadata** — a table over the row or column cap is
+  rejected with the CSV codes, without decoding column data.
+- **Projection** — only the requested columns are decoded, while
+  ``column_names`` still reports every column in the file.
+- **Typed cells** — values reach coercion as stored (ints stay ints, nulls
+  are nulls), and a float in a declared ``integer`` column is a type error
+  exactly as the string ``"5.0"`` is.
+- **Dispatch** — a binary submission with Parquet/Arrow magic bytes is read
+  columnar end to end, and its results match the equivalent CSV.
+
+pyarrow is an optional extra, so the suite is skipped when it is absent.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+
+import pytest
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase
+from django.test import TestCase
+
+from validibot.submissions.constants import SubmissionFileType
+from validibot.submissions.tests.factories import SubmissionFactory
+from validibot.validations.constants import RulesetType
+from validibot.validations.constants import ValidationType
+from validibot.validations.tests.factories import RulesetFactory
+from validibot.validations.tests.factories import ValidatorFactory
+from validibot.validations.validators.tabular.coercion import coerce_cell
+from validibot.validations.validators.tabular.preflight import CODE_FILE_TOO_LARGE
+from validibot.validations.validators.tabular.preflight import CODE_TOO_MANY_COLUMNS
+from validibot.validations.validators.tabular.preflight import TabularLimits
+from validibot.validations.validators.tabular.preflight import TabularReadError
+from validibot.validations.validators.tabular.readers.columnar import (
+    CODE_UNSUPPORTED_COLUMN_TYPE,
+)
+from validibot.validations.validators.tabular.readers.columnar import FORMAT_ARROW_FILE
+from validibot.validations.validators.tabular.readers.columnar import (
+    FORMAT_ARROW_STREAM,
+)
+from validibot.validations.validators.tabular.readers.columnar import FORMAT_PARQUET
+from validibot.validations.validators.tabular.readers.columnar import (
+    detect_columnar_format,
+)
+from validibot.validations.validators.tabular.readers.columnar import read_columnar
+from validibot.validations.validators.tabular.readers.csv import CODE_BLANK_HEADER
+from validibot.validations.validators.tabular.readers.csv import CODE_TOO_MANY_ROWS
+from validibot.validations.validators.tabular.validator import TabularValidator
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+ROW_COUNT = 3
+DECLARED_INTEGER = 5
+# A column of identical long strings: about 2 MB decoded, a few KB compressed.
+BOMB_ROWS = 2_000
+BOMB_CELL = "x" * 1_000
+BOMB_MAX_BYTES = 200_000
+
+
+def _table(**columns):
+    return pa.table(columns)
+
+
+def _parquet(table) -> bytes:
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer)
+    return buffer.getvalue()
+
+
+def _arrow_file(table, *, options=None) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _arrow_stream(table, *, max_chunksize=None, options=None) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table, max_chunksize=max_chunksize)
+    return sink.getvalue().to_pybytes()
+
+
+def _compressed_bombs() -> dict[str, bytes]:
+    table = _table(id=list(range(BOMB_ROWS)), payload=[BOMB_CELL] * BOMB_ROWS)
+    parquet = io.BytesIO()
+    pq.write_table(table, parquet, compression="zstd", use_dictionary=False)
+    options = pa.ipc.IpcWriteOptions(compression="zstd")
+    return {
+        FORMAT_PARQUET: parquet.getvalue(),
+        FORMAT_ARROW_FILE: _arrow_file(table, options=options),
+        FORMAT_ARROW_STREAM: _arrow_stream(
+            table,
+            max_chunksize=BOMB_ROWS // 4,
+            options=options,
+        ),
+    }
+
+
+def _sample_table():
+    return _table(
+        id=[1, 2, None],
+        score=[1.5, None, 3.0],
+        name=["a", None, "c"],
+        extra=["x", "y", "z"],
+    )
+
+
+class ColumnarReaderTests(SimpleTestCase):
+    """Reading Parquet and Arrow IPC into the shared model."""
+
+    def test_formats_are_detected_by_magic_bytes(self):
+        table = _sample_table()
+
+        self.assertEqual(detect_columnar_format(_parquet(table)), FORMAT_PARQUET)
+        self.assertEqual(detect_columnar_format(_arrow_file(table)), FORMAT_ARROW_FILE)
+        self.assertEqual(
+            detect_columnar_format(_arrow_stream(table)),
+            FORMAT_ARROW_STREAM,
+        )
+        self.assertIsNone(detect_columnar_format(b"id,name\n1,a\n"))
+
+    def test_only_requested_columns_are_decoded(self):
+        for encode in (_parquet, _arrow_file, _arrow_stream):
+            with self.subTest(encode=encode.__name__):
+                result = read_columnar(
+                    encode(_sample_table()),
+                    columns=["name", "id", "missing"],
+                )
+
+                self.assertEqual(
+                    result.column_names,
+                    ["id", "score", "name", "extra"],
+                )
+                self.assertEqual(list(result.dataframe.columns), ["id", "name"])
+                self.assertEqual(result.num_rows, ROW_COUNT)
+                self.assertEqual(result.num_columns, len(result.column_names))
+
+    def test_cells_keep_their_types(self):
+        result = read_columnar(_parquet(_sample_table()))
+
+        ids = result.dataframe["id"].tolist()
+        self.assertEqual(ids, [1, 2, None])
+        self.assertIsInstance(ids[0], int)
+        self.assertEqual(result.dataframe["score"].tolist()[0], 1.5)
+
+    def test_row_cap_is_enforced_from_metadata(self):
+        limits = TabularLimits(max_rows=ROW_COUNT - 1)
+        for encode in (_parquet, _arrow_file):
+            with self.subTest(encode=encode.__name__):
+                with pytest.raises(TabularReadError) as ctx:
+                    read_columnar(encode(_sample_table()), limits=limits)
+                self.assertEqual(ctx.value.code, CODE_TOO_MANY_ROWS)
+
+    def test_stream_row_cap_stops_at_the_first_batch_over(self):
+        content = _arrow_stream(_sample_table(), max_chunksize=1)
+
+        with pytest.raises(TabularReadError) as ctx:
+            read_columnar(content, limits=TabularLimits(max_rows=ROW_COUNT - 1))
+
+        self.assertEqual(ctx.value.code, CODE_TOO_MANY_ROWS)
+
+    def test_byte_cap_applies_to_the_decoded_size(self):
+        limits = TabularLimits(max_bytes=BOMB_MAX_BYTES)
+        for source_format, content in _compressed_bombs().items():
+            with self.subTest(source_format=source_format):
+                self.assertLess(len(content), BOMB_MAX_BYTES)
+
+                with pytest.raises(TabularReadError) as ctx:
+                    read_columnar(content, limits=limits)
+                self.assertEqual(ctx.value.code, CODE_FILE_TOO_LARGE)
+
+                # Only projected columns count toward the decoded size.
+                result = read_columnar(content, columns=["id"], limits=limits)
+                self.assertEqual(result.num_rows, BOMB_ROWS)
+
+    def test_column_cap_is_enforced(self):
+        with pytest.raises(TabularReadError) as ctx:
+            read_columnar(
+                _parquet(_sample_table()),
+                limits=TabularLimits(max_columns=2),
+            )
+
+        self.assertEqual(ctx.value.code, CODE_TOO_MANY_COLUMNS)
+
+    def test_unsafe_headers_fail_like_csv(self):
+        table = pa.table({" ": [1], "id": [2]})
+
+        with pytest.raises(TabularReadError) as ctx:
+            read_columnar(_parquet(table))
+
+        self.assertEqual(ctx.value.code, CODE_BLANK_HEADER)
+
+    def test_nested_columns_are_rejected_only_when_requested(self):
+        table = _table(id=[1], tags=[["a", "b"]])
+
+        result = read_columnar(_parquet(table), columns=["id"])
+        self.assertEqual(result.column_names, ["id", "tags"])
+
+        with pytest.raises(TabularReadError) as ctx:
+            read_columnar(_parquet(table), columns=["tags"])
+        self.assertEqual(ctx.value.code, CODE_UNSUPPORTED_COLUMN_TYPE)
+
+
+class TypedCoercionTests(SimpleTestCase):
+    """Typed cells follow the same rules as their string spellings."""
+
+    def test_integer_rejects_floats_and_booleans(self):
+        self.assertEqual(coerce_cell(DECLARED_INTEGER, "integer").value, 5)
+        self.assertFalse(coerce_cell(5.0, "integer").ok)
+        self.assertFalse(coerce_cell(True, "integer").ok)  # noqa: FBT003
+
+    def test_nulls_and_nan_are_null(self):
+        self.assertTrue(coerce_cell(None, "number").is_null)
+        self.assertTrue(coerce_cell(float("nan"), "number").is_null)
+
+    def test_dates_become_utc_datetimes(self):
+        coerced = coerce_cell(date(2024, 1, 2), "date")
+
+        self.assertEqual(coerced.value, datetime(2024, 1, 2, tzinfo=UTC))
+
+    def test_string_fields_accept_any_scalar_as_text(self):
+        self.assertEqual(coerce_cell(DECLARED_INTEGER, "string").value, "5")
+        self.assertEqual(coerce_cell(False, "string").value, "false")  # noqa: FBT003
+
+
+class ColumnarValidatorTests(TestCase):
+    """Binary submissions are dispatched to the columnar reader."""
+
+    def _validate(self, content: bytes, fields):
+        validator = ValidatorFactory(
+            validation_type=ValidationType.TABULAR,
+            supports_assertions=True,
+        )
+        ruleset = RulesetFactory(
+            ruleset_type=RulesetType.TABULAR,
+            rules_text=json.dumps({"fields": fields}),
+        )
+        submission = SubmissionFactory(
+            content="",
+            file_type=SubmissionFileType.BINARY,
+            input_file=ContentFile(content, name="table.parquet"),
+        )
+        return TabularValidator().validate(validator, submission, ruleset)
+
+    def test_valid_parquet_passes(self):
+        result = self._validate(
+            _parquet(_table(id=[1, 2, 3], score=[0.5, 1.5, 2.5])),
+            [
+                {"name": "id", "type": "integer", "constraints": {"unique": True}},
+                {"name": "score", "type": "number", "constraints": {"maximum": 3}},
+            ],
+        )
+
+        self.assertTrue(result.passed, result.issues)
+        self.assertEqual(result.stats["reader"], FORMAT_PARQUET)
+        self.assertEqual(result.output_values["num_rows"], ROW_COUNT)
+
+    def test_native_findings_match_the_csv_codes(self):
+        result = self._validate(
+            _arrow_file(_table(id=[1, 1, None], score=[0.5, 9.0, 1.0])),
+            [
+                {
+                    "name": "id",
+                    "type": "integer",
+                    "constraints": {"required": True, "unique": True},
+                },
+                {"name": "score", "type": "number", "constraints": {"maximum": 3}},
+            ],
+        )
+
+        self.assertFalse(result.passed)
+        self.assertEqual(
+            {issue.code for issue in result.issues},
+            {
+                "tabular.required_value_missing",
+                "tabular.unique_violation",
+                "tabular.out_of_range",
+            },
+        )
+
+    def test_binary_csv_still_reads_as_csv(self):
+        result = self._validate(
+            b"id,score\n1,0.5\n",
+            [{"name": "id", "type": "integer"}],
+        )
+
+        self.assertTrue(result.passed, result.issues)
+        self.assertEqual(result.stats["reader"], "csv")
@@ -14,13 +14,19 @@ from pathlib import Path
 
 import pytest
 from django.test import TestCase
+from lxml import etree
 
+from validibot.validations.benchmarks.fixtures import generate_thmx
 from validibot.validations.validators.therm.geometry import compute_bounding_box
+from validibot.validations.validators.therm.models import ThermModel
 from validibot.validations.validators.therm.models import ThermPolygon
 from validibot.validations.validators.therm.parser import parse_therm_file
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 SAMPLE_THMX = FIXTURES_DIR / "sample_valid.thmx"
+THERM_DATA_DIR = Path(__file__).resolve().parents[4] / "tests" / "data" / "therm"
+THERM_FIXTURES = [SAMPLE_THMX, *sorted(THERM_DATA_DIR.glob("*.thmx"))]
+SYNTHETIC_POLYGONS = 2_000
 
 
 def _read_sample_thmx() -> str:
@@ -73,6 +79,35 @@ class ThermParserTests(TestCase):
             parse_therm_file("")
 
 
+@pytest.mark.parametrize("path", THERM_FIXTURES, ids=lambda path: path.name)
+@pytest.mark.parametrize(
+    ("source_format", "wrap"),
+    [("thmx", lambda xml: xml), ("thmz", lambda xml: _make_thmz(xml.decode()))],
+    ids=["thmx", "thmz"],
+)
+def test_streaming_parse_matches_tree_parse(path, source_format, wrap):
+    """The one-pass parser accepts and models exactly what a full tree parse did."""
+    xml = path.read_bytes()
+    # The pre-streaming parser: build the whole tree, then model it.
+    etree.fromstring(
+        xml,
+        parser=etree.XMLParser(resolve_entities=False, no_network=True),
+    )
+
+    model = parse_therm_file(wrap(xml), filename=f"model.{source_format}")
+
+    assert model == ThermModel(source_format=source_format, therm_version=None)
+
+
+def test_large_synthetic_model_streams():
+    thmx = generate_thmx(SYNTHETIC_POLYGONS)
+
+    assert parse_therm_file(thmx, filename="big.thmx").source_format == "thmx"
+    # A syntax error deep in the document surfaces as the same ValueError.
+    with pytest.raises(ValueError, match="Invalid XML"):
+        parse_therm_file(thmx[: len(thmx) // 2], filename="big.thmx")
+
+
 # ---- Geometry Tests ----
 
 
@@ -2,12 +2,12 @@
 Regression tests for THMZ zip-bomb protection in the THERM parser.
 
 The THERM validator runs in-process inside the Django/Celery worker and
-opens uploaded ``.thmz`` ZIP archives, decompressing a member entirely into
-memory. Without an uncompressed-size cap, a tiny high-compression-ratio
+opens uploaded ``.thmz`` ZIP archives and streams the model member out of
+them. Without an uncompressed-size cap, a tiny high-compression-ratio
 archive (a "zip bomb") could decompress to many gigabytes and OOM the
 worker. ``parser.MAX_THMZ_UNCOMPRESSED_BYTES`` bounds how much we will
 extract from any single member; these tests pin that protection so a future
-refactor of ``_extract_xml_from_thmz`` cannot silently remove it.
+refactor of ``_open_thmz_model_xml`` cannot silently remove it.
 """
 
 from __future__ import annotations
@@ -20,7 +20,7 @@ import pytest
 from django.test import TestCase
 
 from validibot.validations.validators.therm.parser import MAX_THMZ_UNCOMPRESSED_BYTES
-from validibot.validations.validators.therm.parser import _extract_xml_from_thmz
+from validibot.validations.validators.therm.parser import _BoundedMemberReader
 from validibot.validations.validators.therm.parser import parse_therm_file
 
 # A highly compressible payload: a long run of identical bytes compresses to
@@ -43,6 +43,12 @@ def _make_zipbomb_thmz() -> bytes:
     return buf.getvalue()
 
 
+def _drain(reader: _BoundedMemberReader) -> None:
+    """Read ``reader`` to the end in parser-sized chunks."""
+    while reader.read(64 * 1024):
+        pass
+
+
 class ThermThmzZipBombTests(TestCase):
     """Verify oversized THMZ members are rejected without being materialised."""
 
@@ -92,4 +98,18 @@ class ThermThmzZipBombTests(TestCase):
             mock.patch.object(zipfile.ZipFile, "getinfo", lying_getinfo),
             pytest.raises(ValueError, match="THMZ"),
         ):
-            _extract_xml_from_thmz(thmz)
+            parse_therm_file(thmz, filename="bomb.thmz")
+
+    def test_reader_stops_at_the_cap_whatever_the_header_says(self):
+        """The bounded reader refuses bytes past the cap as they inflate.
+
+        This is the layer that does not trust ``ZipInfo.file_size``: it
+        counts what the member actually produces, in the small reads the
+        streaming parser makes, and fails one byte past the cap.
+        """
+        reader = _BoundedMemberReader(
+            io.BytesIO(b"A" * ZIPBOMB_MEMBER_SIZE),
+            "model.thmx",
+        )
+        with pytest.raises(ValueError, match="decompresses to more than"):
+            _drain(reader)
@@ -200,6 +200,11 @@ urlpatterns = [
         views.ValidationRunJsonView.as_view(),
         name="validation_json",
     ),
+    path(
+        "<uuid:pk>/findings/export/",
+        views.ValidationRunFindingsExportView.as_view(),
+        name="validation_findings_export",
+    ),
     path(
         "<uuid:pk>/credential/download/",
         views.CredentialDownloadView.as_view(),
@@ -831,6 +831,11 @@ class AdvancedValidator(BaseValidator):
     @staticmethod
     def _extract_issues_from_envelope(envelope: Any) -> list[ValidationIssue]:
         """Convert envelope messages to ValidationIssue objects."""
+        return [AdvancedValidator._issue_from_message(msg) for msg in envelope.messages]
+
+    @staticmethod
+    def _issue_from_message(msg: Any) -> ValidationIssue:
+        """Convert one envelope ``ValidationMessage`` to a ValidationIssue."""
         from validibot_shared.validations.envelopes import Severity as EnvelopeSeverity
 
         severity_map = {
@@ -838,14 +843,39 @@ class AdvancedValidator(BaseValidator):
             EnvelopeSeverity.WARNING: Severity.WARNING,
             EnvelopeSeverity.INFO: Severity.INFO,
         }
-        return [
-            ValidationIssue(
-                path=msg.location.path if msg.location else "",
-                message=msg.text,
-                severity=severity_map.get(msg.severity, Severity.INFO),
-            )
-            for msg in envelope.messages
-        ]
+        return ValidationIssue(
+            path=msg.location.path if msg.location else "",
+            message=msg.text,
+            severity=severity_map.get(msg.severity, Severity.INFO),
+        )
+
+    # STREAMED ENVELOPES
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    #
+    # Large output envelopes arrive as a ``StreamedOutputEnvelope`` whose
+    # header (everything except the big arrays) is what ``post_execute_validate``
+    # receives. The processor then walks the arrays named by
+    # ``streamed_issue_paths()`` and turns each item into a finding with
+    # ``issue_from_streamed_item()``, persisting them in batches. Subclasses
+    # that build issues from something other than ``messages`` override both.
+
+    def streamed_issue_paths(self, header_envelope: Any) -> tuple[tuple[str, ...], ...]:
+        """Array paths whose items become findings for a streamed envelope."""
+        from validibot.validations.services.envelope_stream import MESSAGES_PATH
+
+        return (MESSAGES_PATH,)
+
+    def issue_from_streamed_item(
+        self,
+        path: tuple[str, ...],
+        item: Any,
+    ) -> ValidationIssue | None:
+        """Convert one streamed array item to an issue (``None`` to drop it)."""
+        from validibot.validations.services.envelope_stream import MESSAGES_PATH
+
+        if path == MESSAGES_PATH:
+            return self._issue_from_message(item)
+        return None
 
     @staticmethod
     def _determine_passed(envelope: Any, *, assertion_failures: int = 0) -> bool:
@@ -948,9 +978,12 @@ class AdvancedValidator(BaseValidator):
         # persisting envelope messages here as well would duplicate every
         # container finding. SHACL also needs that single post-processing pass
         # to preserve its richer outputs.findings metadata.
-        stats.update(self._extract_outputs_stats(response.output_envelope))
+        from validibot.validations.services.envelope_stream import envelope_header
+
+        header = envelope_header(response.output_envelope)
+        stats.update(self._extract_outputs_stats(header))
         result = ValidationResult(
-            passed=self._determine_passed(response.output_envelope),
+            passed=self._determine_passed(header),
             issues=[],
             stats=stats,
         )
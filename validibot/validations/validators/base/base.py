@@ -58,6 +58,7 @@ from gettext import gettext as _
 from typing import TYPE_CHECKING
 from typing import Any
 
+from validibot.core import spans
 from validibot.validations.cel import DEFAULT_HELPERS
 from validibot.validations.cel import CelHelper
 from validibot.validations.constants import Severity
@@ -447,15 +448,19 @@ class BaseValidator(ABC):
         if stage == "output" and isinstance(payload, dict):
             output_dict = payload
         else:
-            # Input stage: resolve declared step outputs.
-            for io_definition in validator.step_io_definitions.filter(
-                direction=StepIODirection.OUTPUT,
-            ).only("contract_key"):
-                value, found = self._resolve_path(
-                    payload,
-                    io_definition.contract_key,
-                )
-                output_dict[io_definition.contract_key] = value if found else None
+            # Input stage: resolve declared step outputs in one batch.
+            from validibot.validations.services.path_resolution import resolve_paths
+
+            contract_keys = list(
+                validator.step_io_definitions.filter(
+                    direction=StepIODirection.OUTPUT,
+                ).values_list("contract_key", flat=True),
+            )
+            for contract_key, (value, found) in resolve_paths(
+                payload,
+                contract_keys,
+            ).items():
+                output_dict[contract_key] = value if found else None
 
         # NOTE: Declared step inputs are NOT injected into the s.*
         # namespace. They are validator-defined contracts, not
@@ -1121,6 +1126,7 @@ class BaseValidator(ABC):
                     count += 1
         return count
 
+    @spans.traced("assertions")
     def evaluate_assertions_for_stage(
         self,
         *,
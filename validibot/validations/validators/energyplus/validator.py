@@ -46,6 +46,7 @@ if TYPE_CHECKING:
     from validibot.submissions.models import Submission
     from validibot.validations.models import Ruleset
     from validibot.validations.models import Validator
+    from validibot.validations.validators.base.base import ValidationIssue
     from validibot.validations.validators.base.base import ValidationResult
     from validibot.workflows.models import WorkflowStep
 
@@ -183,6 +184,21 @@ class EnergyPlusValidator(AdvancedValidator):
         result = super().post_execute_validate(output_envelope, run_context)
         return self._filter_issues(result, run_context)
 
+    def issue_from_streamed_item(
+        self,
+        path: tuple[str, ...],
+        item: Any,
+    ) -> ValidationIssue | None:
+        """Apply the same warning filter to streamed envelope messages."""
+        issue = super().issue_from_streamed_item(path, item)
+        if (
+            issue is not None
+            and issue.severity != Severity.ERROR
+            and self._should_filter_warnings(self.run_context)
+        ):
+            return None
+        return issue
+
     def extract_output_values(self, output_envelope: Any) -> dict[str, Any] | None:
         """
         Extract simulation metrics from an EnergyPlus output envelope.
@@ -248,32 +248,10 @@ class SchematronValidator(AdvancedValidator):
         """Rebuild findings from structured output per the D10 contract."""
         url_template = self._rule_doc_url_template()
 
-        issues: list[ValidationIssue] = []
-        for finding in getattr(outputs, "findings", None) or []:
-            rule_id = str(getattr(finding, "rule_id", "") or "")
-            location = str(getattr(finding, "location_xpath", "") or "")
-            meta: dict[str, Any] = {
-                "location_xpath": location,
-                "flag": getattr(finding, "flag", "") or "",
-                "role": getattr(finding, "role", "") or "",
-            }
-            rule_url = self._rule_url(url_template, rule_id)
-            if rule_url:
-                meta["rule_url"] = rule_url
-            issues.append(
-                ValidationIssue(
-                    path=location,
-                    message=str(getattr(finding, "message", "") or ""),
-                    severity=_SEVERITY_FROM_STRING.get(
-                        str(getattr(finding, "severity", "") or ""),
-                        # Fail-closed, matching svrl.py: nothing
-                        # publisher-authored is silently downgraded.
-                        Severity.ERROR,
-                    ),
-                    code=rule_id,
-                    meta=meta,
-                ),
-            )
+        issues: list[ValidationIssue] = [
+            self._issue_from_finding(finding, url_template)
+            for finding in getattr(outputs, "findings", None) or []
+        ]
 
         if getattr(outputs, "findings_truncated", False):
             suppressed = int(getattr(outputs, "findings_suppressed_count", 0) or 0)
@@ -293,6 +271,54 @@ class SchematronValidator(AdvancedValidator):
             )
         return issues
 
+    def _issue_from_finding(self, finding: Any, url_template: str) -> ValidationIssue:
+        """Build one D10 finding: native rule id as code, XPath + link in meta."""
+        rule_id = str(getattr(finding, "rule_id", "") or "")
+        location = str(getattr(finding, "location_xpath", "") or "")
+        meta: dict[str, Any] = {
+            "location_xpath": location,
+            "flag": getattr(finding, "flag", "") or "",
+            "role": getattr(finding, "role", "") or "",
+        }
+        rule_url = self._rule_url(url_template, rule_id)
+        if rule_url:
+            meta["rule_url"] = rule_url
+        return ValidationIssue(
+            path=location,
+            message=str(getattr(finding, "message", "") or ""),
+            severity=_SEVERITY_FROM_STRING.get(
+                str(getattr(finding, "severity", "") or ""),
+                # Fail-closed, matching svrl.py: nothing
+                # publisher-authored is silently downgraded.
+                Severity.ERROR,
+            ),
+            code=rule_id,
+            meta=meta,
+        )
+
+    def streamed_issue_paths(self, header_envelope: Any) -> tuple[tuple[str, ...], ...]:
+        """Mirror ``post_execute_validate``'s choice of finding source (D9)."""
+        from validibot.validations.services.envelope_stream import FINDINGS_PATH
+        from validibot.validations.services.envelope_stream import MESSAGES_PATH
+
+        outputs = getattr(header_envelope, "outputs", None)
+        if outputs is None:
+            return (MESSAGES_PATH,)
+        if getattr(outputs, "engine_status", ENGINE_STATUS_OK) != ENGINE_STATUS_OK:
+            return ()
+        return (FINDINGS_PATH,)
+
+    def issue_from_streamed_item(
+        self,
+        path: tuple[str, ...],
+        item: Any,
+    ) -> ValidationIssue | None:
+        from validibot.validations.services.envelope_stream import FINDINGS_PATH
+
+        if path == FINDINGS_PATH:
+            return self._issue_from_finding(item, self._rule_doc_url_template())
+        return super().issue_from_streamed_item(path, item)
+
     @staticmethod
     def _engine_failure_issue(outputs: Any) -> ValidationIssue:
         """Build the single reserved D9 finding for an engine failure.
@@ -182,19 +182,39 @@ class SHACLValidator(AdvancedValidator):
     def _issues_from_outputs(outputs: Any) -> list[ValidationIssue]:
         """Rebuild ValidationIssue rows from the container's structured findings."""
         findings = getattr(outputs, "findings", None) or []
-        issues: list[ValidationIssue] = []
-        for f in findings:
-            issues.append(
-                ValidationIssue(
-                    path=getattr(f, "path", "") or "",
-                    message=f.message,
-                    severity=_SEVERITY_FROM_STRING.get(f.severity, Severity.ERROR),
-                    code=getattr(f, "code", "") or "",
-                    meta=dict(getattr(f, "meta", None) or {}) or None,
-                    assertion_id=getattr(f, "assertion_id", None),
-                ),
-            )
-        return issues
+        return [SHACLValidator._issue_from_finding(f) for f in findings]
+
+    @staticmethod
+    def _issue_from_finding(f: Any) -> ValidationIssue:
+        """Build one ValidationIssue, keeping SHACL meta and SPARQL attribution."""
+        return ValidationIssue(
+            path=getattr(f, "path", "") or "",
+            message=f.message,
+            severity=_SEVERITY_FROM_STRING.get(f.severity, Severity.ERROR),
+            code=getattr(f, "code", "") or "",
+            meta=dict(getattr(f, "meta", None) or {}) or None,
+            assertion_id=getattr(f, "assertion_id", None),
+        )
+
+    def streamed_issue_paths(self, header_envelope: Any) -> tuple[tuple[str, ...], ...]:
+        """Structured findings, plus envelope messages when outputs are absent."""
+        from validibot.validations.services.envelope_stream import FINDINGS_PATH
+        from validibot.validations.services.envelope_stream import MESSAGES_PATH
+
+        if getattr(header_envelope, "outputs", None) is None:
+            return (MESSAGES_PATH,)
+        return (FINDINGS_PATH,)
+
+    def issue_from_streamed_item(
+        self,
+        path: tuple[str, ...],
+        item: Any,
+    ) -> ValidationIssue | None:
+        from validibot.validations.services.envelope_stream import FINDINGS_PATH
+
+        if path == FINDINGS_PATH:
+            return self._issue_from_finding(item)
+        return super().issue_from_streamed_item(path, item)
 
     @staticmethod
     def _build_stats(outputs: Any) -> dict[str, Any]:
@@ -10,21 +10,24 @@ two never disagree about what a cell *is*.
 Every coercion is locale-free: numbers use ``.`` as the decimal separator with
 no thousands grouping, and dates are ISO 8601 only. Two operators on two
 machines coerce the same cell to the same value.
+
+Columnar readers (Parquet, Arrow) hand over cells that are already typed. Those
+are checked against the declared type instead of parsed (:func:`_coerce_typed`),
+so a float column is never round-tripped through its string form.
 """
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
 from typing import Any
 
 from validibot.validations.cel_helpers import _parse_iso8601
 
-if TYPE_CHECKING:
-    # Only used in a local annotation; ``from __future__ import annotations``
-    # keeps it a string at runtime, so the import is type-only.
-    from datetime import datetime
-
 # Boolean spellings accepted by ``type=boolean`` coercion. Matches Table
 # Schema's default true/false value sets (plus the common ``1``/``0``).
 _TRUE_VALUES: frozenset[str] = frozenset({"true", "True", "TRUE", "1"})
@@ -87,8 +90,57 @@ def _coerce_temporal(raw: str) -> Coerced:
     return Coerced(ok=True, is_null=False, value=parsed)
 
 
+def _coerce_typed(value: Any, field_type: str) -> Coerced:
+    """Check an already-typed columnar cell against ``field_type``.
+
+    Mirrors the string rules: ``integer`` accepts only integers (a float
+    ``5.0`` is rejected, as the string ``"5.0"`` is), booleans are never
+    numbers, and a naive timestamp is read as UTC. ``string`` accepts any
+    scalar through its canonical text, so a declared-string numeric column
+    still validates.
+    """
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        # Arrow nulls surface as ``None``, or ``NaN`` in float columns.
+        return _NULL
+    if field_type == "string":
+        return Coerced(ok=True, is_null=False, value=cell_text(value))
+    if isinstance(value, bool):
+        if field_type == "boolean":
+            return Coerced(ok=True, is_null=False, value=value)
+    elif isinstance(value, int):
+        if field_type in {"integer", "number"}:
+            value = value if field_type == "integer" else float(value)
+            return Coerced(ok=True, is_null=False, value=value)
+    elif isinstance(value, float | Decimal):
+        if field_type == "number":
+            return Coerced(ok=True, is_null=False, value=float(value))
+    elif isinstance(value, date) and field_type in {"date", "datetime"}:
+        if not isinstance(value, datetime):
+            value = datetime(value.year, value.month, value.day, tzinfo=UTC)
+        elif value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return Coerced(ok=True, is_null=False, value=value)
+    return Coerced(ok=False, is_null=False, value=None)
+
+
+def cell_text(value: Any) -> str:
+    """Return the text a cell is matched against for length/pattern/enum.
+
+    A CSV cell is its own text. A typed columnar cell uses a canonical,
+    locale-free spelling: ``true``/``false`` for booleans and ISO 8601 for
+    dates, the forms the string coercions accept.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
 def coerce_cell(
-    raw: str,
+    raw: Any,
     field_type: str,
     missing_values: tuple[str, ...] = ("",),
 ) -> Coerced:
@@ -102,7 +154,12 @@ def coerce_cell(
     a fixed set of spellings; ``date``/``datetime`` accept ISO 8601 only.
     Anything that fails is a type error (``ok=False``), which native validation
     reports as ``tabular.type_error``.
+
+    A non-string *raw* is a typed columnar cell and goes through
+    :func:`_coerce_typed`; *missing_values* only applies to text.
     """
+    if not isinstance(raw, str):
+        return _coerce_typed(raw, field_type)
     if raw in missing_values:
         return _NULL
     if field_type == "string":
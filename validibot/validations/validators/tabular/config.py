@@ -16,7 +16,8 @@ config = ValidatorConfig(
     slug="tabular-validator",
     name="Tabular Validator",
     short_description=(
-        "Validate tabular data (CSV in V1) against a column schema and per-row rules."
+        "Validate tabular data (CSV, Parquet or Arrow) against a column schema "
+        "and per-row rules."
     ),
     # NOTE: ValidatorConfig.description is strict-typed `str` (pydantic), so do
     # NOT wrap it in `gettext_lazy` — that would crash on app boot. Other
@@ -33,10 +34,11 @@ config = ValidatorConfig(
     ),
     version=1,
     order=10,
-    # CSV is carried as a plain-text file; the reader handles the rest.
-    supported_file_types=[SubmissionFileType.TEXT],
+    # CSV is carried as a plain-text file; Parquet and Arrow IPC arrive as
+    # binary files and are recognised by their magic bytes.
+    supported_file_types=[SubmissionFileType.TEXT, SubmissionFileType.BINARY],
     supported_data_formats=[SubmissionDataFormat.CSV],
-    allowed_extensions=["csv", "tsv"],
+    allowed_extensions=["csv", "tsv", "parquet", "arrow", "feather"],
     supports_assertions=True,
     icon="bi-table",
     # Tabular owns its workflow import/export body so a re-imported ruleset's
@@ -34,6 +34,7 @@ from typing import TYPE_CHECKING
 from validibot.validations.constants import Severity
 from validibot.validations.regex_safety import UnsafeOrInvalidPatternError
 from validibot.validations.regex_safety import compile_user_pattern
+from validibot.validations.validators.tabular.coercion import cell_text
 from validibot.validations.validators.tabular.coercion import coerce_cell
 
 if TYPE_CHECKING:
@@ -129,7 +130,7 @@ def _validate_field(
         elif not coerced.ok:
             type_error_rows.append(position)
         else:
-            valid.append((position, coerced.value, raw))
+            valid.append((position, coerced.value, cell_text(raw)))
 
     # Nullability: a null cell in a required column is a violation.
     if constraints.required and null_rows:
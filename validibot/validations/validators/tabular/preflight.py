@@ -16,8 +16,9 @@ parsing fails — PREFLIGHT only bounds the cost of reaching that failure.
 See ADR-2026-05-26 (Tabular Validator), "Evaluation pipeline".
 
 Everything here is pure (no Django, no models), so it is unit-testable in
-isolation and shared by every future reader (CSV in V1; TSV/Excel/Parquet
-later).
+isolation. The text checks serve the CSV reader; the Parquet/Arrow readers
+take their sizes from file metadata but enforce the same
+:class:`TabularLimits` and return the same :class:`PreflightResult`.
 """
 
 from __future__ import annotations
@@ -0,0 +1,359 @@
+"""Parquet and Arrow IPC readers — typed, projected, bounded by metadata.
+
+Large tables usually exist as Parquet or Arrow before anyone exports them to
+CSV. Reading them natively skips the export, the UTF-8 decode, the string parse
+and the string-to-type coercion, and produces the same :class:`ReadResult` the
+CSV reader does, with three differences:
+
+- **Limits come from metadata.** Row and column counts are in the Parquet
+  footer and the Arrow IPC file footer, so an oversized table is rejected
+  before any column data is decoded. An Arrow *stream* has no footer; its
+  batches are counted as they arrive and reading stops at the first batch
+  past the cap.
+- **The byte cap applies to decoded data too.** A small, highly compressed
+  upload can decode to gigabytes. Parquet's footer records each column
+  chunk's uncompressed size, so the projected columns are sized before
+  decoding. Arrow IPC batch bodies hold *compressed* buffers when IPC
+  compression is on, so Arrow files and streams are decoded batch by batch
+  and reading stops at the first batch that takes the total past the cap.
+- **Only needed columns are decoded.** The caller passes the declared schema
+  fields; native checks and ``row.*``/``col.*`` assertions can only reference
+  those, so the ``dataframe`` holds just that projection. ``column_names``
+  still lists every column in the file, so presence checks and ``i.*`` see the
+  whole table.
+- **Cells stay typed.** Cells arrive as Python ints, floats, booleans, dates
+  and strings, with nulls as ``None`` (``NaN`` in float columns);
+  :func:`~validibot.validations.validators.tabular.coercion.coerce_cell`
+  checks them against the declared type instead of parsing text.
+
+pyarrow is an optional dependency (the ``tabular-columnar`` extra). Without it
+these readers fail with ``tabular.reader_unavailable``; CSV is unaffected.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pandas as pd
+
+from validibot.validations.validators.tabular.preflight import CODE_EMPTY_FILE
+from validibot.validations.validators.tabular.preflight import CODE_FILE_TOO_LARGE
+from validibot.validations.validators.tabular.preflight import CODE_TOO_MANY_COLUMNS
+from validibot.validations.validators.tabular.preflight import PreflightError
+from validibot.validations.validators.tabular.preflight import PreflightResult
+from validibot.validations.validators.tabular.preflight import TabularLimits
+from validibot.validations.validators.tabular.readers.csv import CODE_PARSE_ERROR
+from validibot.validations.validators.tabular.readers.csv import CODE_TOO_MANY_ROWS
+from validibot.validations.validators.tabular.readers.csv import ParseError
+from validibot.validations.validators.tabular.readers.csv import ReadResult
+from validibot.validations.validators.tabular.readers.csv import _canonical_header_names
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+CODE_READER_UNAVAILABLE = "tabular.reader_unavailable"
+CODE_UNSUPPORTED_COLUMN_TYPE = "tabular.unsupported_column_type"
+
+FORMAT_PARQUET = "parquet"
+FORMAT_ARROW_FILE = "arrow_file"
+FORMAT_ARROW_STREAM = "arrow_stream"
+
+_PARQUET_MAGIC = b"PAR1"
+_ARROW_FILE_MAGIC = b"ARROW1"
+# An Arrow IPC stream opens with a continuation marker. 0xFF never occurs in
+# UTF-8, so no CSV can be mistaken for a stream.
+_ARROW_STREAM_MARKER = b"\xff\xff\xff\xff"
+
+
+def detect_columnar_format(content: bytes) -> str | None:
+    """Return the columnar format *content* is in, or ``None`` for text."""
+    if content.startswith(_PARQUET_MAGIC) and content.endswith(_PARQUET_MAGIC):
+        return FORMAT_PARQUET
+    if content.startswith(_ARROW_FILE_MAGIC):
+        return FORMAT_ARROW_FILE
+    if content.startswith(_ARROW_STREAM_MARKER):
+        return FORMAT_ARROW_STREAM
+    return None
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as exc:
+        msg = (
+            "Parquet and Arrow files need pyarrow, which is not installed. "
+            "Install with: uv sync --extra tabular-columnar"
+        )
+        raise ParseError(msg, code=CODE_READER_UNAVAILABLE) from exc
+    return pa
+
+
+def read_columnar(
+    content: bytes,
+    *,
+    columns: list[str] | None = None,
+    limits: TabularLimits | None = None,
+) -> ReadResult:
+    """Read Parquet or Arrow IPC *content* into the shared in-memory model.
+
+    *columns* names the logical columns to decode (normally the schema's
+    declared fields); ``None`` decodes every column. Names not in the file are
+    ignored here — a missing required column is native validation's finding.
+
+    The byte, column and row caps are enforced before any column data is
+    decoded, the byte cap again against the decoded size of the projected
+    columns, and header names go through the same canonicalisation as CSV
+    (blank, duplicate and case-colliding names fail).
+
+    Raises a :class:`TabularReadError` subclass on any failure.
+    """
+    limits = limits or TabularLimits()
+    size_bytes = len(content)
+    if size_bytes > limits.max_bytes:
+        msg = f"File is {size_bytes} bytes, over the {limits.max_bytes}-byte limit."
+        raise PreflightError(msg, code=CODE_FILE_TOO_LARGE)
+    if size_bytes == 0:
+        raise PreflightError("File is empty.", code=CODE_EMPTY_FILE)
+
+    source_format = detect_columnar_format(content)
+    if source_format is None:
+        raise ParseError(
+            "File is not a Parquet or Arrow IPC file.",
+            code=CODE_PARSE_ERROR,
+        )
+
+    pa = _import_pyarrow()
+    try:
+        if source_format == FORMAT_PARQUET:
+            return _read_parquet(pa, content, columns=columns, limits=limits)
+        return _read_arrow(
+            pa,
+            content,
+            stream=source_format == FORMAT_ARROW_STREAM,
+            columns=columns,
+            limits=limits,
+        )
+    except pa.ArrowException as exc:
+        msg = f"Could not read the file as {source_format}: {exc}"
+        raise ParseError(msg, code=CODE_PARSE_ERROR) from exc
+
+
+def _read_parquet(
+    pa,
+    content: bytes,
+    *,
+    columns: list[str] | None,
+    limits: TabularLimits,
+) -> ReadResult:
+    parquet_file = pa.parquet.ParquetFile(pa.BufferReader(content))
+    schema = parquet_file.schema_arrow
+    metadata = parquet_file.metadata
+    num_rows = metadata.num_rows
+    _check_limits(schema, num_rows, limits)
+    projected = {schema.names[i] for i in _projection(schema, columns, limits)}
+    decoded_bytes = sum(
+        chunk.total_uncompressed_size
+        for group in range(metadata.num_row_groups)
+        for chunk in (
+            metadata.row_group(group).column(index)
+            for index in range(metadata.num_columns)
+        )
+        if chunk.path_in_schema.split(".")[0] in projected
+    )
+    _check_decoded_bytes(decoded_bytes, limits)
+
+    def load(indices: list[int]):
+        return parquet_file.read(columns=[schema.names[i] for i in indices])
+
+    return _build_result(
+        pa,
+        schema,
+        num_rows,
+        load,
+        columns=columns,
+        limits=limits,
+        size_bytes=len(content),
+        source_format=FORMAT_PARQUET,
+    )
+
+
+def _read_arrow(
+    pa,
+    content: bytes,
+    *,
+    stream: bool,
+    columns: list[str] | None,
+    limits: TabularLimits,
+) -> ReadResult:
+    buffer = pa.py_buffer(content)
+    if not stream:
+        file_reader = pa.ipc.open_file(buffer)
+        schema = file_reader.schema
+        num_rows = file_reader.count_rows()
+        _check_limits(schema, num_rows, limits)
+
+        def load(indices: list[int]):
+            options = pa.ipc.IpcReadOptions(included_fields=indices)
+            reader = pa.ipc.open_file(buffer, options=options)
+            batches = []
+            decoded_bytes = 0
+            for index in range(reader.num_record_batches):
+                batch = reader.get_batch(index)
+                decoded_bytes += batch.nbytes
+                _check_decoded_bytes(decoded_bytes, limits)
+                batches.append(batch)
+            return pa.Table.from_batches(batches, schema=reader.schema)
+
+        return _build_result(
+            pa,
+            schema,
+            num_rows,
+            load,
+            columns=columns,
+            limits=limits,
+            size_bytes=len(content),
+            source_format=FORMAT_ARROW_FILE,
+        )
+
+    schema = pa.ipc.open_stream(buffer).schema
+    _check_limits(schema, 0, limits)
+    # No footer: count rows while reading, decoding only the projection and
+    # stopping at the first batch over the cap. An empty field list means "all
+    # fields" to pyarrow, so with nothing projected decode just the first.
+    indices = _projection(schema, columns, limits)
+    if not indices and schema.names:
+        indices = [0]
+    reader = pa.ipc.open_stream(
+        buffer,
+        options=pa.ipc.IpcReadOptions(included_fields=indices),
+    )
+    batches = []
+    num_rows = 0
+    decoded_bytes = 0
+    for batch in reader:
+        num_rows += batch.num_rows
+        if num_rows > limits.max_rows:
+            msg = f"File has more than the {limits.max_rows}-row limit."
+            raise ParseError(msg, code=CODE_TOO_MANY_ROWS)
+        decoded_bytes += batch.nbytes
+        _check_decoded_bytes(decoded_bytes, limits)
+        batches.append(batch)
+    table = pa.Table.from_batches(batches, schema=reader.schema)
+    return _build_result(
+        pa,
+        schema,
+        num_rows,
+        lambda _indices: table,
+        columns=columns,
+        limits=limits,
+        size_bytes=len(content),
+        source_format=FORMAT_ARROW_STREAM,
+    )
+
+
+def _check_limits(schema, num_rows: int, limits: TabularLimits) -> None:
+    if len(schema.names) > limits.max_columns:
+        msg = (
+            f"File has {len(schema.names)} columns, over the "
+            f"{limits.max_columns}-column limit."
+        )
+        raise PreflightError(msg, code=CODE_TOO_MANY_COLUMNS)
+    if num_rows > limits.max_rows:
+        msg = f"File has more than the {limits.max_rows}-row limit."
+        raise ParseError(msg, code=CODE_TOO_MANY_ROWS)
+
+
+def _check_decoded_bytes(decoded_bytes: int, limits: TabularLimits) -> None:
+    if decoded_bytes > limits.max_bytes:
+        msg = (
+            f"File decodes to more than the {limits.max_bytes}-byte limit "
+            f"({decoded_bytes} bytes so far)."
+        )
+        raise PreflightError(msg, code=CODE_FILE_TOO_LARGE)
+
+
+def _projection(
+    schema,
+    columns: list[str] | None,
+    limits: TabularLimits,
+) -> list[int]:
+    """Return the positions of the requested logical columns, in file order."""
+    names = _canonical_header_names(
+        list(schema.names),
+        max_name_chars=limits.max_header_name_chars,
+    )
+    if columns is None:
+        return list(range(len(names)))
+    wanted = set(columns)
+    return [index for index, name in enumerate(names) if name in wanted]
+
+
+def _build_result(
+    pa,
+    schema,
+    num_rows: int,
+    load: Callable[[list[int]], Any],
+    *,
+    columns: list[str] | None,
+    limits: TabularLimits,
+    size_bytes: int,
+    source_format: str,
+) -> ReadResult:
+    names = _canonical_header_names(
+        list(schema.names),
+        max_name_chars=limits.max_header_name_chars,
+    )
+    indices = _projection(schema, columns, limits)
+    for index in indices:
+        if _is_unsupported(pa, schema.field(index).type):
+            msg = (
+                f"Column {names[index]!r} has type {schema.field(index).type}, "
+                f"which cannot be validated as a table cell."
+            )
+            raise ParseError(msg, code=CODE_UNSUPPORTED_COLUMN_TYPE)
+
+    if indices:
+        frame = load(indices).to_pandas(
+            # Keep ints with nulls as ints (not float NaN) and dates as Python
+            # objects, so cells reach coercion exactly as stored.
+            integer_object_nulls=True,
+            date_as_object=True,
+            timestamp_as_object=True,
+        )
+        frame.columns = pd.Index([names[index] for index in indices])
+    else:
+        frame = pd.DataFrame(index=pd.RangeIndex(num_rows))
+
+    return ReadResult(
+        dataframe=frame,
+        column_names=names,
+        num_rows=num_rows,
+        num_columns=len(names),
+        preflight=PreflightResult(
+            size_bytes=size_bytes,
+            # Parquet and Arrow strings are UTF-8 by specification.
+            encoding="utf-8",
+            delimiter="",
+            has_header=True,
+            field_count=len(names),
+            header_names=list(schema.names),
+            text="",
+        ),
+        source_format=source_format,
+    )
+
+
+def _is_unsupported(pa, arrow_type) -> bool:
+    """Nested and raw-binary columns have no single-cell text or value."""
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    return (
+        pa.types.is_nested(arrow_type)
+        or pa.types.is_binary(arrow_type)
+        or pa.types.is_large_binary(arrow_type)
+        or pa.types.is_fixed_size_binary(arrow_type)
+        or pa.types.is_binary_view(arrow_type)
+    )
@@ -49,10 +49,14 @@ class ParseError(TabularReadError):
 class ReadResult:
     """The shared in-memory model produced by any reader.
 
-    ``dataframe`` holds every cell as a string (empty cells are ``""``),
-    keyed by the canonical ``column_names``. ``num_rows`` is ``len(df)`` —
-    the parsed data-row count, never a byte-level newline count (a quoted
-    field may contain newlines per RFC 4180).
+    From CSV, ``dataframe`` holds every cell as a string (empty cells are
+    ``""``), keyed by the canonical ``column_names``. ``num_rows`` is
+    ``len(df)`` — the parsed data-row count, never a byte-level newline count
+    (a quoted field may contain newlines per RFC 4180).
+
+    The columnar readers (``readers/columnar.py``) keep cells typed and decode
+    only the requested columns, so their ``dataframe`` may hold a subset of
+    ``column_names``; ``num_rows`` then comes from file metadata.
     """
 
     dataframe: pd.DataFrame
@@ -60,6 +64,7 @@ class ReadResult:
     num_rows: int
     num_columns: int
     preflight: PreflightResult
+    source_format: str = "csv"
 
 
 def _canonical_header_names(
@@ -1,6 +1,7 @@
 """The Tabular Validator — ties the reader and native validation together.
 
-``validate()`` reads the submitted CSV into the shared in-memory model, runs
+``validate()`` reads the submitted table (CSV text, or Parquet/Arrow IPC
+uploaded as a binary file) into the shared in-memory model, runs
 native structured validation against the ruleset's Table Schema, evaluates
 per-row CEL assertions through ``row.*`` and aggregate assertions through
 ``col.*``, maps the resulting :class:`NativeFinding`s onto the platform's
@@ -24,6 +25,9 @@ from typing import Any
 
 from django.utils.translation import gettext as _
 
+from validibot.core import metrics
+from validibot.core import spans
+from validibot.submissions.constants import SubmissionFileType
 from validibot.validations.constants import Severity
 from validibot.validations.validators.base.base import AssertionStats
 from validibot.validations.validators.base.base import BaseValidator
@@ -36,9 +40,15 @@ from validibot.validations.validators.tabular.column_eval import (
 from validibot.validations.validators.tabular.metadata import TABULAR_DATASET_INPUTS
 from validibot.validations.validators.tabular.native import DEFAULT_REPORT_MAX_EXAMPLES
 from validibot.validations.validators.tabular.native import validate_native
+from validibot.validations.validators.tabular.preflight import CODE_FILE_TOO_LARGE
+from validibot.validations.validators.tabular.preflight import PreflightError
 from validibot.validations.validators.tabular.preflight import TabularDialect
 from validibot.validations.validators.tabular.preflight import TabularLimits
 from validibot.validations.validators.tabular.preflight import TabularReadError
+from validibot.validations.validators.tabular.readers.columnar import (
+    detect_columnar_format,
+)
+from validibot.validations.validators.tabular.readers.columnar import read_columnar
 from validibot.validations.validators.tabular.readers.csv import read_csv
 from validibot.validations.validators.tabular.row_eval import RowAssertion
 from validibot.validations.validators.tabular.row_eval import evaluate_row_assertions
@@ -61,12 +71,25 @@ CODE_INVALID_SCHEMA = "tabular.invalid_schema"
 # it individually through their options.
 _DEFAULT_REPORT_MAX_EXAMPLES = DEFAULT_REPORT_MAX_EXAMPLES
 
+# Per-lane throughput. Rows are counted only for lanes that actually ran over
+# the table, so rows/second per lane is a straight ratio of the two series.
+TABULAR_ROWS = metrics.counter(
+    "validibot_tabular_rows_total",
+    "Rows processed by each tabular validation lane.",
+    labelnames=("lane",),
+)
+TABULAR_LANE_SECONDS = metrics.histogram(
+    "validibot_tabular_lane_seconds",
+    "Wall-clock time spent in each tabular validation lane.",
+    labelnames=("lane",),
+)
+
 
 class TabularValidator(BaseValidator):
-    """In-process validator for tabular data (CSV in V1).
+    """In-process validator for tabular data (CSV, Parquet, Arrow IPC).
 
     See the module docstring and ADR-2026-05-26 for the full design. The
-    validate flow is: load schema → read CSV → native validation → row CEL →
+    validate flow is: load schema → read table → native validation → row CEL →
     column CEL → dataset CEL, returning aggregated ``ValidationIssue``s.
     """
 
@@ -90,7 +113,8 @@ class TabularValidator(BaseValidator):
         # 1. Load the structured config (Table Schema). A bad schema is a
         #    configuration error reported as a single finding, not a crash.
         try:
-            schema = self._load_schema(ruleset)
+            with spans.span("parse"):
+                schema = self._load_schema(ruleset)
         except (ValueError, TypeError) as exc:
             return self._single_error(
                 CODE_INVALID_SCHEMA,
@@ -100,22 +124,16 @@ class TabularValidator(BaseValidator):
 
         dialect, limits, report_max_examples = self._load_settings(ruleset)
 
-        # 2. Read the body. Content arrives pre-decoded from get_content(); we
-        #    re-encode as UTF-8 and read as UTF-8. Encoding is pinned to UTF-8
-        #    in V1 (there is no editable encoding setting) because get_content()
-        #    has already decoded the submission — honoring another encoding needs
-        #    a raw-bytes read path (a future slice). A read failure (oversized,
-        #    ragged, undecodable) becomes a single finding carrying its code.
-        content = submission.get_content() or ""
-        content_bytes = content.encode("utf-8") if isinstance(content, str) else content
-        declared_columns = None if dialect.has_header else schema.field_names()
+        # 2. Read the body. A read failure (oversized, ragged, undecodable)
+        #    becomes a single finding carrying its code.
         try:
-            read_result = read_csv(
-                content_bytes,
-                dialect=dialect,
-                declared_columns=declared_columns,
-                limits=limits,
-            )
+            with spans.span("read"):
+                read_result = self._read_table(
+                    submission,
+                    schema=schema,
+                    dialect=dialect,
+                    limits=limits,
+                )
         except TabularReadError as exc:
             return self._single_error(
                 exc.code,
@@ -162,12 +180,17 @@ class TabularValidator(BaseValidator):
         # 5. Native structured validation against the schema. The wall-clock
         #    budget bounds the author-supplied regex pattern checks (which run
         #    against every submitter cell) the same way the row lane is bounded.
-        native_findings = validate_native(
-            read_result,
-            schema,
-            report_max_examples=report_max_examples,
-            wall_clock_budget_s=limits.max_wallclock_s,
-        )
+        with (
+            TABULAR_LANE_SECONDS.labels(lane="native").time(),
+            spans.span("native"),
+        ):
+            native_findings = validate_native(
+                read_result,
+                schema,
+                report_max_examples=report_max_examples,
+                wall_clock_budget_s=limits.max_wallclock_s,
+            )
+        TABULAR_ROWS.labels(lane="native").inc(read_result.num_rows)
         issues.extend(self._to_issue(finding) for finding in native_findings)
 
         # 6. Row-stage CEL (the row.* loop). Validator-owned: these assertions
@@ -175,28 +198,40 @@ class TabularValidator(BaseValidator):
         #    doesn't bind) and evaluated here against every row, with now()
         #    pinned to the run clock.
         row_assertions = self._collect_row_assertions(validator, ruleset)
-        row_findings = evaluate_row_assertions(
-            read_result,
-            schema,
-            row_assertions,
-            signals=self._workflow_signals(run_context),
-            input_values=self._input_values,
-            now=self._run_clock(run_context),
-            report_max_examples=report_max_examples,
-        )
+        with (
+            TABULAR_LANE_SECONDS.labels(lane="row").time(),
+            spans.span("row"),
+        ):
+            row_findings = evaluate_row_assertions(
+                read_result,
+                schema,
+                row_assertions,
+                signals=self._workflow_signals(run_context),
+                input_values=self._input_values,
+                now=self._run_clock(run_context),
+                report_max_examples=report_max_examples,
+            )
+        if row_assertions:
+            TABULAR_ROWS.labels(lane="row").inc(read_result.num_rows)
         issues.extend(self._to_issue(finding) for finding in row_findings)
 
         # 7. Column-stage CEL runs once against typed per-column aggregates.
         column_assertions = self._collect_column_assertions(validator, ruleset)
-        column_findings = evaluate_column_assertions(
-            read_result,
-            schema,
-            column_assertions,
-            signals=self._workflow_signals(run_context),
-            input_values=self._input_values,
-            now=self._run_clock(run_context),
-            wall_clock_budget_s=limits.max_wallclock_s,
-        )
+        with (
+            TABULAR_LANE_SECONDS.labels(lane="column").time(),
+            spans.span("column"),
+        ):
+            column_findings = evaluate_column_assertions(
+                read_result,
+                schema,
+                column_assertions,
+                signals=self._workflow_signals(run_context),
+                input_values=self._input_values,
+                now=self._run_clock(run_context),
+                wall_clock_budget_s=limits.max_wallclock_s,
+            )
+        if column_assertions:
+            TABULAR_ROWS.labels(lane="column").inc(read_result.num_rows)
         issues.extend(self._to_issue(finding) for finding in column_findings)
 
         # 8. Output-stage CEL assertions (those that read the validator's
@@ -248,6 +283,7 @@ class TabularValidator(BaseValidator):
                 "native_finding_count": len(native_findings),
                 "row_assertion_count": len(row_assertions),
                 "column_assertion_count": len(column_assertions),
+                "reader": read_result.source_format,
             },
         )
 
@@ -304,6 +340,50 @@ class TabularValidator(BaseValidator):
             assertion_id=finding.assertion_id,
         )
 
+    def _read_table(
+        self,
+        submission: Submission,
+        *,
+        schema: TabularSchema,
+        dialect: TabularDialect,
+        limits: TabularLimits,
+    ) -> ReadResult:
+        """Read the submission with the reader its content calls for.
+
+        Text submissions arrive pre-decoded from ``get_content()``; we re-encode
+        as UTF-8 and read as UTF-8. Encoding is pinned to UTF-8 in V1 (there is
+        no editable encoding setting) because ``get_content()`` has already
+        decoded the submission.
+
+        Binary submissions are read as exact bytes, bounded by the byte cap.
+        Parquet and Arrow IPC content (recognised by its magic bytes) goes to
+        the columnar reader, which decodes only the declared columns; anything
+        else is read as CSV.
+        """
+        if submission.file_type == SubmissionFileType.BINARY:
+            try:
+                content_bytes = submission.read_bytes(max_bytes=limits.max_bytes)
+            except ValueError as exc:
+                msg = f"File is over the {limits.max_bytes}-byte limit."
+                raise PreflightError(msg, code=CODE_FILE_TOO_LARGE) from exc
+            if detect_columnar_format(content_bytes) is not None:
+                return read_columnar(
+                    content_bytes,
+                    columns=schema.field_names(),
+                    limits=limits,
+                )
+        else:
+            content = submission.get_content() or ""
+            content_bytes = (
+                content.encode("utf-8") if isinstance(content, str) else content
+            )
+        return read_csv(
+            content_bytes,
+            dialect=dialect,
+            declared_columns=None if dialect.has_header else schema.field_names(),
+            limits=limits,
+        )
+
     def _load_schema(self, ruleset: Ruleset) -> TabularSchema:
         raw_schema = getattr(ruleset, "rules", None)
         if not raw_schema:
@@ -10,7 +10,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from dataclasses import field
-from typing import Any
 
 
 @dataclass
@@ -81,6 +80,3 @@ class ThermModel:
     # Flags
     has_cma_data: bool = False
     has_glazing_system: bool = False
-
-    # Raw XML root for advanced queries (not serialized)
-    xml_root: Any = field(default=None, repr=False)
@@ -16,14 +16,19 @@ from __future__ import annotations
 import io
 import logging
 import zipfile
-from typing import Any
+from contextlib import contextmanager
+from typing import IO
+from typing import TYPE_CHECKING
 
 from validibot.validations.validators.therm.models import ThermModel
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 logger = logging.getLogger(__name__)
 
 # Maximum uncompressed size we will extract from a single member of a .thmz
-# ZIP archive. THMZ archives are opened and read entirely in-process inside
+# ZIP archive. THMZ archives are opened and read in-process inside
 # the Django/Celery THERM validator, so a small "zip bomb" with a very high
 # compression ratio could otherwise decompress to many gigabytes and OOM the
 # worker. 50 MiB is comfortably above any legitimate THERM model XML while
@@ -39,11 +44,16 @@ def parse_therm_file(
     Parse a THERM file (THMX or THMZ) into a ThermModel.
 
     For .thmz files (detected by filename or by attempting ZIP extraction),
-    the archive is unpacked and the primary model XML is identified and
-    parsed.
+    the archive is opened and the primary model XML is identified and
+    streamed straight out of it.
 
     For .thmx files, the content is parsed directly as XML.
 
+    Either way the XML is read with ``iterparse`` in a single pass and
+    each element is discarded once it closes, so memory is bounded by the
+    largest single element rather than by the whole document — large
+    multi-cross-section models never materialise as one lxml tree.
+
     Args:
         content: Raw file content (str or bytes).
         filename: Original filename, used to detect format.
@@ -51,144 +61,160 @@ def parse_therm_file(
     Raises:
         ValueError: If the file cannot be parsed as THERM.
     """
-    try:
-        from lxml import etree
-    except ImportError as exc:
-        msg = "lxml is required for THERM validation but is not installed."
-        raise ImportError(msg) from exc
-
     raw_bytes = content.encode("utf-8") if isinstance(content, str) else content
 
     # Detect format: THMZ (ZIP archive) or THMX (raw XML)
     is_thmz = (filename and filename.lower().endswith(".thmz")) or _is_zip(raw_bytes)
 
-    if is_thmz:
-        xml_bytes = _extract_xml_from_thmz(raw_bytes)
-        source_format = "thmz"
-    else:
-        xml_bytes = raw_bytes
-        source_format = "thmx"
+    if not is_thmz:
+        return _stream_model(io.BytesIO(raw_bytes), source_format="thmx")
 
-    # Parse XML
     try:
-        parser = etree.XMLParser(
-            recover=False,
-            remove_blank_text=True,
-            resolve_entities=False,
-            no_network=True,
-        )
-        root = etree.fromstring(xml_bytes, parser=parser)
-    except etree.XMLSyntaxError as exc:
-        msg = f"Invalid XML in THERM file: {exc}"
+        with _open_thmz_model_xml(raw_bytes) as source:
+            return _stream_model(source, source_format="thmz")
+    except zipfile.BadZipFile as exc:
+        # Also raised mid-stream, e.g. when a member fails its CRC check.
+        msg = f"Invalid THMZ archive: {exc}"
         raise ValueError(msg) from exc
 
-    return _build_model(root, source_format=source_format)
-
 
 def _is_zip(data: bytes) -> bool:
     """Check if data starts with ZIP magic bytes."""
     return data[:4] == b"PK\x03\x04"
 
 
-def _read_member_bounded(zf: zipfile.ZipFile, name: str) -> bytes:
+class _BoundedMemberReader:
+    """
+    File-like view of a ZIP member that refuses to inflate past the cap.
+
+    THMZ archives are decompressed in-process, so an attacker can supply a
+    tiny archive whose members declare (or actually decompress to) many
+    gigabytes — a classic "zip bomb" — and exhaust the worker's memory.
+    :func:`_open_thmz_model_xml` rejects a member whose declared
+    uncompressed size (``ZipInfo.file_size``) is over
+    ``MAX_THMZ_UNCOMPRESSED_BYTES``; this reader catches archives that
+    *lie* about ``file_size`` (the value is attacker-controlled metadata)
+    by counting the bytes actually inflated and failing as soon as they
+    pass the cap. The parser pulls from it in small reads, so at most one
+    read's worth of the member is ever held in memory.
     """
-    Read a single ZIP member, refusing anything larger than the cap.
-
-    THMZ archives are decompressed entirely in-process, so an attacker can
-    supply a tiny archive whose members declare (or actually decompress to)
-    many gigabytes — a classic "zip bomb" — and exhaust the worker's memory.
-    We defend in two layers:
-
-    1. Reject up front if the member's declared uncompressed size
-       (``ZipInfo.file_size``) already exceeds ``MAX_THMZ_UNCOMPRESSED_BYTES``.
-       This catches honest-but-huge archives cheaply, without decompressing.
-    2. Stream the member and stop as soon as the decompressed bytes exceed the
-       cap. This catches archives that *lie* about ``file_size`` (the value is
-       attacker-controlled metadata), so we never materialise more than roughly
-       the cap in memory regardless of what the header claims.
 
-    Args:
-        zf: The open ZIP archive to read from.
-        name: The member name to extract.
+    def __init__(self, member: IO[bytes], name: str):
+        self._member = member
+        self._name = name
+        self._inflated = 0
+
+    def read(self, size: int = -1) -> bytes:
+        # Never read more than one byte past the cap, even if asked to
+        # read everything.
+        remaining = MAX_THMZ_UNCOMPRESSED_BYTES + 1 - self._inflated
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        data = self._member.read(size)
+        self._inflated += len(data)
+        if self._inflated > MAX_THMZ_UNCOMPRESSED_BYTES:
+            msg = (
+                "THMZ archive member "
+                f"{self._name!r} decompresses to more than the "
+                f"{MAX_THMZ_UNCOMPRESSED_BYTES}-byte limit."
+            )
+            raise ValueError(msg)
+        return data
 
-    Returns:
-        The decompressed bytes of the member.
 
-    Raises:
-        ValueError: If the member exceeds ``MAX_THMZ_UNCOMPRESSED_BYTES`` by
-            either its declared size or its actual decompressed length.
-    """
-    info = zf.getinfo(name)
-    if info.file_size > MAX_THMZ_UNCOMPRESSED_BYTES:
-        msg = (
-            "THMZ archive member "
-            f"{name!r} declares an uncompressed size of {info.file_size} bytes, "
-            f"which exceeds the {MAX_THMZ_UNCOMPRESSED_BYTES}-byte limit."
-        )
-        raise ValueError(msg)
-
-    # Read one byte past the cap so we can detect a member that under-reports
-    # its size in the header and actually decompresses to something larger.
-    with zf.open(name) as member:
-        data = member.read(MAX_THMZ_UNCOMPRESSED_BYTES + 1)
-    if len(data) > MAX_THMZ_UNCOMPRESSED_BYTES:
-        msg = (
-            "THMZ archive member "
-            f"{name!r} decompresses to more than the "
-            f"{MAX_THMZ_UNCOMPRESSED_BYTES}-byte limit."
-        )
-        raise ValueError(msg)
-    return data
-
-
-def _extract_xml_from_thmz(data: bytes) -> bytes:
+@contextmanager
+def _open_thmz_model_xml(data: bytes) -> Iterator[_BoundedMemberReader]:
     """
-    Extract the primary model XML from a THMZ ZIP archive.
+    Open the primary model XML inside a THMZ ZIP archive for streaming.
 
     THMZ archives contain multiple files. The primary model
     file is identified by extension (.thmx) or as the largest
     XML file in the archive.
 
-    Every member is read through :func:`_read_member_bounded`, which enforces
-    ``MAX_THMZ_UNCOMPRESSED_BYTES`` so a high-compression-ratio archive cannot
-    OOM the in-process validator.
-    """
-    try:
-        with zipfile.ZipFile(io.BytesIO(data)) as zf:
-            # Look for a .thmx file first
-            thmx_files = [n for n in zf.namelist() if n.lower().endswith(".thmx")]
-            if thmx_files:
-                return _read_member_bounded(zf, thmx_files[0])
-
-            # Fall back to any XML file
-            xml_files = [n for n in zf.namelist() if n.lower().endswith(".xml")]
-            if xml_files:
-                largest = max(xml_files, key=lambda n: zf.getinfo(n).file_size)
-                return _read_member_bounded(zf, largest)
+    The member is refused up front if its declared uncompressed size is
+    over ``MAX_THMZ_UNCOMPRESSED_BYTES``, and read through
+    :class:`_BoundedMemberReader`, which enforces the same cap on the bytes
+    actually inflated, so a high-compression-ratio archive cannot OOM the
+    in-process validator.
 
+    Raises:
+        ValueError: If the archive has no model XML or the member is over
+            the cap.
+        zipfile.BadZipFile: If the archive is not a valid ZIP.
+    """
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        names = zf.namelist()
+        # Look for a .thmx file first, then fall back to the largest XML file.
+        thmx_files = [n for n in names if n.lower().endswith(".thmx")]
+        xml_files = [n for n in names if n.lower().endswith(".xml")]
+        if thmx_files:
+            name = thmx_files[0]
+        elif xml_files:
+            name = max(xml_files, key=lambda n: zf.getinfo(n).file_size)
+        else:
             msg = "THMZ archive does not contain a .thmx or .xml file."
             raise ValueError(msg)
-    except zipfile.BadZipFile as exc:
-        msg = f"Invalid THMZ archive: {exc}"
-        raise ValueError(msg) from exc
 
+        info = zf.getinfo(name)
+        if info.file_size > MAX_THMZ_UNCOMPRESSED_BYTES:
+            msg = (
+                "THMZ archive member "
+                f"{name!r} declares an uncompressed size of {info.file_size} "
+                f"bytes, which exceeds the {MAX_THMZ_UNCOMPRESSED_BYTES}-byte "
+                "limit."
+            )
+            raise ValueError(msg)
+        with zf.open(info) as member:
+            yield _BoundedMemberReader(member, name)
 
-def _build_model(root: Any, source_format: str) -> ThermModel:
+
+def _stream_model(
+    source: IO[bytes] | _BoundedMemberReader,
+    source_format: str,
+) -> ThermModel:
     """
-    Build a ThermModel from a parsed XML root element.
+    Build a ThermModel in one streaming pass over the model XML.
+
+    Each element is cleared when it closes and dropped from its parent,
+    the usual ``iterparse`` idiom for keeping the partial tree from
+    growing with the document.
 
     TODO: Implement XML element traversal based on the actual
     THERM XML schema. Element names, attribute names, and
     structure should be determined from real THERM files and
-    LBNL documentation.
+    LBNL documentation. Extraction belongs in the loop below, reading
+    each element before it is cleared.
     """
+    try:
+        from lxml import etree
+    except ImportError as exc:
+        msg = "lxml is required for THERM validation but is not installed."
+        raise ImportError(msg) from exc
+
     model = ThermModel(
         source_format=source_format,
         therm_version=None,
     )
-    model.xml_root = root
-
-    # TODO: parse materials, polygons, boundary conditions,
-    # mesh parameters, U-factor tags, etc. from the XML tree
+    try:
+        for _event, element in etree.iterparse(
+            source,
+            events=("end",),
+            recover=False,
+            remove_blank_text=True,
+            resolve_entities=False,
+            no_network=True,
+        ):
+            # TODO: parse materials, polygons, boundary conditions,
+            # mesh parameters, U-factor tags, etc. from ``element``
+            element.clear(keep_tail=False)
+            # The root's siblings are comments or processing instructions
+            # outside the document element; there is no parent to trim.
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+    except etree.XMLSyntaxError as exc:
+        msg = f"Invalid XML in THERM file: {exc}"
+        raise ValueError(msg) from exc
 
     return model
@@ -35,6 +35,7 @@ from validibot.validations.views.runs import GuestValidationRunListView
 from validibot.validations.views.runs import ValidationRunAccessMixin
 from validibot.validations.views.runs import ValidationRunDeleteView
 from validibot.validations.views.runs import ValidationRunDetailView
+from validibot.validations.views.runs import ValidationRunFindingsExportView
 from validibot.validations.views.runs import ValidationRunJsonView
 from validibot.validations.views.runs import ValidationRunListView
 from validibot.validations.views.step_io import ValidatorStepIOCreateView
@@ -79,6 +80,7 @@ __all__ = [
     "ValidationRunDeleteView",
     "ValidationRunDetailView",
     "ValidationRunFilter",
+    "ValidationRunFindingsExportView",
     "ValidationRunJsonView",
     "ValidationRunListView",
     "ValidationRunViewSet",
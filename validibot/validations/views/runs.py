@@ -12,6 +12,7 @@ from django.http import FileResponse
 from django.http import Http404
 from django.http import HttpResponse
 from django.http import HttpResponseRedirect
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import DetailView
@@ -30,7 +31,6 @@ from validibot.validations.credential_utils import (
 )
 from validibot.validations.credential_utils import get_signed_credential_display_context
 from validibot.validations.models import Artifact
-from validibot.validations.models import ValidationFinding
 from validibot.validations.models import ValidationRun
 from validibot.validations.models import ValidationStepRun
 from validibot.validations.services.artifact_display import (
@@ -39,6 +39,10 @@ from validibot.validations.services.artifact_display import (
 from validibot.validations.services.artifact_display import build_artifact_display_item
 from validibot.validations.services.artifact_display import build_artifact_display_items
 from validibot.validations.services.artifact_display import open_artifact_download
+from validibot.validations.services.findings_keyset import attach_inline_findings
+from validibot.validations.services.findings_keyset import inline_findings_prefetch
+from validibot.validations.services.findings_keyset import stream_findings_csv
+from validibot.validations.services.findings_keyset import stream_findings_ndjson
 from validibot.validations.services.report_layout import resolve_report_layout
 from validibot.workflows.models import Workflow
 
@@ -69,24 +73,12 @@ class ValidationRunAccessMixin(LoginRequiredMixin, BreadcrumbMixin):
         active_org_id = (
             active_org.id if active_org else getattr(user, "current_org_id", None)
         )
-        step_run_prefetch = Prefetch(
-            "step_runs",
-            queryset=ValidationStepRun.objects.select_related("workflow_step")
-            .prefetch_related("findings", "findings__ruleset_assertion")
-            .order_by("step_order", "pk"),
-        )
-        findings_prefetch = Prefetch(
-            "findings",
-            queryset=ValidationFinding.objects.select_related(
-                "validation_step_run",
-                "validation_step_run__workflow_step",
-                "ruleset_assertion",
-            ).order_by("severity", "-created"),
-        )
+        # No findings here: a run can hold hundreds of thousands. Pages read
+        # per-severity counts from ``summary_record`` and load findings
+        # through ``findings_keyset`` only where they show them.
         return (
             ValidationRun.objects.for_user(user, org=active_org_id)
-            .select_related("workflow", "submission", "org")
-            .prefetch_related(step_run_prefetch, findings_prefetch)
+            .select_related("workflow", "submission", "org", "summary_record")
             .order_by("-created")
         )
 
@@ -190,14 +182,14 @@ class ValidationRunDetailView(ValidationRunAccessMixin, DetailView):
         context = super().get_context_data(**kwargs)
         run: ValidationRun = context["run"]
         outputs_viewable = run.are_outputs_viewable
-        step_runs_query = run.step_runs.select_related(
-            "workflow_step",
-            "workflow_step__validator",
+        step_runs = list(
+            run.step_runs.select_related(
+                "workflow_step",
+                "workflow_step__validator",
+            ),
         )
         if outputs_viewable:
-            step_runs_query = step_runs_query.prefetch_related("findings")
-        step_runs = list(step_runs_query)
-        findings = list(run.findings.all()) if outputs_viewable else []
+            attach_inline_findings(step_runs)
 
         # Build display step outputs and template params for each step run.
         from validibot.validations.services.step_output_display import (
@@ -252,7 +244,6 @@ class ValidationRunDetailView(ValidationRunAccessMixin, DetailView):
         context.update(
             {
                 "step_runs": step_runs,
-                "all_findings": findings,
                 "summary_record": getattr(run, "summary_record", None),
                 "step_outputs": step_outputs,
                 "has_step_outputs": bool(step_outputs),
@@ -314,7 +305,14 @@ class ValidationRunJsonView(ValidationRunAccessMixin, DetailView):
     context_object_name = "run"
 
     def get_queryset(self):
-        return self.get_base_queryset()
+        return self.get_base_queryset().prefetch_related(
+            Prefetch(
+                "step_runs",
+                queryset=ValidationStepRun.objects.select_related(
+                    "workflow_step",
+                ).prefetch_related(inline_findings_prefetch()),
+            ),
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -356,6 +354,34 @@ class ValidationRunJsonView(ValidationRunAccessMixin, DetailView):
         return breadcrumbs
 
 
+class ValidationRunFindingsExportView(ValidationRunAccessMixin, DetailView):
+    """Stream every finding of a run as CSV (default) or ``?format=ndjson``.
+
+    Run pages embed at most ``RUN_FINDINGS_INLINE_LIMIT`` findings per step;
+    this is the complete set, read in keyset batches so the worker's memory
+    stays flat however large the run is.
+    """
+
+    export_formats = {
+        "csv": (stream_findings_csv, "text/csv"),
+        "ndjson": (stream_findings_ndjson, "application/x-ndjson"),
+    }
+
+    def get(self, request, *args, **kwargs):
+        run = self.get_object()
+        if not run.are_outputs_viewable:
+            raise Http404(_("Findings for this run are no longer available."))
+        export_format = request.GET.get("format", "csv")
+        if export_format not in self.export_formats:
+            export_format = "csv"
+        stream, content_type = self.export_formats[export_format]
+        response = StreamingHttpResponse(stream(run), content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="run-{run.pk}-findings.{export_format}"'
+        )
+        return response
+
+
 class ValidationRunDeleteView(ValidationRunAccessMixin, DeleteView):
     template_name = "validations/partials/validation_confirm_delete.html"
 
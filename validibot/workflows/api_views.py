@@ -10,10 +10,12 @@ These viewsets implement the org-scoped routing pattern:
 
 from __future__ import annotations
 
+import json
 from http import HTTPStatus
 from typing import TYPE_CHECKING
 
 from django.shortcuts import get_object_or_404
+from django.utils.translation import gettext_lazy
 from rest_framework import permissions
 from rest_framework import viewsets
 from rest_framework.decorators import action
@@ -26,6 +28,7 @@ from validibot.core.idempotency import idempotent
 from validibot.users.permissions import PermissionCode
 from validibot.validations.constants import ValidationRunSource
 from validibot.validations.serializers import ValidationRunStartSerializer
+from validibot.workflows.constants import WorkflowStartErrorCode
 from validibot.workflows.models import Workflow
 from validibot.workflows.serializers import WorkflowFullSerializer
 from validibot.workflows.serializers import WorkflowSlimSerializer
@@ -35,7 +38,11 @@ from validibot.workflows.version_utils import get_latest_workflow
 from validibot.workflows.version_utils import get_latest_workflow_ids
 from validibot.workflows.views_helpers import resolve_project
 from validibot.workflows.views_launch_helpers import LaunchValidationError
+from validibot.workflows.views_launch_helpers import build_bulk_submissions
 from validibot.workflows.views_launch_helpers import build_submission_from_api
+from validibot.workflows.views_launch_helpers import collect_bulk_upload_files
+from validibot.workflows.views_launch_helpers import ensure_launch_preconditions
+from validibot.workflows.views_launch_helpers import launch_api_bulk_validation_runs
 from validibot.workflows.views_launch_helpers import launch_api_validation_run
 
 if TYPE_CHECKING:
@@ -129,7 +136,7 @@ class OrgScopedWorkflowViewSet(OrgScopedMixin, viewsets.ReadOnlyModelViewSet):
         # The launch action needs to see inactive workflows so the
         # contract can return a 409, not so unauthorised users can
         # discover them. Access checks below remain unchanged.
-        include_inactive = getattr(self, "action", None) == "runs"
+        include_inactive = getattr(self, "action", None) in {"runs", "runs_bulk"}
         if user.is_authenticated and user.is_superuser:
             return Workflow.objects.filter(
                 org=org,
@@ -273,6 +280,73 @@ class OrgScopedWorkflowViewSet(OrgScopedMixin, viewsets.ReadOnlyModelViewSet):
             source=ValidationRunSource.API,
         )
 
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="runs/bulk",
+        url_name="runs-bulk",
+        throttle_scope="workflow_launch",
+    )
+    @idempotent
+    def runs_bulk(self, request, *args, **kwargs):
+        """
+        Start one validation run per uploaded file.
+
+        **Request format:** `multipart/form-data` with one `files` part per
+        file, or a single zip in `archive`. Optional `file_type` applies to
+        files whose type can't be told from the name; optional `metadata` is
+        a JSON object attached to every submission. At most
+        `BULK_LAUNCH_MAX_FILES` files per request.
+
+        **Response:** 202 with `runs` (filename, run `id`, `status`, `url`)
+        and `errors` (filename, `code`, `detail`) for files that were not
+        launched. 400 if no file could be launched.
+        """
+        workflow = self.get_object()
+        project = resolve_project(workflow=workflow, request=request)
+        try:
+            ensure_launch_preconditions(workflow=workflow, user=request.user)
+            bulk_build = build_bulk_submissions(
+                workflow=workflow,
+                user=request.user,
+                project=project,
+                files=collect_bulk_upload_files(request),
+                requested_file_type=request.data.get("file_type") or "",
+                metadata=_parse_bulk_metadata(request.data.get("metadata")),
+            )
+        except LaunchValidationError as exc:
+            status_code = exc.status_code
+            if status_code == HTTPStatus.FORBIDDEN:
+                status_code = HTTPStatus.NOT_FOUND
+            return APIResponse(exc.payload, status=status_code)
+
+        return launch_api_bulk_validation_runs(
+            request=request,
+            workflow=workflow,
+            bulk_build=bulk_build,
+            source=ValidationRunSource.API,
+        )
+
+
+def _parse_bulk_metadata(raw) -> dict:
+    """Decode the bulk launch ``metadata`` form field (a JSON object)."""
+
+    if not raw:
+        return {}
+    if isinstance(raw, dict):
+        return raw
+    try:
+        metadata = json.loads(raw)
+    except (TypeError, ValueError):
+        metadata = None
+    if not isinstance(metadata, dict):
+        raise LaunchValidationError(
+            detail=gettext_lazy("metadata must be a JSON object."),
+            code=WorkflowStartErrorCode.INVALID_PAYLOAD,
+            status_code=HTTPStatus.BAD_REQUEST,
+        )
+    return metadata
+
 
 class WorkflowVersionViewSet(OrgScopedMixin, viewsets.ReadOnlyModelViewSet):
     """
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class WorkflowsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "validibot.workflows"
+
+    def ready(self):
+        import validibot.workflows.signals  # noqa: F401
@@ -10,16 +10,23 @@ into:
   public workflow info page.
 
 These are presentation adapters.  The authoritative validation is handled by the
-Pydantic model built in ``schema_builder.py``.
+Pydantic model built in ``schema_builder.py``.  Form classes are cached the same
+way as those models, keyed by ``schema_cache_key``.
 """
 
 from __future__ import annotations
 
+import json
+from functools import lru_cache
+
 from crispy_forms.helper import FormHelper
 from crispy_forms.layout import Field as CrispyField
 from crispy_forms.layout import Layout
 from django import forms as django_forms
 
+from validibot.workflows.schema_builder import COMPILED_SCHEMA_CACHE_SIZE
+from validibot.workflows.schema_builder import schema_cache_key
+
 # ── JSON Schema type → Django field class ────────────────────────────────
 
 FIELD_MAP: dict[str, type[django_forms.Field]] = {
@@ -57,7 +64,16 @@ def schema_to_django_form(schema: dict) -> type[django_forms.Form]:
       types we convert (``exclusiveMinimum: 0`` → ``min_value: 1``).  For float
       types we use the exclusive value as the inclusive bound — the Pydantic
       layer enforces the strict bound.
+
+    The class is built once per distinct schema and cached. Sharing it is safe
+    because Django copies ``base_fields`` into every form instance.
     """
+    return _compile_django_form(schema_cache_key(schema))
+
+
+@lru_cache(maxsize=COMPILED_SCHEMA_CACHE_SIZE)
+def _compile_django_form(schema_key: str) -> type[django_forms.Form]:
+    schema = json.loads(schema_key)
     properties = schema.get("properties", {})
     required_fields = set(schema.get("required", []))
     form_fields: dict[str, django_forms.Field] = {}
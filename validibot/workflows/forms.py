@@ -466,6 +466,7 @@ class WorkflowForm(forms.ModelForm):
             "allow_submission_name",
             "allow_submission_meta_data",
             "allow_submission_short_description",
+            "result_cache_enabled",
             "featured_image",
             "version",
             "history_policy",
@@ -503,6 +504,13 @@ class WorkflowForm(forms.ModelForm):
                 "transient storage so they can be delivered, then purges them "
                 "shortly after validation. The permanent evidence receipt remains."
             ),
+            "result_cache_enabled": _(
+                "When the same file is submitted again and nothing about the "
+                "workflow, its validators or its resources has changed, reuse "
+                "the earlier results instead of re-running the validators. "
+                "Requires outputs to be retained; workflows with action steps "
+                "always run."
+            ),
         }
 
     def __init__(
@@ -952,6 +960,7 @@ class WorkflowForm(forms.ModelForm):
                 Field("allow_submission_name"),
                 Field("allow_submission_meta_data"),
                 Field("allow_submission_short_description"),
+                Field("result_cache_enabled"),
                 css_class=APP_FORM_SECTION_CLASS,
             ),
             Div(
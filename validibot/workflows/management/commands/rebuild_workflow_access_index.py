@@ -0,0 +1,27 @@
+"""Recompute the precomputed workflow read-access index from scratch.
+
+The index behind ``Workflow.objects.for_user`` is maintained incrementally by
+signals. Run this after raw SQL edits, fixture loads, or bulk
+``QuerySet.update()`` writes that bypassed those signals.
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from validibot.workflows.services.access_index import rebuild_workflow_access_index
+
+
+class Command(BaseCommand):
+    """Rebuild ``WorkflowAccessIndex`` for every organization."""
+
+    help = "Recompute the workflow access index for every organization."
+
+    def handle(self, *args, **options):
+        """Resync each org's index rows."""
+        org_count = rebuild_workflow_access_index()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt workflow access index for {org_count} org(s)."
+            ),
+        )
@@ -0,0 +1,72 @@
+# Generated by Django 6.0.7 on 2026-10-18 21:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations
+from django.db import models
+
+
+def backfill_workflow_access_index(apps, schema_editor):
+    """Populate the index for existing workflows using historical models."""
+
+    del schema_editor
+    from validibot.workflows.services.access_index import rebuild_workflow_access_index
+
+    rebuild_workflow_access_index(registry=apps)
+
+
+class Migration(migrations.Migration):
+    """Add the precomputed (user, workflow) read-access index."""
+
+    dependencies = [
+        ("users", "0004_current_schema"),
+        ("workflows", "0009_alter_workflow_output_retention"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkflowAccessIndex",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "workflow",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="workflows.workflow",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "workflow access index row",
+                "verbose_name_plural": "workflow access index",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "workflow"),
+                        name="uq_workflow_access_index_user_workflow",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(
+            backfill_workflow_access_index,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.7 on 2026-10-18 23:21
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    """Add the per-workflow result cache opt-in."""
+
+    dependencies = [
+        ("workflows", "0010_workflow_access_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="workflow",
+            name="result_cache_enabled",
+            field=models.BooleanField(
+                default=False,
+                help_text="Reuse the results of an earlier run when the same content is validated again against an unchanged workflow, instead of re-running every validator.",
+            ),
+        ),
+    ]
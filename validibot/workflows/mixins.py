@@ -22,6 +22,8 @@ from validibot.validations.credential_utils import get_signed_credential_display
 from validibot.validations.models import Ruleset
 from validibot.validations.models import ValidationRun
 from validibot.validations.services.artifact_display import build_artifact_display_items
+from validibot.validations.services.findings_keyset import attach_inline_findings
+from validibot.validations.services.findings_keyset import inline_findings_prefetch
 from validibot.validations.services.report_layout import resolve_report_layout
 from validibot.workflows.constants import WORKFLOW_LAUNCH_INPUT_MODE_SESSION_KEY
 from validibot.workflows.forms import WorkflowForm
@@ -131,7 +133,6 @@ class WorkflowAccessMixin(LoginRequiredMixin, BreadcrumbMixin):
             .filter(_has_admin_membership=True)
             .select_related("org", "user", "project")
             .prefetch_related("validation_runs")
-            .distinct()
         )
         queryset = queryset | admin_queryset
         if not self.include_tombstoned_workflows:
@@ -698,9 +699,10 @@ class WorkflowLaunchContextMixin(WorkflowObjectMixin):
                 "workflow_step",
                 "workflow_step__validator",
             )
-            .prefetch_related("findings", "findings__ruleset_assertion")
+            .prefetch_related(inline_findings_prefetch())
             .order_by("step_order"),
         )
+        attach_inline_findings(step_runs)
         run_in_progress = run.status in self.polling_statuses
         findings: list[Any] = []
         if not run_in_progress:
@@ -899,12 +901,9 @@ class WorkflowLaunchContextMixin(WorkflowObjectMixin):
             .prefetch_related(
                 "step_runs",
                 "step_runs__workflow_step",
-                "step_runs__findings",
                 "artifacts",
                 "artifacts__workflow_step",
                 "artifacts__step_run",
-                "findings",
-                "findings__ruleset_assertion",
             )
             .first()
         )
@@ -32,7 +32,6 @@ from validibot.users.models import Organization
 from validibot.users.models import Role
 from validibot.users.models import User
 from validibot.users.permissions import PermissionCode
-from validibot.users.permissions import roles_for_permission
 from validibot.workflows.constants import AgentBillingMode
 from validibot.workflows.constants import WorkflowConstantType
 from validibot.workflows.constants import WorkflowHistoryPolicy
@@ -138,31 +137,23 @@ class WorkflowQuerySet(models.QuerySet):
         if not getattr(user, "is_authenticated", False):
             return self.none()
 
-        # Org membership subquery
-        allowed_view_roles = roles_for_permission(PermissionCode.WORKFLOW_VIEW)
-        membership_subq = Membership.objects.filter(
-            org=OuterRef("org_id"),
-            user=user,
-            is_active=True,
-        )
-        if required_role_code:
-            membership_subq = membership_subq.filter(roles__code=required_role_code)
-        else:
-            membership_subq = membership_subq.filter(roles__code__in=allowed_view_roles)
-
-        qs = self.annotate(
-            _has_membership=Exists(membership_subq),
-        )
-
         # Role-specific queries are CAPABILITY checks ("is this user an
         # AUTHOR in this workflow's org?"), not read-visibility. They are
         # deliberately NOT narrowed by ``workflow_visibility`` — an org
         # member's role-based capability does not depend on how widely
         # the workflow is shared. The creator always qualifies.
         if required_role_code:
-            return qs.filter(
-                Q(_has_membership=True) | Q(user_id=user.id),
-            ).distinct()
+            membership_subq = Membership.objects.filter(
+                org=OuterRef("org_id"),
+                user=user,
+                is_active=True,
+                roles__code=required_role_code,
+            )
+            return (
+                self.annotate(_has_membership=Exists(membership_subq))
+                .filter(Q(_has_membership=True) | Q(user_id=user.id))
+                .distinct()
+            )
 
         # Read/visibility path — tier by ``workflow_visibility``:
         #   • creator + explicit per-workflow grant  → ALL tiers (incl PRIVATE)
@@ -172,61 +163,22 @@ class WorkflowQuerySet(models.QuerySet):
         # the people explicitly invited to it (grants) — NOT to every
         # org member, which is the new behaviour the old ``is_public``
         # boolean could not express.
-
-        # Per-workflow grant: family-scoped to ``(org_id, slug)`` so any
-        # active grant on any version of the workflow family makes every
-        # version visible. Without the family expansion, cloning a
-        # workflow to v2 would silently strip a guest's access until
-        # someone re-granted manually.
-        grant_subq = WorkflowAccessGrant.objects.filter(
-            user=user,
-            is_active=True,
-            workflow__org_id=OuterRef("org_id"),
-            workflow__slug=OuterRef("slug"),
-        )
-        qs = qs.annotate(_has_grant=Exists(grant_subq))
-
-        # Org-wide guest access: one row authorises every workflow in the
-        # org, current and future. The subquery joins back by ``org_id``
-        # so the read-side picks up new workflows as they're added, with
-        # no acceptance-time snapshot.
-        org_guest_subq = OrgGuestAccess.objects.filter(
-            user=user,
-            is_active=True,
-            org_id=OuterRef("org_id"),
-        )
-        qs = qs.annotate(_has_org_guest_access=Exists(org_guest_subq))
-
-        # Effective visibility is stored visibility masked by the org
-        # ceiling at READ time. In SQL that means:
-        #   effective >= ORG       iff both stored value and cap are >= ORG
-        #   effective == ALL_USERS iff both stored value and cap are ALL_USERS
-        # This mirrors ``Workflow.effective_visibility()`` so lowering an
-        # org cap immediately narrows existing rows without overwriting the
-        # workflow's stored intent.
-        org_or_wider = Q(
-            workflow_visibility__in=[
-                WorkflowVisibility.ORG,
-                WorkflowVisibility.ALL_USERS,
-            ],
-            org__workflow_visibility_cap__in=[
-                WorkflowVisibility.ORG,
-                WorkflowVisibility.ALL_USERS,
-            ],
-        )
+        #
+        # Paths 1-4 (with their tiering) are precomputed per user in
+        # ``WorkflowAccessIndex``; the rules that populate it live in
+        # ``services/access_index.py``. Only the ALL_USERS tier, which
+        # needs no per-user data, is evaluated here. Effective visibility
+        # is the stored value masked by the org ceiling at READ time, so
+        # lowering an org cap immediately narrows existing rows without
+        # overwriting the workflow's stored intent.
+        indexed_workflow_ids = WorkflowAccessIndex.objects.filter(
+            user_id=user.id,
+        ).values("workflow_id")
         all_users_effective = Q(
             workflow_visibility=WorkflowVisibility.ALL_USERS,
             org__workflow_visibility_cap=WorkflowVisibility.ALL_USERS,
         )
-        access_filter = (
-            Q(user_id=user.id)
-            | Q(_has_grant=True)
-            | (Q(_has_membership=True) & org_or_wider)
-            | (Q(_has_org_guest_access=True) & org_or_wider)
-            | all_users_effective
-        )
-
-        return qs.filter(access_filter).distinct()
+        return self.filter(Q(pk__in=indexed_workflow_ids) | all_users_effective)
 
 
 class WorkflowManager(models.Manager):
@@ -638,6 +590,20 @@ class Workflow(FeaturedImageMixin, TimeStampedModel):
         ),
     )
 
+    # Opt-in memoization of run results. When enabled, a launch whose
+    # submission content, workflow definition, validator versions and step
+    # resources all match an earlier completed run is answered by cloning
+    # that run's results instead of re-executing the validators. See
+    # ``validations/services/result_cache.py``.
+    result_cache_enabled = models.BooleanField(
+        default=False,
+        help_text=_(
+            "Reuse the results of an earlier run when the same content is "
+            "validated again against an unchanged workflow, instead of "
+            "re-running every validator."
+        ),
+    )
+
     success_message = models.TextField(
         blank=True,
         default="",
@@ -1081,6 +1047,13 @@ class Workflow(FeaturedImageMixin, TimeStampedModel):
             is_active=False,
             modified=now,
         )
+        # Grants authorise the whole family, so the bulk revocation above
+        # (which sends no signals) can narrow sibling versions too.
+        from validibot.workflows.services.access_index import (
+            sync_workflow_family_access,
+        )
+
+        sync_workflow_family_access(self.org_id, self.slug)
         self.invites.filter(status=InviteStatus.PENDING).update(
             status=InviteStatus.CANCELED,
             modified=now,
@@ -2311,6 +2284,53 @@ class OrgGuestAccess(TimeStampedModel):
         self.save(update_fields=["is_active", "modified"])
 
 
+class WorkflowAccessIndex(models.Model):
+    """Precomputed read access: one row per (user, workflow) the user may see.
+
+    ``Workflow.objects.for_user`` used to evaluate every access path
+    (membership, creator, family grant, org-wide guest access, visibility
+    tier) as correlated subqueries on each call, and
+    ``ValidationRun.objects.for_user`` nested that query again. This table
+    materialises the result of every *per-user* path so both querysets
+    resolve through one indexed semi-join on ``(user, workflow)``.
+
+    The ``ALL_USERS`` tier is deliberately not materialised: it applies to
+    every authenticated user, so it stays a plain column filter on the
+    workflow and its org.
+
+    Rows are maintained by ``validibot.workflows.services.access_index``,
+    driven by signals on workflows, organizations, memberships, membership
+    roles, grants, and org-wide guest access (see ``workflows/signals.py``).
+    Bulk ``QuerySet.update()`` writes bypass those signals and must call the
+    service explicitly; ``manage.py rebuild_workflow_access_index`` repairs
+    any drift.
+    """
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    workflow = models.ForeignKey(
+        Workflow,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "workflow"],
+                name="uq_workflow_access_index_user_workflow",
+            ),
+        ]
+        verbose_name = _("workflow access index row")
+        verbose_name_plural = _("workflow access index")
+
+    def __str__(self):
+        return f"{self.user_id} -> {self.workflow_id}"
+
+
 class WorkflowInvite(TimeStampedModel):
     """
     Invitation for an external user to access a specific workflow as a guest.
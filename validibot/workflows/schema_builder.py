@@ -8,6 +8,11 @@ into:
 - An **eligibility check** (``workflow_has_input_form``) that determines whether
   a workflow qualifies for the structured-form launch experience.
 
+Compiled models are cached per process, keyed by the schema's content (see
+``schema_cache_key``), so a launch page render or submission against an
+unchanged schema reuses the class instead of rebuilding it. Editing the schema
+changes the key, so a stale model is never served.
+
 Important: the stored JSON Schema is the canonical contract. The Pydantic model
 produced here is a *derived runtime validator* for the supported v1 schema subset;
 it does not replace or supersede the stored schema.
@@ -15,6 +20,8 @@ it does not replace or supersede the stored schema.
 
 from __future__ import annotations
 
+import json
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Literal
 
@@ -27,6 +34,10 @@ from validibot.submissions.constants import SubmissionFileType
 if TYPE_CHECKING:
     from validibot.workflows.models import Workflow
 
+# Distinct schemas kept compiled per process, per builder. Workflows share a
+# handful of schemas, so this bounds memory without evicting live ones.
+COMPILED_SCHEMA_CACHE_SIZE = 128
+
 # ── Type mapping ─────────────────────────────────────────────────────────
 
 JSONSCHEMA_TYPE_MAP: dict[str, type] = {
@@ -60,6 +71,16 @@ def workflow_has_input_form(workflow: Workflow) -> bool:
     return bool(schema and schema.get("properties"))
 
 
+def schema_cache_key(schema: dict) -> str:
+    """Return the compiled-class cache key for *schema*.
+
+    The key is the schema's compact JSON text. Keys are not sorted: property
+    order is the field order of the generated model and form, so two schemas
+    that differ only in order must not share a compiled class.
+    """
+    return json.dumps(schema, separators=(",", ":"), ensure_ascii=False)
+
+
 def build_pydantic_model(
     schema: dict,
     model_name: str = "DynamicInput",
@@ -68,9 +89,20 @@ def build_pydantic_model(
 
     Handles flat properties only — no nested objects or arrays.
 
+    The model is compiled once per distinct schema and cached; callers must
+    treat the returned class as shared and never modify it.
+
     Important: the stored JSON Schema remains the canonical contract.
     This model is a derived runtime validator for the supported schema subset.
     """
+    return _compile_pydantic_model(schema_cache_key(schema), model_name)
+
+
+@lru_cache(maxsize=COMPILED_SCHEMA_CACHE_SIZE)
+def _compile_pydantic_model(schema_key: str, model_name: str) -> type[BaseModel]:
+    # Build from the key rather than the caller's dict, so the cached class
+    # depends only on what it is cached under.
+    schema = json.loads(schema_key)
     properties = schema.get("properties", {})
     required_fields = set(schema.get("required", []))
     fields: dict = {}
@@ -314,6 +314,7 @@ class WorkflowFullSerializer(WorkflowSlimSerializer):
             "allow_submission_short_description",
             "input_retention",
             "output_retention",
+            "result_cache_enabled",
             "success_message",
             "agent_billing_mode",
             "agent_max_launches_per_hour",
@@ -0,0 +1,231 @@
+"""Maintain ``WorkflowAccessIndex``, the precomputed workflow read-access table.
+
+``Workflow.objects.for_user`` answers "which workflows may this user see?"
+from ``WorkflowAccessIndex`` rows instead of evaluating every access path per
+request. This module owns the rules that populate those rows, which are the
+per-user read paths documented on ``WorkflowQuerySet.for_user``:
+
+* the workflow's creator, on every visibility tier;
+* any user holding an active ``WorkflowAccessGrant`` on a workflow in the
+  same family (same ``org_id`` and ``slug``), on every tier;
+* active org members whose roles grant ``WORKFLOW_VIEW``, and users with
+  active ``OrgGuestAccess`` to the org, when the workflow's effective
+  visibility (stored value masked by the org ceiling) is ``ORG`` or wider.
+
+The ``ALL_USERS`` tier applies to everyone and is never materialised.
+
+Every entry point recomputes the desired rows for one *scope* — a user within
+an org, a set of workflows, or a whole org — and diffs them against the
+stored rows, so a sync is idempotent and repairs any drift inside its scope.
+Syncs triggered by deletions pass ``prune_only=True``: a deletion can only
+narrow access, and inserting rows while a cascade is in flight could
+reference a row the cascade is about to remove.
+
+The builders take an optional app registry so the backfill migration can run
+them against historical models.
+
+Every access change in the process funnels through ``_sync`` (from the signal
+receivers, or directly after a bulk ``update()``), so it is also where cached
+``PermissionSnapshot``s are invalidated.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from django.apps import apps as global_apps
+
+from validibot.users.permissions import PermissionCode
+from validibot.users.permissions import invalidate_permission_snapshots
+from validibot.users.permissions import roles_for_permission
+from validibot.workflows.constants import WorkflowVisibility
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.apps.registry import Apps
+
+logger = logging.getLogger(__name__)
+
+_ORG_OR_WIDER = frozenset({WorkflowVisibility.ORG, WorkflowVisibility.ALL_USERS})
+
+
+def _view_role_codes() -> list[str]:
+    return sorted(roles_for_permission(PermissionCode.WORKFLOW_VIEW))
+
+
+def _desired_pairs(
+    registry: Apps,
+    *,
+    org_id: int,
+    user_id: int | None,
+    workflow_ids: Iterable[int] | None,
+) -> set[tuple[int, int]]:
+    """Return the ``(user_id, workflow_id)`` rows the scope should hold."""
+    workflow_model = registry.get_model("workflows", "Workflow")
+    grant_model = registry.get_model("workflows", "WorkflowAccessGrant")
+    guest_model = registry.get_model("workflows", "OrgGuestAccess")
+    membership_model = registry.get_model("users", "Membership")
+    org_model = registry.get_model("users", "Organization")
+
+    cap = (
+        org_model.objects.filter(pk=org_id)
+        .values_list("workflow_visibility_cap", flat=True)
+        .first()
+    )
+    if cap is None:
+        return set()
+    cap_allows_org = cap in _ORG_OR_WIDER
+
+    workflows = workflow_model.objects.filter(org_id=org_id)
+    if workflow_ids is not None:
+        workflows = workflows.filter(pk__in=list(workflow_ids))
+    workflow_rows = list(
+        workflows.values_list("pk", "user_id", "slug", "workflow_visibility"),
+    )
+    if not workflow_rows:
+        return set()
+
+    grants = grant_model.objects.filter(is_active=True, workflow__org_id=org_id)
+    memberships = membership_model.objects.filter(
+        org_id=org_id,
+        is_active=True,
+        roles__code__in=_view_role_codes(),
+    )
+    guests = guest_model.objects.filter(org_id=org_id, is_active=True)
+    if user_id is not None:
+        grants = grants.filter(user_id=user_id)
+        memberships = memberships.filter(user_id=user_id)
+        guests = guests.filter(user_id=user_id)
+    if workflow_ids is not None:
+        grants = grants.filter(
+            workflow__slug__in={slug for _pk, _user, slug, _vis in workflow_rows},
+        )
+
+    family_grantees: dict[str, set[int]] = defaultdict(set)
+    for grantee_id, slug in grants.values_list("user_id", "workflow__slug"):
+        family_grantees[slug].add(grantee_id)
+    org_wide_users: set[int] = set()
+    if cap_allows_org:
+        org_wide_users.update(memberships.values_list("user_id", flat=True))
+        org_wide_users.update(guests.values_list("user_id", flat=True))
+
+    pairs: set[tuple[int, int]] = set()
+    for workflow_id, creator_id, slug, visibility in workflow_rows:
+        viewers = set(family_grantees.get(slug, ()))
+        if creator_id is not None:
+            viewers.add(creator_id)
+        if visibility in _ORG_OR_WIDER:
+            viewers |= org_wide_users
+        if user_id is not None:
+            viewers &= {user_id}
+        pairs.update((viewer_id, workflow_id) for viewer_id in viewers)
+    return pairs
+
+
+def _sync(
+    *,
+    org_id: int,
+    user_id: int | None = None,
+    workflow_ids: Iterable[int] | None = None,
+    prune_only: bool = False,
+    registry: Apps | None = None,
+) -> None:
+    invalidate_permission_snapshots()
+    registry = registry or global_apps
+    index_model = registry.get_model("workflows", "WorkflowAccessIndex")
+    if workflow_ids is not None:
+        workflow_ids = list(workflow_ids)
+
+    stored = index_model.objects.all()
+    if workflow_ids is not None:
+        stored = stored.filter(workflow_id__in=workflow_ids)
+    else:
+        stored = stored.filter(workflow__org_id=org_id)
+    if user_id is not None:
+        stored = stored.filter(user_id=user_id)
+    existing = {
+        (row_user_id, row_workflow_id): pk
+        for pk, row_user_id, row_workflow_id in stored.values_list(
+            "pk",
+            "user_id",
+            "workflow_id",
+        )
+    }
+    desired = _desired_pairs(
+        registry,
+        org_id=org_id,
+        user_id=user_id,
+        workflow_ids=workflow_ids,
+    )
+
+    stale = [pk for pair, pk in existing.items() if pair not in desired]
+    if stale:
+        index_model.objects.filter(pk__in=stale).delete()
+    if prune_only:
+        return
+    missing = desired - existing.keys()
+    if missing:
+        index_model.objects.bulk_create(
+            [
+                index_model(user_id=row_user_id, workflow_id=row_workflow_id)
+                for row_user_id, row_workflow_id in missing
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+
+def sync_user_access(user_id: int, org_id: int, *, prune_only: bool = False) -> None:
+    """Recompute one user's rows for every workflow in one org.
+
+    Called when the user's membership, membership roles, grants, or
+    org-wide guest access in that org change.
+    """
+    _sync(org_id=org_id, user_id=user_id, prune_only=prune_only)
+
+
+def sync_workflow_access(workflow_ids: Iterable[int], *, org_id: int) -> None:
+    """Recompute every user's rows for the given workflows of one org.
+
+    Rows for these workflows held under a previous org are also replaced,
+    since stored rows are matched by workflow id alone.
+    """
+    _sync(org_id=org_id, workflow_ids=workflow_ids)
+
+
+def sync_workflow_family_access(
+    org_id: int,
+    slug: str,
+    *,
+    user_id: int | None = None,
+) -> None:
+    """Recompute rows for every version of a workflow family.
+
+    A grant on any version authorises the whole family, so revoking grants
+    on one version must re-evaluate its siblings.
+    """
+    workflow_model = global_apps.get_model("workflows", "Workflow")
+    workflow_ids = workflow_model.objects.filter(org_id=org_id, slug=slug).values_list(
+        "pk",
+        flat=True,
+    )
+    _sync(org_id=org_id, user_id=user_id, workflow_ids=workflow_ids)
+
+
+def sync_org_access(org_id: int, *, registry: Apps | None = None) -> None:
+    """Recompute every row for one org (e.g. after a visibility-cap change)."""
+    _sync(org_id=org_id, registry=registry)
+
+
+def rebuild_workflow_access_index(*, registry: Apps | None = None) -> int:
+    """Recompute the whole index org by org; return the number of orgs synced."""
+    registry = registry or global_apps
+    org_model = registry.get_model("users", "Organization")
+    org_ids = list(org_model.objects.values_list("pk", flat=True).order_by("pk"))
+    for org_id in org_ids:
+        sync_org_access(org_id, registry=registry)
+    logger.info("Rebuilt workflow access index for %s org(s)", len(org_ids))
+    return len(org_ids)
@@ -309,6 +309,7 @@ class WorkflowVersioningService:
             allowed_file_types=list(workflow.allowed_file_types or []),
             input_retention=workflow.input_retention,
             output_retention=workflow.output_retention,
+            result_cache_enabled=workflow.result_cache_enabled,
             success_message=workflow.success_message,
             input_schema=deepcopy(workflow.input_schema),
             input_schema_source_mode=workflow.input_schema_source_mode,
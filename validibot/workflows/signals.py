@@ -0,0 +1,200 @@
+"""
+Signal receivers that keep ``WorkflowAccessIndex`` current.
+
+Each receiver maps a change to the narrowest index scope it can affect and
+hands it to ``validibot.workflows.services.access_index``:
+
+* a workflow's creator, org, slug, or visibility → that workflow's rows;
+* an org's visibility cap → the org's rows;
+* a membership, its roles, a workflow grant, or org-wide guest access →
+  that user's rows in the org.
+
+Deletions only prune rows (see the service module). ``QuerySet.update()``
+does not send signals, so bulk writes to these models call the service
+directly.
+"""
+
+from __future__ import annotations
+
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from validibot.users.models import Membership
+from validibot.users.models import MembershipRole
+from validibot.users.models import Organization
+from validibot.workflows.models import OrgGuestAccess
+from validibot.workflows.models import Workflow
+from validibot.workflows.models import WorkflowAccessGrant
+from validibot.workflows.services.access_index import sync_org_access
+from validibot.workflows.services.access_index import sync_user_access
+from validibot.workflows.services.access_index import sync_workflow_access
+
+# Model fields (and their attnames) that feed the access index.
+_WORKFLOW_ACCESS_FIELDS = {
+    "org": "org_id",
+    "user": "user_id",
+    "slug": "slug",
+    "workflow_visibility": "workflow_visibility",
+}
+_ORG_ACCESS_FIELDS = {"workflow_visibility_cap": "workflow_visibility_cap"}
+
+
+def _access_fields_changed(instance, fields: dict[str, str], update_fields) -> bool:
+    """Return whether a pending save changes any of ``fields``."""
+    if instance._state.adding:
+        return True
+    if update_fields is not None and not set(update_fields) & fields.keys():
+        return False
+    stored = (
+        type(instance).objects.filter(pk=instance.pk).values(*fields.values()).first()
+    )
+    if stored is None:
+        return True
+    return any(stored[attname] != getattr(instance, attname) for attname in stored)
+
+
+@receiver(pre_save, sender=Workflow, dispatch_uid="workflow_access_index_pre_save")
+def _note_workflow_access_change(sender, instance, raw, update_fields, **kwargs):
+    if raw:
+        return
+    instance._access_index_dirty = _access_fields_changed(
+        instance,
+        _WORKFLOW_ACCESS_FIELDS,
+        update_fields,
+    )
+
+
+@receiver(post_save, sender=Workflow, dispatch_uid="workflow_access_index_save")
+def _sync_workflow_on_save(sender, instance, raw, **kwargs):
+    if raw or not getattr(instance, "_access_index_dirty", True):
+        return
+    sync_workflow_access([instance.pk], org_id=instance.org_id)
+
+
+@receiver(pre_save, sender=Organization, dispatch_uid="org_access_index_pre_save")
+def _note_org_access_change(sender, instance, raw, update_fields, **kwargs):
+    if raw:
+        return
+    # A brand-new org has no workflows to index yet.
+    instance._access_index_dirty = (
+        not instance._state.adding
+        and _access_fields_changed(instance, _ORG_ACCESS_FIELDS, update_fields)
+    )
+
+
+@receiver(post_save, sender=Organization, dispatch_uid="org_access_index_save")
+def _sync_org_on_save(sender, instance, raw, **kwargs):
+    if raw or not getattr(instance, "_access_index_dirty", False):
+        return
+    sync_org_access(instance.pk)
+
+
+@receiver(post_save, sender=Membership, dispatch_uid="membership_access_index_save")
+def _sync_membership_on_save(sender, instance, raw, **kwargs):
+    if raw:
+        return
+    sync_user_access(instance.user_id, instance.org_id)
+
+
+@receiver(
+    post_delete,
+    sender=Membership,
+    dispatch_uid="membership_access_index_delete",
+)
+def _sync_membership_on_delete(sender, instance, **kwargs):
+    sync_user_access(instance.user_id, instance.org_id, prune_only=True)
+
+
+def _sync_memberships(membership_ids, *, prune_only: bool = False) -> None:
+    for user_id, org_id in Membership.objects.filter(
+        pk__in=membership_ids,
+    ).values_list("user_id", "org_id"):
+        sync_user_access(user_id, org_id, prune_only=prune_only)
+
+
+@receiver(
+    post_save,
+    sender=MembershipRole,
+    dispatch_uid="membership_role_access_index_save",
+)
+def _sync_membership_role_on_save(sender, instance, raw, **kwargs):
+    if raw:
+        return
+    _sync_memberships([instance.membership_id])
+
+
+@receiver(
+    post_delete,
+    sender=MembershipRole,
+    dispatch_uid="membership_role_access_index_delete",
+)
+def _sync_membership_role_on_delete(sender, instance, **kwargs):
+    _sync_memberships([instance.membership_id], prune_only=True)
+
+
+@receiver(
+    m2m_changed,
+    sender=Membership.roles.through,
+    dispatch_uid="membership_roles_access_index_changed",
+)
+def _sync_membership_roles_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    # ``roles.add()`` bulk-inserts through rows without ``post_save``;
+    # removals already arrive as ``MembershipRole`` deletions.
+    if action != "post_add":
+        return
+    _sync_memberships(pk_set if reverse else [instance.pk])
+
+
+def _grant_org_id(grant: WorkflowAccessGrant) -> int | None:
+    return (
+        Workflow.objects.filter(pk=grant.workflow_id)
+        .values_list("org_id", flat=True)
+        .first()
+    )
+
+
+@receiver(
+    post_save,
+    sender=WorkflowAccessGrant,
+    dispatch_uid="workflow_grant_access_index_save",
+)
+def _sync_grant_on_save(sender, instance, raw, **kwargs):
+    if raw:
+        return
+    org_id = _grant_org_id(instance)
+    if org_id is not None:
+        sync_user_access(instance.user_id, org_id)
+
+
+@receiver(
+    post_delete,
+    sender=WorkflowAccessGrant,
+    dispatch_uid="workflow_grant_access_index_delete",
+)
+def _sync_grant_on_delete(sender, instance, **kwargs):
+    org_id = _grant_org_id(instance)
+    if org_id is not None:
+        sync_user_access(instance.user_id, org_id, prune_only=True)
+
+
+@receiver(
+    post_save,
+    sender=OrgGuestAccess,
+    dispatch_uid="org_guest_access_index_save",
+)
+def _sync_org_guest_access_on_save(sender, instance, raw, **kwargs):
+    if raw:
+        return
+    sync_user_access(instance.user_id, instance.org_id)
+
+
+@receiver(
+    post_delete,
+    sender=OrgGuestAccess,
+    dispatch_uid="org_guest_access_index_delete",
+)
+def _sync_org_guest_access_on_delete(sender, instance, **kwargs):
+    sync_user_access(instance.user_id, instance.org_id, prune_only=True)
@@ -0,0 +1,242 @@
+"""Tests for the precomputed workflow read-access index.
+
+``Workflow.objects.for_user`` and ``ValidationRun.objects.for_user`` resolve
+through ``WorkflowAccessIndex``. These tests pin them to the subquery-based
+policy they replaced (reproduced below as the reference), across every access
+path, and check that the index follows each kind of change that can grant or
+revoke access.
+"""
+
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Exists
+from django.db.models import OuterRef
+from django.db.models import Q
+
+from validibot.users.constants import PermissionCode
+from validibot.users.constants import RoleCode
+from validibot.users.models import Membership
+from validibot.users.permissions import membership_grants_permission
+from validibot.users.permissions import roles_for_permission
+from validibot.users.tests.factories import OrganizationFactory
+from validibot.users.tests.factories import UserFactory
+from validibot.users.tests.factories import grant_role
+from validibot.users.tests.utils import ensure_all_roles_exist
+from validibot.validations.models import ValidationRun
+from validibot.validations.tests.factories import ValidationRunFactory
+from validibot.workflows.constants import WorkflowVisibility
+from validibot.workflows.models import OrgGuestAccess
+from validibot.workflows.models import Workflow
+from validibot.workflows.models import WorkflowAccessGrant
+from validibot.workflows.models import WorkflowAccessIndex
+from validibot.workflows.tests.factories import WorkflowFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _reference_workflow_ids(user) -> set[int]:
+    """The per-request subquery policy ``for_user`` used before the index."""
+    membership = Membership.objects.filter(
+        org=OuterRef("org_id"),
+        user=user,
+        is_active=True,
+        roles__code__in=roles_for_permission(PermissionCode.WORKFLOW_VIEW),
+    )
+    grant = WorkflowAccessGrant.objects.filter(
+        user=user,
+        is_active=True,
+        workflow__org_id=OuterRef("org_id"),
+        workflow__slug=OuterRef("slug"),
+    )
+    guest = OrgGuestAccess.objects.filter(
+        user=user,
+        is_active=True,
+        org_id=OuterRef("org_id"),
+    )
+    wide = [WorkflowVisibility.ORG, WorkflowVisibility.ALL_USERS]
+    org_or_wider = Q(
+        workflow_visibility__in=wide,
+        org__workflow_visibility_cap__in=wide,
+    )
+    return set(
+        Workflow.objects.annotate(
+            _m=Exists(membership),
+            _g=Exists(grant),
+            _o=Exists(guest),
+        )
+        .filter(
+            Q(user_id=user.id)
+            | Q(_g=True)
+            | (Q(_m=True) & org_or_wider)
+            | (Q(_o=True) & org_or_wider)
+            | Q(
+                workflow_visibility=WorkflowVisibility.ALL_USERS,
+                org__workflow_visibility_cap=WorkflowVisibility.ALL_USERS,
+            ),
+        )
+        .values_list("pk", flat=True),
+    )
+
+
+def _reference_run_ids(user) -> set[int]:
+    """The membership-loop policy ``ValidationRun.for_user`` used before."""
+    full_orgs, own_orgs = set(), set()
+    for membership in user.memberships.filter(is_active=True):
+        if membership_grants_permission(
+            membership,
+            PermissionCode.VALIDATION_RESULTS_VIEW_ALL,
+        ):
+            full_orgs.add(membership.org_id)
+        elif membership_grants_permission(
+            membership,
+            PermissionCode.VALIDATION_RESULTS_VIEW_OWN,
+        ):
+            own_orgs.add(membership.org_id)
+    return set(
+        ValidationRun.objects.filter(
+            Q(org_id__in=full_orgs)
+            | Q(org_id__in=own_orgs, user_id=user.pk)
+            | Q(user_id=user.pk, workflow_id__in=_reference_workflow_ids(user)),
+        ).values_list("pk", flat=True),
+    )
+
+
+def _assert_matches_reference(users) -> None:
+    for user in users:
+        indexed = set(Workflow.objects.for_user(user).values_list("pk", flat=True))
+        assert indexed == _reference_workflow_ids(user), user.username
+        runs = set(ValidationRun.objects.for_user(user).values_list("pk", flat=True))
+        assert runs == _reference_run_ids(user), user.username
+
+
+@pytest.fixture
+def world():
+    """Two orgs, every visibility tier, and one user per access path."""
+    ensure_all_roles_exist()
+    capped_org = OrganizationFactory(
+        workflow_visibility_cap=WorkflowVisibility.ORG,
+    )
+    open_org = OrganizationFactory()
+    creator = UserFactory(orgs=[open_org])
+    grant_role(creator, open_org, RoleCode.AUTHOR)
+
+    workflows = {}
+    for org in (open_org, capped_org):
+        for visibility in WorkflowVisibility.values:
+            workflows[org.pk, visibility] = WorkflowFactory(
+                org=org,
+                user=creator,
+                workflow_visibility=visibility,
+            )
+    private_v1 = workflows[open_org.pk, WorkflowVisibility.PRIVATE]
+    private_v2 = WorkflowFactory(
+        org=open_org,
+        user=creator,
+        slug=private_v1.slug,
+        version=2,
+        workflow_visibility=WorkflowVisibility.PRIVATE,
+    )
+
+    viewer = UserFactory(orgs=[open_org])
+    grant_role(viewer, open_org, RoleCode.WORKFLOW_VIEWER)
+    executor = UserFactory(orgs=[open_org, capped_org])
+    grant_role(executor, open_org, RoleCode.EXECUTOR)
+    grant_role(executor, capped_org, RoleCode.EXECUTOR)
+    roleless = UserFactory(orgs=[open_org])
+    grantee = UserFactory(orgs=[])
+    WorkflowAccessGrant.objects.create(workflow=private_v1, user=grantee)
+    guest = UserFactory(orgs=[])
+    OrgGuestAccess.objects.create(user=guest, org=capped_org)
+    stranger = UserFactory(orgs=[])
+    users = [creator, viewer, executor, roleless, grantee, guest, stranger]
+
+    for workflow in [*workflows.values(), private_v2]:
+        for launcher in users:
+            ValidationRunFactory(
+                org=workflow.org,
+                workflow=workflow,
+                user=launcher,
+            )
+    return {
+        "open_org": open_org,
+        "capped_org": capped_org,
+        "private_v1": private_v1,
+        "private_v2": private_v2,
+        "creator": creator,
+        "viewer": viewer,
+        "executor": executor,
+        "grantee": grantee,
+        "guest": guest,
+        "users": users,
+    }
+
+
+def test_index_matches_reference_policy_for_every_access_path(world):
+    _assert_matches_reference(world["users"])
+    visible = set(Workflow.objects.for_user(world["grantee"]))
+    assert {world["private_v1"], world["private_v2"]} <= visible
+
+
+def test_revocations_and_role_changes_narrow_the_index(world):
+    executor_membership = Membership.objects.get(
+        user=world["executor"],
+        org=world["open_org"],
+    )
+    executor_membership.remove_role(RoleCode.EXECUTOR)
+    viewer_membership = Membership.objects.get(
+        user=world["viewer"],
+        org=world["open_org"],
+    )
+    viewer_membership.is_active = False
+    viewer_membership.save()
+    WorkflowAccessGrant.objects.get(user=world["grantee"]).revoke()
+    OrgGuestAccess.objects.get(user=world["guest"]).revoke()
+
+    _assert_matches_reference(world["users"])
+    assert not Workflow.objects.for_user(world["grantee"]).filter(
+        pk=world["private_v2"].pk,
+    )
+
+
+def test_visibility_and_cap_changes_are_reflected(world):
+    private_v1 = world["private_v1"]
+    private_v1.workflow_visibility = WorkflowVisibility.ORG
+    private_v1.save()
+    open_org = world["open_org"]
+    open_org.workflow_visibility_cap = WorkflowVisibility.PRIVATE
+    open_org.save()
+
+    _assert_matches_reference(world["users"])
+
+
+def test_new_family_version_inherits_grants(world):
+    private_v3 = WorkflowFactory(
+        org=world["open_org"],
+        user=world["creator"],
+        slug=world["private_v1"].slug,
+        version=3,
+        workflow_visibility=WorkflowVisibility.PRIVATE,
+    )
+
+    assert Workflow.objects.for_user(world["grantee"]).filter(pk=private_v3.pk)
+    _assert_matches_reference(world["users"])
+
+
+def test_leaving_an_org_removes_membership_rows(world):
+    world["executor"].orgs.remove(world["capped_org"])
+
+    _assert_matches_reference(world["users"])
+
+
+def test_rebuild_command_repairs_drift(world):
+    WorkflowAccessIndex.objects.all().delete()
+    output = StringIO()
+
+    call_command("rebuild_workflow_access_index", stdout=output)
+
+    assert "Rebuilt workflow access index" in output.getvalue()
+    _assert_matches_reference(world["users"])
@@ -439,6 +439,53 @@ class TestSchemaToDjangoForm:
         assert form.helper.disable_csrf is True
 
 
+class TestCompiledSchemaCache:
+    """Compiled models and form classes are reused per distinct schema.
+
+    Launch pages build both on every render and submission, so they are
+    cached by schema content. A changed schema must never get a stale class.
+    """
+
+    def test_same_schema_reuses_compiled_classes(self, simple_schema):
+        """An equal schema, even a different dict, hits the cache."""
+        copy = json.loads(json.dumps(simple_schema))
+
+        assert build_pydantic_model(simple_schema) is build_pydantic_model(copy)
+        assert schema_to_django_form(simple_schema) is schema_to_django_form(copy)
+
+    def test_changed_schema_compiles_fresh(self, simple_schema):
+        """Editing the schema changes the key, so the new rules apply."""
+        model = build_pydantic_model(simple_schema)
+        simple_schema["properties"]["name"]["enum"] = ["Ada"]
+
+        changed = build_pydantic_model(simple_schema)
+
+        assert changed is not model
+        with pytest.raises(PydanticValidationError):
+            changed(name="Alice")
+
+    def test_property_order_is_part_of_the_key(self):
+        """Field order follows property order, so reordering is a new form."""
+        first = {
+            "type": "object",
+            "properties": {"a": {"type": "string"}, "b": {"type": "string"}},
+        }
+        second = {
+            "type": "object",
+            "properties": {"b": {"type": "string"}, "a": {"type": "string"}},
+        }
+
+        assert list(schema_to_django_form(first)().fields) == ["a", "b"]
+        assert list(schema_to_django_form(second)().fields) == ["b", "a"]
+
+    def test_model_name_is_part_of_the_key(self, simple_schema):
+        """Models built under different names are distinct classes."""
+        model = build_pydantic_model(simple_schema, model_name="Other")
+
+        assert model.__name__ == "Other"
+        assert model is not build_pydantic_model(simple_schema)
+
+
 class TestSchemaToRequirementRows:
     """Generate human-readable requirement rows for display.
 
@@ -0,0 +1,332 @@
+"""
+Tests for the bulk workflow launch endpoint.
+
+``POST /api/v1/orgs/<org>/workflows/<id>/runs/bulk/`` takes many files (as
+repeated ``files`` parts or one zip ``archive``) and starts one run per file.
+These tests run the real launch service: they check per-file outcomes, the
+batch-wide refusals, and that admission costs one INSERT per table however
+many files the request carries.
+"""
+
+import io
+import json
+import zipfile
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from validibot.core.policies import register_org_policy
+from validibot.core.policies import reset_org_policies
+from validibot.core.run_hooks import register_run_created_hook
+from validibot.core.run_hooks import reset_run_created_hooks
+from validibot.submissions.constants import SubmissionFileType
+from validibot.submissions.models import Submission
+from validibot.users.constants import RoleCode
+from validibot.users.tests.factories import OrganizationFactory
+from validibot.users.tests.factories import UserFactory
+from validibot.users.tests.factories import grant_role
+from validibot.validations.constants import ValidationRunSource
+from validibot.validations.constants import ValidationType
+from validibot.validations.models import ValidationRun
+from validibot.validations.tests.factories import ValidatorFactory
+from validibot.workflows.constants import WorkflowStartErrorCode
+from validibot.workflows.tests.factories import WorkflowFactory
+from validibot.workflows.tests.factories import WorkflowStepFactory
+
+BATCH_SIZE = 5
+GOOD_FILES = 3
+MAX_FILES = 2
+JSON_BYTES = b'{"name": "example"}'
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+@pytest.fixture
+def org(db):
+    return OrganizationFactory()
+
+
+@pytest.fixture
+def user(db, org):
+    user = UserFactory()
+    grant_role(user, org, RoleCode.EXECUTOR)
+    user.set_current_org(org)
+    return user
+
+
+@pytest.fixture
+def workflow(db, org, user):
+    allowed_types = [SubmissionFileType.JSON]
+    wf = WorkflowFactory(org=org, user=user, allowed_file_types=allowed_types)
+    validator = ValidatorFactory(
+        validation_type=ValidationType.BASIC,
+        supported_file_types=allowed_types,
+    )
+    WorkflowStepFactory(workflow=wf, validator=validator)
+    return wf
+
+
+def bulk_url(workflow) -> str:
+    return f"/api/v1/orgs/{workflow.org.slug}/workflows/{workflow.pk}/runs/bulk/"
+
+
+def json_files(count: int) -> list[SimpleUploadedFile]:
+    return [
+        SimpleUploadedFile(f"item-{index}.json", JSON_BYTES) for index in range(count)
+    ]
+
+
+def zip_archive(members: dict[str, bytes]) -> SimpleUploadedFile:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return SimpleUploadedFile("batch.zip", buffer.getvalue())
+
+
+def _corrupt_crc(archive: SimpleUploadedFile) -> SimpleUploadedFile:
+    """Flip one stored byte of the last member so its CRC no longer matches."""
+    raw = bytearray(archive.read())
+    offset = raw.rindex(JSON_BYTES)
+    raw[offset] ^= 0xFF
+    return SimpleUploadedFile("batch.zip", bytes(raw))
+
+
+def _mark_encrypted(archive: SimpleUploadedFile) -> SimpleUploadedFile:
+    """Set the encrypted flag on the last member's central directory entry."""
+    raw = bytearray(archive.read())
+    flags = raw.rindex(b"PK\x01\x02") + 8
+    raw[flags] |= 0x01
+    return SimpleUploadedFile("batch.zip", bytes(raw))
+
+
+def _inserts_into(captured: CaptureQueriesContext, table: str) -> int:
+    prefix = f'INSERT INTO "{table}"'
+    return sum(query["sql"].startswith(prefix) for query in captured)
+
+
+@pytest.mark.django_db
+class TestBulkLaunchAPI:
+    def test_each_file_gets_a_run_and_bad_files_are_reported(
+        self,
+        api_client,
+        user,
+        workflow,
+    ):
+        api_client.force_authenticate(user=user)
+        files = [*json_files(GOOD_FILES), SimpleUploadedFile("notes.yaml", b"a: 1")]
+
+        resp = api_client.post(
+            bulk_url(workflow),
+            data={"files": files, "metadata": json.dumps({"batch": "nightly"})},
+            format="multipart",
+        )
+
+        assert resp.status_code == status.HTTP_202_ACCEPTED, resp.data
+        body = resp.json()
+        assert [run["filename"] for run in body["runs"]] == [
+            "item-0.json",
+            "item-1.json",
+            "item-2.json",
+        ]
+        assert [error["filename"] for error in body["errors"]] == ["notes.yaml"]
+        assert (
+            body["errors"][0]["code"]
+            == WorkflowStartErrorCode.FILE_TYPE_UNSUPPORTED.value
+        )
+
+        runs = ValidationRun.objects.filter(pk__in=[r["id"] for r in body["runs"]])
+        assert runs.count() == GOOD_FILES
+        for run in runs:
+            assert run.source == ValidationRunSource.API
+            assert run.submission.latest_run_id == run.pk
+            assert run.submission.metadata == {"batch": "nightly"}
+            assert run.submission.checksum_sha256
+            assert run.submission.get_content() == JSON_BYTES.decode()
+
+    def test_zip_archive_members_are_launched(self, api_client, user, workflow):
+        api_client.force_authenticate(user=user)
+        archive = zip_archive(
+            {
+                "a.json": JSON_BYTES,
+                "nested/b.json": JSON_BYTES,
+                "__MACOSX/._a.json": b"resource fork",
+                ".hidden.json": JSON_BYTES,
+            },
+        )
+
+        resp = api_client.post(
+            bulk_url(workflow),
+            data={"archive": archive},
+            format="multipart",
+        )
+
+        assert resp.status_code == status.HTTP_202_ACCEPTED, resp.data
+        body = resp.json()
+        assert sorted(run["filename"] for run in body["runs"]) == ["a.json", "b.json"]
+        assert body["errors"] == []
+
+    def test_invalid_archive_is_rejected(self, api_client, user, workflow):
+        api_client.force_authenticate(user=user)
+
+        resp = api_client.post(
+            bulk_url(workflow),
+            data={"archive": SimpleUploadedFile("batch.zip", b"not a zip")},
+            format="multipart",
+        )
+
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+        assert resp.json()["code"] == WorkflowStartErrorCode.INVALID_PAYLOAD.value
+
+    @pytest.mark.parametrize("damage", [_corrupt_crc, _mark_encrypted])
+    def test_unreadable_archive_member_is_rejected(
+        self,
+        api_client,
+        user,
+        workflow,
+        damage,
+    ):
+        api_client.force_authenticate(user=user)
+        archive = damage(zip_archive({"a.json": b"{}", "b.json": JSON_BYTES}))
+
+        resp = api_client.post(
+            bulk_url(workflow),
+            data={"archive": archive},
+            format="multipart",
+        )
+
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+        assert resp.json()["code"] == WorkflowStartErrorCode.INVALID_PAYLOAD.value
+        assert not Submission.objects.filter(workflow=workflow).exists()
+
+    def test_too_many_files_are_rejected_before_any_submission(
+        self,
+        api_client,
+        user,
+        workflow,
+        settings,
+    ):
+        settings.BULK_LAUNCH_MAX_FILES = MAX_FILES
+        api_client.force_authenticate(user=user)
+
+        resp = api_client.post(
+            bulk_url(workflow),
+            data={"files": json_files(MAX_FILES + 1)},
+            format="multipart",
+        )
+
+        assert resp.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert not Submission.objects.filter(workflow=workflow).exists()
+
+    def test_all_files_rejected_returns_400(self, api_client, user, workflow):
+        api_client.force_authenticate(user=user)
+
+        resp = api_client.post(
+            bulk_url(workflow),
+            data={"files": [SimpleUploadedFile("notes.yaml", b"a: 1")]},
+            format="multipart",
+        )
+
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+        assert len(resp.json()["errors"]) == 1
+        assert not ValidationRun.objects.filter(workflow=workflow).exists()
+
+    def test_non_executor_gets_404(self, api_client, org, workflow):
+        outsider = UserFactory()
+        grant_role(outsider, org, RoleCode.AUTHOR)
+        api_client.force_authenticate(user=outsider)
+
+        resp = api_client.post(
+            bulk_url(workflow),
+            data={"files": json_files(1)},
+            format="multipart",
+        )
+
+        assert resp.status_code == status.HTTP_404_NOT_FOUND
+        assert not Submission.objects.filter(workflow=workflow).exists()
+
+    def test_org_policy_sees_the_batch_size_and_can_refuse_it(
+        self,
+        api_client,
+        user,
+        workflow,
+    ):
+        seen = {}
+
+        def deny(org, action, **context):
+            seen.update(context)
+            return False, "Not enough credits for this batch"
+
+        register_org_policy(deny)
+        try:
+            api_client.force_authenticate(user=user)
+            resp = api_client.post(
+                bulk_url(workflow),
+                data={"files": json_files(BATCH_SIZE)},
+                format="multipart",
+            )
+        finally:
+            reset_org_policies()
+
+        assert resp.status_code == status.HTTP_403_FORBIDDEN
+        assert resp.json()["code"] == WorkflowStartErrorCode.ORG_POLICY_DENIED.value
+        assert seen["run_count"] == BATCH_SIZE
+        assert not ValidationRun.objects.filter(workflow=workflow).exists()
+
+    def test_hook_refusal_drops_only_that_run(self, api_client, user, workflow):
+        def refuse_second(validation_run, **context):
+            if validation_run.submission.name == "item-1.json":
+                raise PermissionError("Insufficient compute credits")
+
+        register_run_created_hook(refuse_second)
+        try:
+            api_client.force_authenticate(user=user)
+            resp = api_client.post(
+                bulk_url(workflow),
+                data={"files": json_files(GOOD_FILES)},
+                format="multipart",
+            )
+        finally:
+            reset_run_created_hooks()
+
+        assert resp.status_code == status.HTTP_202_ACCEPTED, resp.data
+        body = resp.json()
+        assert [run["filename"] for run in body["runs"]] == [
+            "item-0.json",
+            "item-2.json",
+        ]
+        assert body["errors"] == [
+            {
+                "filename": "item-1.json",
+                "code": WorkflowStartErrorCode.ORG_POLICY_DENIED.value,
+                "detail": "Insufficient compute credits",
+            },
+        ]
+        assert ValidationRun.objects.filter(workflow=workflow).count() == GOOD_FILES - 1
+
+    def test_admission_is_one_insert_per_table_for_the_whole_batch(
+        self,
+        api_client,
+        user,
+        workflow,
+    ):
+        api_client.force_authenticate(user=user)
+
+        with CaptureQueriesContext(connection) as captured:
+            resp = api_client.post(
+                bulk_url(workflow),
+                data={"files": json_files(BATCH_SIZE)},
+                format="multipart",
+            )
+
+        assert resp.status_code == status.HTTP_202_ACCEPTED, resp.data
+        assert len(resp.json()["runs"]) == BATCH_SIZE
+        assert _inserts_into(captured, Submission._meta.db_table) == 1
+        assert _inserts_into(captured, ValidationRun._meta.db_table) == 1
@@ -938,6 +938,9 @@ class WorkflowGuestRevokeView(WorkflowObjectMixin, View):
 
         from validibot.notifications.models import Notification
         from validibot.workflows.models import WorkflowAccessGrant
+        from validibot.workflows.services.access_index import (
+            sync_workflow_family_access,
+        )
 
         if not self.user_can_manage_sharing():
             return HttpResponse(status=HTTPStatus.FORBIDDEN)
@@ -971,6 +974,11 @@ class WorkflowGuestRevokeView(WorkflowObjectMixin, View):
                 user=display_grant.user,
                 is_active=True,
             ).update(is_active=False, modified=timezone.now())
+            sync_workflow_family_access(
+                workflow.org_id,
+                workflow.slug,
+                user_id=display_grant.user_id,
+            )
 
         # Audit the revocation. The bulk ``update()`` above bypasses
         # ``post_save``, so the GUEST_REVOKED entry is written explicitly
@@ -1,13 +1,19 @@
 import base64
 import logging
+import shutil
+import tempfile
+import zipfile
+import zlib
 from collections.abc import Callable
 from dataclasses import dataclass
 from http import HTTPStatus
+from pathlib import PurePosixPath
 from typing import TYPE_CHECKING
 from typing import Any
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.files import File
 from django.db import transaction
 from django.http import HttpRequest
 from django.urls import reverse
@@ -18,8 +24,8 @@ from validibot.core.site_settings import MetadataPolicyError
 from validibot.core.site_settings import get_site_settings
 from validibot.projects.models import Project
 from validibot.submissions.constants import SubmissionRetention
+from validibot.submissions.ingest import ingest_uploaded_file
 from validibot.submissions.ingest import prepare_inline_text
-from validibot.submissions.ingest import prepare_uploaded_file
 from validibot.submissions.models import Submission
 from validibot.submissions.models import SubmissionInputFile
 from validibot.users.models import User
@@ -446,20 +452,11 @@ def process_structured_payload(
                 filename=filename_value,
             )
         max_file = getattr(settings, "SUBMISSION_FILE_MAX_BYTES", 1_000_000_000)
-        ingest = prepare_uploaded_file(
-            uploaded_file=file_obj,
-            filename=filename_value,
-            content_type=ct,
-            max_bytes=max_file,
-        )
-        safe_filename = ingest.filename
-
         submission = Submission(
             org=workflow.org,
             workflow=workflow,
             user=user if getattr(user, "is_authenticated", False) else None,
             project=project,
-            name=safe_filename,
             # Persist the submitter-supplied metadata (already policy-enforced
             # above). This branch previously hard-coded ``{}``, silently
             # dropping metadata on every multipart file upload — which broke
@@ -469,16 +466,20 @@ def process_structured_payload(
             # branch stores the checksum in its own ``checksum_sha256`` column,
             # so unlike the inline branch we do NOT fold ``sha256`` into here.
             metadata=metadata,
-            checksum_sha256=ingest.sha256,
             # Snapshot retention from the workflow — see
             # _resolve_submission_retention for rationale.
             retention_policy=_resolve_submission_retention(workflow),
         )
-        submission.set_content(
+        ingest = ingest_uploaded_file(
+            submission,
             uploaded_file=file_obj,
-            filename=safe_filename,
+            filename=filename_value,
+            content_type=ct,
+            max_bytes=max_file,
             file_type=resolved_file_type,
         )
+        safe_filename = ingest.filename
+        submission.name = safe_filename
 
     elif vd.get("normalized_content") is not None:
         ct = vd["content_type"]
@@ -676,20 +677,16 @@ def build_submission_from_form(
 
     if attachment:
         max_file = int(settings.SUBMISSION_FILE_MAX_BYTES)
-        ingest = prepare_uploaded_file(
+        ingest = ingest_uploaded_file(
+            submission,
             uploaded_file=attachment,
             filename=filename,
             content_type=content_type,
             max_bytes=max_file,
+            file_type=final_file_type,
         )
         safe_filename = ingest.filename
         submission.name = safe_filename
-        submission.checksum_sha256 = ingest.sha256
-        submission.set_content(
-            uploaded_file=attachment,
-            filename=safe_filename,
-            file_type=final_file_type,
-        )
     else:
         safe_filename, ingest = prepare_inline_text(
             text=payload,
@@ -839,6 +836,339 @@ def build_submission_from_api(
     )
 
 
+BULK_FILES_FIELD = "files"
+BULK_ARCHIVE_FIELD = "archive"
+_ARCHIVE_SKIPPED_PREFIXES = ("__MACOSX/",)
+# What zipfile raises while reading a bad member: BadZipFile for a CRC
+# mismatch, RuntimeError when a password is required, NotImplementedError
+# for an unsupported compression method, zlib.error/EOFError for a corrupt
+# or truncated deflate stream.
+_ARCHIVE_MEMBER_ERRORS = (
+    zipfile.BadZipFile,
+    RuntimeError,
+    NotImplementedError,
+    zlib.error,
+    EOFError,
+    OSError,
+)
+
+
+@dataclass
+class BulkSubmissionBuild:
+    """Submissions saved for a bulk launch, plus the files that were rejected."""
+
+    submissions: list[Submission]
+    metadata: dict[str, Any]
+    # One ``{"filename", "code", "detail"}`` entry per rejected file.
+    errors: list[dict[str, Any]]
+
+
+def collect_bulk_upload_files(request: HttpRequest) -> list[File]:
+    """Return the uploaded files for a bulk launch, expanding a zip archive.
+
+    Files come from repeated ``files`` parts, or from the members of a single
+    ``archive`` zip. Directories, dotfiles and macOS resource forks inside the
+    archive are skipped. The archive's declared uncompressed size may not
+    exceed ``SUBMISSION_FILE_MAX_BYTES``, the same cap a single upload has.
+
+    Raises:
+        LaunchValidationError: If there are no files, too many files, or the
+            archive is not a readable zip.
+    """
+
+    files = list(request.FILES.getlist(BULK_FILES_FIELD))
+    archive = request.FILES.get(BULK_ARCHIVE_FIELD)
+    if archive is not None:
+        files.extend(_expand_zip_archive(archive))
+
+    if not files:
+        raise LaunchValidationError(
+            detail=gettext_lazy("Upload files in '%(files)s' or a zip '%(archive)s'.")
+            % {"files": BULK_FILES_FIELD, "archive": BULK_ARCHIVE_FIELD},
+            code=WorkflowStartErrorCode.INVALID_PAYLOAD,
+            status_code=HTTPStatus.BAD_REQUEST,
+        )
+    max_files = int(settings.BULK_LAUNCH_MAX_FILES)
+    if len(files) > max_files:
+        raise LaunchValidationError(
+            detail=gettext_lazy("A bulk launch accepts at most %(max)d files.")
+            % {"max": max_files},
+            code=WorkflowStartErrorCode.INVALID_PAYLOAD,
+            status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+        )
+    return files
+
+
+def _expand_zip_archive(archive) -> list[File]:
+    max_bytes = int(settings.SUBMISSION_FILE_MAX_BYTES)
+    try:
+        zip_file = zipfile.ZipFile(archive)
+    except (zipfile.BadZipFile, OSError) as exc:
+        raise LaunchValidationError(
+            detail=gettext_lazy("The archive is not a valid zip file."),
+            code=WorkflowStartErrorCode.INVALID_PAYLOAD,
+            status_code=HTTPStatus.BAD_REQUEST,
+        ) from exc
+
+    members = [
+        info
+        for info in zip_file.infolist()
+        if not info.is_dir()
+        and not info.filename.startswith(_ARCHIVE_SKIPPED_PREFIXES)
+        and not PurePosixPath(info.filename).name.startswith(".")
+    ]
+    max_files = int(settings.BULK_LAUNCH_MAX_FILES)
+    if len(members) > max_files:
+        # Fail before inflating anything.
+        raise LaunchValidationError(
+            detail=gettext_lazy("A bulk launch accepts at most %(max)d files.")
+            % {"max": max_files},
+            code=WorkflowStartErrorCode.INVALID_PAYLOAD,
+            status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+        )
+    if sum(info.file_size for info in members) > max_bytes:
+        raise LaunchValidationError(
+            detail=gettext_lazy("Archive contents too large."),
+            code=WorkflowStartErrorCode.INVALID_PAYLOAD,
+            status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+        )
+
+    files = []
+    try:
+        for info in members:
+            # Spool to disk past the usual in-memory upload threshold. zipfile
+            # stops reading at the member's declared size, which was bounded
+            # above, so a lying header cannot inflate past the cap.
+            spooled = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+                max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE,
+            )
+            files.append(File(spooled, name=PurePosixPath(info.filename).name))
+            with zip_file.open(info) as member:
+                shutil.copyfileobj(member, spooled)
+            spooled.seek(0)
+    except _ARCHIVE_MEMBER_ERRORS as exc:
+        # A corrupt (bad CRC, truncated), encrypted or unsupported-compression
+        # member; release what was spooled before refusing the archive.
+        for spooled_file in files:
+            spooled_file.close()
+        raise LaunchValidationError(
+            detail=gettext_lazy("The archive is not a valid zip file."),
+            code=WorkflowStartErrorCode.INVALID_PAYLOAD,
+            status_code=HTTPStatus.BAD_REQUEST,
+        ) from exc
+    finally:
+        zip_file.close()
+    return files
+
+
+def build_bulk_submissions(
+    *,
+    workflow: Workflow,
+    user: User,
+    project: Project | None,
+    files: list[File],
+    requested_file_type: str = "",
+    metadata: dict[str, Any] | None = None,
+    submission_settings=None,
+) -> BulkSubmissionBuild:
+    """Validate each uploaded file and save a Submission for every good one.
+
+    Per-file problems (unsupported type, too large, binary content where text
+    was expected) reject just that file; the caller reports them alongside the
+    launched runs. The accepted submissions are saved with one
+    ``bulk_create``, after each file is written to storage.
+
+    ``bulk_create`` skips ``Submission.save()`` and its ``post_save``
+    receivers, so this does their work directly: set the checksum and
+    retention expiry, and record the SUBMISSION_CREATED tracking event.
+    Relationship checks that ``full_clean`` would repeat per file hold for
+    the whole batch: the workflow, project and user are shared, and launch
+    preconditions have already passed.
+
+    Raises:
+        LaunchValidationError: If the shared metadata violates site policy.
+    """
+
+    from validibot.events.constants import AppEventType
+    from validibot.tracking.constants import TrackingEventType
+    from validibot.tracking.services import TrackingEventService
+
+    submission_settings = submission_settings or get_site_settings()
+    try:
+        metadata = enforce_metadata_policy(metadata, submission_settings)
+    except MetadataPolicyError as exc:
+        raise LaunchValidationError(
+            detail=gettext_lazy("Invalid request payload."),
+            code=WorkflowStartErrorCode.INVALID_PAYLOAD,
+            status_code=HTTPStatus.BAD_REQUEST,
+            errors=[{"field": "metadata", "message": str(exc)}],
+        ) from exc
+
+    max_file = int(settings.SUBMISSION_FILE_MAX_BYTES)
+    retention_policy = _resolve_submission_retention(workflow)
+    submitter = user if getattr(user, "is_authenticated", False) else None
+    # The same file type always gets the same answer; ask the launch
+    # contract once per type rather than once per file.
+    violations: dict[str, str | None] = {}
+    submissions: list[Submission] = []
+    errors: list[dict[str, Any]] = []
+
+    for uploaded in files:
+        filename = getattr(uploaded, "name", "") or ""
+        file_type = resolve_submission_file_type(
+            requested=requested_file_type,
+            filename=filename,
+        )
+        if file_type not in violations:
+            violations[file_type] = describe_workflow_file_type_violation(
+                workflow=workflow,
+                file_type=file_type,
+            )
+        if violations[file_type]:
+            errors.append(
+                {
+                    "filename": filename,
+                    "code": WorkflowStartErrorCode.FILE_TYPE_UNSUPPORTED.value,
+                    "detail": str(violations[file_type]),
+                },
+            )
+            continue
+
+        submission = Submission(
+            org=workflow.org,
+            workflow=workflow,
+            user=submitter,
+            project=project,
+            metadata=metadata,
+            retention_policy=retention_policy,
+        )
+        try:
+            ingest = ingest_uploaded_file(
+                submission,
+                uploaded_file=uploaded,
+                filename=filename,
+                content_type=preferred_content_type_for_file(
+                    file_type,
+                    filename=filename,
+                ),
+                max_bytes=max_file,
+                file_type=file_type,
+            )
+        except ValidationError as exc:
+            errors.append(
+                {
+                    "filename": filename,
+                    "code": WorkflowStartErrorCode.INVALID_PAYLOAD.value,
+                    "detail": " ".join(str(message) for message in exc.messages),
+                },
+            )
+            continue
+
+        submission.name = ingest.filename
+        submission._sync_retention_expiry()
+        submissions.append(submission)
+
+    if submissions:
+        Submission.objects.bulk_create(submissions)
+        tracking_service = TrackingEventService()
+        for _submission in submissions:
+            tracking_service.log_tracking_event(
+                event_type=TrackingEventType.APP_EVENT,
+                app_event_type=AppEventType.SUBMISSION_CREATED,
+                project=project,
+                org=workflow.org,
+                user=submitter,
+            )
+    return BulkSubmissionBuild(
+        submissions=submissions,
+        metadata=metadata,
+        errors=errors,
+    )
+
+
+def launch_api_bulk_validation_runs(
+    *,
+    request: HttpRequest,
+    workflow: Workflow,
+    bulk_build: BulkSubmissionBuild,
+    source: ValidationRunSource = ValidationRunSource.API,
+) -> APIResponse:
+    """Launch one run per bulk submission and report every file's outcome.
+
+    Responds 202 with ``runs`` (one entry per launched file) and ``errors``
+    (one per rejected file) whenever at least one run was admitted. If every
+    file was rejected the response is 400 with the same ``errors`` list.
+    Batch-wide refusals map like the single-run endpoint: an org policy
+    denial is 403, missing execute permission 404.
+    """
+
+    if source == ValidationRunSource.LAUNCH_PAGE:
+        msg = "Bulk launch does not accept LAUNCH_PAGE as a source."
+        raise ValueError(msg)
+
+    errors = list(bulk_build.errors)
+    service = ValidationRunService()
+    try:
+        launch_result = service.launch_many(
+            request=request,
+            org=workflow.org,
+            workflow=workflow,
+            submissions=bulk_build.submissions,
+            metadata=bulk_build.metadata,
+            source=source,
+        )
+    except OrgPolicyDeniedError as exc:
+        detail = str(exc) or gettext_lazy(
+            "Your organization can't run this workflow right now.",
+        )
+        payload = {
+            "detail": detail,
+            "code": WorkflowStartErrorCode.ORG_POLICY_DENIED.value,
+        }
+        return APIResponse(payload, status=HTTPStatus.FORBIDDEN)
+    except PermissionError:
+        payload = {
+            "detail": gettext_lazy("You do not have permission to run this workflow."),
+        }
+        return APIResponse(payload, status=HTTPStatus.NOT_FOUND)
+
+    names = {submission.pk: submission.name for submission in bulk_build.submissions}
+    for submission_id, reason in launch_result.refused.items():
+        errors.append(
+            {
+                "filename": names.get(submission_id, ""),
+                "code": WorkflowStartErrorCode.ORG_POLICY_DENIED.value,
+                "detail": reason,
+            },
+        )
+
+    runs = []
+    for validation_run in launch_result.validation_runs:
+        location = request.build_absolute_uri(
+            reverse(
+                "api:org-runs-detail",
+                kwargs={"org_slug": workflow.org.slug, "pk": validation_run.id},
+            ),
+        )
+        runs.append(
+            {
+                "filename": names.get(validation_run.submission_id, ""),
+                "id": str(validation_run.id),
+                "status": validation_run.status,
+                "url": location,
+            },
+        )
+
+    if not runs:
+        payload = {
+            "detail": gettext_lazy("None of the uploaded files could be launched."),
+            "code": WorkflowStartErrorCode.INVALID_PAYLOAD.value,
+            "errors": errors,
+        }
+        return APIResponse(payload, status=HTTPStatus.BAD_REQUEST)
+    return APIResponse({"runs": runs, "errors": errors}, status=HTTPStatus.ACCEPTED)
+
+
 def ensure_launch_preconditions(*, workflow: Workflow, user: User) -> None:
     """Shared entry point for workflow readiness + permission checks."""
 